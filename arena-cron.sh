@@ -3,6 +3,7 @@
 #
 #     0  * * * * /home/you/starship-arena/arena-cron.sh
 #     30 * * * * /home/you/starship-arena/arena-cron.sh remind_due
+#     *  * * * * /home/you/starship-arena/arena-cron.sh worker
 #
 # The run writes itself to logs/arena.log, which rotates. Anything that fails before that, a
 # missing venv or a broken import, goes to whatever the host does with a task's output.
@@ -16,6 +17,8 @@
 # them in time for the hour a game processes on. It keeps to one reminder each per round through
 # the journal rather than the clock, so run it as often as suits.
 #
+# `worker` runs the jobs the web application queued and its own workers have not got to yet.
+#
 set -euo pipefail
 
 cd "$(dirname "${BASH_SOURCE[0]}")"
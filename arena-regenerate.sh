@@ -4,17 +4,18 @@
 #     ./arena-regenerate.sh                     every playable game
 #     ./arena-regenerate.sh The_War_of_Noodles   one of them
 #
-# The data root is copied first, next to itself and stamped with the time, because a regenerate
-# starts by deleting the pickles: a round whose command file is missing cannot be replayed, and
-# every round after it goes with it. The run prints the round each game ends on against the round
-# it was on, and stops on the first one that comes back short.
+# The data root is copied first, next to itself and stamped with the time. Each game is replayed
+# in a staging directory, several at once, and its new rounds are swapped in only when the replay
+# gets back to the round it was on: a round whose command file is missing cannot be replayed, and
+# a game that stops there keeps what it had. The run prints the round each game ends on against the
+# round it was on, and fails if any came back short.
 #
 # What it is for: saved state written by older code, and anything else that makes the worlds on
 # disk not what this code reads. A replay uses today's engine, so a game whose numbers have since
 # been rebalanced comes back as today's rules would have played it.
 #
 # Archived games are left alone. They are not playable, so nothing reads them, and their orders may
-# well be gone - which is the case where this destroys rounds rather than rebuilding them.
+# well be gone, so a replay of one would only ever come back short.
 #
 set -euo pipefail
 
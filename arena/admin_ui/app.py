@@ -10,13 +10,17 @@ import logging
 import random
 import re
 from dataclasses import asdict
+from time import perf_counter
 from flask import Flask, abort, render_template, request, g, jsonify, send_file, redirect, url_for
 
+from arena import metrics, tally
 from arena.errors import UnreadableWorld
 from arena.app.players import LOGIN_COOKIE, LOGIN_COOKIE_MAX_AGE, LOGIN_COOKIE_SECURE
 from arena.cfg import WEB_ROOT, GAME_UI_URL, PLAY_URL
 from arena.app import scenarios
 from arena.app.dto import GameState
+from arena.app.jobs import Job
+from arena.app.locks import GameBusy
 from arena.app.registrations import Registration
 from arena.app.naming import as_stored, for_display
 from arena.admin_ui.appfacade import AppFacade, NameValidator
@@ -39,6 +43,11 @@ def unreadable_world(e: UnreadableWorld):
     return redirect(url_for('unreadable', game=e.game))
 
 
+@app.errorhandler(GameBusy)
+def busy(e: GameBusy):
+    return str(e), 503, {'Retry-After': '5'}
+
+
 # ---------------------------------------------------------------------- HELPERS
 
 
@@ -58,6 +67,31 @@ def server_clock():
 # ---------------------------------------------------------------------- WHO IS ASKING
 
 
+@app.before_request
+def start_the_clock():
+    """First, so the time a request takes and what it reads include the gate."""
+    g._started = perf_counter()
+    g._tally = tally.begin(f"{request.method} {request.path}")
+
+
+@app.after_request
+def say_what_was_read(response):
+    if tally.header and (reads := tally.current()):
+        response.headers[tally.HEADER] = str(reads)
+    return response
+
+
+@app.teardown_request
+def stop_the_clock(_):
+    started = getattr(g, '_started', None)
+    if started is not None:
+        metrics.observe('arena_request_seconds', perf_counter() - started, app='console',
+                        method=request.method,
+                        route=request.url_rule.rule if request.url_rule else 'unmatched')
+    if (token := getattr(g, '_tally', None)) is not None:
+        tally.end(token)
+
+
 @app.before_request
 def only_the_director():
     """The console runs the game, so only the director gets in.
@@ -105,7 +139,8 @@ def save_settings(game: str):
     facade().save_settings(game,
                            on_all_ready=bool(request.form.get('on_all_ready')),
                            hours=[int(h) for h in request.form.getlist('hour')],
-                           announce=bool(request.form.get('announce')))
+                           announce=bool(request.form.get('announce')),
+                           keep_every=int(request.form.get('keep_every') or 0))
     return redirect(url_for('game_overview', game_name=game, _anchor='processing'))
 
 
@@ -120,7 +155,8 @@ def reopen(game: str):
 
 @app.route('/valhalla/<game>', methods=['POST'])
 def to_valhalla(game: str):
-    """Put a copy of a game on show. It carries on being whatever it was."""
+    """Put a copy of a game on show. It carries on being whatever it was. Queued, so it is there
+    once the job has run."""
     facade().export_to_valhalla(game)
     return redirect(url_for('overview', _anchor='valhalla'))
 
@@ -356,6 +392,7 @@ def game_overview(game_name: str):
                            reopenable=facade().is_reopenable(game_name),
                            settings=facade().settings(game_name),
                            journal=facade().journal(game_name, JOURNAL_LINES),
+                           jobs=facade().jobs_of(game_name),
                            known_players=[p.name for p in facade().active_players()],
                            types_by_category=facade().types_by_category(),
                            spawn_error=request.args.get('spawn_error')
@@ -392,31 +429,24 @@ def game_status(game: str):
 def process_turn(game: str):
     """POST rather than GET: a browser is free to prefetch a link, and processing a round twice
     is not something to leave to chance."""
-    was = facade().standing(game).round_nr
-    told = (f"Round {was} processed." if facade().process_turn(game)
-            else "Nothing processed: orders are still missing.")
-    return redirect(url_for('game_overview', game_name=game, msg=told, _anchor='processing'))
+    return _queued(game, facade().process_turn(game))
 
 
 @app.route('/force_process/<game>', methods=['POST'])
 def force_process(game: str):
     """Run the round now, whatever the state of the orders."""
-    was = facade().standing(game).round_nr
-    silent = facade().force_process_turn(game)
-    told = f"Round {was} processed."
-    if silent:
-        told += f" No orders from {', '.join(silent)}."
-    return redirect(url_for('game_overview', game_name=game, msg=told, _anchor='processing'))
+    return _queued(game, facade().force_process_turn(game))
 
 
 @app.route('/regenerate/<game>', methods=['POST'])
 def regenerate(game: str):
-    was = facade().rounds_played(game)
-    now = facade().regenerate_game(game)
-    told = f"Replayed to round {now}."
-    if now < was:
-        told += f" It stopped short of round {was}: orders are missing for a round in between."
-    return redirect(url_for('game_overview', game_name=game, msg=told, _anchor='processing'))
+    return _queued(game, facade().regenerate_game(game))
+
+
+def _queued(game: str, job: Job):
+    """Back to the game at once. What the job made of it is listed under the buttons."""
+    return redirect(url_for('game_overview', game_name=game, msg=f"Queued as job {job.id}.",
+                            _anchor='processing'))
 
 
 @app.route('/players')
@@ -10,8 +10,10 @@ import re
 from dataclasses import dataclass
 from datetime import datetime
 
+from arena.app import jobs
 from arena.app.clock import server_now, zone_name
-from arena.app.dto import By, GameSettings, GameStanding, GameState, ProcessingTrigger
+from arena.app.dto import GameSettings, GameStanding, GameState
+from arena.app.jobs import Job
 from arena.app.naming import for_display
 from arena.app.services import AdminService
 from arena.cfg import GAME_DATA_DIR, MANUAL_FILENAME
@@ -50,6 +52,15 @@ class NameValidator(object):
             self.messages.append('Name can not be empty.')
 
 
+@dataclass
+class JobLine:
+    """A job as the console lists it: when it was queued, and what came of it so far."""
+    when: str
+    kind: str
+    state: str
+    said: str
+
+
 @dataclass
 class JournalLine:
     """One journal entry as the console prints it: a time to read, and pairs to show."""
@@ -119,10 +130,6 @@ class AppFacade(object):
         """Every game being played, each with what its round is waiting for."""
         return self.admin.list_games()
 
-    def rounds_played(self, game: str) -> int:
-        """Read off the file names, so it answers for a game whose rounds cannot be loaded."""
-        return self.admin.playable_games_on_disk()[game]
-
     def stale_rounds(self, game: str) -> list:
         return self.admin.stale_rounds(game)
 
@@ -137,15 +144,19 @@ class AppFacade(object):
 
     # ---------------------------------------------------------------------- COMMANDS
 
-    def process_turn(self, game_name: str) -> bool:
-        return self.admin.process_turn(game_name)
+    def process_turn(self, game_name: str) -> Job:
+        return self.admin.queue(jobs.PROCESS, game_name)
+
+    def regenerate_game(self, game_name: str) -> Job:
+        return self.admin.queue(jobs.REGENERATE, game_name)
 
-    def regenerate_game(self, game_name: str) -> int:
-        return self.admin.regenerate_game(game_name)
+    def force_process_turn(self, game_name: str) -> Job:
+        return self.admin.queue(jobs.FORCE, game_name)
 
-    def force_process_turn(self, game_name: str) -> list[str]:
-        return self.admin.force_process_turn(game_name, By.DIRECTOR,
-                                             ProcessingTrigger.MANUAL_FORCED)
+    def jobs_of(self, game_name: str) -> list[JobLine]:
+        return [JobLine(when=f"{datetime.fromisoformat(job.queued):%d %b %H:%M}", kind=job.kind,
+                        state=job.state, said=job.error or job.result)
+                for job in self.admin.jobs_of(game_name)]
 
     @staticmethod
     def _journal_line(game: str, entry) -> JournalLine:
@@ -187,9 +198,10 @@ class AppFacade(object):
         return self.admin.settings(game)
 
     def save_settings(self, game: str, on_all_ready: bool, hours: list[int],
-                      announce: bool) -> None:
+                      announce: bool, keep_every: int = 0) -> None:
         self.admin.save_settings(game, GameSettings(on_all_ready=on_all_ready,
-                                                    process_hours=hours, announce=announce))
+                                                    process_hours=hours, announce=announce,
+                                                    keep_every=keep_every))
 
     def archived_games(self) -> list:
         return self.admin.list_archived_games()
@@ -250,8 +262,8 @@ class AppFacade(object):
     def delete_archived_game(self, name: str) -> None:
         self.admin.delete_archived_game(name)
 
-    def export_to_valhalla(self, name: str) -> str:
-        return self.admin.export_to_valhalla(name)
+    def export_to_valhalla(self, name: str) -> Job:
+        return self.admin.queue(jobs.EXPORT, name)
 
     def save_synopsis(self, game: str, text: str) -> None:
         self.admin.save_synopsis(game, text)
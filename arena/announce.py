@@ -10,6 +10,7 @@ import urllib.error
 import urllib.request
 from abc import ABC, abstractmethod
 
+from arena import metrics
 from arena.cfg import DISCORD_WEBHOOK
 
 logger = logging.getLogger('starship-arena.announce')
@@ -86,7 +87,9 @@ class Announcer:
             try:
                 channel.send(message)
                 logger.info(f"Announced on {channel.name}: {message}")
+                metrics.count('arena_announcements_total', channel=channel.name, outcome='sent')
                 taken.append(channel)
             except Exception as e:
                 logger.warning(f"{channel.name} took nothing: {e}")
+                metrics.count('arena_announcements_total', channel=channel.name, outcome='failed')
         return taken
\ No newline at end of file
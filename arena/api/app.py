@@ -4,10 +4,15 @@ Speaks only in the DTOs of arena/app, never in engine objects. See docs/architec
 
 Run with: uv run uvicorn arena.api.app:app --reload"""
 
-from fastapi import FastAPI
+from time import perf_counter
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from arena import metrics, tally
 from arena.api.game import router as game_router
+from arena.app.locks import GameBusy
 
 app = FastAPI(title="Starship Arena API")
 
@@ -23,6 +28,40 @@ app.add_middleware(
 app.include_router(game_router)
 
 
+@app.middleware("http")
+async def timed(request: Request, call_next):
+    """Every request's time, by the route it matched rather than the path, which would make a
+    series per game and ship."""
+    start = perf_counter()
+    response = await call_next(request)
+    route = request.scope.get('route')
+    metrics.observe('arena_request_seconds', perf_counter() - start, app='api',
+                    method=request.method, route=route.path if route else 'unmatched')
+    return response
+
+
+@app.middleware("http")
+async def counted(request: Request, call_next):
+    """What the request read from disk, logged, and in a header when that is asked for."""
+    with tally.tallied(f"{request.method} {request.url.path}") as reads:
+        response = await call_next(request)
+    if tally.header:
+        response.headers[tally.HEADER] = str(reads)
+    return response
+
+
+@app.exception_handler(GameBusy)
+async def busy(request: Request, e: GameBusy):
+    """Waited its turn behind somebody else changing the game, and ran out of patience."""
+    return JSONResponse(status_code=503, content={'detail': str(e)}, headers={'Retry-After': '5'})
+
+
 @app.get("/api/health")
 def health():
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
+
+
+@app.get("/api/metrics", response_class=PlainTextResponse)
+def exposition():
+    """What every worker has counted, for Prometheus to scrape. See docs/deployment.md."""
+    return PlainTextResponse(metrics.exposition(), media_type=metrics.CONTENT_TYPE)
\ No newline at end of file
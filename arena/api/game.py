@@ -10,6 +10,7 @@ from pydantic import BaseModel
 
 from arena.app.dto import (ValhallaGame, GameSummary, OpenGame, ShipRound, PlayerPlan, GameOverview,
                            GameReplay, ShipTypeInfo, Me, Pulse, Reminders, ServerTime, SoloGame)
+from arena.app.jobs import Job
 from arena.app.players import LOGIN_COOKIE, LOGIN_COOKIE_MAX_AGE, LOGIN_COOKIE_SECURE, Player
 from arena.app.services import GameService
 
@@ -292,8 +293,18 @@ def set_ready(game: str, player: str, body: ReadyBody, me: Player = Depends(requ
     """Saying you are done with the round, which is not the same as having saved orders."""
     if not (me.is_director or me.name == player):
         raise HTTPException(status_code=403, detail=f"{player} is not you.")
-    processed = service.set_ready(game, player, body.ready)
-    return {"ready": service.is_ready(game, player), "processed": processed}
+    job = service.set_ready(game, player, body.ready)
+    return {"ready": service.is_ready(game, player), "job": job.id if job else None}
+
+
+@router.get("/{game}/jobs/{job_id}")
+def job(game: str, job_id: str, me: Player = Depends(require_login)) -> Job:
+    """Where the work a request queued has got to. Saying ready answers before the round is
+    played, and the pulse shows when it is."""
+    found = service.job(job_id)
+    if found is None or found.game != game:
+        raise HTTPException(status_code=404, detail=f"No job {job_id} in {game}.")
+    return found
 
 
 @router.get("/{game}/ships/{ship}/commands")
@@ -283,6 +283,7 @@ class GameSettings:
     on_all_ready: bool
     process_hours: list[int]   # hours of the day it runs on. Empty means never
     announce: bool = True      # tell the players a round has been processed
+    keep_every: int = 0        # keep the world of one round in this many, and the latest. 0: all
 
 
 class By(str, Enum):
@@ -315,6 +316,18 @@ class ReminderTrigger(str, Enum):
         return self.value
 
 
+@dataclass
+class Divergence:
+    """Where a replay first parted from what was recorded when the game was played.
+
+    `name` is the object that parted. `tick` is 0 and `name` empty when a whole round is at
+    issue."""
+    round_nr: int
+    tick: int
+    name: str
+    why: str
+
+
 @dataclass
 class StaleRound:
     """One saved round, read against the code as it is now.
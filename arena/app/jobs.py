@@ -0,0 +1,182 @@
+"""Work too long to do inside a request: playing a round, regenerating a game, exporting one.
+
+A job is a JSON file under the data root's jobs directory, and the directory it is in is its
+state: pending, running, done or failed. A job is claimed by renaming it into running, which only
+one process can win, so the web workers and the CLI's `worker` can all drain the same queue. Every
+file is written whole and renamed into place, so nobody reads a job half written.
+
+Enqueuing starts a thread in this process to drain the queue, if there is none yet. Started on
+first use inside the worker rather than at import, because the host forks after import and a fork
+keeps only the thread that called it. See docs/adr/0008-stateless-and-lazy.md."""
+
+import json
+import logging
+import os
+import secrets
+import threading
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Callable
+
+from arena.app.clock import server_now
+from arena.cfg import JOBS_DIR_NAME
+
+logger = logging.getLogger('starship-arena.jobs')
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+STATES = (PENDING, RUNNING, DONE, FAILED)
+# What a job can be asked to do. `AdminService.run_job` is what does it.
+WHEN_READY = 'ready'
+PROCESS = 'process'
+FORCE = 'force'
+REGENERATE = 'regenerate'
+EXPORT = 'export'
+KINDS = (WHEN_READY, PROCESS, FORCE, REGENERATE, EXPORT)
+# Finished jobs kept per state, newest first. A screen shows the last few of a game.
+KEEP = 200
+
+# Whether enqueuing drains the queue in this process. A test turns it off and drains by hand.
+background = True
+_lock = threading.Lock()
+_drainers = {}
+
+
+@dataclass
+class Job:
+    """Something queued for a game, and what came of it once it ran."""
+    id: str
+    kind: str
+    game: str
+    state: str = PENDING
+    queued: str = ''     # ISO 8601 in server time, as the journal has it
+    started: str = ''
+    finished: str = ''
+    result: str = ''     # what the work said it did
+    error: str = ''
+
+    @property
+    def over(self) -> bool:
+        return self.state in (DONE, FAILED)
+
+
+def _now() -> str:
+    return server_now().isoformat(timespec='seconds')
+
+
+class JobQueue(object):
+    """The queue of one data root, and what runs a job off it."""
+
+    def __init__(self, root: str | Path, run: Callable[[Job], str]):
+        self.directory = Path(root) / JOBS_DIR_NAME
+        self.run = run
+
+    def _path(self, state: str, job_id: str) -> Path:
+        return self.directory / state / f"{job_id}.json"
+
+    def _write(self, job: Job) -> None:
+        path = self._path(job.state, job.id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix('.partial')
+        partial.write_text(json.dumps(asdict(job)))
+        os.replace(partial, path)
+
+    def _read(self, path: Path) -> Job | None:
+        """None when it moved on between being listed and being read."""
+        try:
+            raw = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        return Job(**{f.name: raw[f.name] for f in fields(Job) if f.name in raw})
+
+    def _ids(self, state: str) -> list[str]:
+        """Oldest first, because an id starts with when it was queued."""
+        where = self.directory / state
+        return sorted(p.stem for p in where.glob('*.json')) if where.is_dir() else []
+
+    def enqueue(self, kind: str, game: str) -> Job:
+        """Queue work for a game. The same work still waiting is not queued twice."""
+        for job_id in self._ids(PENDING):
+            waiting = self._read(self._path(PENDING, job_id))
+            if waiting and (waiting.kind, waiting.game) == (kind, game):
+                return waiting
+        job = Job(id=f"{server_now():%Y%m%d-%H%M%S-%f}-{secrets.token_hex(3)}", kind=kind,
+                  game=game, queued=_now())
+        self._write(job)
+        logger.info(f"{game}: queued {kind} as {job.id}")
+        if background:
+            self._drain_in_background()
+        return job
+
+    def job(self, job_id: str) -> Job | None:
+        for state in STATES:
+            found = self._read(self._path(state, job_id))
+            if found:
+                return found
+        return None
+
+    def jobs_of(self, game: str, limit: int = 5) -> list[Job]:
+        """A game's jobs, newest first."""
+        found = [job for state in STATES for job_id in self._ids(state)
+                 if (job := self._read(self._path(state, job_id))) and job.game == game]
+        return sorted(found, key=lambda j: j.id, reverse=True)[:limit]
+
+    def claim(self) -> Job | None:
+        """The oldest job waiting, now running here. None when nothing is left to claim."""
+        for job_id in self._ids(PENDING):
+            running = self._path(RUNNING, job_id)
+            running.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.rename(self._path(PENDING, job_id), running)
+            except FileNotFoundError:
+                continue   # another process got there first
+            job = self._read(running)
+            job.state, job.started = RUNNING, _now()
+            self._write(job)
+            return job
+        return None
+
+    def work(self, job: Job) -> Job:
+        """Run a claimed job and file it under what came of it."""
+        try:
+            job.result, job.state = self.run(job), DONE
+        except Exception as e:
+            logger.exception(f"{job.game}: {job.kind} {job.id} failed")
+            job.error, job.state = str(e), FAILED
+        job.finished = _now()
+        self._write(job)
+        self._path(RUNNING, job.id).unlink(missing_ok=True)
+        self._prune(job.state)
+        return job
+
+    def drain(self) -> list[Job]:
+        """Run jobs until none is waiting. Returns what this call ran."""
+        ran = []
+        while job := self.claim():
+            ran.append(self.work(job))
+        return ran
+
+    def _prune(self, state: str) -> None:
+        for job_id in self._ids(state)[:-KEEP]:
+            self._path(state, job_id).unlink(missing_ok=True)
+
+    def _drain_in_background(self) -> None:
+        """One thread per process and queue, which ends when the queue is empty. It looks once
+        more with the lock held before it goes, so a job queued as it leaves starts another."""
+        key = (os.getpid(), self.directory)
+        with _lock:
+            if key in _drainers:
+                return
+
+            def drain():
+                while True:
+                    self.drain()
+                    with _lock:
+                        if not self._ids(PENDING):
+                            del _drainers[key]
+                            return
+
+            _drainers[key] = threading.Thread(target=drain, name='arena-jobs', daemon=True)
+            _drainers[key].start()
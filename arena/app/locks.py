@@ -0,0 +1,112 @@
+"""One writer per game at a time, across every worker, cron run and job thread on the host.
+
+Advisory and fair. Whoever wants a game's lock takes a ticket, a file in the game's directory under
+the data root's locks, and waits until no live ticket older than theirs is left. Tickets are served
+in the order they were taken, so a stream of saves cannot starve a round that is waiting to run.
+
+A ticket is held open with an flock on it for as long as its owner lives, and renamed into place
+only once it is, so a ticket nobody can lock belongs to somebody alive. One that can be locked was
+left by a process that died, and whoever finds it throws it away.
+
+The same thread asking again for a lock it holds gets it at once, because processing a round can
+end in finishing the game, which moves it."""
+
+import fcntl
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from time import perf_counter
+
+from arena import metrics
+from arena.cfg import LOCKS_DIR_NAME
+
+logger = logging.getLogger('starship-arena.locks')
+
+# How long a request waits behind the writers ahead of it before giving up. Under the host's
+# 300 seconds, so the player hears why rather than getting a 504.
+TIMEOUT_SECONDS = 120
+POLL_SECONDS = 0.05
+
+_held = threading.local()
+
+
+class GameBusy(Exception):
+    """Somebody else was changing the game for longer than anyone should wait."""
+
+    def __init__(self, game: str, waited: float):
+        super().__init__(f"{game} is busy: something else has been changing it for "
+                         f"{waited:.0f} seconds. Try again in a moment.")
+        self.game = game
+
+
+def _alive(ticket: Path) -> bool:
+    try:
+        fd = os.open(ticket, os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    finally:
+        os.close(fd)
+    if not ticket.exists():
+        return False   # its owner let go between the listing and the look
+    logger.warning(f"{ticket.parent.name}: threw away {ticket.name}, left by a process that died")
+    ticket.unlink(missing_ok=True)
+    return False
+
+
+class GameLock(object):
+    """Held for the body of a `with`."""
+
+    def __init__(self, root: str | Path, game: str, operation: str, timeout: float = None):
+        self.directory = Path(root) / LOCKS_DIR_NAME / game
+        self.game = game
+        self.operation = operation
+        self.timeout = TIMEOUT_SECONDS if timeout is None else timeout
+        self.ticket = None
+        self.fd = None
+
+    def __enter__(self):
+        held = _held.__dict__.setdefault('depth', {})
+        if self.directory in held:
+            held[self.directory] += 1
+            return self
+        start = perf_counter()
+        self._take_ticket()
+        while ahead := [t for t in sorted(self.directory.glob('*.ticket'))
+                        if t.name < self.ticket.name and _alive(t)]:
+            waited = perf_counter() - start
+            if waited > self.timeout:
+                self._release()
+                logger.warning(f"{self.game}: {self.operation} gave up behind {ahead[0].name}")
+                raise GameBusy(self.game, waited)
+            time.sleep(POLL_SECONDS)
+        metrics.observe('arena_lock_wait_seconds', perf_counter() - start,
+                        operation=self.operation)
+        held[self.directory] = 1
+        return self
+
+    def __exit__(self, *_):
+        held = _held.depth
+        held[self.directory] -= 1
+        if not held[self.directory]:
+            del held[self.directory]
+            self._release()
+
+    def _take_ticket(self):
+        """Locked before it is visible, so nobody mistakes it for one left behind."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = f"{time.time_ns():020d}-{os.getpid()}-{threading.get_ident()}"
+        taking = self.directory / f"{name}.taking"
+        self.fd = os.open(taking, os.O_CREAT | os.O_RDWR)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        self.ticket = self.directory / f"{name}.ticket"
+        os.rename(taking, self.ticket)
+
+    def _release(self):
+        self.ticket.unlink(missing_ok=True)
+        os.close(self.fd)
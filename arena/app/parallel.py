@@ -0,0 +1,102 @@
+"""Work on many games at once, each in a process of its own, none allowed to run for ever.
+
+A child is forked per game, so one that raises, crashes or hangs takes nothing else with it, and
+at most `workers` run at a time, started in the order the games were given. A child still going
+when its budget runs out is killed and reported as stopped. What it had written by then is the
+previous round or a whole new one, because a world is saved by a rename.
+
+Forked rather than spawned, so a child starts with the caller's services as they stand. Only the
+CLI calls this, from a process that holds no threads. See docs/adr/0008-stateless-and-lazy.md."""
+
+import logging
+import multiprocessing
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from time import monotonic
+from typing import Callable
+
+from arena import metrics
+
+logger = logging.getLogger('starship-arena.parallel')
+
+POLL_SECONDS = 0.5
+
+
+@dataclass
+class Ran:
+    """What came of one game's work."""
+    key: str
+    ok: bool
+    said: str        # what the work returned, or why it did not finish
+    seconds: float
+
+
+def _child(work: Callable[[str], str], key: str, conn):
+    try:
+        conn.send((True, work(key)))
+    except Exception as e:
+        logger.exception(f"{key}: failed")
+        conn.send((False, str(e)))
+    finally:
+        # A child leaves through os._exit, which skips what atexit would have flushed.
+        metrics.flush()
+        conn.close()
+
+
+def each(keys: list[str], work: Callable[[str], str], workers: int, budget: float,
+         told: Callable[[Ran], None] = None) -> list[Ran]:
+    """`work(key)` for every key, in a child each. Answers in the order the keys were given.
+
+    `told` hears each answer in that order too, as soon as it and every one before it are in."""
+    forked = multiprocessing.get_context('fork')
+    waiting, running, done = list(keys), {}, {}
+    heard = 0
+    while waiting or running:
+        while waiting and len(running) < max(1, workers):
+            key = waiting.pop(0)
+            here, there = forked.Pipe(duplex=False)
+            child = forked.Process(target=_child, args=(work, key, there), name=f"arena-{key}")
+            child.start()
+            there.close()
+            running[key] = (child, here, monotonic())
+        answered = wait([conn for _, conn, _ in running.values()], timeout=POLL_SECONDS)
+        for key, (child, conn, started) in list(running.items()):
+            took = monotonic() - started
+            if conn in answered:
+                try:
+                    ok, said = conn.recv()
+                except EOFError:
+                    child.join()
+                    ok, said = False, f"died with exit code {child.exitcode}"
+            elif took > budget:
+                child.kill()
+                ok, said = False, f"still running after {budget:.0f} seconds, stopped"
+                logger.warning(f"{key}: {said}")
+            else:
+                continue
+            child.join()
+            conn.close()
+            del running[key]
+            done[key] = Ran(key=key, ok=ok, said=said, seconds=took)
+        while told and heard < len(keys) and keys[heard] in done:
+            told(done[keys[heard]])
+            heard += 1
+    return [done[key] for key in keys]
+
+
+def here(keys: list[str], work: Callable[[str], str],
+         told: Callable[[Ran], None] = None) -> list[Ran]:
+    """As `each`, but one key after another in this process and with no budget. For when what the
+    work leaves behind in the process is wanted, such as a trace, which a child takes with it."""
+    done = []
+    for key in keys:
+        started = monotonic()
+        try:
+            ok, said = True, work(key)
+        except Exception as e:
+            logger.exception(f"{key}: failed")
+            ok, said = False, str(e)
+        done.append(Ran(key=key, ok=ok, said=said, seconds=monotonic() - started))
+        if told:
+            told(done[-1])
+    return done
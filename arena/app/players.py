@@ -9,6 +9,7 @@ import secrets
 from dataclasses import dataclass
 
 from arena.cfg import PLAYERS_FILE_NAME
+from arena.storage import FileStorage, Storage
 
 logger = logging.getLogger('starship-arena.players')
 
@@ -63,17 +64,19 @@ class Player:
 
 
 class PlayerRegistry:
-    """The people who can log in, read from and written to players.jsonl."""
+    """The people who can log in, read from and written to players.jsonl at the top of the data
+    root, or of whatever store is given."""
 
-    def __init__(self, data_root: str):
+    def __init__(self, data_root: str, store: Storage = None):
         self.path = os.path.join(str(data_root), PLAYERS_FILE_NAME)
+        self.store = store or FileStorage(data_root)
 
     def all(self) -> list[Player]:
         """One JSON object per line. Only `name` is required: see docs/data.md."""
-        if not os.path.exists(self.path):
+        if not self.store.exists(PLAYERS_FILE_NAME):
             return []
         players = []
-        with open(self.path) as f:
+        with self.store.reading(PLAYERS_FILE_NAME, kind='players') as f:
             for number, line in enumerate(f, start=1):
                 if not line.strip() or line.lstrip().startswith('#'):
                     continue
@@ -181,6 +184,5 @@ class PlayerRegistry:
         return record
 
     def _save(self, players: list[Player]) -> None:
-        with open(self.path, 'w') as f:
-            for p in sorted(players, key=lambda x: x.name):
-                f.write(json.dumps(self._record(p)) + '\n')
\ No newline at end of file
+        self.store.write(PLAYERS_FILE_NAME, ''.join(json.dumps(self._record(p)) + '\n'
+                                                    for p in sorted(players, key=lambda x: x.name)))
\ No newline at end of file
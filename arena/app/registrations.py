@@ -6,6 +6,7 @@ import re
 from dataclasses import dataclass, field
 
 from arena.cfg import REGISTRATION_FILE_NAME
+from arena.storage import FileStorage, Storage
 
 # A ship's name ends up in a command file's name, so it has to survive being part of a path.
 SHIP_NAME = re.compile(r'[A-Za-z][A-Za-z0-9_-]*$')
@@ -23,16 +24,17 @@ class Registration:
 
 
 class RegistrationFile:
-    """One JSON object per line, in the game's own directory."""
+    """One JSON object per line, in the game's own directory, or its store when it is given one."""
 
-    def __init__(self, game_dir: str):
+    def __init__(self, game_dir: str, store: Storage = None):
         self.path = os.path.join(str(game_dir), REGISTRATION_FILE_NAME)
+        self.store = store or FileStorage(game_dir)
 
     def all(self) -> list[Registration]:
-        if not os.path.exists(self.path):
+        if not self.store.exists(REGISTRATION_FILE_NAME):
             return []
         entries = []
-        with open(self.path) as f:
+        with self.store.reading(REGISTRATION_FILE_NAME, kind='registrations') as f:
             for number, line in enumerate(f, start=1):
                 if not line.strip() or line.lstrip().startswith('#'):
                     continue
@@ -78,9 +80,10 @@ class RegistrationFile:
         self._save(entries)
 
     def _save(self, entries: list[Registration]) -> None:
-        with open(self.path, 'w') as f:
-            for e in sorted(entries, key=lambda x: x.player):
-                record = {'player': e.player, 'names': e.names}
-                if e.faction:
-                    record['faction'] = e.faction
-                f.write(json.dumps(record) + '\n')
\ No newline at end of file
+        lines = []
+        for e in sorted(entries, key=lambda x: x.player):
+            record = {'player': e.player, 'names': e.names}
+            if e.faction:
+                record['faction'] = e.faction
+            lines.append(json.dumps(record) + '\n')
+        self.store.write(REGISTRATION_FILE_NAME, ''.join(lines))
\ No newline at end of file
@@ -7,20 +7,25 @@ import logging
 import random
 import re
 import shutil
+import tempfile
 from collections import defaultdict
 from dataclasses import asdict
 from datetime import datetime, time, timedelta
+from functools import wraps
 from math import atan2, degrees
 from pathlib import Path
+from typing import Callable
 from zoneinfo import available_timezones
 
 from arena.announce import Announcer
 from arena.cfg import (ADMIN_UI_URL, COMMANDS_DIR, INIT_FILE_NAME, MANUAL_FILENAME, PLAY_URL,
-                       REGISTRATION_FILE_NAME, STATUS_FILE_TEMPLATE)
+                       PROCESS_DUE_BUDGET_SECONDS, PROCESS_DUE_WORKERS, REGENERATE_BUDGET_SECONDS,
+                       REGENERATE_WORKERS, REGISTRATION_FILE_NAME, STATUS_FILE_TEMPLATE)
 from arena.errors import UnreadableWorld
-from arena.engine.admin import GameSetup, regenerate_game as engine_regenerate_game
+from arena.engine.admin import (GameSetup, regenerate_game as engine_regenerate_game, stage,
+                                verify_game as engine_verify_game)
 from arena.engine.command import parse_commands
-from arena.engine.game import Game
+from arena.engine.game import Game, world_of
 from arena.engine.gamedirectory import (BodyFile, GAMES_ROOT, GameDirectory, GamesIn, GamesRoot,
                                         ShipFile)
 from arena.engine.history import Tick
@@ -28,16 +33,20 @@ from arena.engine.objects.registry.builder import all_fielded_types
 from arena.engine.objects.event import BeamEvent, ExplosionEvent, HitEvent
 from arena.engine.objects.objectinspace import Stance
 from arena.engine.replay import Replay
-from arena.app import from_valhalla, scenarios, valhalla
+from arena.storage import Storage
+from arena.app import from_valhalla, jobs, parallel, scenarios, valhalla
 from arena.app.clock import next_occurrence, server_now, their_hour_today, zone_name
 from arena.app.naming import SOLO_PREFIX, for_display, is_solo_game_name, solo_game_name
+from arena.app.jobs import Job, JobQueue
+from arena.app.locks import GameLock
+from arena.app.parallel import Ran
 from arena.app.players import DIRECTOR, LOGIN_COOKIE, PLAYER, Player, PlayerRegistry
 from arena.app.registrations import Registration, RegistrationFile
 from arena.app.dto import (
     CommanderScore, ValhallaGame, ValhallaSide, FormingGame, GameSummary, OpenGame, ShipLimits,
     ScanInfo, TickState, ShipRound, CommandCheck,
     TrackPoint, TickEvent, TickCondition, ComponentStatus, Contact, ShipPlan, PlayerPlan, Explosion,
-    Effect, Beam, GameReplay, ReplayObject, ObjectTick, StaleRound,
+    Effect, Beam, GameReplay, ReplayObject, ObjectTick, StaleRound, Divergence,
     WeaponInfo, ComponentInput,
     Outcome, ShipSummary, FactionSummary, GameOverview, GameStanding, ShipTypeInfo, Me, LoginInfo,
     GameSettings, GameState, Pulse, GamePulse, JournalEntry, By, ProcessingTrigger,
@@ -64,13 +73,27 @@ def _entry(raw: dict) -> JournalEntry:
                         detail={k: str(v) for k, v in raw.items() if k not in ('at', 'event')})
 
 
+def _locked(method):
+    """Hold the game's write lock for the whole of a method whose first argument is the game.
+    See arena/app/locks.py."""
+    @wraps(method)
+    def locked(self, game: str, *args, **kwargs):
+        with GameLock(self.dirs.root, game, method.__name__):
+            return method(self, game, *args, **kwargs)
+    return locked
+
+
 class _EngineAccess:
     """Shared engine/storage access. The GameDirectory never leaves this layer."""
 
-    def __init__(self, data_root: str | Path = None, announcer: Announcer = None):
-        self.dirs = GamesRoot(Path(data_root)) if data_root is not None else GAMES_ROOT
-        self.players = PlayerRegistry(self.dirs.root)
+    def __init__(self, data_root: str | Path = None, announcer: Announcer = None,
+                 store: Storage = None):
+        """`store` keeps the games and the registry of a data root that is given, as GAME_DATABASE
+        does for the configured one."""
+        self.dirs = GamesRoot(Path(data_root), store) if data_root is not None else GAMES_ROOT
+        self.players = PlayerRegistry(self.dirs.root, self.dirs.store)
         self.announcer = announcer if announcer is not None else Announcer()
+        self.job_queue = JobQueue(self.dirs.root, self._run_job)
 
     def _gd(self, game: str) -> GameDirectory:
         """A playable game, so nothing above this line asks which root it is kept in."""
@@ -92,6 +115,11 @@ class _EngineAccess:
         GameSetup(gd, ShipFile(gd, placed), BodyFile(gd, scenario.bodies(rng))).execute()
         gd.write_scenario(scenario.key)
 
+    def _run_job(self, job: Job) -> str:
+        """The director's service does the work, whoever queued it: a player saying ready sets
+        off a round the way a director would."""
+        return AdminService(self.dirs.root, self.announcer).run_job(job)
+
     def _append_journal(self, game: str, event: str, **detail) -> None:
         """Add a line to the game's journal. Real time enters here, never below."""
         self._gd(game).append_journal({'at': server_now().isoformat(timespec='seconds'),
@@ -126,16 +154,30 @@ class _EngineAccess:
         """Over: no more orders and no more rounds, still there for everyone who played it."""
         self._move_game(name, GamesIn.Finished)
 
+    @_locked
     def _move_game(self, name: str, to: GamesIn) -> None:
-        source = next((where for where in MOVABLE_ROOTS
-                       if (self.dirs.path(where) / name).is_dir()), None)
+        source = next((where for where in MOVABLE_ROOTS if self.dirs.holds(where, name)), None)
         if source is None:
             raise ValueError(f"There is no shared game called '{name}'.")
-        target = self.dirs.path(to) / name
-        if target.exists():
+        if self.dirs.holds(to, name):
             raise ValueError(f"A game called '{name}' is already {to}.")
-        target.parent.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(self.dirs.path(source) / name), str(target))
+        moved = self.dirs.move(name, source, to)
+        if to.packed:
+            moved.pack()
+        else:
+            moved.unpack()
+
+    def pack_games(self) -> list[str]:
+        """Pack every finished and archived game with a file outside its pack. Answers which."""
+        loose = [gd.game_name for where in GamesIn if where.packed
+                 for gd in self.dirs.directories_in(where) if gd.loose_names]
+        for name in loose:
+            self._pack(name)
+        return loose
+
+    @_locked
+    def _pack(self, name: str) -> None:
+        self.dirs.locate(name).pack()
 
     def _announce_round_processed(self, game: str, round_nr: int) -> None:
         """Tell the players a round is out, if this game is set to."""
@@ -239,14 +281,19 @@ class _EngineAccess:
     def scenario_of(self, game: str) -> str:
         return self.dirs.locate(game).read_scenario()
 
+    def _registration_file(self, game: str, where: GamesIn = GamesIn.Registering):
+        return RegistrationFile(self.dirs.path(where) / game,
+                                self.dirs.stored.within(f"{where}/{game}"))
+
     def registrations(self, game: str) -> list[Registration]:
         """Whoever registered, wherever the game is: still forming, or already started."""
-        forming = self.dirs.registering / game
-        return RegistrationFile(forming if forming.exists()
-                                else self.dirs.games / game).all()
+        forming = self.dirs.holds(GamesIn.Registering, game)
+        return self._registration_file(game, GamesIn.Registering if forming
+                                       else GamesIn.Active).all()
 
+    @_locked
     def assign(self, game: str, factions: dict[str, str]) -> None:
-        RegistrationFile(self.dirs.registering / game).assign(factions)
+        self._registration_file(game).assign(factions)
 
     def forming_games(self) -> list[FormingGame]:
         """Every game collecting registrations, with how much has come in."""
@@ -260,12 +307,14 @@ class _EngineAccess:
                                        assigned=sum(1 for e in entries if e.faction)))
         return forming
 
+    @_locked
     def register(self, game: str, player: str, names: list[str]) -> Registration:
         scenario = scenarios.by_key(self.scenario_of(game))
-        return RegistrationFile(self.dirs.registering / game).put(player, names, scenario.max_ships)
+        return self._registration_file(game).put(player, names, scenario.max_ships)
 
+    @_locked
     def withdraw(self, game: str, player: str) -> None:
-        RegistrationFile(self.dirs.registering / game).remove(player)
+        self._registration_file(game).remove(player)
 
     def playable_games_on_disk(self) -> dict[str, int]:
         """Every playable game against the round it is on, read from the file names alone.
@@ -355,18 +404,25 @@ class _EngineAccess:
         raw = gd.read_settings()
         return GameSettings(on_all_ready=raw.get('process_on_all_ready', False),
                             process_hours=sorted(raw.get('process_hours', [])),
-                            announce=raw.get('announce', True))
+                            announce=raw.get('announce', True),
+                            keep_every=raw.get('keep_every', 0))
 
     def settings(self, game: str) -> GameSettings:
         return self._settings_of(self._gd(game))
 
+    @_locked
     def save_settings(self, game: str, settings: GameSettings) -> None:
         hours = sorted(set(settings.process_hours))
         if any(not 0 <= h <= 23 for h in hours):
             raise ValueError(f"Hours run from 0 to 23: {hours}")
-        self._gd(game).write_settings({'process_on_all_ready': settings.on_all_ready,
-                                       'process_hours': hours,
-                                       'announce': settings.announce})
+        if settings.keep_every < 0:
+            raise ValueError(f"Keep one round in {settings.keep_every}? 0 keeps every round.")
+        gd = self._gd(game)
+        gd.write_settings({'process_on_all_ready': settings.on_all_ready,
+                           'process_hours': hours,
+                           'announce': settings.announce,
+                           'keep_every': settings.keep_every})
+        gd.keep_only_keyframes()
 
     def all_ready(self, game: str) -> bool:
         players = {p for p in Game(self._gd(game)).players if p}
@@ -379,21 +435,39 @@ class _EngineAccess:
         gd = self._gd(game)
         return gd.is_ready(player, gd.last_round_number + 1)
 
-    def set_ready(self, game: str, player: str, ready: bool) -> bool:
-        """Returns whether saying so processed the round."""
+    @_locked
+    def set_ready(self, game: str, player: str, ready: bool) -> Job | None:
+        """Returns the job queued to play the round, when saying so made everyone ready."""
         gd = self._active_gd(game)
         gd.set_ready(player, gd.last_round_number + 1, ready)
-        if ready and self.settings(game).on_all_ready and self.all_ready(game):
-            g = Game(self._gd(game))
-            if g.current_round_ready:
-                round_nr = g.current_round_nr
-                g.process_current_round()
-                self._append_journal(game, 'processed', round=round_nr,
-                                     by=By.PLAYER, trigger=ProcessingTrigger.ALL_READY)
-                self._announce_round_processed(game, round_nr)
-                self._settle(game)
-                return True
-        return False
+        if ready and self._due_on_all_ready(game):
+            return self.job_queue.enqueue(jobs.WHEN_READY, game)
+        return None
+
+    def _due_on_all_ready(self, game: str) -> bool:
+        return (self.settings(game).on_all_ready and self.all_ready(game)
+                and Game(self._gd(game)).current_round_ready)
+
+    @_locked
+    def process_when_ready(self, game: str) -> bool:
+        """Play the round if everyone is still ready for it. Asked again when the job runs,
+        because a player can take it back while the job waits. Returns whether it ran."""
+        if not self._due_on_all_ready(game):
+            return False
+        g = Game(self._active_gd(game))
+        round_nr = g.current_round_nr
+        g.process_current_round()
+        self._append_journal(game, 'processed', round=round_nr,
+                             by=By.PLAYER, trigger=ProcessingTrigger.ALL_READY)
+        self._announce_round_processed(game, round_nr)
+        self._settle(game)
+        return True
+
+    def job(self, job_id: str) -> Job | None:
+        return self.job_queue.job(job_id)
+
+    def jobs_of(self, game: str) -> list[Job]:
+        return self.job_queue.jobs_of(game)
 
     def pulse(self, game: str, player: str) -> Pulse:
         """Read from the ships file and the ready files only: no round is unpickled, because
@@ -561,10 +635,7 @@ class GameService(_EngineAccess):
         scenario = scenarios.SOLO
         name = solo_game_name(player)
         ships = scenario.roster(player, picks, random.Random())
-        self.dirs.solo.mkdir(parents=True, exist_ok=True)
-        theirs = self.dirs.solo / name
-        if theirs.exists():
-            shutil.rmtree(theirs)
+        self.dirs.remove(GamesIn.Solo, name)
         self._build_game(self.dirs.directory_in(GamesIn.Solo, name), scenario, ships)
         self.save_settings(name, GameSettings(on_all_ready=True, process_hours=[], announce=False))
         return self.solo_game(player)
@@ -608,11 +679,11 @@ class GameService(_EngineAccess):
                 checks.append(CommandCheck(line=c.command_line.text, ok=c.is_valid, feedback=c.feedback_results))
         return checks
 
+    @_locked
     def save_commands(self, game: str, ship_name: str, lines: list[str]) -> None:
         gd = self._active_gd(game)
         round_nr = gd.last_round_number + 1
-        with open(gd.command_file(ship_name, round_nr), 'w') as f:
-            f.write('\n'.join(lines))
+        gd.write_command_file(ship_name, round_nr, lines)
 
     def get_player_plan(self, game: str, player: str, round_nr: int = None) -> PlayerPlan:
         """The faction-shared picture for a player at the end of a round.
@@ -628,7 +699,7 @@ class GameService(_EngineAccess):
             round_nr = last_round
         if not 0 <= round_nr <= last_round:
             raise KeyError(f"{game} has no round {round_nr}")
-        world = gd.load_world(round_nr)
+        world = world_of(gd, round_nr)
         ois = world.objects
         factions = self._factions_of(world, player)
         if not factions:
@@ -981,7 +1052,7 @@ class GameService(_EngineAccess):
 
     @staticmethod
     def _load_ship(gd: GameDirectory, ship_name: str, round_nr: int):
-        world = gd.load_world(round_nr)
+        world = world_of(gd, round_nr)
         if ship_name in world.graveyard:
             return world.graveyard[ship_name]
         return world.objects[ship_name]
@@ -1016,9 +1087,13 @@ class AdminService(_EngineAccess):
 
         Called once an hour by cron, which is where the timing comes from: the games say which
         hour they want, and nothing here measures elapsed time. Deadlines override readiness, so a
-        due game processes whether the orders are in or not."""
+        due game processes whether the orders are in or not.
+
+        The due games play side by side, each in a process of its own, the one whose round has
+        waited longest first. A round still playing after PROCESS_DUE_BUDGET_SECONDS is stopped
+        and journalled as failed, unless it was saved before it was."""
         now = server_now()
-        run = []
+        run, due = [], {}
         for game in self.list_games():
             try:
                 if now.hour not in self.settings(game.name).process_hours:
@@ -1026,17 +1101,50 @@ class AdminService(_EngineAccess):
                 if self._deadline_already_fired(game.name, now):
                     run.append(f"{game.name}: this hour's deadline has already run")
                     continue
-                logger.info(f"{game.name}: processing round {game.current_round}")
-                silent = self.force_process_turn(game.name, By.CRON, ProcessingTrigger.DEADLINE)
-                run.append(f"{game.name}: round {game.current_round} processed"
-                           + (f", no orders from {', '.join(silent)}" if silent else ""))
+                due[game.name] = game
             except Exception as e:
                 # One unreadable game must not stop the rest of the hour's work.
-                run.append(f"{game.name}: FAILED, {e}")
-                self._append_journal(game.name, 'failed', round=game.current_round,
-                                     by=By.CRON, trigger=ProcessingTrigger.DEADLINE, error=str(e))
+                run.append(self._failed_due(game, str(e)))
+        oldest_first = sorted(due, key=self._round_opened)
+        for ran in parallel.each(oldest_first, self._play_due, PROCESS_DUE_WORKERS,
+                                 PROCESS_DUE_BUDGET_SECONDS):
+            run.append(f"{ran.key}: {ran.said}" if ran.ok else self._stopped_due(due[ran.key], ran))
         return run
 
+    def _round_opened(self, game: str) -> str:
+        """When the round being planned began: its last round played, or never."""
+        return next((raw['at'] for raw in reversed(self._gd(game).read_journal())
+                     if raw['event'] == 'processed'), '')
+
+    def _play_due(self, game: str) -> str:
+        round_nr = self._gd(game).last_round_number + 1
+        logger.info(f"{game}: processing round {round_nr}")
+        silent = self.force_process_turn(game, By.CRON, ProcessingTrigger.DEADLINE)
+        return f"round {round_nr} processed" + (f", no orders from {', '.join(silent)}"
+                                                 if silent else "")
+
+    def _stopped_due(self, game: GameSummary, ran: Ran) -> str:
+        """A child stopped or dead can have saved the round first. Then the round was played, and
+        it is journalled and announced as played, if the child did not get that far itself."""
+        round_nr = game.current_round
+        with GameLock(self.dirs.root, game.name, 'process_due'):
+            gd = self._gd(game.name)
+            if gd.last_round_number < round_nr:
+                return self._failed_due(game, ran.said)
+            if not any(raw['event'] == 'processed' and raw.get('round') == round_nr
+                       for raw in gd.read_journal()):
+                self._append_journal(game.name, 'processed', round=round_nr,
+                                     by=By.CRON, trigger=ProcessingTrigger.DEADLINE)
+                self._announce_round_processed(game.name, round_nr)
+                if gd.active:
+                    self._settle(game.name)
+        return f"{game.name}: round {round_nr} processed, then {ran.said}"
+
+    def _failed_due(self, game: GameSummary, error: str) -> str:
+        self._append_journal(game.name, 'failed', round=game.current_round,
+                             by=By.CRON, trigger=ProcessingTrigger.DEADLINE, error=error)
+        return f"{game.name}: FAILED, {error}"
+
     def remind_due(self) -> list[str]:
         """Poke the players who still owe orders and asked to be poked.
 
@@ -1130,22 +1238,24 @@ class AdminService(_EngineAccess):
         """Out of every list. Its data is untouched."""
         self._move_game(name, GamesIn.Archived)
 
+    @_locked
     def delete_archived_game(self, name: str) -> None:
         """Delete for good. Only reaches into the archive, so a live game cannot be lost here."""
-        shutil.rmtree(self.dirs.archived / name)
+        if not self.dirs.holds(GamesIn.Archived, name):
+            raise FileNotFoundError(f"There is no archived game called '{name}'.")
+        self.dirs.remove(GamesIn.Archived, name)
 
+    @_locked
     def export_to_valhalla(self, name: str) -> str:
         """Write a playable game into the museum as text, and answer where it landed.
 
         A copy rather than a move, so exporting again overwrites.
         See docs/adr/0034-a-finished-game-is-exported-to-a-schema-of-its-own.md."""
-        into = self.dirs.valhalla / name
-        into.mkdir(parents=True, exist_ok=True)
         museum = self.dirs.directory_in(GamesIn.Valhalla, name)
         text = valhalla.export(Replay(self._gd(name)), name)
         museum.write_replay(text)
         self._gd(name).copy_roster_to(museum)
-        return str(into)
+        return museum.path
 
     def save_synopsis(self, game: str, text: str) -> None:
         """The director's account of a game, which is what its entry in Valhalla is introduced by.
@@ -1196,7 +1306,6 @@ class AdminService(_EngineAccess):
     def create_game(self, name: str, ships: list[dict], scenario: str) -> None:
         """Name a game and build it: its roster deployed, its terrain in place."""
         self._claim_name(name)
-        self.dirs.games.mkdir(parents=True, exist_ok=True)
         self._build_game(self.dirs.directory_in(GamesIn.Active, name),
                          scenarios.by_key(scenario), ships)
 
@@ -1206,45 +1315,41 @@ class AdminService(_EngineAccess):
         """Name a game and start collecting registrations for it."""
         scenarios.by_key(scenario)
         self._claim_name(name)
-        (self.dirs.registering / name).mkdir(parents=True)
         self.dirs.directory_in(GamesIn.Registering, name).write_scenario(scenario)
 
     def is_reopenable(self, name: str) -> bool:
         """Built from registrations and no round played yet, so the roster can still be redealt."""
         gd = self.dirs.directory_in(GamesIn.Active, name)
-        return (gd.last_round_number <= 0
-                and (self.dirs.games / name / REGISTRATION_FILE_NAME).exists())
+        return gd.last_round_number <= 0 and gd.file_exists(REGISTRATION_FILE_NAME)
 
+    @_locked
     def reopen_registrations(self, name: str) -> None:
         """Put a started game back into registration, roster and all.
 
         Only before its first round: after that the roster is what people have been playing."""
-        source = self.dirs.games / name
         gd = self.dirs.directory_in(GamesIn.Active, name)
         if gd.last_round_number > 0:
             raise ValueError(f"'{name}' has played rounds. Archive it instead.")
-        if not (source / REGISTRATION_FILE_NAME).exists():
+        if not gd.file_exists(REGISTRATION_FILE_NAME):
             raise ValueError(f"'{name}' was not built from registrations.")
-        for leftover in (INIT_FILE_NAME, STATUS_FILE_TEMPLATE.format(0)):
-            (source / leftover).unlink(missing_ok=True)
-        shutil.rmtree(source / COMMANDS_DIR, ignore_errors=True)
-        self.dirs.registering.mkdir(parents=True, exist_ok=True)
-        shutil.move(str(source), str(self.dirs.registering / name))
+        for leftover in (INIT_FILE_NAME, STATUS_FILE_TEMPLATE.format(0), COMMANDS_DIR.rstrip('/')):
+            gd.store.remove(leftover)
+        self.dirs.move(name, GamesIn.Active, GamesIn.Registering)
 
+    @_locked
     def start_game(self, name: str, ships: list[dict], settings: GameSettings) -> None:
         """Move the directory into play, write the roster, keep the registrations as the record."""
-        self.dirs.games.mkdir(parents=True, exist_ok=True)
-        target = self.dirs.games / name
-        if target.exists():
+        if self.dirs.holds(GamesIn.Active, name):
             raise ValueError(f"A game called '{name}' is already being played.")
         # Asked before the move, because the scenario is read from where the game is registering.
         scenario = self.scenario_of(name)
-        shutil.move(str(self.dirs.registering / name), str(target))
+        self.dirs.move(name, GamesIn.Registering, GamesIn.Active)
         # The name was claimed when registrations opened, and the directory is already here.
         self._build_game(self.dirs.directory_in(GamesIn.Active, name),
                          scenarios.by_key(scenario), ships)
         self.save_settings(name, settings)
 
+    @_locked
     def spawn_ship(self, game: str, name: str, ship_type: str, player: str = '',
                    faction: str = None, x: int = 0, y: int = 0, heading: int = 0,
                    round_nr: int = None, tick: int = 1) -> None:
@@ -1273,6 +1378,7 @@ class AdminService(_EngineAccess):
             record['faction'] = faction
         gd.append_spawn(record)
 
+    @_locked
     def process_turn(self, game: str) -> bool:
         """Process only when every order is in. Returns whether it ran."""
         g = Game(self._active_gd(game))
@@ -1286,6 +1392,7 @@ class AdminService(_EngineAccess):
         self._settle(game)
         return True
 
+    @_locked
     def force_process_turn(self, game: str, by: By, trigger: ProcessingTrigger) -> list[str]:
         """Process whether or not the orders are in, writing an empty file for those that are not.
 
@@ -1296,8 +1403,7 @@ class AdminService(_EngineAccess):
         round_nr = g.current_round_nr
         silent = sorted(g.missing_command_files)
         for ship in silent:
-            with open(gd.command_file(ship, round_nr), 'w') as f:
-                f.write('')
+            gd.write_command_file(ship, round_nr, [])
         Game(gd).process_current_round()
         detail = {'round': round_nr, 'by': by, 'trigger': trigger}
         if silent:
@@ -1311,7 +1417,7 @@ class AdminService(_EngineAccess):
         """Every saved round of a game read against today's code, oldest first."""
         gd = self._gd(game)
         out = []
-        for nr in range(gd.last_round_number + 1):
+        for nr in gd.saved_rounds:
             try:
                 out.append(StaleRound(round_nr=nr, missing=gd.missing_in(nr)))
             except UnreadableWorld as e:
@@ -1319,11 +1425,98 @@ class AdminService(_EngineAccess):
         return out
 
     def regenerate_game(self, game: str) -> int:
-        """Replay from the plans, back to the round it was on. Returns the round it ended on."""
-        to_round = engine_regenerate_game(self._gd(game))
-        self._append_journal(game, 'regenerated', round=to_round, by=By.DIRECTOR)
+        """Replay from the plans, back to the round it was on. Returns the round it ended on.
+
+        The game is held while it is copied out and while the replay is swapped in, not while it
+        plays. A replay that stops short is thrown away, and the game keeps the rounds it had. So
+        is one of a game that played a round meanwhile, or whose last round's orders changed."""
+        gd = self._gd(game)
+        staged = self.dirs.staging_for(gd)
+        try:
+            with GameLock(self.dirs.root, game, 'regenerate_game'):
+                was = gd.last_round_number
+                played_from = (gd.where, was, gd.read_inputs(was))
+                stage(gd, staged)
+            to_round = engine_regenerate_game(staged, was)
+            with GameLock(self.dirs.root, game, 'regenerate_game'):
+                gd = self._gd(game)
+                if to_round < was:
+                    self._append_journal(game, 'failed', round=was, by=By.DIRECTOR,
+                                         error=f"a replay stopped at round {to_round}")
+                elif (gd.where, gd.last_round_number, gd.read_inputs(was)) != played_from:
+                    self._append_journal(game, 'failed', round=was, by=By.DIRECTOR,
+                                         error="the game moved on while it was replayed")
+                    raise ValueError(f"{game} moved on while it was replayed, so the replay is "
+                                     f"thrown away. Regenerate it again.")
+                else:
+                    gd.take_worlds_from(staged)
+                    self._append_journal(game, 'regenerated', round=to_round, by=By.DIRECTOR)
+        finally:
+            shutil.rmtree(Path(staged.path).parent, ignore_errors=True)
         return to_round
 
+    def verify_game(self, game: str) -> Divergence | None:
+        """Replay the game in a scratch directory, tick by tick against what each tick came to
+        when it was played. The game is held only while its files are copied out."""
+        gd = self._gd(game)
+        with tempfile.TemporaryDirectory() as scratch:
+            copy = GameDirectory(scratch, game, gd.where)
+            with GameLock(self.dirs.root, game, 'verify_game'):
+                recorded = {nr: gd.read_ticks(nr) for nr in range(gd.last_round_number + 1)}
+                gd.copy_plans_to(copy)
+            found = engine_verify_game(recorded, copy)
+        return Divergence(*found) if found else None
+
+    def regenerate_games(self, games: list[str], told: Callable[[Ran], None] = None,
+                         in_process: bool = False) -> list[Ran]:
+        """Replay several games side by side, each in a process of its own, at most
+        REGENERATE_WORKERS at once. A game's answer is the round it ended on, or why it did not
+        finish. `told` hears them in the order the games were given, as they come in.
+
+        `in_process` plays them one after another in this process instead, with no budget, so a
+        trace started here sees their rounds."""
+        if in_process:
+            return parallel.here(games, self._regenerated_to, told)
+        return parallel.each(games, self._regenerated_to, REGENERATE_WORKERS,
+                             REGENERATE_BUDGET_SECONDS, told)
+
+    def _regenerated_to(self, game: str) -> str:
+        return str(self.regenerate_game(game))
+
+    # ---------------------------------------------------------------------- JOBS
+
+    def queue(self, kind: str, game: str) -> Job:
+        """Have a job do it, and answer at once. What came of it is in `job` later."""
+        if kind not in jobs.KINDS:
+            raise ValueError(f"There is no job called '{kind}'.")
+        self._gd(game)
+        return self.job_queue.enqueue(kind, game)
+
+    def run_job(self, job: Job) -> str:
+        """Do what a job asks, and say what came of it in the words the console uses."""
+        game = job.game
+        round_nr = self._gd(game).last_round_number + 1
+        if job.kind == jobs.WHEN_READY:
+            return (f"Round {round_nr} processed." if self.process_when_ready(game)
+                    else "Nothing processed: not everyone is ready any more.")
+        if job.kind == jobs.PROCESS:
+            return (f"Round {round_nr} processed." if self.process_turn(game)
+                    else "Nothing processed: orders are still missing.")
+        if job.kind == jobs.FORCE:
+            silent = self.force_process_turn(game, By.DIRECTOR, ProcessingTrigger.MANUAL_FORCED)
+            return f"Round {round_nr} processed." + (
+                f" No orders from {', '.join(silent)}." if silent else "")
+        if job.kind == jobs.REGENERATE:
+            was = round_nr - 1
+            now = self.regenerate_game(game)
+            return f"Replayed to round {now}." + (
+                f" It stopped short of round {was}: orders are missing for a round in between."
+                f" The rounds it had are kept." if now < was else "")
+        if job.kind == jobs.EXPORT:
+            self.export_to_valhalla(game)
+            return "On show in Valhalla."
+        raise ValueError(f"There is no job called '{job.kind}'.")
+
     def command_status(self, game: str) -> dict[str, bool]:
         return Game(self._gd(game)).command_file_status
 
@@ -65,6 +65,32 @@ LOG_FILE_LEVEL = os.environ.get('LOG_FILE_LEVEL', 'DEBUG')  # what the file keep
 LOG_FILE_BYTES = int(os.environ.get('LOG_FILE_BYTES', 1_000_000))
 LOG_FILE_KEEP = int(os.environ.get('LOG_FILE_KEEP', 10))
 
+# Where every process adds what it counted, so /api/metrics can answer for all the preforked
+# workers and the cron runs together. Empty means nothing is counted, which is what the test
+# suite and a development machine want. Relative means inside the repository.
+METRICS_DIR = os.environ.get('METRICS_DIR', getattr(secret, 'METRICS_DIR', ''))
+if METRICS_DIR and not os.path.isabs(METRICS_DIR):
+    METRICS_DIR = os.path.join(REPO_ROOT, METRICS_DIR)
+
+# process_due plays the games due this hour side by side, this many at once, and stops any still
+# playing its round after the budget. See docs/deployment.md#processing-on-the-clock.
+PROCESS_DUE_WORKERS = int(os.environ.get('PROCESS_DUE_WORKERS',
+                                         getattr(secret, 'PROCESS_DUE_WORKERS', os.cpu_count() or 1)))
+PROCESS_DUE_BUDGET_SECONDS = float(os.environ.get('PROCESS_DUE_BUDGET_SECONDS',
+                                                  getattr(secret, 'PROCESS_DUE_BUDGET_SECONDS', 600)))
+
+# regenerate replays the playable games side by side in the same way, with an hour each. See
+# docs/deployment.md.
+REGENERATE_WORKERS = int(os.environ.get('REGENERATE_WORKERS',
+                                        getattr(secret, 'REGENERATE_WORKERS', os.cpu_count() or 1)))
+REGENERATE_BUDGET_SECONDS = float(os.environ.get('REGENERATE_BUDGET_SECONDS',
+                                                 getattr(secret, 'REGENERATE_BUDGET_SECONDS', 3600)))
+
+# How many rounds played again for a game that keeps only some of its worlds stay in the shared
+# cache, the least recently read going first. See docs/data.md#keeping-fewer-rounds.
+WORLD_CACHE_ROUNDS = int(os.environ.get('WORLD_CACHE_ROUNDS',
+                                        getattr(secret, 'WORLD_CACHE_ROUNDS', 200)))
+
 MANUAL_FILENAME = os.path.join(REPO_ROOT, "starship-arena-manual.pdf")
 
 # File and directory names wrt the game data root
@@ -79,6 +105,13 @@ if not os.path.isabs(GAME_DATA_DIR):
     GAME_DATA_DIR = os.path.join(REPO_ROOT, GAME_DATA_DIR)
 logger.info(f"cfg.py: Loading game data from {GAME_DATA_DIR}")
 
+# The games and the player registry kept as rows of this SQLite database rather than as files in
+# GAME_DATA_DIR, which still holds the jobs, the locks, the staging area and the world cache.
+# Empty means files. Relative means inside GAME_DATA_DIR. See docs/data.md#one-database.
+GAME_DATABASE = os.environ.get('GAME_DATABASE', getattr(secret, 'GAME_DATABASE', ''))
+if GAME_DATABASE and not os.path.isabs(GAME_DATABASE):
+    GAME_DATABASE = os.path.join(GAME_DATA_DIR, GAME_DATABASE)
+
 ARCHIVE_DIR_NAME = "archived"
 FINISHED_DIR_NAME = "finished"
 REGISTERING_DIR_NAME = "registering"
@@ -86,6 +119,10 @@ GAMES_DIR_NAME = "games"
 SOLO_DIR_NAME = "solo-games"
 VALHALLA_DIR_NAME = "valhalla"
 PLAYERS_FILE_NAME = "players.jsonl"
+JOBS_DIR_NAME = "jobs"
+LOCKS_DIR_NAME = "locks"
+STAGING_DIR_NAME = "staging"
+CACHE_DIR_NAME = "cache"
 
 
 # The data root itself is `GamesRoot`, in arena/engine/gamedirectory.py: it hands out game
@@ -94,6 +131,11 @@ PLAYERS_FILE_NAME = "players.jsonl"
 # File and directory names inside each game folder
 
 STATUS_FILE_TEMPLATE = "status_round_{}.pickle"
+INPUTS_FILE_TEMPLATE = "status_round_{}.inputs"
+TICKS_FILE_TEMPLATE = "status_round_{}.ticks"
+# A regenerate that cannot read the last round it could keep falls back to the latest round that is
+# a multiple of this, and replays from there. A game that keeps only some worlds uses its own.
+KEYFRAME_ROUNDS = 10
 COMMANDS_DIR = 'commands/'
 READY_DIR = 'ready/'
 READY_FILE_TEMPLATE = READY_DIR + "{}.txt"
@@ -112,6 +154,9 @@ VALIDATED_FILE_NAME = "replay.validated"
 SYNOPSIS_FILE_NAME = "synopsis.txt"
 STORIES_FILE_NAME = "stories.jsonl"
 WIN_STORY_FILE_NAME = "win-story.json"
+# Everything of a game that is finished or archived, in one file. See
+# docs/adr/0042-a-game-out-of-play-is-one-file.md.
+PACK_FILE_NAME = "game.zip"
 
 # ============================================= SHIP CORE METRICS
 
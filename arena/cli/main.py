@@ -12,19 +12,23 @@ __author__ = 'Serge Beaumont'
 import argparse
 import logging
 import sys
-import os
+import time
 
+from arena import tally
 from arena.announce import Announcer
-from arena.cfg import LOG_FILE_NAME, PLAY_URL
+from arena.cfg import INIT_FILE_NAME, LOG_DIR, LOG_FILE_NAME, PLAY_URL
 from arena.log import configure_logger
 
 from arena.app.clock import server_now
 from arena.app.players import PlayerRegistry, DIRECTOR, PLAYER
 from arena.app.services import AdminService
+from arena.cli.profiling import profile
+from arena.engine import trace
 from arena.engine.admin import setup_game
 from arena.engine.game import Game
 from arena.engine.gamedirectory import GAMES_ROOT, GameDirectory, GamesIn
 from arena.engine.reporting.manual import generate_manual
+from arena.storage import SqliteStorage
 
 logger = logging.getLogger('starship-arena')
 
@@ -33,11 +37,16 @@ def parse_args():
     parser = argparse.ArgumentParser()
     parser.add_argument("action",
                         choices=['setup', 'generate', 'regenerate', 'manual', 'link', 'players',
-                                 'process_due', 'remind_due', 'announce', 'export'],
+                                 'process_due', 'remind_due', 'announce', 'export', 'profile',
+                                 'worker', 'verify', 'pack', 'to_sqlite', 'from_sqlite'],
                         help="Set a game up, generate its unprocessed rounds, replay games from "
                              "their orders, build the manual, issue a login link, list who can log "
                              "in, process the games due this hour, remind whoever still owes "
-                             "orders, send a test announcement, or export a game to the museum")
+                             "orders, send a test announcement, export a game to the museum, "
+                             "profile a round on a copy of a game, run the queued jobs, replay "
+                             "games aside to check they come out the same, pack the games out "
+                             "of play into a file each, or copy the data root into a SQLite "
+                             "database and back")
     parser.add_argument("gamedir", nargs='?',
                         help="The name of the game you want to process.")
     parser.add_argument("-n", "--name", help="Who to issue a login link for.")
@@ -46,26 +55,36 @@ def parse_args():
     parser.add_argument("-u", "--url", default="",
                         help="Where the game UI is, e.g. https://example.com. Left out, the "
                              "link is printed as a path.")
+    parser.add_argument("-r", "--round", type=int,
+                        help="With profile, play this round again rather than the current one.")
+    parser.add_argument("-o", "--out", default=LOG_DIR,
+                        help="With profile, where the reports go. The log directory if left out.")
+    parser.add_argument("--poll", type=float, default=0, metavar="SECONDS",
+                        help="With worker, keep looking for jobs this often rather than stopping "
+                             "once the queue is empty.")
+    parser.add_argument("--database", metavar="FILE",
+                        help="With to_sqlite or from_sqlite, the SQLite database to write or read.")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="With generate or regenerate, write where the rounds spent their "
+                             "time to FILE, for chrome://tracing or Perfetto.")
     return parser.parse_args()
 
 
 def do_setup(game_dir: GameDirectory):
     init_file = game_dir.init_file
-    if not os.path.exists(init_file):
+    if not game_dir.file_exists(INIT_FILE_NAME):
         sys.exit(f"Can not find initialization file '{init_file}'")
     setup_game(game_dir)
 
 
-def generate(data_root: str, game_name: str):
+def generate(game_dir: GameDirectory):
     """Process every round whose orders are all in, one after the other.
 
-    A Game reads the round it is on when it is built, so each round gets a fresh one."""
-    while True:
-        game = Game(GameDirectory(data_root, game_name))
-        if not game.current_round_ready:
-            break
+    One Game plays them all, each round opened on the world the one before left in memory."""
+    game = Game(game_dir)
+    while game.current_round_ready:
         logger.info(f"Processing round {game.current_round_nr}")
-        game.process_current_round()
+        game.process_current_round(carry_on=True)
 
 
 def issue_link(name: str, director: bool, url: str):
@@ -76,7 +95,8 @@ def issue_link(name: str, director: bool, url: str):
     before they can hand out anything."""
     if not name:
         sys.exit("Who for? Use --name.")
-    player = PlayerRegistry(GAMES_ROOT.root).issue(name, role=DIRECTOR if director else PLAYER)
+    player = PlayerRegistry(GAMES_ROOT.root, GAMES_ROOT.store).issue(
+        name, role=DIRECTOR if director else PLAYER)
     # The address given is the game UI's own, wherever that is, and it answers at the root of it.
     # A host that knows its own address says so in secret.py.
     where = url.rstrip('/') if url else PLAY_URL
@@ -87,12 +107,14 @@ def issue_link(name: str, director: bool, url: str):
               "SITE_URL in secret.py.")
 
 
-def regenerate(game_name: str = None) -> int:
+def regenerate(game_name: str = None, in_process: bool = False) -> int:
     """Replay games from their ships file and orders, back to the round they were on.
 
-    One game, or every playable one when none is named. Each round it ends on is printed against
-    the round it was on: a game whose orders are missing for a round cannot be replayed past it,
-    and the rounds after that are gone. Returns how many came back short.
+    One game, or every playable one when none is named, side by side, or one after another in
+    this process when `in_process`, which is how a trace sees them. Each round it ends on is
+    printed against the round it was on, in name order as they finish: a game whose orders are
+    missing for a round cannot be replayed past it, and keeps the rounds it had rather than take
+    the replay. Returns how many came back short or did not finish.
 
     Read off the file names rather than through a listing, because a listing loads every world to
     say what each game is waiting for, and a world too old for this code to read is the whole
@@ -104,13 +126,46 @@ def regenerate(game_name: str = None) -> int:
             sys.exit(f"No playable game called '{game_name}'.")
         games = {game_name: games[game_name]}
     short = 0
-    for name, was in games.items():
-        now = admin.regenerate_game(name)
+
+    def told(ran):
+        nonlocal short
+        was = games[ran.key]
+        if not ran.ok:
+            short += 1
+            print(f"  {ran.key:24} round {was} -> FAILED, {ran.said}")
+            return
+        now = int(ran.said)
         short += (now < was)
-        print(f"  {name:24} round {was} -> {now}{'   LOST ROUNDS' if now < was else ''}")
+        print(f"  {ran.key:24} round {was} -> {now}"
+              f"{'   STOPPED SHORT, rounds kept' if now < was else ''}")
+    admin.regenerate_games(list(games), told, in_process)
     return short
 
 
+def verify(game_name: str = None) -> int:
+    """Replay games in a scratch directory, and say where each first parts from how it was played.
+
+    One game, or every playable one when none is named. Nothing in the games is changed, so this
+    is safe to run after any change to the engine that should not have changed a game. Returns how
+    many parted."""
+    admin = AdminService()
+    games = admin.playable_games_on_disk()
+    if game_name:
+        if game_name not in games:
+            sys.exit(f"No playable game called '{game_name}'.")
+        games = {game_name: games[game_name]}
+    parted = 0
+    for name, rounds in games.items():
+        found = admin.verify_game(name)
+        if not found:
+            print(f"  {name:24} the same through round {rounds}")
+            continue
+        parted += 1
+        where = f"round {found.round_nr}" + (f" tick {found.tick}" if found.tick else "")
+        print(f"  {name:24} {where}{' ' + found.name if found.name else ''}: {found.why}")
+    return parted
+
+
 def process_due():
     """Process every game whose settings name this hour. Run hourly by cron."""
     done = AdminService().process_due()
@@ -129,6 +184,17 @@ def remind_due():
         logger.info(f"Nobody to remind at {server_now():%H:%M %Z}")
 
 
+def work(poll: float):
+    """Run what the web application queued. Once through the queue from cron, or for good."""
+    queue = AdminService().job_queue
+    while True:
+        for job in queue.drain():
+            logger.info(f"{job.game}: {job.kind} {job.state}. {job.error or job.result}")
+        if not poll:
+            return
+        time.sleep(poll)
+
+
 def announce_test():
     """Say something harmless on every channel. This is how a host proves it can reach them."""
     announcer = Announcer()
@@ -150,7 +216,7 @@ def _reminders_of(p) -> str:
 
 
 def list_players():
-    players = PlayerRegistry(GAMES_ROOT.root).all()
+    players = PlayerRegistry(GAMES_ROOT.root, GAMES_ROOT.store).all()
     if not players:
         print("Nobody can log in yet. Issue the first link with:")
         print("  python arena/cli/main.py link --name <you> --director")
@@ -163,6 +229,16 @@ def list_players():
 def main():
     configure_logger(LOG_FILE_NAME)
     args = parse_args()
+    if args.trace and args.action in ('generate', 'regenerate'):
+        trace.start()
+    try:
+        with tally.tallied(args.action):
+            act(args)
+    finally:
+        trace.stop(args.trace)
+
+
+def act(args):
     if args.action == 'manual':
         logger.info("Generating manual...")
         generate_manual()
@@ -176,14 +252,32 @@ def main():
         remind_due()
     elif args.action == 'regenerate':
         logger.info("Regenerating...")
-        if regenerate(args.gamedir):
-            sys.exit("A game came back short. Restore the backup before anything else runs.")
+        if regenerate(args.gamedir, in_process=bool(args.trace)):
+            sys.exit("A game came back short. It kept its saved rounds; the lines above say which.")
+    elif args.action == 'verify':
+        if verify(args.gamedir):
+            sys.exit("A replay parted from how a game was played. The lines above say where.")
+    elif args.action == 'pack':
+        for name in AdminService().pack_games():
+            print(f"  {name}")
+    elif args.action in ('to_sqlite', 'from_sqlite'):
+        if not args.database:
+            sys.exit("Which database? Give it with --database.")
+        copy = GAMES_ROOT.copy_into if args.action == 'to_sqlite' else GAMES_ROOT.copy_from
+        print(f"Copied {copy(SqliteStorage(args.database))} files.")
     elif args.action == 'announce':
         announce_test()
+    elif args.action == 'worker':
+        work(args.poll)
     elif args.action == 'export':
         if not args.gamedir:
             sys.exit("Which game? Give its name.")
-        print(f"Written to {AdminService(GAMES_ROOT.root).export_to_valhalla(args.gamedir)}")
+        print(f"Written to {AdminService().export_to_valhalla(args.gamedir)}")
+    elif args.action == 'profile':
+        if not args.gamedir:
+            sys.exit("Which game? Give its name.")
+        for path in profile(GAMES_ROOT.locate(args.gamedir), args.out, args.round):
+            print(f"  {path}")
     else:
         if not args.gamedir:
             sys.exit("Which game? Give its name.")
@@ -195,7 +289,7 @@ def main():
             do_setup(game_dir)
         else:
             logger.info("Generating unprocessed rounds...")
-            generate(str(GAMES_ROOT.games), args.gamedir)
+            generate(game_dir)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,123 @@
+"""Where one round of a game spends its time and its memory.
+
+Always played on a copy, in a scratch directory thrown away afterwards, so a live game can be
+profiled without anything in it changing. The round is played twice, once under cProfile and
+once under tracemalloc: tracing memory slows every allocation, and would skew the times."""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from arena.app.locks import GameLock
+from arena.engine.game import Game, world_of
+from arena.engine.gamedirectory import GameDirectory
+from arena.engine.round import PHASES
+from arena.storage import copy_files
+
+# How many functions, and how many places that allocate, a report lists.
+TOP = 40
+
+
+def scratch_copy(game_dir: GameDirectory, into: str, round_nr: int = None) -> GameDirectory:
+    """The game copied under into, taken back to just before round_nr when one is given.
+
+    The game is held while it is copied, so a round or an order saved meanwhile is in the copy
+    whole or not at all."""
+    copy = GameDirectory(into, game_dir.game_name)
+    with GameLock(Path(game_dir.path).parent.parent, game_dir.game_name, 'profile'):
+        copy_files(game_dir.store, copy.store)
+    last = copy.last_round_number
+    if round_nr is not None:
+        if not 1 <= round_nr <= last + 1:
+            sys.exit(f"{game_dir.game_name} has rounds 1 to {last + 1}, not {round_nr}.")
+        copy.forget_rounds_after(round_nr - 1)
+        if not copy.status_file_for_round_exists(round_nr - 1):
+            # Let go of by a game that keeps only some rounds, so played again to start from.
+            world = world_of(game_dir, round_nr - 1)
+            world.kept_in(copy)
+            world.save(round_nr - 1)
+    return copy
+
+
+def _played(game_dir: GameDirectory, round_nr: int | None, run):
+    """What run makes of a Game on a fresh copy, ready to play its round."""
+    with tempfile.TemporaryDirectory() as scratch:
+        game = Game(scratch_copy(game_dir, scratch, round_nr))
+        if not game.current_round_ready:
+            sys.exit(f"Round {game.current_round_nr} of {game.name} is missing orders from "
+                     f"{', '.join(sorted(game.missing_command_files))}.")
+        return game.current_round_nr, run(game)
+
+
+def _profiled(game: Game) -> cProfile.Profile:
+    profiler = cProfile.Profile()
+    profiler.runcall(game.process_current_round)
+    return profiler
+
+
+def _measured(phase, used: dict):
+    """The phase, counting what it allocates and the most it holds above where it started."""
+    def measured(*args):
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        try:
+            return phase(*args)
+        finally:
+            now, peak = tracemalloc.get_traced_memory()
+            used['calls'] += 1
+            used['net'] += now - before
+            used['peak'] = max(used['peak'], peak - before)
+    return measured
+
+
+def _allocations(game: Game) -> tuple[dict, tracemalloc.Snapshot]:
+    """Per phase of the tick what it allocated, and what the round as a whole left held."""
+    game_round = game.current_round
+    used = {phase: {'calls': 0, 'net': 0, 'peak': 0} for phase in PHASES}
+    for phase in PHASES:
+        setattr(game_round, phase, _measured(getattr(game_round, phase), used[phase]))
+    tracemalloc.start()
+    try:
+        game.process_current_round()
+        return used, tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+
+def time_report(profiler: cProfile.Profile) -> str:
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    stats.sort_stats('cumulative').print_stats(TOP)
+    stats.sort_stats('tottime').print_stats(TOP)
+    return out.getvalue()
+
+
+def memory_report(used: dict, snapshot: tracemalloc.Snapshot) -> str:
+    lines = [f"{'phase':20} {'calls':>6} {'net KiB':>10} {'peak KiB':>10}"]
+    for phase, u in used.items():
+        lines.append(f"{phase:20} {u['calls']:6} {u['net'] / 1024:10.1f} {u['peak'] / 1024:10.1f}")
+    lines += ['', f"Held when the round was saved, the {TOP} largest:"]
+    lines += [str(stat) for stat in snapshot.statistics('lineno')[:TOP]]
+    return '\n'.join(lines) + '\n'
+
+
+def profile(game_dir: GameDirectory, out_dir: str, round_nr: int = None) -> list[str]:
+    """Play a round on a copy and write what it cost. The current round, or round_nr again.
+
+    Returns the files written: the time report, the pstats it was made from, and the memory."""
+    played, profiler = _played(game_dir, round_nr, _profiled)
+    _, (used, snapshot) = _played(game_dir, round_nr, _allocations)
+
+    os.makedirs(out_dir, exist_ok=True)
+    stem = os.path.join(out_dir, f"{game_dir.game_name}-round-{played}")
+    profiler.dump_stats(f"{stem}.pstats")
+    with open(f"{stem}.txt", 'w') as f:
+        f.write(time_report(profiler))
+    with open(f"{stem}-memory.txt", 'w') as f:
+        f.write(memory_report(used, snapshot))
+    return [f"{stem}.txt", f"{stem}.pstats", f"{stem}-memory.txt"]
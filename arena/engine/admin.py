@@ -5,12 +5,18 @@ Administrative features
 
 from collections import defaultdict
 import logging
+import os
+import shutil
 
 import arena.engine.objects.registry.builder as builder
+from arena.cfg import KEYFRAME_ROUNDS
+from arena.errors import UnreadableWorld
+from arena.engine import fingerprint
 from arena.engine.gamedirectory import BodyFile, GameDirectory, ShipFile
 from arena.engine.world import World
 from arena.engine.game import Game
 from arena.engine.history import TICK_ZERO
+from arena.storage import FileStorage, copy_files
 
 logger = logging.getLogger('starship-arena.admin')
 
@@ -37,9 +43,10 @@ class GameSetup(object):
         self._dir.clean()
         self.run_tick_zero()
         for faction, ships in group_by_faction(self.ships.values()).items():
-            logger.info(f"=={faction}==")
+            logger.info("==%s==", faction)
             for ship in ships:
-                logger.info(f"Ship: {ship.name}, Faction: {ship.faction}, Pos: {ship.pos}, Type: {ship.class_name}")
+                logger.info("Ship: %s, Faction: %s, Pos: %s, Type: %s",
+                            ship.name, ship.faction, ship.pos, ship.class_name)
         self.save()
 
     def run_tick_zero(self):
@@ -69,34 +76,102 @@ class GameSetup(object):
         return objects_in_space
 
     def save(self):
-        """Save the round 0 pickle file and the ships file with coordinates (to ensure idempotency)."""
-        self.world.save(0)
+        """Save the ships file with coordinates (to ensure idempotency) and the round 0 pickle file.
+
+        The files first, because the world records what it was set up from as they then read."""
         self.shipfile.save(self.ships.values())
         if self.bodyfile.body_lines:
             self.bodyfile.save()
+        self.world.save(0)
 
 
-def regenerate_game(gd: GameDirectory) -> int:
+def regenerate_game(gd: GameDirectory, target: int = None) -> int:
     """Rebuild a game from its ships file and command files, back to the round it was on.
 
     Snapshots are written as rounds are processed, so a change to what they hold only reaches
     rounds processed afterwards; this replays the earlier ones. Deterministic, because the ships
-    file holds where everything started and setup draws nothing. Returns the round it ended on."""
-    target = gd.last_round_number
-    logger.info(f"Regenerating {gd.game_name} up to round {target}")
-    GameSetup(gd).execute()
+    file holds where everything started and setup draws nothing. Returns the round it ended on.
+
+    A saved round played from what it would be played from today is kept, and so is every one
+    before it: the replay starts after the last of them. See arena/engine/fingerprint.py."""
+    target = gd.last_round_number if target is None else target
+    game = _resume(gd, target)
+    logger.info("Regenerating %s from round %s up to round %s",
+                gd.game_name, gd.last_round_number + 1, target)
     while gd.last_round_number < target:
-        game = Game(gd)
         if not game.current_round_ready:
-            logger.info(f"Stopping at round {gd.last_round_number}: not all orders are in")
+            logger.info("Stopping at round %s: not all orders are in", gd.last_round_number)
             break
-        game.process_current_round()
+        game.process_current_round(carry_on=True)
     return gd.last_round_number
 
 
+def _resume(gd: GameDirectory, target: int) -> Game:
+    """The game opened on the last saved round that would come out the same, or set up afresh.
+
+    A round that cannot be read is passed over for the latest keyframe before it, a round that is
+    a multiple of KEYFRAME_ROUNDS, and that for the one before, down to round 0. A game that keeps
+    only some worlds opens on the latest it kept, and its keyframes are the rounds it keeps."""
+    kept = -1
+    for nr, digest in enumerate(fingerprint.chain(gd, target)):
+        if gd.read_inputs(nr) != digest:
+            break
+        kept = nr
+    every = gd.keep_every or KEYFRAME_ROUNDS
+    keyframes = range(kept - 1 - (kept - 1) % every, -1, -every)
+    for nr in ([kept] if kept >= 0 else []) + list(keyframes):
+        gd.forget_rounds_after(nr)
+        if not gd.has_been_setup:
+            break
+        try:
+            return Game(gd)
+        except UnreadableWorld:
+            logger.info("Round %s of %s cannot be read, going back further", nr, gd.game_name)
+    GameSetup(gd).execute()
+    return Game(gd)
+
+
+def _link_worlds(source: str, copy: str):
+    """A saved round is linked rather than copied: it is only ever replaced, never written into."""
+    if os.path.basename(source).startswith('status_round_'):
+        os.link(source, copy)
+    else:
+        shutil.copy2(source, copy)
+
+
+def stage(gd: GameDirectory, staged: GameDirectory) -> None:
+    """Copy a game into `staged` to be replayed there, so the game itself is not touched while that
+    runs. From a game kept in a database, the worlds are copied too."""
+    if not isinstance(gd.store, FileStorage):
+        staged.setup_directories()
+        copy_files(gd.store, staged.store)
+        return
+    shutil.copytree(gd.path, staged.path, ignore=shutil.ignore_patterns('*.partial'),
+                    copy_function=_link_worlds)
+
+
+def verify_game(recorded: dict[int, list[dict] | None],
+                scratch: GameDirectory) -> tuple[int, int, str, str] | None:
+    """Replay a copy of a game's plans from setup, and hold what each tick came to against what was
+    recorded when it was played. Where they first part: round, tick, object and how. None when
+    they do not."""
+    target = max(recorded)
+    reached = regenerate_game(scratch, target)
+    for nr in range(target + 1):
+        if recorded[nr] is None:
+            return nr, 0, '', "nothing was recorded when it was played"
+        if nr > reached:
+            return nr, 0, '', "the replay stopped before it: orders are missing"
+        if found := fingerprint.first_difference(recorded[nr], scratch.read_ticks(nr)):
+            return found
+    return None
+
+
 def setup_game(gd: GameDirectory, ship_file: ShipFile=None) -> Game:
     setup = GameSetup(gd, ship_file)
-    logger.info(f"Setup {gd.path} for ship file: {setup.shipfile}")
+    logger.info("Setup %s for ship file: %s", gd.path, setup.shipfile)
     setup.execute()
-    logger.info(f"Current status: {gd.load_current_world().objects}")
+    if logger.isEnabledFor(logging.INFO):
+        # Reading the world back is the dear part, so it waits for somebody to be listening.
+        logger.info("Current status: %s", gd.load_current_world().objects)
     return Game(gd)
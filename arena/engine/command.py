@@ -9,6 +9,7 @@ from collections import defaultdict
 from typing import Protocol, runtime_checkable
 from abc import ABC, abstractmethod
 
+from arena import tally
 from arena.engine.history import Tick
 from arena.engine.world import World
 from arena.engine.objects.ship import AccelerationParameter, TurnParameter
@@ -77,6 +78,20 @@ class Commandable(Protocol):
         ...
 
 
+_COMMANDABLE: dict[type, bool] = {}
+
+
+def is_commandable(ois) -> bool:
+    """isinstance(ois, Commandable), asked once per class.
+
+    A runtime Protocol check walks every member on every call, and every instance of a class
+    carries the same members."""
+    kind = type(ois)
+    if kind not in _COMMANDABLE:
+        _COMMANDABLE[kind] = isinstance(ois, Commandable)
+    return _COMMANDABLE[kind]
+
+
 class Command(ABC):
     # How this command is known internally. Which words a player types to trigger it is not
     # the command's business: that lives in COMMAND_WORDS, so wording can change or gain
@@ -87,7 +102,7 @@ class Command(ABC):
     def for_command_line(cls, command_line: CommandLine, ship: Commandable, world):
         word = command_line.name.upper()
         if word not in COMMAND_WORDS:
-            logger.warning(f"Unknown command {command_line}")
+            logger.warning("Unknown command %s", command_line)
             return UnknownCommand(command_line, ship, world)
         key, options = COMMAND_WORDS[word]
         return all_command_types[key](command_line, ship, world, **options)
@@ -100,7 +115,7 @@ class Command(ABC):
         self.target = target
         params_valid = self._init_params(self.command_line.params)
         for fr in self.feedback_results:
-            logger.info(f"{target.name} {fr}")
+            logger.info("%s %s", target.name, fr)
         self.is_valid = self.command_line.is_valid and params_valid
 
     @abstractmethod
@@ -116,8 +131,8 @@ class Command(ABC):
         return self.command_line.text
 
     def execute(self, tick: Tick):
-        logger.debug(f'{self.target.name} executing command "{self.command_line.text}"')
-        self.target.add_event(InternalEvent(f'Executing command "{self.command_line.text}"'))
+        logger.debug('%s executing command "%s"', self.target.name, self.command_line.text)
+        self.target.add_event(InternalEvent('Executing command "{}"', self.command_line.text))
 
     @property
     def feedback_results(self):
@@ -334,12 +349,12 @@ class CommandSet(object):
 
     def add(self, cmd: Command):
         if not cmd.is_valid:
-            logger.info(f"CommandSet: invalid command {str(cmd)}: {cmd.feedback_results}.")
+            logger.info("CommandSet: invalid command %s: %s.", cmd, cmd.feedback_results)
             # A command that is refused is something the player needs to hear about, so it
             # goes in the ship's history and turns up in the round report rather than
             # silently doing nothing.
-            cmd.target.add_event(InternalEvent(
-                f'Could not execute "{cmd.text}": {"; ".join(cmd.feedback_results)}'))
+            cmd.target.add_event(InternalEvent('Could not execute "{}": {}',
+                                               cmd.text, "; ".join(cmd.feedback_results)))
             self.errors.append(cmd)
             return
         # Which commands run before or after the move, and which ones there can only be one
@@ -370,12 +385,12 @@ class CommandSet(object):
 
 def read_command_file(command_file_name: str, ship, world) -> dict:
     """Read a command file with the commands for a ship."""
-    with open(command_file_name) as infile:
-        logger.info(f"Reading {command_file_name}")
+    with tally.reading(command_file_name, kind='commands') as infile:
+        logger.info("Reading %s", command_file_name)
         lines = [line.strip() for line in infile.readlines() if not line.isspace()]
 
     commands = parse_commands(lines, ship, world)
-    logger.info(f"Parsed command file {command_file_name}")
+    logger.info("Parsed command file %s", command_file_name)
     return commands
 
 
@@ -390,6 +405,6 @@ def parse_commands(lines: list[str], ship, world):
             if command_line.is_valid:
                 commands[command_line.tick].add(Command.for_command_line(command_line, ship, world))
         except Exception:
-            logger.error(f"Error while trying to parse line {line} ({line_nr})")
+            logger.error("Error while trying to parse line %s (%s)", line, line_nr)
             raise
     return commands
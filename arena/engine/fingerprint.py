@@ -0,0 +1,156 @@
+"""What a round was played from, as one hash, so a regenerate can tell which saved rounds it would
+only make again. And what each tick of it came to, so a replay can be held against the game.
+
+A round's world follows from the world before it, its orders, its lines of the spawn plan and the
+engine that plays it, and from nothing else (see docs/adr/0002-deterministic-rounds.md). So a hash
+over those stands for the world it made. The world before is stood for by its own hash in the same
+way, which chains every round back to round 0, whose hash is over the roster and the terrain.
+
+The engine is the source of the modules under `arena/engine` that decide what a round comes to,
+and the scan multiplier `arena/cfg.py` holds for them. Where a game is kept, how a round is traced
+or hashed, and how it is read back or written up are left out. Which phase a change touched is not
+worth knowing: any change to the engine makes every saved round one to regenerate.
+
+Beside that hash each round also gets one over its plans alone, chained the same way. A round
+a game let go of is played again against that one, so a new engine does not lose it.
+
+What a tick came to is a hash per object over its snapshot and its events at that tick, and one
+over those for the world. Canonical: floats written exactly, another object named rather than
+followed, and nothing that depends on where in memory something is."""
+
+import dataclasses
+import hashlib
+import inspect
+import json
+from enum import Enum
+from functools import cache
+from pathlib import Path
+
+from arena.cfg import (BODIES_FILE_NAME, COMMAND_FILE_TEMPLATE, INIT_FILE_NAME,
+                       MAX_SCAN_MULTIPLIER, max_scan)
+
+ARENA_DIR = Path(__file__).parent.parent
+
+# Under arena/engine, but with no say in what a round comes to.
+NOT_PLAYED = ('engine/fingerprint.py', 'engine/gamedirectory.py', 'engine/replay.py',
+              'engine/trace.py', 'engine/reporting/')
+
+
+def sources() -> list[Path]:
+    """The modules that decide what a round comes to."""
+    return [source for source in sorted(ARENA_DIR.glob('engine/**/*.py'))
+            if not source.relative_to(ARENA_DIR).as_posix().startswith(NOT_PLAYED)]
+
+
+@cache
+def engine() -> str:
+    """The engine's source, hashed. The code does not change under a running process."""
+    h = hashlib.sha256()
+    for source in sources():
+        h.update(source.relative_to(ARENA_DIR).as_posix().encode())
+        h.update(source.read_bytes())
+    h.update(f"{MAX_SCAN_MULTIPLIER} {inspect.getsource(max_scan)}".encode())
+    return h.hexdigest()
+
+
+def _contents(gd, name: str) -> bytes:
+    if not gd.file_exists(name):
+        return b''
+    with gd.reading(name, 'rb', kind='inputs') as f:
+        return f.read()
+
+
+def of_setup(gd, engine_too: bool = True) -> str:
+    """Round 0: the roster and the terrain it was set up from. Without `engine_too`, the plans
+    alone."""
+    h = hashlib.sha256(engine().encode() if engine_too else b'')
+    for name in (INIT_FILE_NAME, BODIES_FILE_NAME):
+        h.update(name.encode())
+        h.update(_contents(gd, name))
+    return h.hexdigest()
+
+
+def of_round(gd, nr: int, before: str, engine_too: bool = True) -> str:
+    """Round `nr`, played on the world whose hash is `before`."""
+    h = hashlib.sha256(f"{engine()} {before}".encode() if engine_too else before.encode())
+    for command_file in gd.files_like(COMMAND_FILE_TEMPLATE.format('*', nr)):
+        h.update(Path(command_file).name.encode())
+        h.update(_contents(gd, command_file))
+    for record in gd.load_spawns():
+        if record['round'] == nr:
+            h.update(json.dumps(record, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def chain(gd, last: int) -> list[str]:
+    """What every round up to `last` would be played from, as the plans stand."""
+    hashes = [of_setup(gd)]
+    for nr in range(1, last + 1):
+        hashes.append(of_round(gd, nr, hashes[-1]))
+    return hashes
+
+
+def _canonical(value):
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return repr(value)
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(json.dumps(_canonical(v), sort_keys=True) for v in value)
+    if dataclasses.is_dataclass(value):
+        return {f.name: _canonical(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if hasattr(value, 'name'):
+        return {'name': value.name}
+    return type(value).__name__
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def of_ticks(world, round_nr: int) -> list[dict]:
+    """Every tick of a round the world holds, in order: a hash per object there, and the world's."""
+    present = {}
+    for part in (world.objects, world.graveyard, world.destroyed, world.spawns):
+        for name, ois in part.items():
+            present.setdefault(name, ois)
+    ticks = sorted({t for ois in present.values() for t in ois.history.ticks if t.round == round_nr},
+                   key=lambda t: t.abs_tick)
+    records = []
+    for tick in ticks:
+        objects = {}
+        for name in sorted(present):
+            if tick in present[name].history.ticks:
+                th = present[name].history.ticks[tick]
+                objects[name] = _digest([_canonical(th.data), [str(e) for e in th.events]])
+        records.append({'round': tick.round, 'tick': tick.tick, 'world': _digest(objects),
+                        'objects': objects})
+    return records
+
+
+def first_difference(saved: list[dict], replayed: list[dict]) -> tuple[int, int, str, str] | None:
+    """Where two records of a round part: round, tick, object and how. None when they do not."""
+    for was, now in zip(saved, replayed):
+        if (was['round'], was['tick']) != (now['round'], now['tick']):
+            return was['round'], was['tick'], '', "the replay has other ticks"
+        if was['world'] == now['world']:
+            continue
+        for name in sorted(was['objects'].keys() | now['objects'].keys()):
+            if name not in now['objects']:
+                return was['round'], was['tick'], name, "only in the saved game"
+            if name not in was['objects']:
+                return was['round'], was['tick'], name, "only in the replay"
+            if was['objects'][name] != now['objects'][name]:
+                return was['round'], was['tick'], name, "changed"
+    if len(saved) != len(replayed):
+        longer = saved if len(saved) > len(replayed) else replayed
+        gone = longer[min(len(saved), len(replayed))]
+        return gone['round'], gone['tick'], '', "the replay has other ticks"
+    return None
+
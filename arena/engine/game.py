@@ -1,12 +1,16 @@
 """Game is one game directory: which round it is on, whether the next one can run, and running it."""
 import logging
+import shutil
 
-from arena.engine.command import Commandable, parse_commands, CommandSet
-from arena.engine.gamedirectory import GameDirectory
+from arena import metrics
+from arena.errors import RoundNotKept
+from arena.engine import fingerprint, trace
+from arena.engine.command import is_commandable, parse_commands, CommandSet
+from arena.engine.gamedirectory import GameDirectory, MemoryDirectory
 from arena.engine.history import Tick
 from arena.engine.objects.registry import builder
 from .round import GameRound
-from .world import World
+from .world import World, Whereabouts
 
 logger = logging.getLogger('starship-arena.game')
 
@@ -29,7 +33,7 @@ class Game(object):
             raise ValueError(f"Round number has to be from 0 to {self.current_round_nr}, not {round_nr}.")
         # Initialize the - unprocessed - current round with the data from the previous round.
         round_to_load = round_nr if round_nr < self.current_round_nr else self.current_round_nr - 1
-        self.world = self._dir.load_world(round_to_load)
+        self.world = world_of(self._dir, round_to_load)
         self.plan_spawns(round_nr)
         return GameRound(self.world, round_nr)
 
@@ -81,7 +85,8 @@ class Game(object):
     @property
     def player_ships(self):
         """Return a list of all player controlled ships."""
-        return [s for s in self.current_round.world.objects.values() if s.is_player_controlled]
+        return list(self.current_round.world.find_objects(where={Whereabouts.Objects},
+                                                         player_controlled=True).values())
 
     @property
     def factions(self):
@@ -101,19 +106,34 @@ class Game(object):
 
     # -------------------------------------------------------------------------------- Commands
 
-    def process_current_round(self):
-        """The main execution of the round. Here is where it all happens."""
+    @trace.traced('process_current_round')
+    def process_current_round(self, carry_on: bool = False):
+        """The main execution of the round. Here is where it all happens.
+
+        Carrying on opens the next round on the world this one leaves in memory, rather than on a
+        read of the file it was just saved to, for a caller playing several rounds in a row."""
 
         # Load all commands into player ships and do initial scan for reporting.
         if self.missing_command_files:
             raise FilesMissing(f"Missing command files {self.missing_command_files}")
 
-        cr = self.current_round
-        cr.do_round(self.load_commands())
+        with metrics.timed('arena_round_seconds'):
+            cr = self.current_round
+            with trace.span('load_commands'):
+                commands = self.load_commands()
+            cr.do_round(commands)
+
+            # Save the state of the current round.
+            logger.debug("Saving game %s round %s", self._dir.game_name, cr.round_nr)
+            cr.world.save(cr.round_nr)
+        if carry_on:
+            self._carry_on(cr)
 
-        # Save the state of the current round.
-        logger.debug(f"Saving game {self._dir.game_name} round {cr.round_nr}")
-        cr.world.save(cr.round_nr)
+    def _carry_on(self, played: GameRound):
+        """What init_round does for the round after `played`, without reading back its world."""
+        self.world = played.world
+        self.plan_spawns(played.round_nr + 1)
+        self.rounds = {played.round_nr + 1: GameRound(self.world, played.round_nr + 1)}
 
 
     def load_commands(self):
@@ -122,8 +142,65 @@ class Game(object):
         Only a ship with a player has a command file. A hull with nobody at the helm still gets
         an entry, because its own Controller components may add commands as the round runs."""
         ship_commands = dict()
-        for ship in [s for s in self.current_round.world.objects.values() if isinstance(s, Commandable)]:
+        for ship in [s for s in self.current_round.world.objects.values() if is_commandable(s)]:
             lines = self._dir.read_command_file(ship.name, self.current_round_nr) \
                 if ship.is_player_controlled else []
             ship_commands[ship.name] = parse_commands(lines, ship, self.current_round.world)
         return ship_commands
+
+
+def world_of(gd: GameDirectory, nr: int) -> World:
+    """Round `nr`'s world: the one saved, or for a game that let go of it, the one it comes to when
+    played again from the latest round before it that is saved or cached. See
+    docs/adr/0041-keep-only-some-rounds.md."""
+    if gd.status_file_for_round_exists(nr):
+        return gd.load_world(nr)
+    cache = gd.world_cache
+    if world := cache.load(gd, nr):
+        return world
+    start = next(r for r in range(nr - 1, -1, -1)
+                 if gd.status_file_for_round_exists(r) or cache.holds(gd, r))
+    for r in range(start + 1, nr + 1):
+        before = gd.read_plans(r - 1)
+        if not before or fingerprint.of_round(gd, r, before, engine_too=False) != gd.read_plans(r):
+            raise RoundNotKept(gd.game_name, nr)
+    logger.info("Playing %s again from round %s up to round %s", gd.game_name, start + 1, nr)
+    playing = cache.scratch()
+    scratch = GameDirectory(playing, gd.game_name, gd.where)
+    try:
+        gd.copy_plans_to(scratch)
+        if gd.status_file_for_round_exists(start):
+            gd.lend_world(start, scratch)
+        else:
+            cache.lend(gd, start, scratch)
+        game = Game(scratch)
+        for r in range(start + 1, nr + 1):
+            game.process_current_round(carry_on=r < nr)
+            cache.keep(scratch, r)
+        world = scratch.load_world(nr)
+    finally:
+        shutil.rmtree(playing, ignore_errors=True)
+    world.kept_in(gd)
+    return world
+
+
+def simulate(world: World, round_nr: int, orders: list[dict[str, list[str]]],
+             spawns: list[dict] = (), every_round: bool = True) -> dict[int, World]:
+    """Play a round for each entry of `orders` on from `world`, the world at the end of round
+    `round_nr`, in memory and without a game directory on disk. An entry is each ship's command
+    lines for that round, and a player's ship left out of one gives no orders. `spawns` are lines
+    of a spawn plan. Answers the world at the end of every round played, by round.
+
+    Each of those is a world of its own, which costs a copy per round. Without `every_round`,
+    `world` itself is played on and only the last round's is answered."""
+    gd = MemoryDirectory(keep_every_round=every_round)
+    for record in spawns:
+        gd.append_spawn(record)
+    gd.save_world(world, round_nr)
+    game = Game(gd)
+    for played, lines in enumerate(orders, start=1):
+        for ship in game.player_ships:
+            gd.write_command_file(ship.name, game.current_round_nr, lines.get(ship.name, []))
+        game.process_current_round(carry_on=played < len(orders))
+    rounds = [nr for nr in gd.saved_rounds if nr > round_nr]
+    return {nr: gd.worlds[nr] for nr in (rounds if every_round else rounds[-1:])}
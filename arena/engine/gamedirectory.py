@@ -2,21 +2,24 @@
 Abstraction of a directory of a specific game of Space Arena.
 
 - Hides all the specific information about structure and file names.
-- Performs specific file operations on the directory.
+- Performs specific file operations on the directory, through the storage it is kept in.
 """
 
 import fnmatch
 import json
 import re
-import shutil
 import pickle
+import tempfile
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from abc import ABC
 
+from arena import tally
 from arena.cfg import *
 from arena.errors import UnreadableWorld
+from arena.storage import FileStorage, MemoryStorage, SqliteStorage, Storage, copy_files
+from arena.engine import fingerprint, trace
 from arena.engine.world import World
 import logging
 
@@ -35,11 +38,19 @@ class _Stubbing(pickle.Unpickler):
 
     def find_class(self, module: str, name: str):
         try:
-            return super().find_class(module, name)
+            found = super().find_class(module, name)
         except (AttributeError, ImportError):
-            self.absent[f"{module}.{name}"] = self.absent.get(f"{module}.{name}", 0) + 1
+            self._count(f"{module}.{name}")
             return type(name, (), {'__init__': lambda s, *a, **kw: None,
                                    '__setstate__': lambda s, state: None})
+        if not isinstance(found, type) or '__reduce__' not in vars(found):
+            return found
+        # A class that is rebuilt from its constructor is never handed state to set, so state
+        # saved for it was saved by an older version of it, and that is counted as missing too.
+        return type(name, (found,), {'__setstate__': lambda s, state: self._count(f"{module}.{name}")})
+
+    def _count(self, what: str):
+        self.absent[what] = self.absent.get(what, 0) + 1
 
 
 class GamesIn(str, Enum):
@@ -64,12 +75,24 @@ class GamesIn(str, Enum):
         """Whether a game in here can still be opened by the people who played it."""
         return self.active or self is GamesIn.Finished
 
+    @property
+    def packed(self) -> bool:
+        """Whether a game in here is kept in one file, its pack."""
+        return self in (GamesIn.Finished, GamesIn.Archived)
+
 
 @dataclass(frozen=True)
 class GamesRoot:
-    """A data root, and the places a game directory can be in it."""
+    """A data root, and the places a game directory can be in it. Its games and its player registry
+    are files under `root`, or kept in `store` when it is given one."""
 
     root: Path
+    store: Storage = None
+
+    @property
+    def stored(self) -> Storage:
+        """Where the games and the player registry are kept, named from the root."""
+        return self.store or FileStorage(self.root)
 
     def path(self, where: GamesIn) -> Path:
         return self.root / where.value
@@ -99,7 +122,21 @@ class GamesRoot:
         return self.path(GamesIn.Valhalla)
 
     def directory_in(self, where: GamesIn, game: str) -> 'GameDirectory':
-        return GameDirectory(str(self.path(where)), game, where)
+        return GameDirectory(str(self.path(where)), game, where,
+                             self.stored.within(f"{where}/{game}"))
+
+    def holds(self, where: GamesIn, game: str) -> bool:
+        if self.store is None:
+            return (self.path(where) / game).is_dir()
+        return self.store.exists(f"{where}/{game}")
+
+    def move(self, game: str, source: GamesIn, to: GamesIn) -> 'GameDirectory':
+        """A game from one root into another, whole, in one step."""
+        self.stored.rename(f"{source}/{game}", f"{to}/{game}")
+        return self.directory_in(to, game)
+
+    def remove(self, where: GamesIn, game: str):
+        self.stored.remove(f"{where}/{game}")
 
     def directory(self, game: str) -> 'GameDirectory':
         """A game that can still be opened, wherever it is kept."""
@@ -110,28 +147,79 @@ class GamesRoot:
         return self._found_in(game, [w for w in GamesIn if w is not GamesIn.Valhalla])
 
     def _found_in(self, game: str, roots: list[GamesIn]) -> 'GameDirectory':
-        found = next((w for w in roots if (self.path(w) / game).is_dir()), GamesIn.Active)
+        found = next((w for w in roots if self.holds(w, game)), GamesIn.Active)
         return self.directory_in(found, game)
 
     def directories_in(self, where: GamesIn) -> list['GameDirectory']:
         """Every game in one root, in name order. Empty while the root has never been made."""
+        if self.store is not None:
+            return [self.directory_in(where, name.split('/')[-1])
+                    for name in self.store.names(f"{where}/*")]
         root = self.path(where)
         if not root.exists():
             return []
         return [self.directory_in(where, d.name)
                 for d in sorted(p for p in root.iterdir() if p.is_dir())]
 
+    def staging_for(self, gd: 'GameDirectory') -> 'GameDirectory':
+        """Where a replay of a game is built before it is swapped in. On the same disk, so the
+        swap is a rename, and in a directory made for this replay alone, so two of one game do
+        not build in each other's. Whoever asked takes that directory away."""
+        area = self.root / STAGING_DIR_NAME / gd.where.value
+        area.mkdir(parents=True, exist_ok=True)
+        return GameDirectory(tempfile.mkdtemp(dir=area, prefix=f"{gd.game_name}-"), gd.game_name,
+                             gd.where)
+
     def playable(self) -> list['GameDirectory']:
         """Shared games and everybody's own, which are the two a round is planned in."""
         return [gd for where in GamesIn if where.active
                 for gd in self.directories_in(where)]
 
+    def copy_into(self, store: Storage) -> int:
+        """The player registry and every game, written into another store under the names they
+        have here. The staging area and the world cache are not data. Answers how many files."""
+        here = self.stored
+        copied = 0
+        if here.exists(PLAYERS_FILE_NAME):
+            with here.reading(PLAYERS_FILE_NAME, 'rb', kind='copy') as f:
+                store.write(PLAYERS_FILE_NAME, f.read())
+            copied += 1
+        for where in GamesIn:
+            for gd in self.directories_in(where):
+                copied += copy_files(gd.store, store.within(f"{where}/{gd.game_name}"))
+        return copied
+
+    def copy_from(self, store: Storage) -> int:
+        """What `copy_into` wrote, back into this data root, each game packed if its root packs
+        them. Answers how many files."""
+        copied = 0
+        if store.exists(PLAYERS_FILE_NAME):
+            with store.reading(PLAYERS_FILE_NAME, 'rb', kind='copy') as f:
+                self.stored.write(PLAYERS_FILE_NAME, f.read())
+            copied += 1
+        for where in GamesIn:
+            for name in store.names(f"{where}/*"):
+                gd = self.directory_in(where, name.split('/')[-1])
+                gd.setup_directories()
+                copied += copy_files(store.within(name), gd.store)
+                if where.packed:
+                    gd.pack()
+        return copied
+
 
 class GameDirectory(object):
-    def __init__(self, data_root: str, game_name: str, where: GamesIn = GamesIn.Active):
+    """One game's files, kept in `store`: a directory on disk unless another store is given.
+
+    Lending a world to another game and taking the worlds of a replay link and rename files on
+    disk, and copy them in any other store. See
+    docs/adr/0043-game-data-behind-a-storage-interface.md."""
+
+    def __init__(self, data_root: str, game_name: str, where: GamesIn = GamesIn.Active,
+                 store: Storage = None):
         self._dir = os.path.join(data_root, game_name)
         self.game_name = game_name
         self.where = where
+        self.store = store or FileStorage(self._dir)
 
     @property
     def active(self) -> bool:
@@ -146,14 +234,42 @@ class GameDirectory(object):
 
     @property
     def exists(self) -> bool:
-        return os.path.exists(self._dir)
+        return self.store.exists('')
 
     def file_exists(self, name) -> bool:
-        return os.path.exists(os.path.join(self._dir, name))
+        return self.store.exists(name)
 
     @property
     def ls(self) -> list[str]:
-        return os.listdir(self._dir)
+        """What is at the top of the directory, the pack's contents in place of the pack."""
+        return self.store.names('*')
+
+    def files_like(self, pattern: str) -> list[str]:
+        """The names of the files that match a pattern like COMMAND_FILE_TEMPLATE's, in order."""
+        return self.store.names(pattern)
+
+    def reading(self, name: str, mode: str = 'r', kind: str = 'text'):
+        """One of the game's files, opened to be read and counted, from the pack if it is in there.
+
+        A file written since the game was packed sits beside the pack, and is the one read."""
+        return self.store.reading(name, mode, kind=kind)
+
+    # ---------------------------------------------------------------------- QUERIES - The pack
+
+    @property
+    def packed(self) -> bool:
+        """Whether the game's files are in one, which is how a game out of play is kept.
+        See docs/adr/0042-a-game-out-of-play-is-one-file.md."""
+        return self.store.packed
+
+    @property
+    def loose_names(self) -> list[str]:
+        """The files beside the pack rather than in it, with their directories."""
+        return self.store.loose_names
+
+    def _read_bytes(self, name: str) -> bytes:
+        with self.reading(name, 'rb', kind='copy') as f:
+            return f.read()
 
     @property
     def path(self) -> str:
@@ -171,53 +287,60 @@ class GameDirectory(object):
             last_round = max([int(n) for s in pickle_files for n in re.split('[-_. ]+', s) if n.isdigit()])
         return last_round
 
+    @property
+    def saved_rounds(self) -> list[int]:
+        """The rounds whose worlds are on disk, in order. Every one, unless the game keeps fewer."""
+        return sorted(int(re.sub(r'\D', '', name)) for name in fnmatch.filter(self.ls, '*.pickle'))
+
+    @property
+    def keep_every(self) -> int:
+        """Keep the world of one round in this many, and the latest. 0 keeps every one."""
+        return self.read_settings().get('keep_every', 0)
+
+    @property
+    def world_cache(self) -> 'WorldCache':
+        """The cache on the data root this game is in."""
+        return WorldCache(Path(self._dir).parent.parent / CACHE_DIR_NAME)
 
     def read_settings(self) -> dict:
-        path = os.path.join(self._dir, SETTINGS_FILE_NAME)
-        if not os.path.exists(path):
+        if not self.file_exists(SETTINGS_FILE_NAME):
             return {}
-        with open(path) as f:
+        with self.reading(SETTINGS_FILE_NAME, kind='settings') as f:
             lines = [line for line in f if line.strip() and not line.lstrip().startswith('#')]
         return json.loads(lines[0]) if lines else {}
 
     def write_settings(self, settings: dict) -> None:
-        with open(os.path.join(self._dir, SETTINGS_FILE_NAME), 'w') as f:
-            f.write(json.dumps(settings, sort_keys=True) + '\n')
+        self.store.write(SETTINGS_FILE_NAME, json.dumps(settings, sort_keys=True) + '\n')
 
     def read_scenario(self) -> str | None:
         """Which scenario built this game, or nothing for one set up from a roster by hand."""
-        path = os.path.join(self._dir, SCENARIO_FILE_NAME)
-        if not os.path.exists(path):
+        if not self.file_exists(SCENARIO_FILE_NAME):
             return None
-        with open(path) as f:
+        with self.reading(SCENARIO_FILE_NAME, kind='scenario') as f:
             return json.load(f)['scenario']
 
     def write_scenario(self, key: str) -> None:
-        with open(os.path.join(self._dir, SCENARIO_FILE_NAME), 'w') as f:
-            f.write(json.dumps({'scenario': key}) + '\n')
+        self.store.write(SCENARIO_FILE_NAME, json.dumps({'scenario': key}) + '\n')
 
     def read_outcome(self) -> dict | None:
         """How the game ended, or nothing while it has not."""
-        path = os.path.join(self._dir, OUTCOME_FILE_NAME)
-        if not os.path.exists(path):
+        if not self.file_exists(OUTCOME_FILE_NAME):
             return None
-        with open(path) as f:
+        with self.reading(OUTCOME_FILE_NAME, kind='outcome') as f:
             return json.load(f)
 
     def write_outcome(self, outcome: dict) -> None:
-        with open(os.path.join(self._dir, OUTCOME_FILE_NAME), 'w') as f:
-            f.write(json.dumps(outcome, sort_keys=True) + '\n')
+        self.store.write(OUTCOME_FILE_NAME, json.dumps(outcome, sort_keys=True) + '\n')
 
     def write_replay(self, text: str) -> None:
         """The game as text, which is the whole of it once the pickles are gone. ADR 0034.
 
         A different file, so whatever was said about the last one no longer holds."""
-        with open(os.path.join(self._dir, REPLAY_FILE_NAME), 'w') as f:
-            f.write(text)
-        Path(self._dir, VALIDATED_FILE_NAME).unlink(missing_ok=True)
+        self.store.write(REPLAY_FILE_NAME, text)
+        self.store.remove(VALIDATED_FILE_NAME)
 
     def read_replay(self) -> str:
-        with open(os.path.join(self._dir, REPLAY_FILE_NAME)) as f:
+        with self.reading(REPLAY_FILE_NAME, kind='replay') as f:
             return f.read()
 
     def replay_validated(self) -> bool:
@@ -225,90 +348,84 @@ class GameDirectory(object):
         return self.file_exists(VALIDATED_FILE_NAME)
 
     def mark_replay_validated(self) -> None:
-        Path(self._dir, VALIDATED_FILE_NAME).touch()
+        self.store.write(VALIDATED_FILE_NAME, '')
+
+    def copy_plans_to(self, other: 'GameDirectory') -> None:
+        """Everything but the saved rounds, into a directory that does not exist yet."""
+        other.setup_directories()
+        for name in self.store.files():
+            if not fnmatch.fnmatch(name, 'status_round_*'):
+                other.store.write(name, self._read_bytes(name))
 
     def copy_roster_to(self, other: 'GameDirectory') -> None:
         """The ships file, into a museum directory beside the export: who flew what, in one
         small file that outlives the game directory."""
-        shutil.copy(os.path.join(self._dir, INIT_FILE_NAME),
-                    os.path.join(other._dir, INIT_FILE_NAME))
+        other.store.write(INIT_FILE_NAME, self._read_bytes(INIT_FILE_NAME))
 
     def write_synopsis(self, text: str) -> None:
         """What the director made of the game. Beside the export, never in it: ADR 0036."""
-        with open(os.path.join(self._dir, SYNOPSIS_FILE_NAME), 'w') as f:
-            f.write(text)
+        self.store.write(SYNOPSIS_FILE_NAME, text)
 
     def read_synopsis(self) -> str:
-        path = os.path.join(self._dir, SYNOPSIS_FILE_NAME)
-        if not os.path.exists(path):
+        if not self.file_exists(SYNOPSIS_FILE_NAME):
             return ''
-        with open(path) as f:
+        with self.reading(SYNOPSIS_FILE_NAME, kind='synopsis') as f:
             return f.read()
 
     def write_stories(self, stories: list[dict]) -> None:
         """Every commander's account of the game, one line each, in the order they arrived."""
-        with open(os.path.join(self._dir, STORIES_FILE_NAME), 'w') as f:
-            f.writelines(json.dumps(story) + '\n' for story in stories)
+        self.store.write(STORIES_FILE_NAME, ''.join(json.dumps(story) + '\n' for story in stories))
 
     def read_stories(self) -> list[dict]:
-        path = os.path.join(self._dir, STORIES_FILE_NAME)
-        if not os.path.exists(path):
+        if not self.file_exists(STORIES_FILE_NAME):
             return []
-        with open(path) as f:
+        with self.reading(STORIES_FILE_NAME, kind='stories') as f:
             return [json.loads(line) for line in f if line.strip()]
 
     def write_win_story(self, story: dict) -> None:
         """How the side that won says it was won. One per game, by whoever on it wrote it last."""
-        with open(os.path.join(self._dir, WIN_STORY_FILE_NAME), 'w') as f:
-            f.write(json.dumps(story) + '\n')
+        self.store.write(WIN_STORY_FILE_NAME, json.dumps(story) + '\n')
 
     def read_win_story(self) -> dict | None:
-        path = os.path.join(self._dir, WIN_STORY_FILE_NAME)
-        if not os.path.exists(path):
+        if not self.file_exists(WIN_STORY_FILE_NAME):
             return None
-        with open(path) as f:
+        with self.reading(WIN_STORY_FILE_NAME, kind='stories') as f:
             return json.loads(f.read())
 
     def remove_win_story(self) -> None:
-        path = os.path.join(self._dir, WIN_STORY_FILE_NAME)
-        if os.path.exists(path):
-            os.remove(path)
+        self.store.remove(WIN_STORY_FILE_NAME)
 
     def append_journal(self, entry: dict) -> None:
         """One line about something that happened to this game. The caller stamps the time."""
-        with open(os.path.join(self._dir, JOURNAL_FILE_NAME), 'a') as f:
-            f.write(json.dumps(entry) + '\n')
+        self.store.append(JOURNAL_FILE_NAME, json.dumps(entry) + '\n')
 
     def read_journal(self, limit: int = 0) -> list[dict]:
         """Oldest first. `limit` keeps the last that many."""
-        path = os.path.join(self._dir, JOURNAL_FILE_NAME)
-        if not os.path.exists(path):
+        if not self.file_exists(JOURNAL_FILE_NAME):
             return []
-        with open(path) as f:
+        with self.reading(JOURNAL_FILE_NAME, kind='journal') as f:
             lines = [line for line in f if line.strip()]
         return [json.loads(line) for line in (lines[-limit:] if limit else lines)]
 
     def is_ready(self, player: str, round_nr: int) -> bool:
-        path = os.path.join(self._dir, READY_FILE_TEMPLATE.format(player))
-        if not os.path.exists(path):
+        name = READY_FILE_TEMPLATE.format(player)
+        if not self.file_exists(name):
             return False
         line = READY_LINE_TEMPLATE.format(round_nr)
-        with open(path) as f:
+        with self.reading(name, kind='ready') as f:
             return any(l.strip() == line for l in f)
 
     def set_ready(self, player: str, round_nr: int, ready: bool) -> None:
         """A file per player, so two of them saying ready at once cannot race."""
-        os.makedirs(os.path.join(self._dir, READY_DIR), exist_ok=True)
-        path = os.path.join(self._dir, READY_FILE_TEMPLATE.format(player))
+        name = READY_FILE_TEMPLATE.format(player)
         line = READY_LINE_TEMPLATE.format(round_nr)
         lines = []
-        if os.path.exists(path):
-            with open(path) as f:
+        if self.file_exists(name):
+            with self.reading(name, kind='ready') as f:
                 lines = [l.strip() for l in f if l.strip() and l.strip() != line]
         if ready:
             lines.append(line)
-        with open(path, 'w') as f:
-            f.write('\n'.join(lines) + ('\n' if lines else ''))
+        self.store.write(name, '\n'.join(lines) + ('\n' if lines else ''))
 
     def command_file(self, name, round_nr) -> str:
         return CommandFile(self, name, round_nr).full_name
@@ -320,6 +437,9 @@ class GameDirectory(object):
         """Read a command file with the commands for a ship."""
         return CommandFile(self, name, round_nr).load()
 
+    def write_command_file(self, name, round_nr, lines: list[str]) -> None:
+        CommandFile(self, name, round_nr).save(lines)
+
     def status_file_for_round_exists(self, nr) -> bool:
         return StatusFile(self, nr).exists
 
@@ -351,7 +471,72 @@ class GameDirectory(object):
     # ---------------------------------------------------------------------- COMMANDS
 
     def save_world(self, world: World, nr: int):
+        """The world, and beside it what it was played from and what each of its ticks came to.
+        The old record of what it was played from goes first, so a save stopped halfway leaves a
+        round with none rather than one that is wrong."""
+        self.store.remove(INPUTS_FILE_TEMPLATE.format(nr))
         StatusFile(self, nr).save(world)
+        self.store.write(TICKS_FILE_TEMPLATE.format(nr),
+                         '\n'.join(json.dumps(t) for t in fingerprint.of_ticks(world, nr)))
+        if nr:
+            self.write_inputs(nr, fingerprint.of_round(self, nr, self.read_inputs(nr - 1) or ''),
+                              fingerprint.of_round(self, nr, self.read_plans(nr - 1) or '',
+                                                   engine_too=False))
+        else:
+            self.write_inputs(nr, fingerprint.of_setup(self),
+                              fingerprint.of_setup(self, engine_too=False))
+        self.keep_only_keyframes()
+
+    def keep_only_keyframes(self):
+        """Let go of every world the game does not keep: all but round 0, every `keep_every`th
+        round and the latest. What each round was played from and came to stays, which is what
+        playing one again is checked against. See docs/adr/0041-keep-only-some-rounds.md."""
+        every = self.keep_every
+        if not every:
+            return
+        last = self.last_round_number
+        for nr in self.saved_rounds:
+            if nr % every and nr != last:
+                self.store.remove(StatusFile(self, nr).name)
+
+    def lend_world(self, nr: int, other: 'GameDirectory'):
+        """Round `nr` and what it was played from, linked into `other` to be played on from."""
+        world = StatusFile(self, nr)
+        if isinstance(self.store, FileStorage) and os.path.exists(world.full_name):
+            os.link(world.full_name, StatusFile(other, nr).full_name)
+        else:
+            other.store.write(world.name, self._read_bytes(world.name))
+        other.write_inputs(nr, self.read_inputs(nr), self.read_plans(nr))
+
+    def read_ticks(self, nr: int) -> list[dict] | None:
+        """What each tick of round `nr` came to, as recorded when it was played."""
+        if not self.file_exists(TICKS_FILE_TEMPLATE.format(nr)):
+            return None
+        with self.reading(TICKS_FILE_TEMPLATE.format(nr), kind='ticks') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _inputs(self, nr: int) -> list[str]:
+        if not self.file_exists(INPUTS_FILE_TEMPLATE.format(nr)):
+            return []
+        with self.reading(INPUTS_FILE_TEMPLATE.format(nr), kind='inputs') as f:
+            return f.read().split()
+
+    def read_inputs(self, nr: int) -> str | None:
+        """What round `nr` was played from, as recorded when it was. See arena/engine/fingerprint.py."""
+        return next(iter(self._inputs(nr)), None)
+
+    def read_plans(self, nr: int) -> str | None:
+        """The same, over the plans alone. None for a round saved before that was recorded."""
+        return next(iter(self._inputs(nr)[1:]), None)
+
+    def write_inputs(self, nr: int, digest: str, plans: str = None):
+        self.store.write(INPUTS_FILE_TEMPLATE.format(nr), f"{digest}\n{plans}" if plans else digest)
+
+    def forget_rounds_after(self, nr: int):
+        """Take away every round after `nr`, and what each was played from."""
+        for name in fnmatch.filter(self.ls, 'status_round_*'):
+            if int(re.sub(r'\D', '', name)) > nr:
+                self.store.remove(name)
 
     def append_spawn(self, record: dict):
         """A plan is added to rather than rewritten, unlike the world it will produce."""
@@ -359,32 +544,94 @@ class GameDirectory(object):
 
     def clean(self, keep_pickle_files=False):
         """Clean the game directory of all generated files."""
-        types_to_remove = ['*.html', '*.png', '*.pdf', '*.pickle']
+        types_to_remove = ['*.html', '*.png', '*.pdf', '*.pickle', '*.inputs', '*.ticks']
         if keep_pickle_files:
-            types_to_remove = types_to_remove[:-1]
+            types_to_remove = types_to_remove[:-3]
         for file_type in types_to_remove:
             for f in fnmatch.filter(self.ls, file_type):
-                os.remove(os.path.join(self._dir, f))
+                self.store.remove(f)
 
         # Remove round directories
         for rd_dir in fnmatch.filter(self.ls, 'round*'):
-            shutil.rmtree(os.path.join(self._dir, rd_dir))
+            self.store.remove(rd_dir)
+
+    def take_worlds_from(self, other: 'GameDirectory'):
+        """Move in what a replay in `other` wrote: its roster files, and its worlds with what each
+        was played from and came to.
+
+        One rename each, the worlds in round order, so the round being planned is the last to
+        change and every file anyone opens meanwhile is whole."""
+        worlds = sorted((name for name in fnmatch.filter(other.ls, 'status_round_*')
+                         if not name.endswith('.partial')),
+                        key=lambda name: (int(re.sub(r'\D', '', name)), name.endswith('.pickle')))
+        rosters = [name for name in (INIT_FILE_NAME, BODIES_FILE_NAME) if other.file_exists(name)]
+        for name in rosters + worlds:
+            self.store.take(name, other.store)
+        # A world the replay let go of would otherwise stay here beside what the new round was
+        # played from.
+        self.keep_only_keyframes()
+
+    def pack(self):
+        """Every file of the game into one, the pack, and the directory left holding only that."""
+        self.store.pack()
+
+    def unpack(self):
+        self.store.unpack()
 
     def setup_directories(self):
-        if not os.path.exists(self._dir):
-            os.mkdir(self._dir)
-        cmd_dir = os.path.join(self._dir, COMMANDS_DIR)
-        if not os.path.exists(cmd_dir):
-            os.mkdir(cmd_dir)
+        self.store.make(COMMANDS_DIR)
 
     def check_ok(self):
         # Check if all is okay
-        missing = [d for d in (self._dir, self.init_file) if not os.path.exists(d)]
+        found = {self._dir: self.exists, self.init_file: self.file_exists(INIT_FILE_NAME)}
+        missing = [d for d, there in found.items() if not there]
         if missing:
             raise FileExistsError(f"{', '.join(missing)} not found.")
 
 
+class MemoryDirectory(GameDirectory):
+    """A game held in memory, for playing rounds headless: its orders and spawn plan in a
+    MemoryStorage and its worlds as they are, in a dict by round. Nothing is written to disk, and
+    a world is neither pickled nor hashed when it is saved, so a replay cannot be verified.
+
+    Keeping every round keeps a copy of each world as it was saved, because the next round is
+    played on from the same one. Without it, every round is that one world."""
+
+    def __init__(self, game_name: str = 'headless', keep_every_round: bool = False):
+        super().__init__('', game_name, GamesIn.Active, MemoryStorage())
+        self.worlds: dict[int, World] = {}
+        self.keep_every_round = keep_every_round
+
+    @property
+    def last_round_number(self) -> int:
+        return max(self.worlds, default=-1)
+
+    @property
+    def saved_rounds(self) -> list[int]:
+        return sorted(self.worlds)
+
+    def status_file_for_round_exists(self, nr) -> bool:
+        return nr in self.worlds
+
+    def load_world(self, round_nr) -> World:
+        """A copy, when every round is kept, so the round played on it leaves the kept one be."""
+        world = self.worlds[round_nr]
+        return self._copied(world) if self.keep_every_round else world
+
+    def save_world(self, world: World, nr: int):
+        self.worlds[nr] = self._copied(world) if self.keep_every_round else world
+        self.worlds[nr].kept_in(self)
+
+    def _copied(self, world: World) -> World:
+        copy = pickle.loads(pickle.dumps(world))
+        copy.kept_in(self)
+        return copy
+
+
 class GameFile(ABC):
+    # What a read of it is counted as. See arena/tally.py.
+    kind = 'text'
+
     def __init__(self, gd: GameDirectory, name: str):
         self.gd = gd
         self._name = name
@@ -401,15 +648,17 @@ class GameFile(ABC):
     def exists(self) -> bool:
         return self.gd.file_exists(self.name)
 
+    def _reading(self, mode: str = 'r'):
+        return self.gd.reading(self.name, mode, kind=self.kind)
+
     def load(self) -> list:
         """Load file, one stripped line per list item"""
-        with open(self.full_name) as f:
+        with self._reading() as f:
             return [line.strip() for line in f.readlines()]
 
     def save(self, contents):
         """Write file, one line per list item"""
-        with open(self.full_name, 'w') as f:
-            f.write('\n'.join(contents))
+        self.gd.store.write(self.name, '\n'.join(contents))
 
 
 class JsonLinesFile(GameFile):
@@ -428,6 +677,8 @@ class JsonLinesFile(GameFile):
 
 
 class ShipFile(JsonLinesFile):
+    kind = 'ships'
+
     @dataclass
     class ShipFileLine:
         name: str
@@ -483,6 +734,7 @@ class BodyFile(JsonLinesFile):
 
     Optional, because a game without any is a game on empty space. Nothing writes coordinates
     back the way ships do, since a fixture never moves off the ones it was given."""
+    kind = 'bodies'
 
     @dataclass
     class BodyFileLine:
@@ -514,6 +766,7 @@ class SpawnFile(JsonLinesFile):
     A plan is added to, never rewritten, so a line stands for one instruction that was given.
     What a ShipSpawner creates does not belong here: its Fire order is already the instruction,
     and a second record would spawn it twice on a replay."""
+    kind = 'spawns'
 
     def __init__(self, gd: GameDirectory):
         super().__init__(gd, SPAWN_FILE_NAME)
@@ -522,12 +775,13 @@ class SpawnFile(JsonLinesFile):
         return super().load() if self.exists else list()
 
     def append(self, record: dict):
-        with open(self.full_name, 'a') as f:
-            f.write(json.dumps(record) + '\n')
+        self.gd.store.append(self.name, json.dumps(record) + '\n')
 
 
 class StatusFile(GameFile):
     """Pickle file with the state of the game between rounds."""
+    kind = 'world'
+
     def __init__(self, gd: GameDirectory, nr: int):
         self.nr = nr
         super().__init__(gd, self.name)
@@ -540,8 +794,10 @@ class StatusFile(GameFile):
     def round(self) -> int:
         return self.nr
 
+    @trace.traced('StatusFile.load', 'io')
     def load(self) -> World:
-        with open(self.full_name, 'rb') as f:
+        with self._reading('rb') as f:
+            tally.unpickled()
             try:
                 world = pickle.load(f)
             except Exception as e:
@@ -549,14 +805,15 @@ class StatusFile(GameFile):
         world.kept_in(self.gd)
         return world
 
+    @trace.traced('StatusFile.save', 'io')
     def save(self, world: World):
         assert isinstance(world, World)
-        with open(self.full_name, 'wb') as status_file:
-            pickle.dump(world, status_file)
+        # Replaced whole, so a process stopped halfway leaves the round unsaved, not broken.
+        self.gd.store.write(self.name, pickle.dumps(world))
 
     def missing(self) -> dict:
         """What this round names that the code no longer has, and how often."""
-        with open(self.full_name, 'rb') as f:
+        with self._reading('rb') as f:
             reader = _Stubbing(f)
             try:
                 reader.load()
@@ -565,8 +822,83 @@ class StatusFile(GameFile):
         return reader.absent
 
 
+class CachedStatusFile(StatusFile):
+    """A world in the cache, read as round `nr` of the game asking for it."""
+
+    def __init__(self, gd: GameDirectory, nr: int, path: Path):
+        super().__init__(gd, nr)
+        self._path = path
+
+    @property
+    def full_name(self):
+        return str(self._path)
+
+    def _reading(self, mode: str = 'r'):
+        return tally.reading(self.full_name, mode, kind=self.kind)
+
+
+@dataclass(frozen=True)
+class WorldCache:
+    """Worlds played again because their game let go of them, shared by every game on a data root.
+
+    Each is named after the hash of what it was played from, so an entry never goes stale: a game
+    whose plans changed asks for another name. Past WORLD_CACHE_ROUNDS entries, the least recently
+    read go first."""
+
+    path: Path
+
+    def _entry(self, gd: GameDirectory, nr: int) -> Path | None:
+        digest = gd.read_inputs(nr)
+        return self.path / f"{digest}.pickle" if digest else None
+
+    def holds(self, gd: GameDirectory, nr: int) -> bool:
+        entry = self._entry(gd, nr)
+        return bool(entry) and entry.exists()
+
+    def load(self, gd: GameDirectory, nr: int) -> World | None:
+        """Round `nr` of `gd`, if it has been played again and is still here."""
+        if not (entry := self._entry(gd, nr)):
+            return None
+        try:
+            os.utime(entry)
+            return CachedStatusFile(gd, nr, entry).load()
+        except FileNotFoundError:
+            return None
+
+    def keep(self, gd: GameDirectory, nr: int):
+        """Round `nr` as `gd` saved it, linked in under what it was played from."""
+        entry = self._entry(gd, nr)
+        partial = entry.with_suffix(f".{os.getpid()}.partial")
+        partial.unlink(missing_ok=True)
+        os.link(StatusFile(gd, nr).full_name, partial)
+        os.replace(partial, entry)
+        self._evict()
+
+    def lend(self, gd: GameDirectory, nr: int, other: GameDirectory):
+        """Round `nr` of `gd` from here, linked into `other` to be played on from."""
+        os.link(self._entry(gd, nr), StatusFile(other, nr).full_name)
+        other.write_inputs(nr, gd.read_inputs(nr), gd.read_plans(nr))
+
+    def scratch(self) -> str:
+        """A directory of its own to play in, on the same disk so its worlds can be linked in."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        return tempfile.mkdtemp(dir=self.path, prefix='playing-')
+
+    def _evict(self):
+        entries = []
+        for entry in self.path.glob('*.pickle'):
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry))
+            except FileNotFoundError:
+                pass   # somebody else evicted it first
+        for _, entry in sorted(entries, reverse=True)[WORLD_CACHE_ROUNDS:]:
+            entry.unlink(missing_ok=True)
+
+
 class CommandFile(GameFile):
     """A player's command file for one ship for one round"""
+    kind = 'commands'
+
     def __init__(self, gd: GameDirectory, ship_name: str, round_nr: int):
         self.ship_name = ship_name
         self.round_nr = round_nr
@@ -577,4 +909,5 @@ class CommandFile(GameFile):
         return COMMAND_FILE_TEMPLATE.format(self.ship_name, self.round_nr)
 
 
-GAMES_ROOT = GamesRoot(Path(GAME_DATA_DIR))
+GAMES_ROOT = GamesRoot(Path(GAME_DATA_DIR),
+                       SqliteStorage(GAME_DATABASE) if GAME_DATABASE else None)
@@ -0,0 +1,27 @@
+"""Which of the engine's hooks a class actually answers.
+
+Most hooks are empty defaults, and a tick calls each of them on everything in space. A class that
+leaves one alone has nothing to do in that phase, so the phase can pass it by. Worked out once per
+class, from the class: it is a question about the code, where ADR 0010 is about what an object
+says it is."""
+
+from functools import cache
+
+
+@cache
+def overridden(cls: type, base: type) -> frozenset:
+    """The names base defines that cls gives a body of its own."""
+    return frozenset(name for name, default in vars(base).items()
+                     if getattr(cls, name, default) is not default)
+
+
+def answers(thing, base: type, *hooks: str) -> bool:
+    """Whether thing's class overrides any of base's hooks named."""
+    return not overridden(type(thing), base).isdisjoint(hooks)
+
+
+def answering(things, base: type, *hooks: str) -> list:
+    """Those of things that answer any of the hooks, in the order given.
+
+    The order is the caller's, so skipping the rest cannot change what happens to these."""
+    return [t for t in things if answers(t, base, *hooks)]
@@ -102,6 +102,6 @@ class Beacon(ObjectInSpace):
             if ois is self or ois.name in self.docked or not self.has_docked(ois):
                 continue
             self.docked.add(ois.name)
-            arrival = ArrivalEvent(f"{ois.name} docked at {self.name}.", ois)
+            arrival = ArrivalEvent("{} docked at {}.", ois, ois.name, self.name)
             self.add_event(arrival)
             ois.add_event(arrival)
\ No newline at end of file
@@ -41,8 +41,8 @@ class Component(ABC):
     def description(self):
         return self.__class__.__name__
 
-    def add_internal_event(self, message: str):
-        self.owner.add_event(InternalEvent(message))
+    def add_internal_event(self, message: str, *args):
+        self.owner.add_event(InternalEvent(message, *args))
 
     def attach(self, container):
         self.container = container
@@ -73,10 +73,10 @@ class Component(ABC):
         pass
 
     def activation(self, on_off: bool):
-        self.owner.add_event(InternalEvent(f"Component {self.name} can not be activated/deactivated."))
+        self.owner.add_event(InternalEvent("Component {} can not be activated/deactivated.", self.name))
 
     def power_up(self, amount: int):
-        self.owner.add_event(InternalEvent(f"Component {self.name} can not be powered."))
+        self.owner.add_event(InternalEvent("Component {} can not be powered.", self.name))
 
     @property
     def expected_parameters(self):
@@ -24,7 +24,7 @@ class Controller(Component, ABC):
 
     def add_command(self, tick_nr: int, command: str, world):
         cmd = Command.for_command_line(CommandLine(f"{tick_nr}: {command}"), self.container, world)
-        self.add_internal_event(f"{self.name}: adding command '{cmd.command_line.text}'")
+        self.add_internal_event("{}: adding command '{}'", self.name, cmd.command_line.text)
         self.container.commands[cmd.tick].add(cmd)
 
 
@@ -40,7 +40,7 @@ class Pilot(Controller):
     def set_current_target(self, target_name: str):
         if not self.target_name or self.target_name != target_name:
             self.target_name = target_name
-            self.add_internal_event(f"{self.name}: setting target to {self.target_name}")
+            self.add_internal_event("{}: setting target to {}", self.name, self.target_name)
 
     def decide(self, world: World, tick: Tick):
         if self.target_name:
@@ -68,7 +68,7 @@ class Gunner(Controller):
 
     def set_targeting_mode(self, mode: TargetingMode):
         if mode != self.target_mode:
-            self.add_internal_event(f"{self.name}: setting targeting mode to {mode}")
+            self.add_internal_event("{}: setting targeting mode to {}", self.name, mode)
             self.target_mode = mode
 
     @property
@@ -87,7 +87,7 @@ class Gunner(Controller):
                     if took_a_shot:
                         break
             if not took_a_shot and enemies:
-                self.add_internal_event(f"{self.name}: Firing at closest enemy.")
+                self.add_internal_event("{}: Firing at closest enemy.", self.name)
                 self.fire_laser(laser, enemies[0], tick, world)
 
     def fire_laser(self, laser, enemy, tick, world):
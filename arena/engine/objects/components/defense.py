@@ -74,13 +74,13 @@ class Shields(Component):
         if amount > self.container.battery:
             amount = self.container.battery
         self.container.battery -= amount
-        self.add_internal_event(f"Used {amount} energy: battery at {self.container.battery}")
+        self.add_internal_event("Used {} energy: battery at {}", amount, self.container.battery)
 
         self.strengths[qdrt] += amount
         if self.strengths[qdrt] > 2 * self.max_strengths[qdrt]:
-            self.add_internal_event(f"Shield {qdrt} can't boost beyond twice the strength.")
+            self.add_internal_event("Shield {} can't boost beyond twice the strength.", qdrt)
             self.strengths[qdrt] = 2 * self.max_strengths[qdrt]
-        self.add_internal_event(f"Boosted shield quadrant {qdrt} to {self.strengths[qdrt]}")
+        self.add_internal_event("Boosted shield quadrant {} to {}", qdrt, self.strengths[qdrt])
 
     def take_damage_from(self, damage_type: DamageType, damage: int, struck_from: Point) -> Effect:
         """Take what reached this shield, and answer with what became of it.
@@ -104,12 +104,12 @@ class Shields(Component):
         taken = min(strength, damage)
         self.strengths[quadrant] = strength - taken
         if damage <= strength:
-            self.add_internal_event(f"Shield {quadrant} hit for {damage}. "
-                                    f"Remaining strength: {self.strengths[quadrant]}")
+            self.add_internal_event("Shield {} hit for {}. Remaining strength: {}",
+                                    quadrant, damage, self.strengths[quadrant])
             return Effect(self.name, Outcome.Damaged, taken, taken // 2, 0)
 
         through = damage - taken
-        self.add_internal_event(f"Hit on shield {quadrant} broke the shield: {through} passed through.")
+        self.add_internal_event("Hit on shield {} broke the shield: {} passed through.", quadrant, through)
         return Effect(self.name, Outcome.Breached, taken,
                       taken // 2 + self.shield_break_score, through)
 
@@ -122,5 +122,5 @@ class Shields(Component):
         super().post_round_reset()
         for qdrt in ['N', 'E', 'S', 'W']:
             if self.strengths[qdrt] > self.max_strengths[qdrt]:
-                self.add_internal_event(f"Shield {qdrt} boost dissipated: now at {self.strengths[qdrt]}.")
+                self.add_internal_event("Shield {} boost dissipated: now at {}.", qdrt, self.strengths[qdrt])
                 self.strengths[qdrt] = self.max_strengths[qdrt]
@@ -27,11 +27,11 @@ class Cloak(Component):
         spent = min(amount - self.power, self.container.battery) if amount > self.power else 0
         self.container.battery -= spent
         self.power = amount
-        self.add_internal_event(f"Cloak {self.name} drawing {self.power} energy a tick.")
+        self.add_internal_event("Cloak {} drawing {} energy a tick.", self.name, self.power)
 
     def use_energy(self):
         if self.power > self.container.battery:
-            self.add_internal_event(f"Not enough energy for cloak {self.name}: shutting down.")
+            self.add_internal_event("Not enough energy for cloak {}: shutting down.", self.name)
             self.power = 0
         else:
             self.container.battery -= self.power
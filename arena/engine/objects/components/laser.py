@@ -55,16 +55,18 @@ class Laser(Weapon):
     def fire(self, params: dict, world: World, tick: Tick):
         target_ship = params['target'].value
         if not target_ship:
-            self.add_internal_event(f"Can't fire {self.name}. Unknown (or dead?) ship name: {params['target'].object_name}")
+            self.add_internal_event("Can't fire {}. Unknown (or dead?) ship name: {}",
+                                    self.name, params['target'].object_name)
             return None
 
         firing_angle = self.owner.direction_to(target_ship.xy)
         if self.firing_arc and not self.in_firing_arc(firing_angle):
-            self.add_internal_event(f"{self.name} can not fire at angle {round(firing_angle, 1)}: {self.firing_arc}.")
+            self.add_internal_event("{} can not fire at angle {}: {}.",
+                                    self.name, round(firing_angle, 1), self.firing_arc)
             return None
 
         if self.container.can_scan(target_ship, world) and not self.damage_to(target_ship):
-            self.add_internal_event(f"{self.name} is out of reach at this distance: no damage.")
+            self.add_internal_event("{} is out of reach at this distance: no damage.", self.name)
             return None
 
         if target_ship and self.can_fire_at(target_ship, world):
@@ -82,7 +84,8 @@ class Laser(Weapon):
             temp_status = 'Overheated' if not self.temperature_ok else ''
             battery_status = 'Low Battery' if not self.energy_ok else ''
             target_status = 'Target not visible' if not self.owner.can_scan(target_ship, world) else ''
-            self.add_internal_event(f"Ship {self.owner.name} failed to laser {target_ship.name}: {' '.join([temp_status, battery_status, target_status])}")
+            self.add_internal_event("Ship {} failed to laser {}: {}", self.owner.name, target_ship.name,
+                                    ' '.join([temp_status, battery_status, target_status]))
         self.temperature += self.heat_per_shot
         self.container.battery -= self.energy_per_shot
 
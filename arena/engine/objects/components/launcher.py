@@ -42,18 +42,19 @@ class Launcher(Weapon):
         firing_angle = params['direction'].value
 
         if self.ammo <= 0:
-            self.add_internal_event(f"{self.name} could not fire: ammo empty.")
+            self.add_internal_event("{} could not fire: ammo empty.", self.name)
             return None
 
         if self.firing_arc and not self.in_firing_arc(firing_angle):
-            self.add_internal_event(f"{self.name} can not fire at angle {firing_angle}: {self.firing_arc}.")
+            self.add_internal_event("{} can not fire at angle {}: {}.",
+                                    self.name, firing_angle, self.firing_arc)
             return None
 
         self.missile_number += 1
         self.ammo -= 1
         heading = (self.container.heading + firing_angle) % 360
         name = f'{self.container.name}-{self.payload_type.name}-{self.name}-{self.missile_number}'
-        self.add_internal_event(f"Launcher {self.name} fired {name} in direction {firing_angle}")
+        self.add_internal_event("Launcher {} fired {} in direction {}", self.name, name, firing_angle)
         return self._create_missile(name, heading=heading, tick=tick)
 
     @property
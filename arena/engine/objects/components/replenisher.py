@@ -43,27 +43,27 @@ class Replenisher(Weapon):
     def fire(self, params: dict, world: World, tick: Tick):
         ship = params['ship'].value
         if not ship:
-            self.add_internal_event(f"{self.name}: {params['ship'].object_name} is not in space.")
+            self.add_internal_event("{}: {} is not in space.", self.name, params['ship'].object_name)
             return None
         if ship is self.container:
-            self.add_internal_event(f"{self.name} can not restock the base it is mounted on.")
+            self.add_internal_event("{} can not restock the base it is mounted on.", self.name)
             return None
         if not ship.faction:
-            self.add_internal_event(f"{self.name}: {ship.name} is not a ship it can restock.")
+            self.add_internal_event("{}: {} is not a ship it can restock.", self.name, ship.name)
             return None
         distance = self.container.distance_to(ship.xy)
         if distance > self.range:
-            self.add_internal_event(
-                f"{self.name}: {ship.name} is {distance} away, beyond the {self.range} it reaches.")
+            self.add_internal_event("{}: {} is {} away, beyond the {} it reaches.",
+                                    self.name, ship.name, distance, self.range)
             return None
         if ship.speed > self.max_approach_speed:
-            self.add_internal_event(
-                f"{self.name}: {ship.name} is passing at {ship.speed}, too fast to hold.")
+            self.add_internal_event("{}: {} is passing at {}, too fast to hold.",
+                                    self.name, ship.name, ship.speed)
             return None
 
         ship.replenish()
-        self.owner.add_event(ReplenishEvent(f"Replenished {ship.name}"))
-        ship.add_event(ReplenishEvent(f"Replenished by {self.container.name}"))
+        self.owner.add_event(ReplenishEvent("Replenished {}", ship.name))
+        ship.add_event(ReplenishEvent("Replenished by {}", self.container.name))
         return None
 
     @property
@@ -49,17 +49,18 @@ class Gravscan(Weapon):
                                (direction + scan_cone // 2) % 360)
             scan_distance = self.reach_of(scan_cone)
             self.container.battery -= self.energy_per_pulse
-            self.add_internal_event(f"Gravscan {self.name} used {self.energy_per_pulse} energy.")
-            self.add_internal_event(f"Gravscan {self.name} activated (width {scan_cone}, distance {scan_distance}).")
+            self.add_internal_event("Gravscan {} used {} energy.", self.name, self.energy_per_pulse)
+            self.add_internal_event("Gravscan {} activated (width {}, distance {}).",
+                                    self.name, scan_cone, scan_distance)
             pings = 0
             for ois in world.objects.values():
                 if self.in_firing_arc(self.container.direction_to(ois.pos)):
                     if self.container.distance_to(ois.pos) <= ois.modify_scan_range(scan_distance):
                         pings += 1
                         self.container.add_event(ScanEvent.create_scan(self.container, ois))
-            self.add_internal_event(f"Gravscan got {pings} pings.")
+            self.add_internal_event("Gravscan got {} pings.", pings)
         else:
-            self.add_internal_event(f"Not enough energy to fire Gravscan.")
+            self.add_internal_event("Not enough energy to fire Gravscan.")
         self.firing_arc = self.default_firing_arc
 
     @property
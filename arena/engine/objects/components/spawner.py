@@ -41,20 +41,20 @@ class ShipSpawner(Weapon):
         direction = params['direction'].value
 
         if not wreck:
-            self.add_internal_event(
-                f"{self.name}: {params['wreck'].object_name} is not a wreck in this game.")
+            self.add_internal_event("{}: {} is not a wreck in this game.",
+                                    self.name, params['wreck'].object_name)
             return None
         if wreck.faction != self.owner.faction:
-            self.add_internal_event(f"{self.name}: {wreck.name} was not ours to replace.")
+            self.add_internal_event("{}: {} was not ours to replace.", self.name, wreck.name)
             return None
         if CLAIMED in wreck.tags:
-            self.add_internal_event(f"{self.name}: {wreck.name} has already been replaced.")
+            self.add_internal_event("{}: {} has already been replaced.", self.name, wreck.name)
             return None
         if self.ammo <= 0:
-            self.add_internal_event(f"{self.name} has no replacements left.")
+            self.add_internal_event("{} has no replacements left.", self.name)
             return None
         if self.firing_arc and not self.in_firing_arc(direction):
-            self.add_internal_event(f"{self.name} can not spawn at angle {direction}: {self.firing_arc}.")
+            self.add_internal_event("{} can not spawn at angle {}: {}.", self.name, direction, self.firing_arc)
             return None
 
         self.ammo -= 1
@@ -64,9 +64,9 @@ class ShipSpawner(Weapon):
         replacement = builder.spawn(wreck.type_name, self.replacement_name(wreck.name, world),
                                     vector, tick=tick, player=wreck.player)
         replacement.faction = wreck.faction
-        wreck.tags.add(CLAIMED)
-        self.add_internal_event(
-            f"{self.name} replaced {wreck.name} with {replacement.name} for {wreck.player}.")
+        world.tag(wreck, CLAIMED)
+        self.add_internal_event("{} replaced {} with {} for {}.",
+                                self.name, wreck.name, replacement.name, wreck.player)
         return replacement
 
     @staticmethod
@@ -54,7 +54,7 @@ class Warhead(Component):
         if self.spent:
             return None
         fractions = list()
-        for ois in [o for o in world.objects.values() if self.triggers_on(o)]:
+        for ois in [o for o in world.on_other_sides(self.container) if self.triggers_on(o)]:
             from_fraction = max(self.container.tick_fraction, ois.tick_fraction)
             span = 1 - from_fraction
             closest = self.container.leg_from(from_fraction).closest_fraction(
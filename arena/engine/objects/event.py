@@ -125,16 +125,22 @@ class Event(object):
 
 
 class InternalEvent(Event):
-    def __init__(self, message):
+    """A line for the owner's log, kept as its template and values.
+
+    Most of these are never read, so they are only put together when one is. The values are
+    taken as they are at the moment, which is why they have to be ones that cannot change."""
+
+    def __init__(self, message: str, *args):
         super().__init__(None, 'Message', None)
         self.message = message
+        self.args = args
 
     @property
     def kind(self) -> str:
         return 'internal'
 
     def __str__(self):
-        return self.message
+        return self.message.format(*self.args) if self.args else self.message
 
 
 class ReplenishEvent(InternalEvent):
@@ -148,8 +154,8 @@ class ReplenishEvent(InternalEvent):
 class ArrivalEvent(InternalEvent):
     """A ship reaching somewhere the game was played for. What that is worth is nobody's here."""
 
-    def __init__(self, message, ship):
-        super().__init__(message)
+    def __init__(self, message, ship, *args):
+        super().__init__(message, *args)
         self.ship = ship
 
     @property
@@ -4,7 +4,7 @@ Values, all of them. Nothing here knows what an object in space is.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from math import sin, cos, radians, degrees, sqrt, atan2, copysign
 
 # A gap of nothing has no direction, so a closest fraction stops this far short of one. A tenth
@@ -12,11 +12,17 @@ from math import sin, cos, radians, degrees, sqrt, atan2, copysign
 MIN_GAP = 0.1
 
 
-@dataclass
+@dataclass(frozen=True)
 class Point(object):
+    __slots__ = ('x', 'y')
     x: float
     y: float
 
+    def __reduce__(self):
+        # A frozen, slotted class cannot have its fields set back one by one, which is how pickle
+        # would otherwise restore it.
+        return Point, (self.x, self.y)
+
     def translate(self, direction, distance):
         angle = radians(direction)
         new_x = self.x + (sin(angle) * distance)
@@ -34,8 +40,13 @@ class Point(object):
         return self.x, self.y
 
 
-@dataclass
+@dataclass(frozen=True)
 class Vector(object):
+    """Where something is, which way it faces and how fast it goes. A change is a new Vector.
+
+    What is worked out from one is kept on it the first time it is asked, which stays true for as
+    long as the vector does and goes with it when an object is given another."""
+    __slots__ = ('pos', 'heading', 'speed', '_delta', '_rounded_pos')
     pos: Point
     heading: float
     speed: float
@@ -44,7 +55,10 @@ class Vector(object):
         # A heading is a direction, so 450 and 90 are the same one. direction_to folds a
         # difference into [-180, 180] with a single wrap, and gets it wrong for anything
         # further out, so a heading never gets to leave the circle.
-        self.heading = self.heading % 360
+        object.__setattr__(self, 'heading', self.heading % 360)
+
+    def __reduce__(self):
+        return Vector, (self.pos, self.heading, self.speed)
 
     @property
     def x(self):
@@ -61,11 +75,33 @@ class Vector(object):
             speed=round(self.speed, digits)
         )
 
+    @property
+    def rounded_pos(self) -> Point:
+        """The position to a tenth, which is what anybody is shown."""
+        try:
+            return self._rounded_pos
+        except AttributeError:
+            object.__setattr__(self, '_rounded_pos', self.pos.rounded(1))
+            return self._rounded_pos
+
     @property
     def delta(self) -> tuple:
         """This tick's travel, as a change in x and y."""
-        angle = radians(self.heading)
-        return sin(angle) * self.speed, cos(angle) * self.speed
+        try:
+            return self._delta
+        except AttributeError:
+            angle = radians(self.heading)
+            object.__setattr__(self, '_delta', (sin(angle) * self.speed, cos(angle) * self.speed))
+            return self._delta
+
+    def with_pos(self, pos: Point) -> 'Vector':
+        return Vector(pos, self.heading, self.speed)
+
+    def with_heading(self, heading: float) -> 'Vector':
+        return Vector(self.pos, heading, self.speed)
+
+    def with_speed(self, speed: float) -> 'Vector':
+        return Vector(self.pos, self.heading, speed)
 
     def with_delta(self, dx: float, dy: float) -> 'Vector':
         """The same position, travelling as that change in x and y describes.
@@ -74,9 +110,9 @@ class Vector(object):
         it faced rather than the way it now travels."""
         travel = degrees(atan2(dx, dy)) % 360
         astern = self.speed < 0
-        return replace(self,
-                       heading=(travel + 180) % 360 if astern else travel,
-                       speed=copysign(sqrt(dx * dx + dy * dy), self.speed))
+        return Vector(self.pos,
+                      (travel + 180) % 360 if astern else travel,
+                      copysign(sqrt(dx * dx + dy * dy), self.speed))
 
     def component_along(self, direction: float) -> float:
         """How much of this travel runs in that direction, negative when it runs against it."""
@@ -85,19 +121,19 @@ class Vector(object):
         return dx * sin(angle) + dy * cos(angle)
 
     def translate(self, direction, distance):
-        return replace(self, pos=self.pos.translate(direction, distance))
+        return Vector(self.pos.translate(direction, distance), self.heading, self.speed)
 
     def move(self, fraction: float = 1):
         return self.translate(self.heading, self.speed * fraction)
 
     def turn(self, angle):
-        return replace(self, heading=self.heading + angle)
+        return Vector(self.pos, self.heading + angle, self.speed)
 
     def accelerate(self, delta_v):
-        return replace(self, speed=self.speed + delta_v)
+        return Vector(self.pos, self.heading, self.speed + delta_v)
 
     def copy(self):
-        return replace(self)
+        return self
 
 
 @dataclass
@@ -8,6 +8,7 @@ from arena.engine.objects.geometry import Vector
 from arena.engine.objects.objectinspace import Encounter, Impulse, ObjectInSpace, Stance
 from .event import DamageType, HitEvent
 from arena.engine.objects.component import Component
+from arena.engine.hooks import answering
 from arena.engine.history import Tick, TICK_ZERO
 from arena.engine.world import World
 
@@ -124,8 +125,8 @@ class MachineInSpace(ObjectInSpace, ABC):
         """The earliest of what it runs into and what any of its components names."""
         if self.is_destroyed or self.tick_ended:
             return None
-        found = [e for e in
-                 [super().encounter(world)] + [c.encounter(world) for c in self.all_components.values()]
+        reaching = answering(self.all_components.values(), Component, 'encounter')
+        found = [e for e in [super().encounter(world)] + [c.encounter(world) for c in reaching]
                  if e is not None]
         return min(found, key=lambda e: e.fraction) if found else None
 
@@ -149,6 +150,10 @@ class MachineInSpace(ObjectInSpace, ABC):
             return Stance.Neutral
         return Stance.Friend if mine == theirs else Stance.Foe
 
+    @property
+    def side(self) -> str | None:
+        return self.owner.faction
+
     @property
     def range(self) -> int:
         """The furthest any of this machine's components acts into space."""
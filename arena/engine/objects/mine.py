@@ -49,11 +49,11 @@ class Mine(MachineInSpace):
             wh.post_move(world)
 
         speed = self.speed - self._type.slow_down_rate
-        self.vector.speed = speed if speed > 0 else 0
+        self.speed = speed if speed > 0 else 0
 
         # Die when battery is dead.
         self.battery -= self._type.energy_per_tick
         if self.is_destroyed and (self.battery <= 0):
-            self.owner.add_event(InternalEvent(f"{self.name} fizzled out."))
+            self.owner.add_event(InternalEvent("{} fizzled out.", self.name))
 
 
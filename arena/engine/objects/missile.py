@@ -6,7 +6,6 @@ Further capabilities are defined by their warheads (and other components in futu
 """
 
 import logging
-from dataclasses import replace
 
 from .event import InternalEvent
 from arena.engine.objects.geometry import Vector
@@ -66,7 +65,7 @@ class Missile(MachineInSpace):
         # Die when battery is dead.
         self.battery -= self.energy_per_move
         if self.is_destroyed and (self.battery <= 0):
-            self.owner.add_event(InternalEvent(f"{self.name} fizzled out."))
+            self.owner.add_event(InternalEvent("{} fizzled out.", self.name))
 
     def _intercept(self):
         """Rockets just fly straight"""
@@ -101,7 +100,7 @@ class GuidedMissile(Missile):
     def scan(self, world: World):
         """Find the nearest enemy object in the scan cone"""
         self.target = None
-        for ois in [o for o in world.objects.values() if o.stance_towards(self) == Stance.Foe]:
+        for ois in [o for o in world.on_other_sides(self) if o.stance_towards(self) == Stance.Foe]:
             if self.can_scan(ois, world) and self.in_scan_cone(ois):
                 if self.target:
                     if self.distance_to(ois.xy) < self.distance_to(self.target.xy):
@@ -115,7 +114,7 @@ class GuidedMissile(Missile):
             intercept_pos = self.target.vector.translate(self.target.heading, self.target.speed).pos
             intercept_distance = self.distance_to(intercept_pos)
             if intercept_distance < self.speed:
-                self.vector.speed = round(intercept_distance - 1, 0)
+                self.speed = round(intercept_distance - 1, 0)
             self.turn(self.direction_to(intercept_pos))
 
 
@@ -128,5 +127,5 @@ class MissileType(MachineType):
     mass = 0.1
 
     def create(self, name: str, vector: Vector, owner=None, tick: Tick = TICK_ZERO):
-        vector = replace(vector, speed=self.max_speed)
+        vector = vector.with_speed(self.max_speed)
         return super().create(name, vector, owner, tick)
@@ -11,7 +11,7 @@ import logging
 from enum import Enum
 from math import degrees, sqrt, atan2, pi
 from abc import abstractmethod, ABC
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 
 from arena.engine.history import History, Tick, TICK_ZERO
 from arena.engine.objects.event import InternalEvent, Event
@@ -114,7 +114,7 @@ class ObjectInSpace(ABC):
 
     @property
     def pos(self):
-        return self.vector.pos.rounded(1)
+        return self.vector.rounded_pos
 
     @property
     def heading(self):
@@ -126,8 +126,6 @@ class ObjectInSpace(ABC):
 
     def distance_to(self, point: Point) -> float:
         assert isinstance(point, Point), f"{point} is not a Point"
-        if isinstance(point, tuple):
-            point = Point(*point)
         return round(sqrt((self.vector.x - point.x)**2 + (self.vector.y - point.y)**2), 1)
 
     @property
@@ -216,6 +214,12 @@ class ObjectInSpace(ABC):
         """How much space this takes up, and so what stops at it. Most things are a point."""
         return 0
 
+    @property
+    def range(self) -> float:
+        """The furthest this acts into space around itself. Only a machine carries anything that
+        does."""
+        return 0
+
     @property
     def is_immovable(self) -> bool:
         """Effectively infinite mass, said without the arithmetic: the world moves around it."""
@@ -230,6 +234,14 @@ class ObjectInSpace(ABC):
         """Nothing in space is on a side until something puts it on one."""
         return Stance.Neutral
 
+    @property
+    def side(self) -> str | None:
+        """The faction it fights for, None when it fights for nobody.
+
+        What World.on_other_sides files it under, so it has to agree with stance_towards: nothing
+        without a side is ever anybody's foe."""
+        return None
+
     @property
     @abstractmethod
     def type_name(self) -> str:
@@ -260,18 +272,18 @@ class ObjectInSpace(ABC):
     def add_event(self, event: Event):
         assert isinstance(event, Event)
         self.history.add_event(event)
-        logger.debug(f"{self.name} event: {str(event)}")
+        logger.debug("%s event: %s", self.name, event)
 
-    def add_internal_event(self, message: str):
+    def add_internal_event(self, message: str, *args):
         assert message is not None
-        self.add_event(InternalEvent(message))
+        self.add_event(InternalEvent(message, *args))
 
     def round_reset(self):
         self.history.reset()
-        logger.debug(f"{self.name} round reset.")
+        logger.debug("%s round reset.", self.name)
 
     def post_round_reset(self):
-        logger.debug(f"{self.name} post-round reset.")
+        logger.debug("%s post-round reset.", self.name)
 
     @property
     def snapshot(self):
@@ -289,12 +301,12 @@ class ObjectInSpace(ABC):
 
     def place_at(self, pos: Point):
         """Put this object somewhere without it having travelled there."""
-        self.vector = replace(self.vector, pos=pos)
+        self.vector = self.vector.with_pos(pos)
         self.moved_from = pos
 
     def face(self, point: Point):
         """Point this object at somewhere without it having turned."""
-        self.vector = replace(self.vector, heading=self.heading_to(point))
+        self.vector = self.vector.with_heading(self.heading_to(point))
 
     def end_tick(self):
         """Spend what is left of the tick where it stands, so a later move does nothing."""
@@ -308,17 +320,17 @@ class ObjectInSpace(ABC):
         self.tick_fraction = to_fraction
         new_pos = self.vector.pos.rounded().as_tuple
         if old_pos != new_pos:
-            logger.debug(f"{self.name} moving from {old_pos} to {new_pos} heading {self.heading}")
-            self.add_internal_event(f"Moved from {old_pos} to {new_pos}")
+            logger.debug("%s moving from %s to %s heading %s", self.name, old_pos, new_pos, self.heading)
+            self.add_internal_event("Moved from {} to {}", old_pos, new_pos)
         else:
-            logger.debug(f"{self.name} no movement at {old_pos}")
+            logger.debug("%s no movement at %s", self.name, old_pos)
 
     def accelerate(self, delta_v):
         self.vector = self.vector.accelerate(delta_v)
 
     @speed.setter
     def speed(self, amount):
-        self.vector = replace(self.vector, speed=amount)
+        self.vector = self.vector.with_speed(amount)
 
     # ---------------------------------------------------------------------- ENGINE HOOKS
 
@@ -20,7 +20,9 @@ from arena.engine.objects.objectinspace import Impulse, ObjectInSpace
 from arena.engine.objects.event import (DamageType, Effect, HitEvent, InternalEvent, Outcome,
                                         ScanEvent)
 from arena.engine.history import Tick, TICK_ZERO
-from arena.engine.world import World
+from arena.engine.hooks import answering
+from arena.engine.objects.component import Component
+from arena.engine.world import World, Whereabouts
 
 logger = logging.getLogger(__name__)
 
@@ -89,25 +91,26 @@ class Ship(MachineInSpace):
     def accelerate(self, delta_v):
         old_speed = self.speed
         if abs(delta_v) > self._type.max_delta_v:
-            self.add_internal_event(f"Limiting acceleration {delta_v} to max acceleration |{self._type.max_delta_v}|")
+            self.add_internal_event("Limiting acceleration {} to max acceleration |{}|",
+                                    delta_v, self._type.max_delta_v)
             delta_v = self._type.max_delta_v if delta_v > 0 else -self._type.max_delta_v
         self.vector = self.vector.accelerate(delta_v)
         if self.speed > self._type.max_speed:
             self.speed = self._type.max_speed
-            self.add_internal_event(f"Limiting speed to max speed |{self._type.max_speed}|")
+            self.add_internal_event("Limiting speed to max speed |{}|", self._type.max_speed)
         if self.speed < -self._type.max_speed:
-            self.vector.speed = -self._type.max_speed
-            self.add_internal_event(f"Limiting speed to max speed |{-self._type.max_speed}|")
+            self.speed = -self._type.max_speed
+            self.add_internal_event("Limiting speed to max speed |{}|", -self._type.max_speed)
         if old_speed != self.speed:
-            self.add_internal_event(f"Changed speed from {old_speed} to {self.speed}")
+            self.add_internal_event("Changed speed from {} to {}", old_speed, self.speed)
 
     def turn(self, angle):
         if abs(angle) > self._type.max_turn:
-            self.add_event(InternalEvent(f"Limiting turn {angle} to max turn |{self._type.max_turn}|"))
+            self.add_event(InternalEvent("Limiting turn {} to max turn |{}|", angle, self._type.max_turn))
             angle = self._type.max_turn if (angle > 0) else -self._type.max_turn
-        self.vector.heading = (self.heading + angle) % 360
+        self.vector = self.vector.with_heading((self.heading + angle) % 360)
         if angle != 0:
-            self.add_internal_event(f"Turned {angle} degrees to {self.heading}")
+            self.add_internal_event("Turned {} degrees to {}", angle, self.heading)
 
     # ---------------------------------------------------------------------- ENGINE HOOKS
 
@@ -115,12 +118,13 @@ class Ship(MachineInSpace):
         self.battery += self.generators
         if self.battery > self._type.max_battery:
             self.battery = self._type.max_battery
-        self.add_internal_event(f"Generated {self.generators} energy: battery at {self.battery}/{self._type.max_battery}")
+        self.add_internal_event("Generated {} energy: battery at {}/{}",
+                                self.generators, self.battery, self._type.max_battery)
 
     def scan(self, world: World):
         """Terrain is on the chart already, so a sweep records only what has to be found."""
-        for ois in [ob for ob in world.objects.values()
-                    if not ob.is_terrain and self.can_scan(ob, world)]:
+        in_space = world.find_objects(where={Whereabouts.Objects}, terrain=False)
+        for ois in [ob for ob in in_space.values() if self.can_scan(ob, world)]:
             self.add_event(ScanEvent.create_scan(self, ois))
 
     def take_impulse_from(self, impulse: Impulse):
@@ -137,8 +141,8 @@ class Ship(MachineInSpace):
         dx, dy = self.vector.delta
         mx, my = impulse.momentum
         self.vector = self.vector.with_delta(dx + mx / self.mass, dy + my / self.mass)
-        self.add_internal_event(f"Struck {impulse.source.name} at {round(arrival)}: "
-                                f"heading {self.heading} at {self.speed}")
+        self.add_internal_event("Struck {} at {}: heading {} at {}",
+                                impulse.source.name, round(arrival), self.heading, self.speed)
 
     def _damage_hull(self, amount: int) -> int:
         """Take the damage, and score for the hull that was actually there to remove.
@@ -155,7 +159,7 @@ class Ship(MachineInSpace):
 
         A ship destroyed earlier in the same tick is still here to be hit, because the round
         clears the dead out only at the end of it. Only the first killing blow scores."""
-        logger.debug(f"{self.name} taking damage from HitEvent {str(hit_event)}")
+        logger.debug("%s taking damage from HitEvent %s", self.name, hit_event)
         self.add_event(hit_event)
 
         already_killed = self.is_destroyed
@@ -174,15 +178,16 @@ class Ship(MachineInSpace):
             if hit_event._type == DamageType.Nanocyte:
                 amount = 2 * amount
                 score = self._damage_hull(amount)
-                self.add_internal_event(f"Nanocytes burned your hull for {amount} to {self.hull}")
+                self.add_internal_event("Nanocytes burned your hull for {} to {}", amount, self.hull)
             elif hit_event._type == DamageType.EMP:
                 battery_drain = amount if amount <= self.battery else self.battery
                 score = min(amount, self.battery) // 2
                 self.battery -= battery_drain
-                self.add_internal_event(f"EMP blast drained out battery by {battery_drain}: {self.battery} left.")
+                self.add_internal_event("EMP blast drained out battery by {}: {} left.",
+                                        battery_drain, self.battery)
             else:
                 score = self._damage_hull(amount)
-                self.add_internal_event(f"Hull decreased by {amount} to {self.hull}")
+                self.add_internal_event("Hull decreased by {} to {}", amount, self.hull)
 
             what_was_hit = BATTERY if hit_event._type == DamageType.EMP else HULL
             hit_event.add_effect(Effect(what_was_hit, Outcome.Damaged, amount, score, 0))
@@ -190,27 +195,27 @@ class Ship(MachineInSpace):
         if not already_killed and self.is_destroyed:
             # Only the final blow scores the kill.
             hit_event.add_effect(Effect(HULL, Outcome.Breached, 0, self.kill_score, 0))
-            self.add_internal_event(f"You were destroyed. Killing blow by {hit_event.source.name}.")
+            self.add_internal_event("You were destroyed. Killing blow by {}.", hit_event.source.name)
 
     def tick(self, tick: Tick):
         super().tick(tick)
-        logger.debug(f"{self.name} starting tick {tick}")
-        for comp in self.all_components.values():
+        logger.debug("%s starting tick %s", self.name, tick)
+        for comp in answering(self.all_components.values(), Component, 'tick'):
             comp.tick(tick)
 
     def use_energy(self):
-        for comp in self.all_components.values():
+        for comp in answering(self.all_components.values(), Component, 'use_energy'):
             comp.use_energy()
         if self.battery < (self.speed // 10):
             new_max_speed = self.battery * 10
-            self.add_internal_event(f"Not enough energy for current speed: slowing down to {new_max_speed}")
+            self.add_internal_event("Not enough energy for current speed: slowing down to {}", new_max_speed)
             self.speed = new_max_speed
 
     def post_move(self, world):
         # Spend energy based on speed
         movement_energy = self.speed // 10
         self.battery -= movement_energy
-        self.add_internal_event(f"Used {movement_energy} energy for movement.")
+        self.add_internal_event("Used {} energy for movement.", movement_energy)
 
     def decide(self, world: World, tick: Tick):
         for comp in self.control.values():
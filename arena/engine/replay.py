@@ -3,6 +3,7 @@
 Game is the game moving forward. This is every round of it that has been saved, so any tick can be
 asked what was in space at it."""
 
+from arena.engine.game import world_of
 from arena.engine.gamedirectory import GameDirectory
 from arena.engine.history import TICK_ZERO, Tick
 from arena.engine.world import World
@@ -16,7 +17,7 @@ class Replay(object):
     there yet; ask a later one and its copy of the object has moved on."""
 
     def __init__(self, gd: GameDirectory):
-        self.worlds = {nr: gd.load_world(nr) for nr in range(gd.last_round_number + 1)}
+        self.worlds = {nr: world_of(gd, nr) for nr in range(gd.last_round_number + 1)}
 
     @property
     def first(self) -> Tick:
@@ -4,12 +4,59 @@ do_tick holds the phase order, which is the heart of the engine."""
 
 import logging
 
-from arena.engine.command import Commandable, CommandSet
+from arena.engine import trace
+from arena.engine.command import CommandSet, is_commandable
 from arena.engine.history import Tick
+from arena.engine.hooks import answers
+from arena.engine.objects.objectinspace import ObjectInSpace
 from arena.engine.world import World
 
 logger = logging.getLogger('starship-arena.round')
 
+# The phases of GameRound.do_tick, in its order.
+PHASES = ('open_tick', 'before_moving', 'resolve_encounters', 'move', 'after_moving',
+          'scan_and_decide', 'close_tick', 'clear_the_dead')
+
+
+def islands(objects: list) -> list[list]:
+    """The objects, in groups that cannot reach each other over what is left of the tick.
+
+    Each is boxed around the rest of its leg, widened by its bulk or the furthest it acts, and
+    a unit more against rounding. Whatever two objects meet over, one of them reaches the other,
+    so two whose boxes do not touch are never in one encounter. Every group keeps the order of
+    the list it came from."""
+    boxes = []
+    for o in objects:
+        x, y = o.vector.x, o.vector.y
+        dx, dy = o.vector.delta
+        left = 1 - o.tick_fraction
+        reach = max(o.radius, o.range) + 1
+        boxes.append((min(x, x + dx * left) - reach, min(y, y + dy * left) - reach,
+                      max(x, x + dx * left) + reach, max(y, y + dy * left) + reach))
+
+    group = list(range(len(objects)))
+
+    def root(i):
+        while group[i] != i:
+            group[i] = group[group[i]]
+            i = group[i]
+        return i
+
+    # Swept along x, so a box is only held against the ones it has not yet passed.
+    open_boxes = []
+    for i in sorted(range(len(boxes)), key=lambda i: boxes[i][0]):
+        x0, y0, _, y1 = boxes[i]
+        open_boxes = [j for j in open_boxes if boxes[j][2] >= x0]
+        for j in open_boxes:
+            if boxes[j][1] <= y1 and y0 <= boxes[j][3]:
+                group[root(i)] = root(j)
+        open_boxes.append(i)
+
+    found = {}
+    for i, o in enumerate(objects):
+        found.setdefault(root(i), []).append(o)
+    return list(found.values())
+
 
 class GameRound(object):
     """Takes the correct steps to process a game round."""
@@ -18,7 +65,7 @@ class GameRound(object):
         self.round_nr = round_nr
 
     def pre_move_commands(self, cs: CommandSet, tick: Tick):
-        logger.debug(f"Pre-Move Commands @ tick {tick} for {cs}")
+        logger.debug("Pre-Move Commands @ tick %s for %s", tick, cs)
         if cs.acceleration:
             cs.acceleration.execute(tick)
         if cs.turning:
@@ -27,12 +74,26 @@ class GameRound(object):
             cmd.execute(tick)
 
     def post_move_commands(self, cs: CommandSet, tick: Tick):
-        logger.debug(f"Post-Move Commands @ tick {tick} for {cs}")
+        logger.debug("Post-Move Commands @ tick %s for %s", tick, cs)
         for wpn_cmd in cs.weapons.values():
             wpn_cmd.execute(tick)
         for other_cmd in cs.post_move:
             other_cmd.execute(tick)
 
+    def answering(self, *hooks: str, commands=False) -> list:
+        """What is in space with something to do for any of these hooks, in the world's order.
+
+        The rest would only run an empty default, so a phase can leave them out and still
+        call everything else exactly as it would have."""
+        return [o for o in list(self.world.objects.values())
+                if answers(o, ObjectInSpace, *hooks) or (commands and is_commandable(o))]
+
+    def _commands_due(self, ois, tick_nr: int) -> CommandSet | None:
+        if is_commandable(ois) and ois.commands and (tick_nr in ois.commands):
+            return ois.commands[tick_nr]
+        return None
+
+    @trace.traced('resolve_encounters')
     def resolve_encounters(self):
         """Advance the tick by whatever comes within a range that matters.
 
@@ -41,27 +102,50 @@ class GameRound(object):
         anything is pending at or before it, which is what lets an object that has not moved
         answer where it was, without keeping a history of its own tick.
         See docs/adr/0023-a-tick-advances-by-encounters.md."""
-        while True:
-            found = [e for e in (ois.encounter(self.world)
-                                 for ois in list(self.world.objects.values())) if e is not None]
-            if not found:
-                return
-            earliest = min(e.fraction for e in found)
-            # Name settles the order within one fraction, so which the world lists first cannot
-            # decide it.
-            due = sorted([e for e in found if e.fraction == earliest], key=lambda e: e.subject.name)
-            arrived = [(e.subject, e.subject.tick_fraction) for e in due]
-            for encounter in due:
-                encounter.resolve(self.world)
-            # Something that could not get past its own fraction is wedged, and spends what is
-            # left of the tick there.
-            for ois, was in arrived:
-                if ois.tick_fraction == was:
-                    ois.end_tick()
-
+        known = {}
+        while self.resolve_earliest(known):
+            pass
+
+    @trace.traced('resolve_earliest')
+    def resolve_earliest(self, known: dict) -> bool:
+        """Resolve everything at the earliest fraction anything is due, if anything is.
+
+        Each island is asked on its own, and what it answered is kept in known until something in
+        it resolves: nothing outside one can change what happens inside it."""
+        found, asked = [], {}
+        for island in islands(list(self.world.objects.values())):
+            members = frozenset(o.name for o in island)
+            if members not in known:
+                part = self.world.only(island)
+                asking = (o.encounter(part) for o in trace.each(island))
+                known[members] = [e for e in asking if e is not None]
+            asked[members] = known[members]
+            found += known[members]
+        known.clear()
+        trace.note(candidates=len(found))
+        if not found:
+            return False
+        earliest = min(e.fraction for e in found)
+        # Name settles the order within one fraction, so which the world lists first cannot
+        # decide it.
+        due = sorted([e for e in found if e.fraction == earliest], key=lambda e: e.subject.name)
+        trace.note(due=len(due))
+        arrived = [(e.subject, e.subject.tick_fraction) for e in due]
+        for encounter in due:
+            encounter.resolve(self.world)
+        moved = {e.subject.name for e in due}
+        known.update((members, es) for members, es in asked.items() if members.isdisjoint(moved))
+        # Something that could not get past its own fraction is wedged, and spends what is
+        # left of the tick there.
+        for ois, was in arrived:
+            if ois.tick_fraction == was:
+                ois.end_tick()
+        return True
+
+    @trace.traced('do_tick')
     def do_tick(self, tick: Tick):
         """Perform a single tick. This is where all hooks are called in the right order."""
-        logger.debug(f"Starting tick: {tick}")
+        logger.debug("Starting tick: %s", tick)
         if not isinstance(tick, Tick):
             raise TypeError("tick must be of type Tick")
 
@@ -69,63 +153,85 @@ class GameRound(object):
 
         # Anything due this tick joins before the phases, so it lives the tick out in full.
         self.world.spawn(tick)
-
-        # Set up the reporting for the tick
-        for ois in self.world.objects.values():
+        self.open_tick(tick)
+        self.before_moving(tick, tick_nr)
+        # Every vector is settled by now and nothing has moved, so the tick can be advanced by
+        # whatever comes within a range that matters.
+        self.resolve_encounters()
+        self.move()
+        self.after_moving(tick, tick_nr)
+        self.scan_and_decide(tick)
+        self.close_tick()
+        self.clear_the_dead()
+
+    @trace.traced('open_tick')
+    def open_tick(self, tick: Tick):
+        """Set up the reporting for the tick."""
+        for ois in trace.each(self.world.objects.values()):
             ois.history.set_tick(tick)
             ois.tick(tick)
 
-        # Do everything that has to happen before moving.
-        for ois in self.world.objects.values():
+    @trace.traced('before_moving')
+    def before_moving(self, tick: Tick, tick_nr: int):
+        """Everything that has to happen before moving."""
+        for ois in trace.each(self.answering('generate', 'use_energy', 'pre_move', commands=True)):
             ois.generate()
             ois.use_energy()
-            if isinstance(ois, Commandable) and ois.commands and (tick_nr in ois.commands):
-                self.pre_move_commands(ois.commands[tick_nr], tick)
+            if cs := self._commands_due(ois, tick_nr):
+                self.pre_move_commands(cs, tick)
             ois.pre_move(self.world)
 
-        # Every vector is settled by now and nothing has moved, so the tick can be advanced by
-        # whatever comes within a range that matters.
-        self.resolve_encounters()
-
-        # Then everything travels what is left of its leg.
-        for ois in self.world.objects.values():
+    @trace.traced('move')
+    def move(self):
+        """Everything travels what is left of its leg."""
+        for ois in trace.each(self.world.objects.values()):
             ois.move()
 
-        # All ships perform their post move commands do post-move commands like firing weapons
-        for ois in list(self.world.objects.values()):
-            if isinstance(ois, Commandable) and ois.commands and (tick_nr in ois.commands):
-                self.post_move_commands(ois.commands[tick_nr], tick)
-
-        # All ships scan, "intelligent" objects make decisions (like guided missiles intercepting their target)
-        for ois in list(self.world.objects.values()):
+    @trace.traced('after_moving')
+    def after_moving(self, tick: Tick, tick_nr: int):
+        """The post-move commands, like firing weapons."""
+        for ois in trace.each(self.answering(commands=True)):
+            if cs := self._commands_due(ois, tick_nr):
+                self.post_move_commands(cs, tick)
+
+    @trace.traced('scan_and_decide')
+    def scan_and_decide(self, tick: Tick):
+        """Everything scans, and "intelligent" objects make decisions, like a guided missile
+        turning to intercept its target."""
+        for ois in trace.each(self.answering('scan', 'decide')):
             ois.scan(self.world)
             ois.decide(self.world, tick)
 
-        # Perform post move steps like commands that perform at post move.
-        # and finally update the snapshot
-        for ois in list(self.world.objects.values()):
-            ois.post_move(self.world)
+    @trace.traced('close_tick')
+    def close_tick(self):
+        """The post-move hooks, and finally the snapshot."""
+        for ois in trace.each(list(self.world.objects.values())):
+            if answers(ois, ObjectInSpace, 'post_move'):
+                ois.post_move(self.world)
             ois.history.update()
 
-        # Clear the dead out, keeping the ones whose loss is worth a record.
+    @trace.traced('clear_the_dead')
+    def clear_the_dead(self):
+        """Out of space, keeping the ones whose loss is worth a record."""
         for ois_name, ois in self.world.objects.copy().items():
             if ois.is_destroyed:
-                logger.info(f"{ois_name} destroyed")
-                self.world.destroyed[ois_name] = ois
+                logger.info("%s destroyed", ois_name)
+                self.world.add_destroyed(ois)
                 if ois.leaves_a_wreck:
                     self.world.move_to_graveyard(ois)
                 else:
                     self.world.remove(ois)
 
+    @trace.traced('do_round')
     def do_round(self, ship_commands: dict):
         """The main execution of the round. Here is where it all happens."""
         # Last round's dead go here, rather than when this round is opened: a round is opened to
         # ask the world questions as often as it is opened to run one.
-        self.world.destroyed.clear()
+        self.world.clear_destroyed()
         for ois in self.world.objects.values():
             ois.round_reset()
 
-        for ship in [s for s in self.world.objects.values() if isinstance(s, Commandable)]:
+        for ship in [s for s in self.world.objects.values() if is_commandable(s)]:
             ship.commands = ship_commands[ship.name]
 
         # Do 10 ticks, 1-10
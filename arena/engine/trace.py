@@ -0,0 +1,108 @@
+"""Where a round spends its time, for when one is slow. See docs/development.md#tracing.
+
+Off unless something starts it, and while off every call here is one check of one name. What it
+writes is the Chrome trace event format, which chrome://tracing and Perfetto both open: a span per
+phase of the tick, per pass of the encounter loop and per object a phase visits, named after the
+object's class so they can be added up by kind."""
+
+import json
+import os
+from contextlib import nullcontext
+from functools import wraps
+from time import perf_counter_ns
+
+_trace: 'Trace | None' = None
+_NOTHING = nullcontext()
+
+
+class Trace(object):
+    """The spans of one run, finished and still open."""
+
+    def __init__(self):
+        self.started = perf_counter_ns()
+        self.pid = os.getpid()
+        self.done = []
+        self.open = []
+
+    def _now(self) -> float:
+        """Microseconds since the trace started, which is what the format counts in."""
+        return (perf_counter_ns() - self.started) / 1000
+
+    def begin(self, name: str, cat: str, args: dict):
+        self.open.append({'name': name, 'cat': cat, 'ph': 'X', 'pid': self.pid, 'tid': 0,
+                          'ts': self._now(), 'args': args})
+
+    def end(self):
+        span = self.open.pop()
+        span['dur'] = self._now() - span['ts']
+        self.done.append(span)
+
+    def write(self, path: str):
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self.done, 'displayTimeUnit': 'ms'}, f)
+
+
+class _Span(object):
+    __slots__ = ('name', 'cat', 'args')
+
+    def __init__(self, name: str, cat: str, args: dict):
+        self.name, self.cat, self.args = name, cat, args
+
+    def __enter__(self):
+        _trace.begin(self.name, self.cat, self.args)
+
+    def __exit__(self, *exc):
+        _trace.end()
+
+
+def start():
+    """Collect from here on, anything collected before thrown away."""
+    global _trace
+    _trace = Trace()
+
+
+def stop(path: str = None):
+    """Stop collecting, and write out what was collected when given somewhere to."""
+    global _trace
+    collected, _trace = _trace, None
+    if collected and path:
+        collected.write(path)
+
+
+def span(name: str, cat: str = 'engine', **args):
+    """A context that is one span when tracing, and nothing at all when not."""
+    return _Span(name, cat, args) if _trace else _NOTHING
+
+
+def traced(name: str, cat: str = 'engine'):
+    """The whole of every call to the function is one span."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _trace:
+                return fn(*args, **kwargs)
+            with _Span(name, cat, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def note(**args):
+    """Something worth knowing about the span that is open, like how much it had to look at."""
+    if _trace and _trace.open:
+        _trace.open[-1]['args'].update(args)
+
+
+def each(objects, cat: str = 'object'):
+    """The objects as they are when not tracing. When tracing, a span for each, taken up by
+    whatever the loop does with it, named after its class."""
+    return _each(objects, cat) if _trace else objects
+
+
+def _each(objects, cat: str):
+    for ois in objects:
+        _trace.begin(type(ois).__name__, cat, {'name': ois.name})
+        try:
+            yield ois
+        finally:
+            _trace.end()
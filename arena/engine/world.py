@@ -5,9 +5,14 @@ know something world-spanning has somewhere to ask. Saved whole, once per round,
 keeps a round's wrecks the ones that had died by then."""
 
 from enum import Enum
+from math import floor
 
 from arena.engine.objects.geometry import Leg
 
+# How wide a square of the sight grid is. A body sits in every square its bulk reaches into, so
+# this wants to be about a body across: much smaller and a rock is filed many times over.
+SIGHT_CELL = 100
+
 
 class Whereabouts(str, Enum):
     """One of the world's collections, named after it."""
@@ -23,7 +28,97 @@ class Whereabouts(str, Enum):
 EVERYWHERE = frozenset(Whereabouts)
 
 
+def _cells(low: float, high: float) -> range:
+    return range(floor(low / SIGHT_CELL), floor(high / SIGHT_CELL) + 1)
+
+
+class _Occluders(object):
+    """Everything with bulk, filed so that a sight line only has to look near itself.
+
+    What cannot move is filed once in the squares its bulk reaches into. Anything with a radius
+    that can move is checked every time, because where it was filed would not stay true."""
+
+    def __init__(self, objects):
+        self.grid = {}
+        self.moving = []
+        for o in objects:
+            if not o.radius:
+                continue
+            if not o.is_immovable:
+                self.moving.append(o)
+                continue
+            x, y, r = o.xy.x, o.xy.y, o.radius
+            for i in _cells(x - r, x + r):
+                for j in _cells(y - r, y + r):
+                    self.grid.setdefault((i, j), []).append(o)
+
+    def near(self, here, there) -> list:
+        """Everything whose bulk could touch the line between the two, and maybe some more.
+
+        A body within its radius of the line has that radius reaching into the line's bounding
+        box, so it was filed in one of the squares the box covers."""
+        found = {}
+        for i in _cells(min(here.x, there.x), max(here.x, there.x)):
+            for j in _cells(min(here.y, there.y), max(here.y, there.y)):
+                for o in self.grid.get((i, j), ()):
+                    found[id(o)] = o
+        return [*found.values(), *self.moving]
+
+
+class _Index(object):
+    """One collection's members, filed by what the hot loops ask for.
+
+    Every bucket holds its members in the order the collection does, so a loop over one visits
+    them in the order a loop over the whole collection would have."""
+
+    def __init__(self, members: dict):
+        self.order = {}
+        self.by_faction = {}
+        self.by_tag = {}
+        self.by_category = {}
+        self.by_side = {}
+        self.players = {}
+        self.terrain = {}
+        self.not_terrain = {}
+        for ois in members.values():
+            self.file(ois)
+
+    def _buckets(self, ois):
+        yield self.by_faction.setdefault(ois.faction, {})
+        yield self.by_category.setdefault(ois.category_name, {})
+        yield self.by_side.setdefault(ois.side, {})
+        yield self.terrain if ois.is_terrain else self.not_terrain
+        if ois.is_player_controlled:
+            yield self.players
+        for tag in ois.tags:
+            yield self.by_tag.setdefault(tag, {})
+
+    def file(self, ois):
+        """Something new to the collection, which is last in it."""
+        self.order[ois.name] = len(self.order)
+        for bucket in self._buckets(ois):
+            bucket[ois.name] = ois
+
+    def unfile(self, ois):
+        for bucket in self._buckets(ois):
+            bucket.pop(ois.name, None)
+
+    def on_other_sides(self, side) -> list:
+        """Everything on a side, and not on this one, in the collection's order."""
+        if not side:
+            return []
+        sides = [bucket for s, bucket in self.by_side.items() if s and s != side and bucket]
+        foes = [o for bucket in sides for o in bucket.values()]
+        if len(sides) > 1:
+            foes.sort(key=lambda o: self.order[o.name])
+        return foes
+
+
 class World(object):
+    # Set by a test to have every indexed question first check the indexes against a search of
+    # every collection. See World.check_indexes.
+    checking = False
+
     def __init__(self, gd, objects: dict = None, graveyard: dict = None, spawns: dict = None,
                  destroyed: dict = None):
         self._dir = gd
@@ -34,39 +129,99 @@ class World(object):
         # starts. A round's world is therefore still able to say what was in space at each of its
         # ticks, which the graveyard alone cannot: a rocket that goes off leaves no wreck.
         self.destroyed = destroyed if destroyed is not None else dict()
+        self._occluders = None
+        self._reindex()
 
     def __getstate__(self):
-        """The directory is where this world is kept, not part of what it is."""
+        """The directory is where this world is kept, not part of what it is.
+
+        Nor are the sight grid and the indexes, which are built again from the collections."""
         state = self.__dict__.copy()
         del state['_dir']
+        del state['_occluders']
+        del state['_indexes']
         return state
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._occluders = None
+        self._reindex()
+
+    def _reindex(self):
+        self._indexes = {part: _Index(members) for part, members in self._collections.items()}
+
+    @property
+    def _collections(self) -> dict:
+        return {Whereabouts.Objects: self.objects,
+                Whereabouts.Graveyard: self.graveyard,
+                Whereabouts.Spawns: self.spawns,
+                Whereabouts.Destroyed: self.destroyed}
+
     def kept_in(self, gd):
         """Hand back the directory a loaded world was read from."""
         self._dir = gd
 
+    def only(self, objects) -> 'World':
+        """A world with just these in space, for a question that cannot reach past them.
+
+        Kept nowhere, and built to be asked and thrown away."""
+        return World(self._dir, {o.name: o for o in objects})
+
     def save(self, round_nr: int):
         self._dir.save_world(self, round_nr)
 
+    def _put(self, where: Whereabouts, ois):
+        members = self._collections[where]
+        if ois.name in members:
+            # It keeps its place in the collection, so it has to keep it in the index too.
+            members[ois.name] = ois
+            self._indexes[where] = _Index(members)
+        else:
+            members[ois.name] = ois
+            self._indexes[where].file(ois)
+
+    def _take(self, where: Whereabouts, ois):
+        del self._collections[where][ois.name]
+        self._indexes[where].unfile(ois)
+
     def add(self, ois):
-        self.objects[ois.name] = ois
+        """Into space. Whatever it is filed under, its faction and owner included, is settled
+        before it gets here."""
+        self._put(Whereabouts.Objects, ois)
+        self._occluders = None
 
     def remove(self, ois):
-        del self.objects[ois.name]
+        self._take(Whereabouts.Objects, ois)
+        self._occluders = None
 
     def add_to_graveyard(self, ois):
-        self.graveyard[ois.name] = ois
+        self._put(Whereabouts.Graveyard, ois)
 
     def move_to_graveyard(self, ois):
         self.remove(ois)
         self.add_to_graveyard(ois)
 
+    def add_destroyed(self, ois):
+        self._put(Whereabouts.Destroyed, ois)
+
+    def clear_destroyed(self):
+        self.destroyed.clear()
+        self._indexes[Whereabouts.Destroyed] = _Index(self.destroyed)
+
     def plan_spawn(self, ois):
         """Something due to arrive rather than to have started the game.
 
         Planning the same one twice plans it once, so a round that is set up more than once
         does not double anything."""
-        self.spawns[ois.name] = ois
+        self._put(Whereabouts.Spawns, ois)
+
+    def tag(self, ois, tag: str):
+        """Mark it, wherever it is. Through here rather than on its tags, so that finding it by
+        the mark keeps working."""
+        ois.tags.add(tag)
+        for where, members in self._collections.items():
+            if members.get(ois.name) is ois:
+                self._indexes[where] = _Index(members)
 
     def spawn(self, tick):
         """Put everything planned for this tick into space.
@@ -89,7 +244,7 @@ class World(object):
         """Everything with somebody at the helm, wherever it is: in space, dead, or due.
 
         What a caller wants off them is the caller's business."""
-        return {name: o for name, o in self.all_objects.items() if o.is_player_controlled}
+        return self.find_objects(player_controlled=True)
 
     @property
     def all_names(self) -> set:
@@ -97,33 +252,72 @@ class World(object):
 
         Command files are named after their ship, so a reused name would inherit a dead one's
         orders."""
-        return set(self.all_objects)
+        return set(self.objects).union(self.graveyard, self.spawns, self.destroyed)
 
     def find_objects(self, where=EVERYWHERE, with_tags=frozenset(), without_tags=frozenset(),
-                     faction=None) -> dict:
+                     faction=None, category=None, player_controlled=None, terrain=None) -> dict:
         """Everything matching, by name. Every filter is optional."""
-        collections = {Whereabouts.Objects: self.objects,
-                       Whereabouts.Graveyard: self.graveyard,
-                       Whereabouts.Spawns: self.spawns,
-                       Whereabouts.Destroyed: self.destroyed}
+        if self.checking:
+            self.check_indexes()
         found = {}
         for part in where:
-            found.update(collections[part])
+            index = self._indexes[part]
+            candidates = [self._collections[part]]
+            if faction is not None:
+                candidates.append(index.by_faction.get(faction, {}))
+            if category is not None:
+                candidates.append(index.by_category.get(category, {}))
+            if player_controlled:
+                candidates.append(index.players)
+            if terrain is not None:
+                candidates.append(index.terrain if terrain else index.not_terrain)
+            candidates += [index.by_tag.get(tag, {}) for tag in with_tags]
+            found.update(min(candidates, key=len))
         return {name: o for name, o in found.items()
                 if with_tags <= o.tags
                 and not (without_tags & o.tags)
-                and (faction is None or o.faction == faction)}
+                and (faction is None or o.faction == faction)
+                and (category is None or o.category_name == category)
+                and (player_controlled is None or o.is_player_controlled == player_controlled)
+                and (terrain is None or o.is_terrain == terrain)}
+
+    def on_other_sides(self, ois) -> list:
+        """Everything in space on a side that is not this one's, in the order it came into space.
+
+        Nothing else can be its foe, so a loop looking for one starts here. Which of them are is
+        still theirs to answer, through stance_towards."""
+        if self.checking:
+            self.check_indexes()
+        return self._indexes[Whereabouts.Objects].on_other_sides(ois.side)
+
+    def check_indexes(self):
+        """Fail loudly if any index disagrees with a search of its collection.
+
+        Something changed behind the world's back: added to a collection directly, or its
+        faction, owner or tags changed after it was filed."""
+        for part, members in self._collections.items():
+            expected = _Index(members)
+            actual = self._indexes[part]
+            for bucket in ('by_faction', 'by_tag', 'by_category', 'by_side'):
+                mine = {k: list(v) for k, v in getattr(actual, bucket).items() if v}
+                assert mine == {k: list(v) for k, v in getattr(expected, bucket).items()}, \
+                    f"{part} {bucket} index is stale: {mine}"
+            for bucket in ('players', 'terrain', 'not_terrain'):
+                assert list(getattr(actual, bucket)) == list(getattr(expected, bucket)), \
+                    f"{part} {bucket} index is stale"
 
     def blocks_sight(self, looker, target) -> bool:
         """Whether anything solid stands between the two. See docs/gddr/0038.
 
         Neither end blocks itself: something solid enough to be looked at is inside its own
         radius at the end of the line."""
+        if self._occluders is None:
+            self._occluders = _Occluders(self.objects.values())
         here, there = looker.xy, target.xy
         sight = Leg(here, (there.x - here.x, there.y - here.y))
         return any(sight.closest_fraction(Leg(o.xy, (0, 0)), o.radius) is not None
-                   for o in self.objects.values()
-                   if o.radius and o is not looker and o is not target)
+                   for o in self._occluders.near(here, there)
+                   if o is not looker and o is not target)
 
     def known_to(self, ship) -> dict:
         """Every name this ship may legitimately use in an order.
@@ -11,4 +11,15 @@ class UnreadableWorld(Exception):
     def __init__(self, game: str, file_name: str):
         super().__init__(f"{game}: {file_name} was saved by code this no longer matches.")
         self.game = game
-        self.file_name = file_name
\ No newline at end of file
+        self.file_name = file_name
+
+class RoundNotKept(UnreadableWorld):
+    """A round whose world its game let go of, and whose plans have changed since it was played or
+    were not recorded then, so playing it again would not give it back. Regenerating the game is
+    the cure here too."""
+
+    def __init__(self, game: str, round_nr: int):
+        Exception.__init__(self, f"{game}: round {round_nr} is not kept, and the plans it was "
+                                 f"played from are not the ones on file now.")
+        self.game = game
+        self.file_name = f"status_round_{round_nr}.pickle"
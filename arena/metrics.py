@@ -0,0 +1,226 @@
+"""What the processes serving and playing the game have done, added up across all of them.
+
+Beside the layers, the way `log.py` is, so the engine can count what it reads. Each process keeps
+what it counted since it last wrote, and adds that to one shared file under METRICS_DIR when it
+records, at most once every FLUSH_SECONDS, and on exit. The file is locked while it is added to,
+so the preforked workers and a cron run can all write to it. Nothing is started to do the writing.
+See docs/deployment.md#metrics."""
+
+import atexit
+import fcntl
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from time import monotonic, perf_counter
+
+from arena.cfg import METRICS_DIR
+
+logger = logging.getLogger('starship-arena.metrics')
+
+FILE_NAME = 'metrics.json'
+FLUSH_SECONDS = 1.0
+# Upper bounds in seconds, from a quick request to a big round.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+KINDS = {
+    'arena_request_seconds': ('histogram', "Time to answer a request, by app and route."),
+    'arena_round_seconds': ('histogram', "Time to play a round and save its world."),
+    'arena_world_unpickles_total': ('counter', "Worlds read back from their pickle."),
+    'arena_read_bytes_total': ('counter', "Bytes of game data read from disk, by kind of file."),
+    'arena_announcements_total': ('counter', "Messages sent out, by channel and outcome."),
+    'arena_lock_wait_seconds': ('histogram', "Time waited for a game's write lock, by operation."),
+}
+
+# Nothing is counted without it. A test points it somewhere of its own.
+directory = METRICS_DIR
+
+
+def _empty() -> dict:
+    return {'counters': {}, 'histograms': {}}
+
+
+def _labelled(labels: dict) -> str:
+    """The labels the way the exposition format writes them, which is also the key they are kept
+    under."""
+    def escaped(value) -> str:
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return ','.join(f'{k}="{escaped(v)}"' for k, v in sorted(labels.items()))
+
+
+def _add(total: dict, more: dict):
+    for name, series in more['counters'].items():
+        into = total['counters'].setdefault(name, {})
+        for labels, value in series.items():
+            into[labels] = into.get(labels, 0) + value
+    for name, series in more['histograms'].items():
+        into = total['histograms'].setdefault(name, {})
+        for labels, h in series.items():
+            if labels not in into:
+                into[labels] = {'buckets': [0] * len(BUCKETS), 'sum': 0.0, 'count': 0}
+            kept = into[labels]
+            kept['buckets'] = [a + b for a, b in zip(kept['buckets'], h['buckets'])]
+            kept['sum'] += h['sum']
+            kept['count'] += h['count']
+
+
+class Counts(object):
+    """One process's counts since it last added them to the shared file. The threads of a process
+    share them, so what is pending only changes under a lock."""
+
+    def __init__(self, where: str):
+        self.where = where
+        self.pid = os.getpid()
+        self.pending = _empty()
+        self.flushed = monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.where, FILE_NAME)
+
+    def count(self, name: str, amount: float, labels: dict):
+        key = _labelled(labels)
+        with self._lock:
+            series = self.pending['counters'].setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+        self._maybe_flush()
+
+    def observe(self, name: str, value: float, labels: dict):
+        key = _labelled(labels)
+        with self._lock:
+            series = self.pending['histograms'].setdefault(name, {})
+            h = series.setdefault(key, {'buckets': [0] * len(BUCKETS), 'sum': 0.0, 'count': 0})
+            # Kept cumulative, the way they are written out.
+            for i, bound in enumerate(BUCKETS):
+                if value <= bound:
+                    h['buckets'][i] += 1
+            h['sum'] += value
+            h['count'] += 1
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if monotonic() - self.flushed >= FLUSH_SECONDS:
+            self.flush()
+
+    def flush(self):
+        """Add what is pending to the shared file. Taken out from under the other threads first,
+        so what they count while it is written is pending for the next time."""
+        with self._lock:
+            self.flushed = monotonic()
+            taken, self.pending = self.pending, _empty()
+        if not (taken['counters'] or taken['histograms']):
+            return
+        os.makedirs(self.where, exist_ok=True)
+        with open(self.path, 'a+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            total = _read(f)
+            _add(total, taken)
+            f.seek(0)
+            f.truncate()
+            json.dump(total, f)
+
+
+def _read(f) -> dict:
+    f.seek(0)
+    text = f.read()
+    try:
+        return json.loads(text) if text else _empty()
+    except json.JSONDecodeError:
+        # A process killed halfway through writing. Counting again from nothing beats never
+        # counting again.
+        logger.warning("Unreadable metrics in %s, starting them over", f.name)
+        return _empty()
+
+
+_counts: Counts | None = None
+_making = threading.Lock()
+
+
+def _forked():
+    """A lock of its own in a forked child, which another thread of the parent may have been
+    holding when it forked. What the parent had pending is the parent's to write."""
+    global _making, _counts
+    _making = threading.Lock()
+    _counts = None
+
+
+os.register_at_fork(after_in_child=_forked)
+
+
+def _here() -> Counts | None:
+    """This process's counts, made on first use. A forked worker starts on its own, empty."""
+    global _counts
+    if not directory:
+        return None
+    with _making:
+        if _counts is None or _counts.pid != os.getpid() or _counts.where != directory:
+            _counts = Counts(directory)
+            atexit.register(_counts.flush)
+        return _counts
+
+
+def count(name: str, amount: float = 1, **labels):
+    if counts := _here():
+        counts.count(name, amount, labels)
+
+
+def observe(name: str, value: float, **labels):
+    if counts := _here():
+        counts.observe(name, value, labels)
+
+
+def flush():
+    """Add this process's counts now, for one that will not get to exit normally."""
+    if counts := _here():
+        counts.flush()
+
+
+@contextmanager
+def timed(name: str, **labels):
+    """How long the block takes, observed once it is done, however it ends."""
+    if not directory:
+        yield
+        return
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, perf_counter() - start, **labels)
+
+
+def collected() -> dict:
+    """Everything every process has counted, this one's up to now included."""
+    if not (counts := _here()):
+        return _empty()
+    counts.flush()
+    if not os.path.exists(counts.path):
+        return _empty()
+    with open(counts.path) as f:
+        fcntl.flock(f, fcntl.LOCK_SH)
+        return _read(f)
+
+
+def exposition() -> str:
+    """The counts in the text format Prometheus scrapes."""
+    total = collected()
+    lines = []
+    for name, (kind, help_text) in KINDS.items():
+        kept = total['counters' if kind == 'counter' else 'histograms'].get(name, {})
+        if not kept:
+            continue
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        for labels, value in sorted(kept.items()):
+            braced = f"{{{labels}}}" if labels else ''
+            if kind == 'counter':
+                lines.append(f"{name}{braced} {value}")
+                continue
+            before = labels + ',' if labels else ''
+            for bound, n in zip(BUCKETS, value['buckets']):
+                lines.append(f'{name}_bucket{{{before}le="{bound}"}} {n}')
+            lines.append(f'{name}_bucket{{{before}le="+Inf"}} {value["count"]}')
+            lines.append(f"{name}_sum{braced} {value['sum']}")
+            lines.append(f"{name}_count{braced} {value['count']}")
+    return '\n'.join(lines) + '\n' if lines else ''
@@ -0,0 +1,402 @@
+"""Where a directory's worth of game data is kept: on disk as files, as rows of one SQLite
+database, or in memory. Either way a file is named by its path under the directory and read or
+written whole.
+
+Beside the layers, the way `tally.py` is, because a game directory in the engine and the player
+registry above it both keep their files in one. A data root is files unless GAME_DATABASE names a
+database for it, and converts either way with `arena.cli.main to_sqlite` and `from_sqlite`.
+Memory holds a game played headless, which is found by nobody.
+See docs/adr/0043-game-data-behind-a-storage-interface.md."""
+
+import fnmatch
+import io
+import os
+import shutil
+import sqlite3
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from arena import tally
+from arena.cfg import PACK_FILE_NAME
+
+# Past every character a name can hold, so a range of names can stand for a prefix.
+_LAST = chr(0x10FFFF)
+_WILDCARDS = '*?['
+
+
+def matching(files: list[str], pattern: str) -> set[str]:
+    """Of these files, and the directories they are in, the ones a glob pattern matches. A wildcard
+    stays inside one directory, as it does for Path.glob."""
+    parts = pattern.split('/')
+    found = set()
+    for name in files:
+        components = name.rstrip('/').split('/')[:len(parts)]
+        if len(components) == len(parts) and all(
+                fnmatch.fnmatchcase(c, p) for c, p in zip(components, parts)):
+            found.add('/'.join(components))
+    return found
+
+
+class Storage(ABC):
+    """A directory's worth of files."""
+
+    @abstractmethod
+    def exists(self, name: str) -> bool:
+        """Whether there is a file or a directory by that name. '' is the directory itself."""
+
+    @abstractmethod
+    def names(self, pattern: str) -> list[str]:
+        """The files and directories a glob pattern matches, in order."""
+
+    @abstractmethod
+    def files(self) -> list[str]:
+        """Every file, at any depth, in order."""
+
+    @abstractmethod
+    def reading(self, name: str, mode: str = 'r', kind: str = 'text'):
+        """A file, opened to be read and counted. See arena/tally.py."""
+
+    @abstractmethod
+    def write(self, name: str, data: str | bytes):
+        """A file replaced whole, so a reader sees the old one or the new one, never half of one."""
+
+    @abstractmethod
+    def append(self, name: str, text: str):
+        """Text added to the end of a file, which is made when there is none."""
+
+    @abstractmethod
+    def remove(self, name: str):
+        """A file taken away, or a directory and everything in it. '' is everything."""
+
+    def rename(self, name: str, to: str):
+        """A file or a directory given another name, whole. Here a copy and a removal: a store
+        that can do it in one step does."""
+        for file in self.files():
+            if file == name or file.startswith(name + '/'):
+                with self.reading(file, 'rb', kind='copy') as f:
+                    self.write(to + file[len(name):], f.read())
+        self.remove(name)
+
+    def take(self, name: str, source: 'Storage'):
+        """A file of another store moved in under the same name."""
+        with source.reading(name, 'rb', kind='copy') as f:
+            self.write(name, f.read())
+        source.remove(name)
+
+    @abstractmethod
+    def within(self, directory: str) -> 'Storage':
+        """The files under one directory of this one, named from there."""
+
+    def make(self, directory: str = ''):
+        """A directory ready to hold files. Only files on disk need one."""
+
+    @property
+    def packed(self) -> bool:
+        return False
+
+    @property
+    def loose_names(self) -> list[str]:
+        """The files outside the pack. A store that is one file already has none."""
+        return []
+
+    def pack(self):
+        """Every file into one. A store that is one file already is packed."""
+
+    def unpack(self):
+        pass
+
+
+def _partial(path: str) -> str:
+    """Where a file is written before it is renamed over path. Named for the process and the thread
+    writing it, so two writers of one file never write into each other's."""
+    return f"{path}.{os.getpid()}-{threading.get_ident()}.partial"
+
+
+def copy_files(source: Storage, target: Storage) -> int:
+    """Every file of one store written into another as it stands. Answers how many."""
+    names = source.files()
+    for name in names:
+        with source.reading(name, 'rb', kind='copy') as f:
+            target.write(name, f.read())
+    return len(names)
+
+
+class FileStorage(Storage):
+    """A directory on disk, with its files loose, or in a pack inside it. A file written since the
+    pack was made sits beside it and is the one read.
+    See docs/adr/0042-a-game-out-of-play-is-one-file.md."""
+
+    def __init__(self, path: str | Path):
+        self.path = str(path)
+
+    def _at(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    @property
+    def _pack(self) -> str:
+        return self._at(PACK_FILE_NAME)
+
+    @property
+    def packed(self) -> bool:
+        return os.path.exists(self._pack)
+
+    def _packed_names(self) -> list[str]:
+        """What the pack holds, read off its index. Nothing when there is none."""
+        try:
+            with zipfile.ZipFile(self._pack) as pack:
+                return pack.namelist()
+        except FileNotFoundError:
+            return []
+
+    def _in_pack(self, name: str) -> bool:
+        return any(n == name or n.startswith(name.rstrip('/') + '/') for n in self._packed_names())
+
+    def exists(self, name: str) -> bool:
+        return os.path.exists(self._at(name)) or self._in_pack(name)
+
+    def names(self, pattern: str) -> list[str]:
+        if not os.path.isdir(self.path):
+            raise FileNotFoundError(f"No directory {self.path}")
+        loose = {str(p.relative_to(self.path)) for p in Path(self.path).glob(pattern)
+                 if p.name != PACK_FILE_NAME}
+        return sorted(loose | matching(self._packed_names(), pattern))
+
+    @property
+    def loose_names(self) -> list[str]:
+        return [str(p.relative_to(self.path)) for p in sorted(Path(self.path).rglob('*'))
+                if p.is_file() and p.name != PACK_FILE_NAME and not p.name.endswith('.partial')]
+
+    def files(self) -> list[str]:
+        packed = [n for n in self._packed_names() if not n.endswith('/')]
+        return sorted(set(self.loose_names) | set(packed))
+
+    def reading(self, name: str, mode: str = 'r', kind: str = 'text'):
+        path = self._at(name)
+        if os.path.exists(path) or not self.packed:
+            return tally.reading(path, mode, kind=kind)
+        with zipfile.ZipFile(self._pack) as pack:
+            try:
+                info = pack.getinfo(name)
+            except KeyError:
+                raise FileNotFoundError(f"{name} is not in the pack in {self.path}") from None
+            f = pack.open(info)
+        tally.counted(info.file_size, kind)
+        return f if 'b' in mode else io.TextIOWrapper(f)
+
+    def write(self, name: str, data: str | bytes):
+        """Renamed into place, so it is only ever replaced and a link to it is safe to keep."""
+        path = self._at(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial = _partial(path)
+        with open(partial, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+        os.replace(partial, path)
+
+    def append(self, name: str, text: str):
+        path = self._at(name)
+        if not os.path.exists(path) and self._in_pack(name):
+            # Out of the pack first, or what it held would be lost.
+            self._copy_out(name, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a') as f:
+            f.write(text)
+
+    def remove(self, name: str):
+        """One in the pack can only go with the pack, so the directory is unpacked first."""
+        if self._in_pack(name):
+            self.unpack()
+        path = self._at(name)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            Path(path).unlink(missing_ok=True)
+
+    def rename(self, name: str, to: str):
+        os.makedirs(os.path.dirname(self._at(to)), exist_ok=True)
+        os.replace(self._at(name), self._at(to))
+
+    def take(self, name: str, source: Storage):
+        """A rename when both are on disk, so a file open meanwhile is the old one or the new."""
+        if not isinstance(source, FileStorage):
+            return super().take(name, source)
+        os.replace(source._at(name), self._at(name))
+
+    def within(self, directory: str) -> 'FileStorage':
+        return FileStorage(self._at(directory))
+
+    def make(self, directory: str = ''):
+        os.makedirs(self._at(directory), exist_ok=True)
+
+    def copy_out(self, name: str, to: str):
+        """A file copied to a path outside, out of the pack if that is where it is."""
+        self._copy_out(name, to)
+
+    def _copy_out(self, name: str, to: str):
+        os.makedirs(os.path.dirname(to), exist_ok=True)
+        with self.reading(name, 'rb') as source, open(to, 'wb') as copy:
+            shutil.copyfileobj(source, copy)
+
+    def pack(self):
+        """Every file into the pack, and the directory left holding only that.
+
+        A file written beside an earlier pack replaces the copy in it. The new pack is renamed into
+        place before anything loose goes, so a pack stopped halfway leaves everything as it was."""
+        loose = self.loose_names
+        # Directories too, so an empty one such as commands/ is there again when it is unpacked.
+        directories = [f"{p.relative_to(self.path)}/" for p in sorted(Path(self.path).rglob('*'))
+                       if p.is_dir()]
+        partial = _partial(self._pack)
+        with zipfile.ZipFile(partial, 'w', zipfile.ZIP_DEFLATED) as new:
+            for name in directories + loose:
+                new.write(self._at(name), name)
+            if self.packed:
+                with zipfile.ZipFile(self._pack) as old:
+                    for info in old.infolist():
+                        if info.filename not in loose + directories:
+                            new.writestr(info, old.read(info))
+        os.replace(partial, self._pack)
+        for name in loose:
+            os.remove(self._at(name))
+        for directory in reversed(directories):
+            if not any(Path(self.path, directory).iterdir()):
+                Path(self.path, directory).rmdir()
+
+    def unpack(self):
+        """Every file back out of the pack, and the pack gone. One written since it was packed is
+        newer than its copy in there, and stays."""
+        if not self.packed:
+            return
+        with zipfile.ZipFile(self._pack) as pack:
+            for name in pack.namelist():
+                if not os.path.exists(self._at(name)):
+                    pack.extract(name, self.path)
+        os.remove(self._pack)
+
+
+class SqliteStorage(Storage):
+    """Files as rows of one database, each named by its path under the data root, the names
+    indexed by the table's key. Every write is a transaction of its own.
+
+    A connection per process and thread, because a connection must not cross either."""
+
+    _connections = threading.local()
+
+    def __init__(self, database: str | Path, prefix: str = ''):
+        self.database = str(database)
+        self.prefix = prefix
+
+    def _db(self) -> sqlite3.Connection:
+        held = self._connections.__dict__.setdefault('by_pid', {})
+        key = (os.getpid(), self.database)
+        if key not in held:
+            db = sqlite3.connect(self.database)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS files '
+                       '(name TEXT PRIMARY KEY, data BLOB NOT NULL) WITHOUT ROWID')
+            held[key] = db
+        return held[key]
+
+    def _under(self, start: str) -> list[str]:
+        """The names of every file whose name starts so, without the prefix."""
+        first = self.prefix + start
+        rows = self._db().execute('SELECT name FROM files WHERE name >= ? AND name < ? '
+                                  'ORDER BY name', (first, first + _LAST))
+        return [name[len(self.prefix):] for name, in rows]
+
+    def exists(self, name: str) -> bool:
+        if not name:
+            return bool(self._under(''))
+        return any(n == name or n.startswith(name + '/') for n in self._under(name))
+
+    def names(self, pattern: str) -> list[str]:
+        literal = pattern[:min([pattern.find(c) for c in _WILDCARDS if c in pattern],
+                               default=len(pattern))]
+        return sorted(matching(self._under(literal), pattern))
+
+    def files(self) -> list[str]:
+        return self._under('')
+
+    def reading(self, name: str, mode: str = 'r', kind: str = 'text'):
+        row = self._db().execute('SELECT data FROM files WHERE name = ?',
+                                 (self.prefix + name,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"No {self.prefix + name} in {self.database}")
+        data = bytes(row[0])
+        tally.counted(len(data), kind)
+        return io.BytesIO(data) if 'b' in mode else io.StringIO(data.decode())
+
+    def write(self, name: str, data: str | bytes):
+        with self._db() as db:
+            db.execute('INSERT OR REPLACE INTO files (name, data) VALUES (?, ?)',
+                       (self.prefix + name, data.encode() if isinstance(data, str) else data))
+
+    def append(self, name: str, text: str):
+        with self._db() as db:
+            db.execute('INSERT INTO files (name, data) VALUES (?, ?) ON CONFLICT (name) '
+                       'DO UPDATE SET data = CAST(data || excluded.data AS BLOB)',
+                       (self.prefix + name, text.encode()))
+
+    def remove(self, name: str):
+        whole = self.prefix + name
+        under = whole + '/' if name else whole
+        with self._db() as db:
+            db.execute('DELETE FROM files WHERE name = ? OR (name >= ? AND name < ?)',
+                       (whole, under, under + _LAST))
+
+    def rename(self, name: str, to: str):
+        """One statement, so nobody sees the directory half moved."""
+        whole, under = self.prefix + name, self.prefix + name + '/'
+        with self._db() as db:
+            db.execute('UPDATE files SET name = ? || substr(name, ?) '
+                       'WHERE name = ? OR (name >= ? AND name < ?)',
+                       (self.prefix + to, len(whole) + 1, whole, under, under + _LAST))
+
+    def within(self, directory: str) -> 'SqliteStorage':
+        return SqliteStorage(self.database, f"{self.prefix}{directory.strip('/')}/")
+
+
+class MemoryStorage(Storage):
+    """Files as entries of a dict, for a game nobody needs to find again. Gone with the process."""
+
+    def __init__(self, held: dict[str, bytes] = None, prefix: str = ''):
+        self.held = held if held is not None else {}
+        self.prefix = prefix
+
+    def _under(self, start: str) -> list[str]:
+        first = self.prefix + start
+        return sorted(name[len(self.prefix):] for name in self.held if name.startswith(first))
+
+    def exists(self, name: str) -> bool:
+        if not name:
+            return True
+        return any(n == name or n.startswith(name + '/') for n in self._under(name))
+
+    def names(self, pattern: str) -> list[str]:
+        return sorted(matching(self._under(''), pattern))
+
+    def files(self) -> list[str]:
+        return self._under('')
+
+    def reading(self, name: str, mode: str = 'r', kind: str = 'text'):
+        try:
+            data = self.held[self.prefix + name]
+        except KeyError:
+            raise FileNotFoundError(f"No {self.prefix + name} in memory") from None
+        tally.counted(len(data), kind)
+        return io.BytesIO(data) if 'b' in mode else io.StringIO(data.decode())
+
+    def write(self, name: str, data: str | bytes):
+        self.held[self.prefix + name] = data.encode() if isinstance(data, str) else data
+
+    def append(self, name: str, text: str):
+        self.held[self.prefix + name] = self.held.get(self.prefix + name, b'') + text.encode()
+
+    def remove(self, name: str):
+        for held in self._under(name):
+            if not name or held == name or held.startswith(name + '/'):
+                del self.held[self.prefix + held]
+
+    def within(self, directory: str) -> 'MemoryStorage':
+        return MemoryStorage(self.held, f"{self.prefix}{directory.strip('/')}/")
@@ -0,0 +1,91 @@
+"""What one request or one CLI action read from disk, so an endpoint that opens a file per ship or
+per player shows up as the number it is.
+
+Beside the layers, the way `metrics.py` is. Every read of game data goes through `reading`, which
+counts it into the tally of whatever is being served, if anything is, and into the metrics. A
+tally is kept in a context variable, so two requests on two threads each count their own.
+See docs/deployment.md#reads-per-request."""
+
+import logging
+import os
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from arena import metrics
+
+logger = logging.getLogger('starship-arena.tally')
+
+HEADER = 'X-Arena-Reads'
+# Whether a response says what it read. A development aid, so off unless asked for.
+header = os.environ.get('ARENA_READS_HEADER') == '1'
+
+
+@dataclass
+class Tally:
+    """One request's reads: files opened, the bytes in them, and how many were worlds unpickled."""
+    what: str
+    opens: int = 0
+    bytes_read: int = 0
+    unpickles: int = 0
+    kinds: Counter = field(default_factory=Counter)
+
+    def __str__(self):
+        return f"opens={self.opens}; bytes={self.bytes_read}; unpickles={self.unpickles}"
+
+
+_current: ContextVar[Tally | None] = ContextVar('tally', default=None)
+
+
+def current() -> Tally | None:
+    return _current.get()
+
+
+@contextmanager
+def tallied(what: str):
+    """Count every read inside the block into one Tally, and log it when the block is done."""
+    tally = Tally(what)
+    token = _current.set(tally)
+    try:
+        yield tally
+    finally:
+        _current.reset(token)
+        logger.debug("%s read %s, %s", what, tally, dict(tally.kinds))
+
+
+def begin(what: str):
+    """The start of a tally that ends in another callback than the one it began in, which is how
+    Flask hands out a request. Returns what `end` takes."""
+    return _current.set(Tally(what))
+
+
+def end(token):
+    tally = _current.get()
+    _current.reset(token)
+    if tally:
+        logger.debug("%s read %s, %s", tally.what, tally, dict(tally.kinds))
+
+
+def reading(path: str, mode: str = 'r', kind: str = 'text'):
+    """The file, opened to be read, and counted."""
+    f = open(path, mode)
+    counted(os.fstat(f.fileno()).st_size, kind)
+    return f
+
+
+def counted(size: int, kind: str = 'text'):
+    """A file opened some other way, out of a game's pack or a database, counted as `reading` counts
+    one."""
+    metrics.count('arena_read_bytes_total', size, kind=kind)
+    if tally := _current.get():
+        tally.opens += 1
+        tally.bytes_read += size
+        tally.kinds[kind] += 1
+
+
+def unpickled():
+    """A world was read back from its pickle."""
+    metrics.count('arena_world_unpickles_total')
+    if tally := _current.get():
+        tally.unpickles += 1
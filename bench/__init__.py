@@ -0,0 +1,4 @@
+"""How fast the engine is, measured rather than guessed. See docs/development.md#benchmarks.
+
+Run from the repository, like the CLI, and never by the suite: a timing is only worth comparing
+with another taken on the same machine."""
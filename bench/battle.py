@@ -0,0 +1,198 @@
+"""How a round scales with what is in space.
+
+Builds a battle of a given size: ships of every faction's own line, missiles and mines already in
+flight, and rock. Every ship gets orders for the round, and the round is played with each phase
+of the tick and each pass of the encounter loop timed. The world it ends on is then saved and
+loaded the way a game's is.
+
+    python -m bench.battle                            the sweep, as JSON
+    python -m bench.battle --sizes 10 100 --out b.json
+    python -m bench.battle --against b.json           and what got worse
+
+The same seed builds the same battle, so two runs differ in the code and the machine only."""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from collections import defaultdict
+from math import sqrt
+from random import Random
+from time import perf_counter
+
+from arena.app.scenarios.five_faction_war import FACTIONS
+from arena.engine.command import parse_commands
+from arena.engine.gamedirectory import GameDirectory, StatusFile
+from arena.engine.objects.components.laser import Laser
+from arena.engine.objects.components.launcher import Launcher
+from arena.engine.objects.geometry import Point, Vector
+from arena.engine.objects.registry import builder
+from arena.engine.objects.registry.mines import EMPMine, NanocyteMine, SplinterMine
+from arena.engine.objects.registry.missiles import EMPMissile, NanoMissile, Rocket, Splinter
+from arena.engine.round import PHASES, GameRound
+from arena.engine.world import World
+from bench import results
+
+SIZES = (10, 30, 100, 300, 1000)
+PAYLOADS = (Rocket(), Splinter(), NanoMissile(), EMPMissile(),
+            SplinterMine(), EMPMine(), NanocyteMine())
+# Room per object, which keeps a big battle as crowded as a small one rather than more so.
+ROOM = 150
+
+
+def battle(size: int, seed: int = 0) -> tuple[World, dict]:
+    """About size objects in space, and every ship's orders for round 1.
+
+    Half of it ships, at least one for every faction, a quarter payloads and the rest rock."""
+    rng = Random(seed)
+    half = ROOM * sqrt(size) / 2
+
+    def somewhere() -> tuple:
+        return rng.uniform(-half, half), rng.uniform(-half, half)
+
+    factions = list(FACTIONS)
+    ships = []
+    for i in range(max(len(factions), size // 2)):
+        faction = factions[i % len(factions)]
+        ship = builder.create(f'{faction}-{i}', rng.choice(FACTIONS[faction]), somewhere(),
+                              rng.randrange(360), player=f'Player-{i}')
+        ship.faction = faction
+        ships.append(ship)
+    payloads = [rng.choice(PAYLOADS).create(f'Payload-{i}',
+                                            Vector(Point(*somewhere()), rng.randrange(360), 0),
+                                            owner=rng.choice(ships))
+                for i in range(size // 4)]
+    rocks = [builder.create(f'Rock-{i}', rng.choice(list(builder.all_body_types)), somewhere())
+             for i in range(max(0, size - len(ships) - len(payloads)))]
+    world = World(None, {o.name: o for o in ships + payloads + rocks})
+    return world, {ship.name: parse_commands(orders(ship, ships, rng), ship, world)
+                   for ship in ships}
+
+
+def orders(ship, ships: list, rng: Random) -> list[str]:
+    """A round of the usual: speed up, turn, launch twice and burn the nearest foe."""
+    lines = [f"1: A{rng.randint(5, 10)}", f"2: R{rng.randint(-30, 30)}"]
+    foes = [s for s in ships if s.faction != ship.faction]
+    nearest = min(foes, key=lambda s: ship.distance_to(s.xy)).name if foes else None
+    for weapon in ship.weapons.values():
+        if isinstance(weapon, Launcher):
+            lines += [f"{t}: Fire {weapon.name} {middle_of(weapon.firing_arc)}" for t in (3, 7)]
+        elif isinstance(weapon, Laser) and nearest:
+            lines += [f"{t}: Fire {weapon.name} {nearest}" for t in (4, 8)]
+    return lines
+
+
+def middle_of(firing_arc) -> int:
+    if not firing_arc:
+        return 0
+    left, right = firing_arc
+    return round(left + ((right - left) % 360) / 2) % 360
+
+
+def _timed(phase: str):
+    untimed = getattr(GameRound, phase)
+
+    def timed(self, *args):
+        start = perf_counter()
+        try:
+            return untimed(self, *args)
+        finally:
+            self.phases[phase] += perf_counter() - start
+    return timed
+
+
+class TimedRound(GameRound):
+    """A round that keeps how long each phase took, and each pass of the encounter loop."""
+
+    def __init__(self, world: World, round_nr: int):
+        super().__init__(world, round_nr)
+        self.phases = defaultdict(float)
+        self.passes = []
+
+    def resolve_earliest(self, known: dict) -> bool:
+        start = perf_counter()
+        try:
+            return super().resolve_earliest(known)
+        finally:
+            self.passes.append(perf_counter() - start)
+
+
+for _phase in PHASES:
+    setattr(TimedRound, _phase, _timed(_phase))
+
+
+def measure(size: int, seed: int = 0, repeat: int = 1) -> dict:
+    """One size, played repeat times from scratch. The fastest run is the one kept: anything
+    slower was the machine doing something else as well."""
+    best = None
+    for _ in range(repeat):
+        world, commands = battle(size, seed)
+        objects = len(world.objects)
+        game_round = TimedRound(world, 1)
+        start = perf_counter()
+        game_round.do_round(commands)
+        took = perf_counter() - start
+        if best is None or took < best[0]:
+            best = took, objects, game_round
+    took, objects, game_round = best
+
+    passes = game_round.passes
+    return {'objects': objects,
+            'left': len(game_round.world.objects),
+            'round_s': took,
+            'phases': {f'{p}_s': game_round.phases[p] for p in PHASES},
+            'encounter_passes': len(passes),
+            'encounter_pass_s': sum(passes) / len(passes),
+            'encounter_pass_max_s': max(passes),
+            **saved_and_loaded(game_round.world)}
+
+
+def saved_and_loaded(world: World) -> dict:
+    """The world through a status file and back.
+
+    A world that cannot be saved is a result too: pickle follows references depth first, and
+    enough ships that have scanned each other make a chain deeper than Python lets it go."""
+    root = tempfile.mkdtemp()
+    try:
+        gd = GameDirectory(root, 'bench')
+        os.makedirs(gd.path)
+        status = StatusFile(gd, 1)
+        start = perf_counter()
+        try:
+            status.save(world)
+        except RecursionError as e:
+            return {'save_failed': repr(e)}
+        saved = perf_counter() - start
+        start = perf_counter()
+        status.load()
+        return {'save_s': saved,
+                'load_s': perf_counter() - start,
+                'pickle_bytes': os.path.getsize(status.full_name)}
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time a round of a synthetic battle by size.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--out', help="Where to write the result. Left out, it is printed.")
+    parser.add_argument('--against', help="A result to compare with.")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="How much worse a measure may get before it counts, as a fraction.")
+    args = parser.parse_args()
+
+    result = results.stamp('battle') | {
+        'seed': args.seed, 'repeat': args.repeat,
+        'sizes': {str(size): measure(size, args.seed, args.repeat) for size in args.sizes}}
+    results.write(result, args.out)
+    if args.against:
+        baseline = results.load(args.against, 'battle')
+        if results.report(results.compare(baseline['sizes'], result['sizes']), args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
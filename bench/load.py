@@ -0,0 +1,216 @@
+"""How many players at once the application can take, and what each endpoint costs under them.
+
+Serves `arena.serve:application` from a data root made by `bench.season`, in a process of its own
+under a local threaded WSGI server, and plays player sessions against it over HTTP from one
+asyncio loop: log in, list the games, open the plan, send orders (checked, then saved), say
+ready, watch the replay. Per endpoint it keeps every latency, and reports the median, p95 and p99
+with the throughput over the whole run.
+
+    python -m bench.season /tmp/season --games 200 --players 300
+    python -m bench.load /tmp/season --sessions 500 --concurrency 50 --out load.json
+    python -m bench.load /tmp/season --against load.json
+
+The host preforks two workers and this is one process with threads, so the numbers say how the
+code scales with concurrent players on this machine, not what the host will do. Sending orders
+and saying ready write to the data root, so make a fresh season for a baseline."""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+import time
+from random import Random
+from time import perf_counter
+
+from arena.cfg import REPO_ROOT
+from bench import results
+from bench.season import SESSIONS_FILE, orders
+
+HOST = '127.0.0.1'
+# How long the server has to answer its first health check.
+START_SECONDS = 30
+
+
+def serve(port: int):
+    """The application, until killed. Run in the server's own process."""
+    from socketserver import ThreadingMixIn
+    from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+    from arena.serve import application
+
+    # What every request read is logged at DEBUG, which would be most of the output.
+    logging.getLogger('starship-arena').setLevel(logging.WARNING)
+
+    class Threaded(ThreadingMixIn, WSGIServer):
+        daemon_threads = True
+
+    class Quiet(WSGIRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    make_server(HOST, port, application, server_class=Threaded, handler_class=Quiet).serve_forever()
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+
+def start(root: str, port: int) -> subprocess.Popen:
+    """The server on the data root, answering. Cookies go back over plain http here."""
+    env = dict(os.environ, GAME_DATA_DIR=root, ARENA_INSECURE_COOKIES='1')
+    server = subprocess.Popen([sys.executable, '-m', 'bench.load', '--serve', str(port)],
+                              cwd=REPO_ROOT, env=env)
+    deadline = time.monotonic() + START_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            if asyncio.run(call(port, 'GET', '/api/health'))[0] == 200:
+                return server
+        except OSError:
+            pass
+        time.sleep(0.1)
+    server.kill()
+    sys.exit(f"The server did not answer on {port} within {START_SECONDS}s.")
+
+
+async def call(port: int, method: str, path: str, body=None, cookie: str = '') -> tuple:
+    """One request on a connection of its own. Status, headers and body."""
+    reader, writer = await asyncio.open_connection(HOST, port)
+    payload = json.dumps(body).encode() if body is not None else b''
+    head = [f"{method} {path} HTTP/1.1", f"Host: {HOST}:{port}", "Connection: close",
+            f"Content-Length: {len(payload)}"]
+    if body is not None:
+        head.append("Content-Type: application/json")
+    if cookie:
+        head.append(f"Cookie: {cookie}")
+    writer.write(('\r\n'.join(head) + '\r\n\r\n').encode() + payload)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    top, _, content = raw.partition(b'\r\n\r\n')
+    lines = top.decode('latin-1').split('\r\n')
+    headers = [tuple(part.strip() for part in line.split(':', 1)) for line in lines[1:] if ':' in line]
+    return int(lines[0].split()[1]), headers, content
+
+
+class Driver(object):
+    """Plays sessions against one server and keeps what every request took."""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.latencies = {}
+        self.errors = {}
+
+    async def timed(self, endpoint: str, method: str, path: str, body=None, cookie: str = ''):
+        start = perf_counter()
+        try:
+            status, headers, _ = await call(self.port, method, path, body, cookie)
+        except OSError:
+            status, headers = 0, []
+        self.latencies.setdefault(endpoint, []).append(perf_counter() - start)
+        if not 200 <= status < 300:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+        return headers
+
+    async def session(self, s: dict, rng: Random):
+        headers = await self.timed('login', 'POST', '/api/game/login', {'token': s['token']})
+        cookie = next((v.split(';')[0] for k, v in headers if k.lower() == 'set-cookie'), '')
+        game, player, ship = s['game'], s['player'], s['ship']
+        await self.timed('games', 'GET', '/api/game/games', cookie=cookie)
+        await self.timed('plan', 'GET', f'/api/game/{game}/players/{player}/plan', cookie=cookie)
+        await self.timed('commands', 'POST', f'/api/game/{game}/ships/{ship}/commands',
+                         {'lines': orders(rng)}, cookie)
+        await self.timed('ready', 'POST', f'/api/game/{game}/players/{player}/ready',
+                         {'ready': True}, cookie)
+        await self.timed('replay', 'GET', f'/api/game/{game}/replay', cookie=cookie)
+
+    async def run(self, sessions: list[dict], concurrency: int, seed: int):
+        rng = Random(seed)
+        room = asyncio.Semaphore(concurrency)
+
+        async def one(s):
+            async with room:
+                await self.session(s, rng)
+        await asyncio.gather(*(one(s) for s in sessions))
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Nearest rank, so it is always a latency that was measured."""
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, round(p / 100 * len(ordered)) - 1))]
+
+
+def summary(driver: Driver, wall: float) -> dict:
+    endpoints = {name: {'requests': len(taken), 'errors': driver.errors.get(name, 0),
+                        'p50_s': percentile(taken, 50), 'p95_s': percentile(taken, 95),
+                        'p99_s': percentile(taken, 99)}
+                 for name, taken in driver.latencies.items()}
+    requests = sum(e['requests'] for e in endpoints.values())
+    return {'endpoints': endpoints, 'requests': requests, 'wall_s': wall,
+            'requests_per_sec': requests / wall if wall else 0.0}
+
+
+def table(measured: dict) -> str:
+    lines = [f"{'endpoint':10} {'requests':>8} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"]
+    for name, e in measured['endpoints'].items():
+        lines.append(f"{name:10} {e['requests']:8} {e['errors']:6} {e['p50_s'] * 1000:8.1f} "
+                     f"{e['p95_s'] * 1000:8.1f} {e['p99_s'] * 1000:8.1f}")
+    lines.append(f"{measured['requests']} requests in {measured['wall_s']:.1f}s, "
+                 f"{measured['requests_per_sec']:.1f} a second")
+    return '\n'.join(lines)
+
+
+def measure(root: str, sessions: int, concurrency: int, seed: int = 39) -> dict:
+    with open(os.path.join(root, SESSIONS_FILE)) as f:
+        known = json.load(f)['sessions']
+    chosen = [known[i % len(known)] for i in range(sessions)]
+    port = free_port()
+    server = start(root, port)
+    try:
+        driver = Driver(port)
+        began = perf_counter()
+        asyncio.run(driver.run(chosen, concurrency, seed))
+        return summary(driver, perf_counter() - began)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the application on a made season.")
+    parser.add_argument('root', nargs='?', help="A data root made by bench.season.")
+    parser.add_argument('--sessions', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=20,
+                        help="How many sessions are played at once.")
+    parser.add_argument('--seed', type=int, default=39)
+    parser.add_argument('--out', help="Where to write the result. Left out, it is printed.")
+    parser.add_argument('--against', help="A result to compare with.")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="How much worse a measure may get before it counts, as a fraction.")
+    parser.add_argument('--serve', type=int, metavar='PORT', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.serve)
+        return
+    if not args.root:
+        parser.error("Which data root? Make one with bench.season.")
+
+    measured = measure(os.path.abspath(args.root), args.sessions, args.concurrency, args.seed)
+    print(table(measured), file=sys.stderr)
+    result = results.stamp('load') | {'sessions': args.sessions, 'concurrency': args.concurrency,
+                                      **measured}
+    results.write(result, args.out)
+    if args.against:
+        baseline = results.load(args.against, 'load')
+        if results.report(results.compare(baseline['endpoints'], result['endpoints']),
+                          args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+"""How fast the engine's innermost pieces are, one at a time.
+
+A regenerate runs these millions of times over, so a change to one of them shows here long before
+it shows in a round. Every primitive is handed the same inputs every run, built from a fixed seed
+and fresh for each timing, and only the calls themselves are timed.
+
+    python -m bench.micro                        operations a second, for every primitive
+    python -m bench.micro Leg.closest_fraction   just the one
+    python -m bench.micro --record               and add the run to the history
+    python -m bench.micro --history              what the history says, commit by commit
+    python -m bench.micro --against 268ec65      held against the last run recorded there
+
+The history is a JSON line per run, in bench/micro.jsonl unless told otherwise. It is the
+machine's own and is not tracked."""
+
+import argparse
+import json
+import os
+import sys
+from random import Random
+from time import perf_counter
+
+from arena.cfg import REPO_ROOT
+from arena.engine.command import CommandLine, parse_commands
+from arena.engine.history import History, Tick, TickHistory
+from arena.engine.objects.event import InternalEvent, ScanEvent
+from arena.engine.objects.geometry import Leg, Point, Vector
+from arena.engine.objects.registry import builder
+from arena.engine.world import World
+from bench import results
+
+HISTORY = os.path.join(REPO_ROOT, 'bench', 'micro.jsonl')
+SEED = 34
+# How many calls one timing makes. Enough that the clock's own resolution does not matter.
+CALLS = 20000
+
+PRIMITIVES = {}
+
+
+def primitive(name: str):
+    """A primitive is set up by a function of a seeded Random, which returns what to time and how
+    many calls that makes."""
+    def register(setup):
+        PRIMITIVES[name] = setup
+        return setup
+    return register
+
+
+def _leg(rng: Random) -> Leg:
+    return Leg(Point(rng.uniform(-100, 100), rng.uniform(-100, 100)),
+               (rng.uniform(-60, 60), rng.uniform(-60, 60)))
+
+
+@primitive('Leg.closest_fraction')
+def _(rng):
+    cases = [(_leg(rng), _leg(rng), rng.uniform(5, 60)) for _ in range(CALLS)]
+    return lambda: [a.closest_fraction(b, reach) for a, b, reach in cases], CALLS
+
+
+@primitive('Leg.approach_fraction')
+def _(rng):
+    cases = [(_leg(rng), _leg(rng), rng.uniform(5, 60)) for _ in range(CALLS)]
+    return lambda: [a.approach_fraction(b, reach) for a, b, reach in cases], CALLS
+
+
+def _vectors(rng: Random) -> list:
+    return [Vector(Point(rng.uniform(-500, 500), rng.uniform(-500, 500)),
+                   rng.uniform(0, 360), rng.uniform(0, 60)) for _ in range(CALLS)]
+
+
+@primitive('Vector.move')
+def _(rng):
+    vectors = _vectors(rng)
+    return lambda: [v.move() for v in vectors], CALLS
+
+
+@primitive('Vector.turn')
+def _(rng):
+    vectors = _vectors(rng)
+    angles = [rng.uniform(-45, 45) for _ in vectors]
+    return lambda: [v.turn(a) for v, a in zip(vectors, angles)], CALLS
+
+
+@primitive('Tick.from_abs')
+def _(rng):
+    ticks = [rng.randrange(10, 1000) for _ in range(CALLS)]
+    return lambda: [Tick.from_abs(t) for t in ticks], CALLS
+
+
+@primitive('Tick.ticks_for_round')
+def _(rng):
+    ticks = [Tick(rng.randrange(1, 100), rng.randrange(1, 11)) for _ in range(CALLS // 10)]
+    return lambda: [t.ticks_for_round for t in ticks], len(ticks)
+
+
+@primitive('TickHistory.add_event')
+def _(rng):
+    """A tick's worth at a time: a few dozen messages and scans, some of the scans repeated."""
+    ships = [builder.create(f'S{i}', 'H2545', (rng.uniform(-100, 100), rng.uniform(-100, 100)))
+             for i in range(10)]
+    ticks = []
+    for _ in range(CALLS // 40):
+        events = [InternalEvent("Moved from {} to {}", i, i + 1) for i in range(30)]
+        events += [ScanEvent.create_scan(ships[0], rng.choice(ships[1:])) for _ in range(10)]
+        ticks.append((TickHistory(), events))
+
+    def run():
+        for history, events in ticks:
+            for event in events:
+                history.add_event(event)
+    return run, CALLS
+
+
+@primitive('History.set_tick')
+def _(rng):
+    """A round's ticks for a few ships, each of which snapshots what it was at the last one."""
+    ships = [builder.create(f'S{i}', 'H2545', (i, 0)) for i in range(CALLS // 100)]
+    histories = [History(ship, Tick(1, 1)) for ship in ships]
+    ticks = Tick(rng.randrange(1, 50), 1).ticks_for_round
+
+    def run():
+        for history in histories:
+            for tick in ticks:
+                history.set_tick(tick)
+    return run, len(histories) * len(ticks)
+
+
+def _orders(rng: Random, n: int) -> list[str]:
+    orders = ["A{}", "R{}", "L{}", "Fire R1 {}", "Fire L1 Target", "Boost Shields N {}", "Scan G {}"]
+    return [f"{rng.randint(1, 10)}: {rng.choice(orders).format(rng.randint(1, 30))}"
+            for _ in range(n)]
+
+
+@primitive('CommandLine')
+def _(rng):
+    lines = _orders(rng, CALLS)
+    return lambda: [CommandLine(line) for line in lines], CALLS
+
+
+@primitive('parse_commands')
+def _(rng):
+    """A round's orders for one ship, checked against a world it can see its target in."""
+    ship = builder.create('Ship', 'H2545', (0, 0))
+    target = builder.create('Target', 'H2545', (0, 50))
+    world = World(None, {'Ship': ship, 'Target': target})
+    files = [_orders(rng, 20) for _ in range(CALLS // 20)]
+    return lambda: [parse_commands(lines, ship, world) for lines in files], CALLS
+
+
+def measure(name: str, repeat: int = 5) -> dict:
+    """The fastest of repeat timings, each on inputs of its own."""
+    best = None
+    for _ in range(repeat):
+        run, calls = PRIMITIVES[name](Random(SEED))
+        start = perf_counter()
+        run()
+        took = (perf_counter() - start) / calls
+        best = took if best is None else min(best, took)
+    return {'ops_per_sec': round(1 / best), 'op_s': best}
+
+
+def record(result: dict, path: str):
+    with open(path, 'a') as f:
+        f.write(json.dumps(result) + '\n')
+
+
+def history(path: str) -> list[dict]:
+    """Every recorded run, oldest first."""
+    if not os.path.exists(path):
+        sys.exit(f"No history at {path}. Record a run with --record.")
+    with open(path) as f:
+        runs = [json.loads(line) for line in f if line.strip()]
+    return [run for run in runs if run.get('format') == results.FORMAT]
+
+
+def recorded_at(path: str, commit: str) -> dict:
+    """Every primitive as last recorded at that commit, whichever run that was in."""
+    runs = [run for run in history(path) if run['commit'].startswith(commit)]
+    if not runs:
+        sys.exit(f"Nothing recorded at {commit} in {path}.")
+    return {name: measured for run in runs for name, measured in run['primitives'].items()}
+
+
+def show_history(path: str, names: list[str]):
+    """Operations a second per primitive, a column per recorded run."""
+    runs = history(path)
+    print(f"{'':24}" + ''.join(f"{run['commit'] or '?':>12}" for run in runs))
+    for name in names:
+        print(f"{name:24}" + ''.join(f"{run['primitives'].get(name, {}).get('ops_per_sec', ''):>12}"
+                                     for run in runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the engine's primitives one by one.")
+    parser.add_argument('primitives', nargs='*', metavar='primitive',
+                        help=f"Which of them. Left out, all of them: {', '.join(PRIMITIVES)}.")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--record', action='store_true', help="Add this run to the history.")
+    parser.add_argument('--history', action='store_true', help="Show the history and stop.")
+    parser.add_argument('--file', default=HISTORY, help="Where the history is kept.")
+    parser.add_argument('--against', metavar='COMMIT',
+                        help="Compare with the last run recorded at this commit.")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="How much slower a primitive may get before it counts, as a fraction.")
+    args = parser.parse_args()
+    names = args.primitives or list(PRIMITIVES)
+    if unknown := set(names) - set(PRIMITIVES):
+        parser.error(f"no such primitive: {', '.join(sorted(unknown))}")
+
+    if args.history:
+        show_history(args.file, names)
+        return
+    result = results.stamp('micro') | {
+        'seed': SEED, 'repeat': args.repeat,
+        'primitives': {name: measure(name, args.repeat) for name in names}}
+    for name, measured in result['primitives'].items():
+        print(f"{name:24} {measured['ops_per_sec']:>12} ops/s")
+    if args.record:
+        record(result, args.file)
+    if args.against:
+        baseline = recorded_at(args.file, args.against)
+        if results.report(results.compare(baseline, result['primitives']),
+                          args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""How long the bundled games take to replay, round by round.
+
+Every game under test/test-games with orders to replay is set up afresh and played through, the
+way a regenerate plays a game on the host: one Game, each round opened on the world the round
+before left in memory. Each round is timed until its world is saved, which is what a regenerate
+waits for, and the saved world is measured.
+
+    python -m bench.replay --out replay.json
+    python -m bench.replay --against replay.json       with the change per round
+
+Memory is measured on a run of its own: tracing every allocation slows a round down several
+times over, and would be timed along with it."""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+from arena.cfg import REPO_ROOT
+from arena.engine.admin import setup_game
+from arena.engine.gamedirectory import GameDirectory
+from bench import results
+
+GAMES_DIR = os.path.join(REPO_ROOT, 'test', 'test-games')
+
+
+def bundled() -> list[str]:
+    """Every bundled game with orders to replay. One kept for its unreadable pickle has none."""
+    return sorted(name for name in os.listdir(GAMES_DIR)
+                  if os.path.isdir(os.path.join(GAMES_DIR, name, 'commands')))
+
+
+def replay(name: str, traced: bool = False) -> dict:
+    """Play the game through from its ships file, in a copy. Per round: how long it took, how
+    big its world is saved, and when traced the most memory it held at once."""
+    root = tempfile.mkdtemp()
+    try:
+        shutil.copytree(os.path.join(GAMES_DIR, name), os.path.join(root, name),
+                        ignore=shutil.ignore_patterns('*.pickle'))
+        gd = GameDirectory(root, name)
+        game = setup_game(gd)
+        rounds = {}
+        while game.current_round_ready:
+            if traced:
+                tracemalloc.start()
+            start = perf_counter()
+            game.process_current_round(carry_on=True)
+            measured = {'round_s': perf_counter() - start}
+            if traced:
+                measured = {'peak_bytes': tracemalloc.get_traced_memory()[1]}
+                tracemalloc.stop()
+            measured['pickle_bytes'] = os.path.getsize(gd.last_status_file)
+            rounds[str(gd.last_round_number)] = measured
+        return rounds
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def measure(name: str, repeat: int = 5) -> dict:
+    """The fastest of repeat replays for each round, and a traced one for memory."""
+    runs = [replay(name) for _ in range(repeat)]
+    traced = replay(name, traced=True)
+    rounds = {nr: {'round_s': min(run[nr]['round_s'] for run in runs),
+                   'peak_bytes': traced[nr]['peak_bytes'],
+                   'pickle_bytes': traced[nr]['pickle_bytes']}
+              for nr in runs[0]}
+    return {'rounds': rounds, 'total_s': sum(r['round_s'] for r in rounds.values())}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time replaying the bundled games.")
+    parser.add_argument('games', nargs='*', help="Which of them. Left out, all of them.")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--out', help="Where to write the result. Left out, it is printed.")
+    parser.add_argument('--against', help="A result to compare with.")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="How much worse a measure may get before it counts, as a fraction.")
+    args = parser.parse_args()
+
+    result = results.stamp('replay') | {
+        'repeat': args.repeat,
+        'games': {name: measure(name, args.repeat) for name in args.games or bundled()}}
+    results.write(result, args.out)
+    if args.against:
+        baseline = results.load(args.against, 'replay')
+        if results.report(results.compare(baseline['games'], result['games']), args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""Writing down what a benchmark measured, and holding it against what it measured before.
+
+A result is a JSON object of numbers, nested as deep as a benchmark likes. A number whose key ends
+in `_s` is a time and one ending in `_bytes` a size. Those are the ones compared, and for both of
+them more is worse. Anything else is there to read."""
+
+import json
+import platform
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from arena.cfg import REPO_ROOT
+
+MEASURES = ('_s', '_bytes')
+# Raised whenever a result changes shape, so an old one is refused rather than half compared.
+FORMAT = 1
+
+
+def commit() -> str:
+    """The commit the tree was at, with a + when it had changes on top. Empty outside git."""
+    def git(*args) -> str:
+        return subprocess.run(['git', *args], cwd=REPO_ROOT, capture_output=True, text=True).stdout
+    try:
+        head = git('rev-parse', '--short', 'HEAD').strip()
+        return head + ('+' if head and git('status', '--porcelain', '--untracked-files=no') else '')
+    except OSError:
+        return ''
+
+
+def stamp(benchmark: str) -> dict:
+    """What a result needs to say about where it came from."""
+    return {'benchmark': benchmark,
+            'format': FORMAT,
+            'commit': commit(),
+            'when': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'machine': platform.node()}
+
+
+def write(result: dict, path: str = None):
+    """To the file, or to stdout when there is none."""
+    text = json.dumps(result, indent=2)
+    if path:
+        with open(path, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+def load(path: str, benchmark: str) -> dict:
+    """A result written earlier, by the same benchmark in the same format."""
+    with open(path) as f:
+        result = json.load(f)
+    if (result.get('benchmark'), result.get('format')) != (benchmark, FORMAT):
+        sys.exit(f"{path} is not a {benchmark} result in format {FORMAT}. Measure it again.")
+    return result
+
+
+def flatten(result: dict, prefix: str = '') -> dict:
+    """Every number in it, by the dotted path to it."""
+    flat = {}
+    for key, value in result.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, path + '.'))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+@dataclass
+class Change:
+    key: str
+    was: float
+    now: float
+
+    @property
+    def delta(self) -> float:
+        """How much more it is, as a fraction of what it was."""
+        return (self.now - self.was) / self.was if self.was else 0.0
+
+    def regressed(self, tolerance: float) -> bool:
+        return self.delta > tolerance
+
+    def __str__(self):
+        return f"{self.key:60} {self.was:>12.6g} {self.now:>12.6g} {self.delta:>+8.1%}"
+
+
+def compare(baseline: dict, current: dict) -> list[Change]:
+    """Every measure both have. One that only either has is new or gone, not better or worse."""
+    was, now = flatten(baseline), flatten(current)
+    return [Change(key, was[key], now[key]) for key in now
+            if key in was and key.endswith(MEASURES)]
+
+
+def report(changes: list[Change], tolerance: float) -> list[Change]:
+    """Print the changes, worst marked. Returns the ones past the tolerance."""
+    regressions = [c for c in changes if c.regressed(tolerance)]
+    print(f"{'':60} {'baseline':>12} {'now':>12} {'delta':>8}")
+    for change in changes:
+        print(f"{change}{'   WORSE' if change in regressions else ''}")
+    print(f"{len(regressions)} of {len(changes)} past {tolerance:.0%}.")
+    return regressions
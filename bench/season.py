@@ -0,0 +1,81 @@
+"""A data root with a season in it, for the load test to play against.
+
+Games, players and rounds are made through the services the console uses, so what is on disk is
+what a real season leaves there: rosters placed by a scenario, orders in command files, rounds
+processed and journalled. Every player gets a login, and what a session needs to act as them is
+written beside the games.
+
+    python -m bench.season /tmp/season --games 200 --players 300 --rounds 3
+    python -m bench.load /tmp/season
+
+The same seed makes the same season, apart from the tokens, which are drawn the way a login is."""
+
+import argparse
+import json
+import os
+import sys
+from random import Random
+
+from arena.announce import Announcer
+from arena.app.services import AdminService, GameService
+
+SESSIONS_FILE = 'load-sessions.json'
+TYPES = ('H2545', 'H2552', 'F2547')
+SIDES = ('One', 'Two')
+
+
+def orders(rng: Random) -> list[str]:
+    """A round of the usual for a ship nobody is watching: speed up and turn."""
+    return [f"1: A{rng.randint(5, 10)}", f"2: R{rng.randint(-30, 30)}"]
+
+
+def season(root: str, games: int, players: int, ships_per_game: int, rounds: int,
+           seed: int = 39) -> list[dict]:
+    """Fill root with a season. Returns a session per ship: whose it is, in which game, and the
+    token that logs them in."""
+    rng = Random(seed)
+    # Nothing is announced: the season is made up, and its players are nobody.
+    admin = AdminService(root, announcer=Announcer([]))
+    service = GameService(root, announcer=Announcer([]))
+    names = [f"Pilot{n:03d}" for n in range(1, players + 1)]
+    tokens = {name: admin.issue_login(name).token for name in names}
+
+    sessions = []
+    for g in range(1, games + 1):
+        game = f"Season_{g:03d}"
+        crew = rng.sample(names, min(ships_per_game, players))
+        ships = [{'name': f"{player}-{g}", 'type': rng.choice(TYPES), 'faction': SIDES[i % 2],
+                  'player': player, 'x': 0, 'y': 0}
+                 for i, player in enumerate(crew)]
+        admin.create_game(game, ships, 'generic')
+        for _ in range(rounds):
+            for ship in ships:
+                service.save_commands(game, ship['name'], orders(rng))
+            admin.process_turn(game)
+        sessions += [{'player': s['player'], 'token': tokens[s['player']], 'game': game,
+                      'ship': s['name']} for s in ships]
+        print(f"  {game}: {len(ships)} ships, {rounds} rounds", file=sys.stderr)
+
+    with open(os.path.join(root, SESSIONS_FILE), 'w') as f:
+        json.dump({'sessions': sessions}, f, indent=1)
+    return sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill a data root with a season to load test.")
+    parser.add_argument('root', help="An empty directory to become the data root.")
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--players', type=int, default=300)
+    parser.add_argument('--ships', type=int, default=4, help="Ships per game, one per player.")
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=39)
+    args = parser.parse_args()
+    if os.path.exists(args.root) and os.listdir(args.root):
+        sys.exit(f"{args.root} is not empty.")
+    os.makedirs(args.root, exist_ok=True)
+    made = season(args.root, args.games, args.players, args.ships, args.rounds, args.seed)
+    print(f"{len(made)} sessions in {os.path.join(args.root, SESSIONS_FILE)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""Game data as files against the same data in one SQLite database, on a season's data root.
+
+The root is copied twice, once as the directory it is and once into a database, and the same reads
+and writes are timed on each: what a request does when it opens a game, reads a round's orders,
+loads the latest world or saves orders, and reading the player registry as a login does. Both
+copies are measured for size. See docs/adr/0043-game-data-behind-a-storage-interface.md.
+
+    python -m bench.season /tmp/season --games 200 --players 300
+    python -m bench.storage /tmp/season --out storage.json
+    python -m bench.storage /tmp/season --against storage.json"""
+
+import argparse
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from contextlib import closing
+from pathlib import Path
+from time import perf_counter
+
+from arena.app.players import PlayerRegistry
+from arena.cfg import CACHE_DIR_NAME, COMMAND_FILE_TEMPLATE, STAGING_DIR_NAME
+from arena.engine.gamedirectory import GameDirectory, GamesIn, GamesRoot
+from arena.storage import SqliteStorage
+from bench import results
+
+DATABASE = 'arena.sqlite'
+
+
+def _size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob('*') if p.is_file())
+
+
+def _database_size(database: Path) -> int:
+    """The database as it settles, with what the write-ahead log held folded into it."""
+    with closing(sqlite3.connect(database)) as db:
+        db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    return sum(p.stat().st_size for p in database.parent.glob(database.name + '*'))
+
+
+def _games(root: Path, database: Path = None) -> list[GameDirectory]:
+    """Every active game of a copy, kept in the database when there is one."""
+    if database is None:
+        return GamesRoot(root).directories_in(GamesIn.Active)
+    store = SqliteStorage(database)
+    return [GameDirectory(str(root), name.split('/')[-1], GamesIn.Active, store.within(name))
+            for name in store.names(f"{GamesIn.Active}/*")]
+
+
+def _open(games: list[GameDirectory], registry: PlayerRegistry):
+    for gd in games:
+        registry.all()
+        gd.read_settings()
+        gd.read_journal(limit=20)
+        gd.last_round_number
+
+
+def _orders(games: list[GameDirectory], registry: PlayerRegistry):
+    for gd in games:
+        for name in gd.files_like(COMMAND_FILE_TEMPLATE.format('*', gd.last_round_number)):
+            with gd.reading(name, kind='commands') as f:
+                f.read()
+
+
+def _world(games: list[GameDirectory], registry: PlayerRegistry):
+    for gd in games:
+        gd.load_current_world()
+
+
+def _save(games: list[GameDirectory], registry: PlayerRegistry):
+    for gd in games:
+        gd.write_command_file('Bench', gd.last_round_number + 1, ['1: A5', '2: R10'])
+        gd.append_journal({'event': 'benched'})
+
+
+OPERATIONS = {'open_s': _open, 'orders_s': _orders, 'world_s': _world, 'save_s': _save}
+
+
+def _timed(operation, games, registry, repeat: int) -> float:
+    taken = []
+    for _ in range(repeat):
+        start = perf_counter()
+        operation(games, registry)
+        taken.append(perf_counter() - start)
+    return min(taken)
+
+
+def measure(root: str, repeat: int = 3) -> dict:
+    """The fastest of repeat runs of each operation over every active game, on each store."""
+    work = Path(tempfile.mkdtemp())
+    try:
+        files = work / 'files'
+        shutil.copytree(root, files, ignore=shutil.ignore_patterns(
+            CACHE_DIR_NAME, STAGING_DIR_NAME, DATABASE + '*'))
+        database = work / DATABASE
+        GamesRoot(Path(root)).copy_into(SqliteStorage(database))
+        sizes = {'files': _size(files), 'sqlite': _database_size(database)}
+        stores = {'files': (_games(files), PlayerRegistry(str(files))),
+                  'sqlite': (_games(work, database),
+                             PlayerRegistry(str(work), SqliteStorage(database)))}
+        measured = {}
+        for name, (games, registry) in stores.items():
+            measured[name] = {op: _timed(operation, games, registry, repeat)
+                              for op, operation in OPERATIONS.items()}
+            measured[name]['size_bytes'] = sizes[name]
+        return {'games': len(stores['files'][0]), 'stores': measured}
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time game data as files and as a database.")
+    parser.add_argument('root', help="A data root, such as the one bench.season makes.")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--out', help="Where to write the result. Left out, it is printed.")
+    parser.add_argument('--against', help="A result to compare with.")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="How much worse a measure may get before it counts, as a fraction.")
+    args = parser.parse_args()
+    if not os.path.isdir(args.root):
+        sys.exit(f"No data root at {args.root}. Make one with python -m bench.season.")
+
+    result = results.stamp('storage') | {'repeat': args.repeat} | measure(args.root, args.repeat)
+    results.write(result, args.out)
+    if args.against:
+        baseline = results.load(args.against, 'storage')
+        if results.report(results.compare(baseline['stores'], result['stores']), args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
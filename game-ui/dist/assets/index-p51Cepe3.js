@@ -1,5 +1,5 @@
 (function(){let e=document.createElement(`link`).relList;if(e&&e.supports&&e.supports(`modulepreload`))return;for(let e of document.querySelectorAll(`link[rel="modulepreload"]`))n(e);new MutationObserver(e=>{for(let t of e)if(t.type===`childList`)for(let e of t.addedNodes)e.tagName===`LINK`&&e.rel===`modulepreload`&&n(e)}).observe(document,{childList:!0,subtree:!0});function t(e){let t={};return e.integrity&&(t.integrity=e.integrity),e.referrerPolicy&&(t.referrerPolicy=e.referrerPolicy),e.crossOrigin===`use-credentials`?t.credentials=`include`:e.crossOrigin===`anonymous`?t.credentials=`omit`:t.credentials=`same-origin`,t}function n(e){if(e.ep)return;e.ep=!0;let n=t(e);fetch(e.href,n)}})();var e=Array.isArray,t=Array.prototype.indexOf,n=Array.prototype.includes,r=Array.from,i=Object.defineProperty,a=Object.getOwnPropertyDescriptor,o=Object.getOwnPropertyDescriptors,s=Object.prototype,c=Array.prototype,l=Object.getPrototypeOf,u=Object.isExtensible,d=()=>{};function f(e){for(var t=0;t<e.length;t++)e[t]()}function p(){var e,t;return{promise:new Promise((n,r)=>{e=n,t=r}),resolve:e,reject:t}}function m(e,t){if(Array.isArray(e))return e;if(t===void 0||!(Symbol.iterator in e))return Array.from(e);let n=[];for(let r of e)if(n.push(r),n.length===t)break;return n}var h=1024,g=2048,_=4096,v=8192,y=16384,b=32768,x=1<<25,S=65536,C=1<<19,w=1<<20,ee=1<<25,T=65536,te=1<<21,ne=1<<22,re=1<<23,ie=Symbol(`$state`),ae=Symbol(`legacy props`),oe=Symbol(``),se=Symbol(`attributes`),ce=Symbol(`class`),le=Symbol(`style`),ue=Symbol(`text`),E=Symbol(`form reset`),de=new class extends Error{name=`StaleReactionError`;message="The reaction that called `getAbortSignal()` was re-run or destroyed"},fe=!!globalThis.document?.contentType&&globalThis.document.contentType.includes(`xml`);function pe(){throw Error(`https://svelte.dev/e/async_derived_orphan`)}function me(e,t,n){throw Error(`https://svelte.dev/e/each_key_duplicate`)}function he(e){throw Error(`https://svelte.dev/e/effect_in_teardown`)}function ge(){throw Error(`https://svelte.dev/e/effect_in_unowned_derived`)}function _e(e){throw Error(`https://svelte.dev/e/effect_orphan`)}function ve(){throw Error(`https://svelte.dev/e/effect_update_depth_exceeded`)}function ye(e){throw Error(`https://svelte.dev/e/props_invalid_value`)}function be(){throw Error(`https://svelte.dev/e/state_descriptors_fixed`)}function xe(){throw Error(`https://svelte.dev/e/state_prototype_fixed`)}function Se(){throw Error(`https://svelte.dev/e/state_unsafe_mutation`)}function Ce(){throw Error(`https://svelte.dev/e/svelte_boundary_reset_onerror`)}var we={},D=Symbol(`uninitialized`),Te=`http://www.w3.org/1999/xhtml`,Ee=`http://www.w3.org/2000/svg`,De=`http://www.w3.org/1998/Math/MathML`;function Oe(){console.warn(`https://svelte.dev/e/derived_inert`)}function ke(e){console.warn(`https://svelte.dev/e/hydration_mismatch`)}function Ae(){console.warn(`https://svelte.dev/e/select_multiple_invalid_value`)}function je(){console.warn(`https://svelte.dev/e/svelte_boundary_reset_noop`)}var O=!1;function Me(e){O=e}var k;function Ne(e){if(e===null)throw ke(),we;return k=e}function Pe(){return Ne(mn(k))}function A(e){if(O){if(mn(k)!==null)throw ke(),we;k=e}}function j(e=1){if(O){for(var t=e,n=k;t--;)n=mn(n);k=n}}function Fe(e=!0){for(var t=0,n=k;;){if(n.nodeType===8){var r=n.data;if(r===`]`){if(t===0)return n;--t}else(r===`[`||r===`[!`||r[0]===`[`&&!isNaN(Number(r.slice(1))))&&(t+=1)}var i=mn(n);e&&n.remove(),n=i}}function Ie(e){if(!e||e.nodeType!==8)throw ke(),we;return e.data}function Le(e){return e===this.v}function Re(e,t){return e==e?e!==t||typeof e==`object`&&!!e||typeof e==`function`:t==t}function ze(e){return!Re(e,this.v)}var Be=!1;function Ve(){Be=!0}var He=null;function Ue(e){He=e}function We(e,t=!1,n){He={p:He,i:!1,c:null,e:null,s:e,x:null,r:V,l:Be&&!t?{s:null,u:null,$:[]}:null}}function Ge(e){var t=He,n=t.e;if(n!==null){t.e=null;for(var r of n)Tn(r)}return e!==void 0&&(t.x=e),t.i=!0,He=t.p,e??{}}function Ke(){return!Be||He!==null&&He.l===null}var qe=[];function Je(){var e=qe;qe=[],f(e)}function Ye(e){if(qe.length===0&&!Mt){var t=qe;queueMicrotask(()=>{t===qe&&Je()})}qe.push(e)}function Xe(){for(;qe.length>0;)Je()}function Ze(e){var t=V;if(t===null)return B.f|=re,e;if(!(t.f&32768)&&!(t.f&4))throw e;Qe(e,t)}function Qe(e,t){if(!(t!==null&&t.f&16384)){for(;t!==null;){if(t.f&128){if(!(t.f&32768))throw e;try{t.b.error(e);return}catch(t){e=t}}t=t.parent}throw e}}var $e=~(g|_|h);function et(e,t){e.f=e.f&$e|t}function tt(e){e.f&512||e.deps===null?et(e,h):et(e,_)}function nt(e){if(e!==null)for(let t of e)!(t.f&2)||!(t.f&65536)||(t.f^=T,nt(t.deps))}function rt(e,t,n){e.f&2048?t.add(e):e.f&4096&&n.add(e),nt(e.deps),et(e,h)}var it=!1;function at(e){var t=it;try{return it=!1,[e(),it]}finally{it=t}}function ot(e){O&&pn(e)!==null&&hn(e)}var st=!1;function ct(){st||(st=!0,document.addEventListener(`reset`,e=>{Promise.resolve().then(()=>{if(!e.defaultPrevented)for(let t of e.target.elements)t[E]?.()})},{capture:!0}))}function lt(e){var t=B,n=V;Jn(null),Yn(null);try{return e()}finally{Jn(t),Yn(n)}}function ut(e,t,n,r=n){e.addEventListener(t,()=>lt(n));let i=e[E];i?e[E]=()=>{i(),r(!0)}:e[E]=()=>r(!0),ct()}function dt(e){let t=0,n=Zt(0),r;return()=>{Sn()&&(H(n),kn(()=>(t===0&&(r=gr(()=>e(()=>tn(n)))),t+=1,()=>{Ye(()=>{--t,t===0&&(r?.(),r=void 0,tn(n))})})))}}var ft=S|C;function pt(e,t,n,r){new mt(e,t,n,r)}var mt=class{parent;is_pending=!1;transform_error;#e;#t=O?k:null;#n;#r;#i;#a=null;#o=null;#s=null;#c=null;#l=0;#u=0;#d=!1;#f=new Set;#p=new Set;#m=null;#h=dt(()=>(this.#m=Zt(this.#l),()=>{this.#m=null}));constructor(e,t,n,r){this.#e=e,this.#n=t,this.#r=e=>{var t=V;t.b=this,t.f|=128,n(e)},this.parent=V.b,this.transform_error=r??this.parent?.transform_error??(e=>e),this.#i=An(()=>{if(O){let e=this.#t;Pe();let t=e.data===`[!`;if(e.data.startsWith(`[?`)){let t=JSON.parse(e.data.slice(2));this.#_(t)}else t?this.#y():this.#g()}else this.#b()},ft),O&&(this.#e=k)}#g(){try{this.#a=jn(()=>this.#r(this.#e))}catch(e){this.error(e)}}#_(e){let t=this.#n.failed,{reset:n,invoke_onerror:r}=this.#v(e);Ye(r),t&&(this.#s=jn(()=>{t(this.#e,()=>e,()=>n)}))}#v(e){var t=!1,n=!1;let r=()=>{if(t){je();return}t=!0,n&&Ce(),this.#s!==null&&Rn(this.#s,()=>{this.#s=null}),this.#S(()=>{this.#b()})};return{reset:r,invoke_onerror:()=>{try{n=!0,this.#n.onerror?.(e,r),n=!1}catch(e){Qe(e,this.#i&&this.#i.parent)}}}}#y(){let e=this.#n.pending;e&&(this.is_pending=!0,this.#o=jn(()=>e(this.#e)),Ye(()=>{var e=this.#c=document.createDocumentFragment(),t=fn();e.append(t),this.#a=this.#S(()=>jn(()=>this.#r(t))),this.#u===0&&(this.#e.before(e),this.#c=null,Rn(this.#o,()=>{this.#o=null}),this.#x(N))}))}#b(){try{if(this.is_pending=this.has_pending_snippet(),this.#u=0,this.#l=0,this.#a=jn(()=>{this.#r(this.#e)}),this.#u>0){var e=this.#c=document.createDocumentFragment();Hn(this.#a,e);let t=this.#n.pending;this.#o=jn(()=>t(this.#e))}else this.#x(N)}catch(e){this.error(e)}}#x(e){this.is_pending=!1,e.transfer_effects(this.#f,this.#p)}defer_effect(e){rt(e,this.#f,this.#p)}is_rendered(){return!this.is_pending&&(!this.parent||this.parent.is_rendered())}has_pending_snippet(){return!!this.#n.pending}#S(e){var t=V,n=B,r=He;Yn(this.#i),Jn(this.#i),Ue(this.#i.ctx);try{return Rt.ensure(),e()}catch(e){return Ze(e),null}finally{Yn(t),Jn(n),Ue(r)}}#C(e,t){if(!this.has_pending_snippet()){this.parent&&this.parent.#C(e,t);return}this.#u+=e,this.#u===0&&(this.#x(t),this.#o&&Rn(this.#o,()=>{this.#o=null}),this.#c&&=(this.#e.before(this.#c),null))}update_pending_count(e,t){this.#C(e,t),this.#l+=e,!(!this.#m||this.#d)&&(this.#d=!0,Ye(()=>{this.#d=!1,this.#m&&$t(this.#m,this.#l)}))}get_effect_pending(){return this.#h(),H(this.#m)}error(e){if(!this.#n.onerror&&!this.#n.failed)throw e;N?.is_fork?(this.#a&&N.skip_effect(this.#a),this.#o&&N.skip_effect(this.#o),this.#s&&N.skip_effect(this.#s),N.oncommit(()=>{this.#w(e)})):this.#w(e)}#w(e){this.#a&&=(Fn(this.#a),null),this.#o&&=(Fn(this.#o),null),this.#s&&=(Fn(this.#s),null),O&&(Ne(this.#t),j(),Ne(Fe()));let t=this.#n.failed,n=e=>{let{reset:n,invoke_onerror:r}=this.#v(e);r(),t&&(this.#s=this.#S(()=>{try{return jn(()=>{var r=V;r.b=this,r.f|=128,t(this.#e,()=>e,()=>n)})}catch(e){return Qe(e,this.#i.parent),null}}))};Ye(()=>{var t;try{t=this.transform_error(e)}catch(e){Qe(e,this.#i&&this.#i.parent);return}typeof t==`object`&&t&&typeof t.then==`function`?t.then(n,e=>Qe(e,this.#i&&this.#i.parent)):n(t)})}};function ht(e,t,n,r){let i=Ke()?yt:St;var a=e.filter(e=>!e.settled),o=t.map(i);if(n.length===0&&a.length===0){r(o);return}var s=V,c=gt(),l=a.length===1?a[0].promise:a.length>1?Promise.all(a.map(e=>e.promise)):null;function u(e){if(!(s.f&16384)){c();try{r([...o,...e])}catch(e){Qe(e,s)}_t()}}var d=vt();if(n.length===0){l.then(()=>u([])).finally(d);return}function f(){Promise.all(n.map(e=>xt(e))).then(u).catch(e=>Qe(e,s)).finally(d)}l?l.then(()=>{c(),f(),_t()}):f()}function gt(){var e=V,t=B,n=He,r=N;return function(i=!0){Yn(e),Jn(t),Ue(n),i&&!(e.f&16384)&&(r?.activate(),r?.apply())}}function _t(e=!0){Yn(null),Jn(null),Ue(null),e&&N?.deactivate()}function vt(){var e=V,t=e.b,n=N,r=!!t?.is_rendered();return t?.update_pending_count(1,n),n.increment(r,e),()=>{t?.update_pending_count(-1,n),n.decrement(r,e)}}function yt(e){var t=2|g;return V!==null&&(V.f|=C),{ctx:He,deps:null,effects:null,equals:Le,f:t,fn:e,reactions:null,rv:0,v:D,wv:0,parent:V,ac:null}}var bt=Symbol(`obsolete`);function xt(e,t,n){let r=V;r===null&&pe();var i=void 0,a=Zt(D),o=!B,s=new Set;return On(()=>{var t=V,n=p();i=n.promise;try{Promise.resolve(e()).then(n.resolve,e=>{e!==de&&n.reject(e)}).finally(_t)}catch(e){n.reject(e),_t()}var c=N;if(o){if(t.f&32768)var l=vt();if(r.b?.is_rendered())c.async_deriveds.get(t)?.reject(bt);else for(let e of s.values())e.reject(bt);s.add(n),c.async_deriveds.set(t,n)}let u=(e,t=void 0)=>{l?.(),s.delete(n),t!==bt&&(c.activate(),t?(a.f|=re,$t(a,t)):(a.f&8388608&&(a.f^=re),$t(a,e)),c.deactivate())};n.promise.then(u,e=>u(null,e||`unknown`))}),Cn(()=>{for(let e of s)e.reject(bt)}),new Promise(e=>{function t(n){function r(){n===i?e(a):t(i)}n.then(r,r)}t(i)})}function M(e){let t=yt(e);return Zn(t),t}function St(e){let t=yt(e);return t.equals=ze,t}function Ct(e){var t=e.effects;if(t!==null){e.effects=null;for(var n=0;n<t.length;n+=1)Fn(t[n])}}function wt(e){var t,n=V,r=e.parent;if(!Gn&&r!==null&&e.v!==D&&r.f&24576)return Oe(),e.v;Yn(r);try{e.f&=~T,Ct(e),t=lr(e)}finally{Yn(n)}return t}function Tt(e){var t=wt(e);if(!e.equals(t)&&(e.wv=or(),(!N?.is_fork||e.deps===null)&&(N===null?e.v=t:(N.capture(e,t,!0),kt?.capture(e,t,!0)),e.deps===null))){et(e,h);return}Gn||(At===null?tt(e):(Sn()||N?.is_fork)&&At.set(e,t))}function Et(e){if(e.effects!==null)for(let t of e.effects)(t.teardown||t.ac)&&(t.teardown?.(),t.ac!==null&&lt(()=>{t.ac.abort(de),t.ac=null}),t.fn!==null&&(t.teardown=d),dr(t,0),Nn(t))}function Dt(e){if(e.effects!==null)for(let t of e.effects)t.teardown&&t.fn!==null&&fr(t)}var Ot=null,N=null,kt=null,At=null,jt=null,Mt=!1,Nt=!1,Pt=null,Ft=null,It=0,Lt=1,Rt=class e{id=Lt++;#e=!1;linked=!0;#t=null;#n=null;async_deriveds=new Map;current=new Map;previous=new Map;#r=new Set;#i=new Set;#a=0;#o=new Map;#s=null;#c=[];#l=[];#u=new Set;#d=new Set;#f=new Map;#p=new Set;is_fork=!1;#m=!1;constructor(){Ot===null?Ot=this:(Ot.#n=this,this.#t=Ot),Ot=this}#h(){if(this.is_fork)return!0;for(let n of this.#o.keys()){for(var e=n,t=!1;e.parent!==null;){if(this.#f.has(e)){t=!0;break}e=e.parent}if(!t)return!0}return!1}skip_effect(e){this.#f.has(e)||this.#f.set(e,{d:[],m:[]}),this.#p.delete(e)}unskip_effect(e,t=e=>this.schedule(e)){var n=this.#f.get(e);if(n){this.#f.delete(e);for(var r of n.d)et(r,g),t(r);for(r of n.m)et(r,_),t(r)}this.#p.add(e)}#g(){this.#e=!0,It++>1e3&&(this.#x(),Bt());for(let e of this.#u)this.#d.delete(e),et(e,g),this.schedule(e);for(let e of this.#d)et(e,_),this.schedule(e);let t=this.#c;this.#c=[],this.apply();var n=Pt=[],r=[],i=Ft=[];for(let e of t)try{this.#_(e,n,r)}catch(t){throw qt(e),this.#h()||this.discard(),t}if(N=null,i.length>0){var a=e.ensure();for(let e of i)a.schedule(e)}if(Pt=null,Ft=null,this.#h()){this.#b(r),this.#b(n);for(let[e,t]of this.#f)Kt(e,t);i.length>0&&N.#g();return}let o=this.#v();if(o){this.#b(r),this.#b(n),o.#y(this);return}this.#u.clear(),this.#d.clear();for(let e of this.#r)e(this);this.#r.clear(),kt=this,Ht(r),Ht(n),kt=null,this.#s?.resolve();var s=N;if(this.#a===0&&(this.#c.length===0||s!==null)&&this.#x(),this.#c.length>0)if(s!==null){let e=s;e.#c.push(...this.#c.filter(t=>!e.#c.includes(t)))}else s=this;s!==null&&s.#g()}#_(e,t,n){e.f^=h;for(var r=e.first;r!==null;){var i=r.f,a=(i&96)!=0;if(!(a&&i&1024||i&8192||this.#f.has(r))&&r.fn!==null){a?r.f^=h:i&4?t.push(r):sr(r)&&(i&16&&this.#d.add(r),fr(r));var o=r.first;if(o!==null){r=o;continue}}for(;r!==null;){var s=r.next;if(s!==null){r=s;break}r=r.parent}}}#v(){for(var e=this.#t;e!==null;){if(!e.is_fork){for(let[t,[,n]]of this.current)if(e.current.has(t)&&!n)return e}e=e.#t}return null}#y(e){for(let[t,n]of e.current)!this.previous.has(t)&&e.previous.has(t)&&this.previous.set(t,e.previous.get(t)),this.current.set(t,n);for(let[t,n]of e.async_deriveds){let e=this.async_deriveds.get(t);e&&n.promise.then(e.resolve).catch(e.reject)}e.async_deriveds.clear(),this.transfer_effects(e.#u,e.#d);let t=e=>{var n=e.reactions;if(n!==null&&!(e.f&2&&!(e.f&6144)))for(let e of n){var r=e.f;if(r&2)t(e);else{var i=e;r&4194320&&!this.async_deriveds.has(i)&&(this.#d.delete(i),et(i,g),this.schedule(i))}}};for(let e of this.current.keys())t(e);this.oncommit(()=>e.discard()),e.#x(),N=this,this.#g()}#b(e){for(var t=0;t<e.length;t+=1)rt(e[t],this.#u,this.#d)}capture(e,t,n=!1){e.v!==D&&!this.previous.has(e)&&this.previous.set(e,e.v),e.f&8388608||(this.current.set(e,[t,n]),At?.set(e,t)),this.is_fork||(e.v=t)}activate(){N=this}deactivate(){N=null,At=null}flush(){try{Nt=!0,N=this,this.#g()}finally{It=0,jt=null,Pt=null,Ft=null,Nt=!1,N=null,At=null,Yt.clear()}}discard(){for(let e of this.#i)e(this);this.#i.clear();for(let e of this.async_deriveds.values())e.reject(bt);this.#x(),this.#s?.resolve()}register_created_effect(e){this.#l.push(e)}increment(e,t){if(this.#a+=1,e){let e=this.#o.get(t)??0;this.#o.set(t,e+1)}}decrement(e,t){if(--this.#a,e){let e=this.#o.get(t)??0;e===1?this.#o.delete(t):this.#o.set(t,e-1)}this.#m||(this.#m=!0,Ye(()=>{this.#m=!1,this.linked&&this.flush()}))}transfer_effects(e,t){for(let t of e)this.#u.add(t);for(let e of t)this.#d.add(e);e.clear(),t.clear()}oncommit(e){this.#r.add(e)}ondiscard(e){this.#i.add(e)}settled(){return(this.#s??=p()).promise}static ensure(){if(N===null){let t=N=new e;!Nt&&!Mt&&Ye(()=>{t.#e||t.flush()})}return N}apply(){At=null}schedule(e){if(jt=e,e.b?.is_pending&&e.f&16777228&&!(e.f&32768)){e.b.defer_effect(e);return}for(var t=e;t.parent!==null;){t=t.parent;var n=t.f;if(Pt!==null&&t===V&&(B===null||!(B.f&2)))return;if(n&96){if(!(n&1024))return;t.f^=h}}this.#c.push(t)}#x(){if(this.linked){var e=this.#t,t=this.#n;e===null||(e.#n=t),t===null?Ot=e:t.#t=e,this.linked=!1}}};function zt(e){var t=Mt;Mt=!0;try{var n;for(e&&(N!==null&&!N.is_fork&&N.flush(),n=e());;){if(Xe(),N===null)return n;N.flush()}}finally{Mt=t}}function Bt(){try{ve()}catch(e){Qe(e,jt)}}var Vt=null;function Ht(e){var t=e.length;if(t!==0){for(var n=0;n<t;){var r=e[n++];if(!(r.f&24576)&&sr(r)&&(Vt=new Set,fr(r),r.deps===null&&r.first===null&&r.nodes===null&&r.teardown===null&&r.ac===null&&Ln(r),Vt?.size>0)){Yt.clear();for(let e of Vt){if(e.f&24576)continue;let t=[e],n=e.parent;for(;n!==null;)Vt.has(n)&&(Vt.delete(n),t.push(n)),n=n.parent;for(let e=t.length-1;e>=0;e--){let n=t[e];n.f&24576||fr(n)}}Vt.clear()}}Vt=null}}function Ut(e,t,n,r){if(!n.has(e)&&(n.add(e),e.reactions!==null))for(let i of e.reactions){let e=i.f;e&2?Ut(i,t,n,r):e&4194320&&!(e&2048)&&Wt(i,t,r)&&(et(i,g),Gt(i))}}function Wt(e,t,r){let i=r.get(e);if(i!==void 0)return i;if(e.deps!==null)for(let i of e.deps){if(n.call(t,i))return!0;if(i.f&2&&Wt(i,t,r))return r.set(i,!0),!0}return r.set(e,!1),!1}function Gt(e){N.schedule(e)}function Kt(e,t){if(!(e.f&32&&e.f&1024)){e.f&2048?t.d.push(e):e.f&4096&&t.m.push(e),et(e,h);for(var n=e.first;n!==null;)Kt(n,t),n=n.next}}function qt(e){et(e,h);for(var t=e.first;t!==null;)qt(t),t=t.next}var Jt=new Set,Yt=new Map,Xt=!1;function Zt(e,t){return{f:0,v:e,reactions:null,equals:Le,rv:0,wv:0}}function P(e,t){let n=Zt(e,t);return Zn(n),n}function Qt(e,t=!1,n=!0){let r=Zt(e);return t||(r.equals=ze),Be&&n&&He!==null&&He.l!==null&&(He.l.s??=[]).push(r),r}function F(e,t,n=!1){return B!==null&&(!qn||B.f&131072)&&Ke()&&B.f&4325394&&(Xn===null||!Xn.has(e))&&Se(),$t(e,n?rn(t):t,Ft)}function $t(e,t,n=null){if(!e.equals(t)){Yt.set(e,Gn?t:e.v);var r=Rt.ensure();if(r.capture(e,t),e.f&2){let t=e;e.f&2048&&wt(t),At===null&&tt(t)}e.wv=or(),nn(e,g,n),Ke()&&V!==null&&V.f&1024&&!(V.f&96)&&(er===null?tr([e]):er.push(e)),!r.is_fork&&Jt.size>0&&!Xt&&en()}return t}function en(){Xt=!1;for(let e of Jt){e.f&1024&&et(e,_);let t;try{t=sr(e)}catch{t=!0}t&&fr(e)}Jt.clear()}function tn(e){F(e,e.v+1)}function nn(e,t,n){var r=e.reactions;if(r!==null)for(var i=Ke(),a=r.length,o=0;o<a;o++){var s=r[o],c=s.f;if(!(!i&&s===V)){var l=(c&g)===0;if(l&&et(s,t),c&131072)Jt.add(s);else if(c&2){var u=s;At?.delete(u),c&65536||(c&512&&(V===null||!(V.f&2097152))&&(s.f|=T),nn(u,_,n))}else if(l){var d=s;c&16&&Vt!==null&&Vt.add(d),n===null?Gt(d):n.push(d)}}}}function rn(t){if(typeof t!=`object`||!t||ie in t)return t;let n=l(t);if(n!==s&&n!==c)return t;var r=new Map,i=e(t),o=P(0),u=null,d=ir,f=e=>{if(ir===d)return e();var t=B,n=ir;Jn(null),ar(d);var r=e();return Jn(t),ar(n),r};return i&&r.set(`length`,P(t.length,u)),new Proxy(t,{defineProperty(e,t,n){(!(`value`in n)||n.configurable===!1||n.enumerable===!1||n.writable===!1)&&be();var i=r.get(t);return i===void 0?f(()=>{var e=P(n.value,u);return r.set(t,e),e}):F(i,n.value,!0),!0},deleteProperty(e,t){var n=r.get(t);if(n===void 0){if(t in e){let e=f(()=>P(D,u));r.set(t,e),tn(o)}}else F(n,D),tn(o);return!0},get(e,n,i){if(n===ie)return t;var o=r.get(n),s=n in e;if(o===void 0&&(!s||a(e,n)?.writable)&&(o=f(()=>P(rn(s?e[n]:D),u)),r.set(n,o)),o!==void 0){var c=H(o);return c===D?void 0:c}return Reflect.get(e,n,i)},getOwnPropertyDescriptor(e,t){var n=Reflect.getOwnPropertyDescriptor(e,t);if(n&&`value`in n){var i=r.get(t);i&&(n.value=H(i))}else if(n===void 0){var a=r.get(t),o=a?.v;if(a!==void 0&&o!==D)return{enumerable:!0,configurable:!0,value:o,writable:!0}}return n},has(e,t){if(t===ie)return!0;var n=r.get(t),i=n!==void 0&&n.v!==D||Reflect.has(e,t);return(n!==void 0||V!==null&&(!i||a(e,t)?.writable))&&(n===void 0&&(n=f(()=>P(i?rn(e[t]):D,u)),r.set(t,n)),H(n)===D)?!1:i},set(e,t,n,s){var c=r.get(t),l=t in e;if(i&&t===`length`)for(var d=n;d<c.v;d+=1){var p=r.get(d+``);p===void 0?d in e&&(p=f(()=>P(D,u)),r.set(d+``,p)):F(p,D)}if(c===void 0)(!l||a(e,t)?.writable)&&(c=f(()=>P(void 0,u)),F(c,rn(n)),r.set(t,c));else{l=c.v!==D;var m=f(()=>rn(n));F(c,m)}var h=Reflect.getOwnPropertyDescriptor(e,t);if(h?.set&&h.set.call(s,n),!l){if(i&&typeof t==`string`){var g=r.get(`length`),_=Number(t);Number.isInteger(_)&&_>=g.v&&F(g,_+1)}tn(o)}return!0},ownKeys(e){H(o);var t=Reflect.ownKeys(e).filter(e=>{var t=r.get(e);return t===void 0||t.v!==D});for(var[n,i]of r)i.v!==D&&!(n in e)&&t.push(n);return t},setPrototypeOf(){xe()}})}function an(e){try{if(typeof e==`object`&&e&&ie in e)return e[ie]}catch{}return e}function on(e,t){return Object.is(an(e),an(t))}var sn,cn,ln,un;function dn(){if(sn===void 0){sn=window,cn=/Firefox/.test(navigator.userAgent);var e=Element.prototype,t=Node.prototype,n=Text.prototype;ln=a(t,`firstChild`).get,un=a(t,`nextSibling`).get,u(e)&&(e[ce]=void 0,e[se]=null,e[le]=void 0,e.__e=void 0),u(n)&&(n[ue]=void 0)}}function fn(e=``){return document.createTextNode(e)}function pn(e){return ln.call(e)}function mn(e){return un.call(e)}function I(e,t){if(!O)return pn(e);var n=pn(k);if(n===null)n=k.appendChild(fn());else if(t&&n.nodeType!==3){var r=fn();return n?.before(r),Ne(r),r}return t&&vn(n),Ne(n),n}function L(e,t=!1){if(!O){var n=pn(e);return n instanceof Comment&&n.data===``?mn(n):n}if(t){if(k?.nodeType!==3){var r=fn();return k?.before(r),Ne(r),r}vn(k)}return k}function R(e,t=1,n=!1){let r=O?k:e;for(var i;t--;)i=r,r=mn(r);if(!O)return r;if(n){if(r?.nodeType!==3){var a=fn();return r===null?i?.after(a):r.before(a),Ne(a),a}vn(r)}return Ne(r),r}function hn(e){e.textContent=``}function gn(){return!1}function _n(e,t,n){return t==null||t===`http://www.w3.org/1999/xhtml`?n?document.createElement(e,{is:n}):document.createElement(e):n?document.createElementNS(t,e,{is:n}):document.createElementNS(t,e)}function vn(e){if(e.nodeValue.length<65536)return;let t=e.nextSibling;for(;t!==null&&t.nodeType===3;)t.remove(),e.nodeValue+=t.nodeValue,t=e.nextSibling}function yn(e){V===null&&(B===null&&_e(e),ge()),Gn&&he(e)}function bn(e,t){var n=t.last;n===null?t.last=t.first=e:(n.next=e,e.prev=n,t.last=e)}function xn(e,t){var n=V;n!==null&&n.f&8192&&(e|=v);var r={ctx:He,deps:null,nodes:null,f:e|g|512,first:null,fn:t,last:null,next:null,parent:n,b:n&&n.b,prev:null,teardown:null,wv:0,ac:null};N?.register_created_effect(r);var i=r;if(e&4)Pt===null?Rt.ensure().schedule(r):Pt.push(r);else if(t!==null){try{fr(r)}catch(e){throw Fn(r),e}i.deps===null&&i.teardown===null&&i.nodes===null&&i.first===i.last&&!(i.f&524288)&&(i=i.first,e&16&&e&65536&&i!==null&&(i.f|=S))}if(i!==null&&(i.parent=n,n!==null&&bn(i,n),B!==null&&B.f&2&&!(e&64))){var a=B;(a.effects??=[]).push(i)}return r}function Sn(){return B!==null&&!qn}function Cn(e){let t=xn(8,null);return et(t,h),t.teardown=e,t}function wn(e){yn(`$effect`);var t=V.f;if(!B&&t&32&&He!==null&&!He.i){var n=He;(n.e??=[]).push(e)}else return Tn(e)}function Tn(e){return xn(4|w,e)}function En(e){Rt.ensure();let t=xn(64|C,e);return(e={})=>new Promise(n=>{e.outro?Rn(t,()=>{Fn(t),n(void 0)}):(Fn(t),n(void 0))})}function Dn(e){return xn(4,e)}function On(e){return xn(ne|C,e)}function kn(e,t=0){return xn(8|t,e)}function z(e,t=[],n=[],r=[]){ht(r,t,n,t=>{xn(8,()=>{e(...t.map(H))})})}function An(e,t=0){return xn(16|t,e)}function jn(e){return xn(32|C,e)}function Mn(e){var t=e.teardown;if(t!==null){let e=Gn,n=B;Kn(!0),Jn(null);try{t.call(null)}finally{Kn(e),Jn(n)}}}function Nn(e,t=!1){var n=e.first;for(e.first=e.last=null;n!==null;){let e=n.ac;e!==null&&lt(()=>{e.abort(de)});var r=n.next;n.f&64?n.parent=null:Fn(n,t),n=r}}function Pn(e){for(var t=e.first;t!==null;){var n=t.next;t.f&32||Fn(t),t=n}}function Fn(e,t=!0){var n=!1;(t||e.f&262144)&&e.nodes!==null&&e.nodes.end!==null&&(In(e.nodes.start,e.nodes.end),n=!0),e.f|=x,Nn(e,t&&!n),dr(e,0);var r=e.nodes&&e.nodes.t;if(r!==null)for(let e of r)e.stop();Mn(e),e.f^=x,e.f|=y;var i=e.parent;i!==null&&i.first!==null&&Ln(e),e.next=e.prev=e.teardown=e.ctx=e.deps=e.fn=e.nodes=e.ac=e.b=null}function In(e,t){for(;e!==null;){var n=e===t?null:mn(e);e.remove(),e=n}}function Ln(e){var t=e.parent,n=e.prev,r=e.next;n!==null&&(n.next=r),r!==null&&(r.prev=n),t!==null&&(t.first===e&&(t.first=r),t.last===e&&(t.last=n))}function Rn(e,t,n=!0){var r=[];zn(e,r,!0);var i=()=>{n&&Fn(e),t&&t()},a=r.length;if(a>0){var o=()=>--a||i();for(var s of r)s.out(o)}else i()}function zn(e,t,n){if(!(e.f&8192)){e.f^=v;var r=e.nodes&&e.nodes.t;if(r!==null)for(let e of r)(e.is_global||n)&&t.push(e);for(var i=e.first;i!==null;){var a=i.next;if(!(i.f&64)){var o=(i.f&65536)!=0||(i.f&32)!=0&&(e.f&16)!=0;zn(i,t,o?n:!1)}i=a}}}function Bn(e){Vn(e,!0)}function Vn(e,t){if(e.f&8192){e.f^=v,e.f&1024||(et(e,g),Rt.ensure().schedule(e));for(var n=e.first;n!==null;){var r=n.next,i=(n.f&65536)!=0||(n.f&32)!=0;Vn(n,i?t:!1),n=r}var a=e.nodes&&e.nodes.t;if(a!==null)for(let e of a)(e.is_global||t)&&e.in()}}function Hn(e,t){if(e.nodes)for(var n=e.nodes.start,r=e.nodes.end;n!==null;){var i=n===r?null:mn(n);t.append(n),n=i}}var Un=null,Wn=!1,Gn=!1;function Kn(e){Gn=e}var B=null,qn=!1;function Jn(e){B=e}var V=null;function Yn(e){V=e}var Xn=null;function Zn(e){B!==null&&(Xn??=new Set).add(e)}var Qn=null,$n=0,er=null;function tr(e){er=e}var nr=1,rr=0,ir=rr;function ar(e){ir=e}function or(){return++nr}function sr(e){var t=e.f;if(t&2048)return!0;if(t&2&&(e.f&=~T),t&4096){for(var n=e.deps,r=n.length,i=0;i<r;i++){var a=n[i];if(sr(a)&&Tt(a),a.wv>e.wv)return!0}t&512&&At===null&&et(e,h)}return!1}function cr(e,t,n=!0){var r=e.reactions;if(r!==null&&!(Xn!==null&&Xn.has(e)))for(var i=0;i<r.length;i++){var a=r[i];a.f&2?cr(a,t,!1):t===a&&(n?et(a,g):a.f&1024&&et(a,_),Gt(a))}}function lr(e){var t=Qn,n=$n,r=er,i=B,a=Xn,o=He,s=qn,c=ir,l=e.f;Qn=null,$n=0,er=null,B=l&96?null:e,Xn=null,Ue(e.ctx),qn=!1,ir=++rr,e.ac!==null&&(lt(()=>{e.ac.abort(de)}),e.ac=null);try{e.f|=te;var u=e.fn,d=u();e.f|=b;var f=e.deps,p=N?.is_fork;if(Qn!==null){var m;if(p||dr(e,$n),f!==null&&$n>0)for(f.length=$n+Qn.length,m=0;m<Qn.length;m++)f[$n+m]=Qn[m];else e.deps=f=Qn;if(Sn()&&e.f&512)for(m=$n;m<f.length;m++)(f[m].reactions??=[]).push(e)}else!p&&f!==null&&$n<f.length&&(dr(e,$n),f.length=$n);if(Ke()&&er!==null&&!qn&&f!==null&&!(e.f&6146))for(m=0;m<er.length;m++)cr(er[m],e);if(i!==null&&i!==e){if(rr++,i.deps!==null)for(let e=0;e<n;e+=1)i.deps[e].rv=rr;if(t!==null)for(let e of t)e.rv=rr;er!==null&&(r===null?r=er:r.push(...er))}return e.f&8388608&&(e.f^=re),d}catch(e){return Ze(e)}finally{e.f^=te,Qn=t,$n=n,er=r,B=i,Xn=a,Ue(o),qn=s,ir=c}}function ur(e,r){let i=r.reactions;if(i!==null){var a=t.call(i,e);if(a!==-1){var o=i.length-1;o===0?i=r.reactions=null:(i[a]=i[o],i.pop())}}if(i===null&&r.f&2&&(Qn===null||!n.call(Qn,r))){var s=r;s.f&512&&(s.f^=512,s.f&=~T),s.v!==D&&tt(s),s.ac!==null&&lt(()=>{s.ac.abort(de),s.ac=null,et(s,g)}),Et(s),dr(s,0)}}function dr(e,t){var n=e.deps;if(n!==null)for(var r=t;r<n.length;r++)ur(e,n[r])}function fr(e){var t=e.f;if(!(t&16384)){et(e,h);var n=V,r=Wn;V=e,Wn=(t&96)==0;try{t&16777232?Pn(e):Nn(e),Mn(e);var i=lr(e);e.teardown=typeof i==`function`?i:null,e.wv=nr}finally{Wn=r,V=n}}}async function pr(){await Promise.resolve(),zt()}function H(e){var t=(e.f&2)!=0;if(Un?.add(e),B!==null&&!qn&&!(V!==null&&V.f&16384)&&(Xn===null||!Xn.has(e))){var r=B.deps;if(B.f&2097152)e.rv<rr&&(e.rv=rr,Qn===null&&r!==null&&r[$n]===e?$n++:Qn===null?Qn=[e]:Qn.push(e));else{B.deps??=[],n.call(B.deps,e)||B.deps.push(e);var i=e.reactions;i===null?e.reactions=[B]:n.call(i,B)||i.push(B)}}if(Gn&&Yt.has(e))return Yt.get(e);if(t){var a=e;if(Gn){var o=a.v;return(!(a.f&1024)&&a.reactions!==null||hr(a))&&(o=wt(a)),Yt.set(a,o),o}var s=(a.f&512)==0&&!qn&&B!==null&&(Wn||(B.f&512)!=0),c=(a.f&b)===0;sr(a)&&(s&&(a.f|=512),Tt(a)),s&&!c&&(Dt(a),mr(a))}if(At?.has(e))return At.get(e);if(e.f&8388608)throw e.v;return e.v}function mr(e){if(e.f|=512,e.deps!==null)for(let t of e.deps)(t.reactions??=[]).push(e),t.f&2&&!(t.f&512)&&(Dt(t),mr(t))}function hr(e){if(e.v===D)return!0;if(e.deps===null)return!1;for(let t of e.deps)if(Yt.has(t)||t.f&2&&hr(t))return!0;return!1}function gr(e){var t=qn;try{return qn=!0,e()}finally{qn=t}}[...`allowfullscreen.async.autofocus.autoplay.checked.controls.default.disabled.formnovalidate.indeterminate.inert.ismap.loop.multiple.muted.nomodule.novalidate.open.playsinline.readonly.required.reversed.seamless.selected.webkitdirectory.defer.disablepictureinpicture.disableremoteplayback`.split(`.`)];var _r=[`touchstart`,`touchmove`];function vr(e){return _r.includes(e)}var yr=Symbol(`events`),br=new Set,xr=new Set;function Sr(e,t,n,r={}){function i(e){if(r.capture||Er.call(t,e),!e.cancelBubble)return lt(()=>n?.call(this,e))}return e.startsWith(`pointer`)||e.startsWith(`touch`)||e===`wheel`?Ye(()=>{t.addEventListener(e,i,r)}):t.addEventListener(e,i,r),i}function Cr(e,t,n,r,i){var a={capture:r,passive:i},o=Sr(e,t,n,a);(t===document.body||t===window||t===document||t instanceof HTMLMediaElement)&&Cn(()=>{t.removeEventListener(e,o,a)})}function U(e,t,n){(t[yr]??={})[e]=n}function wr(e){for(var t=0;t<e.length;t++)br.add(e[t]);for(var n of xr)n(e)}var Tr=null;function Er(e){var t=this,n=t.ownerDocument,r=e.type,a=e.composedPath?.()||[],o=a[0]||e.target;Tr=e;var s=0,c=Tr===e&&e[yr];if(c){var l=a.indexOf(c);if(l!==-1&&(t===document||t===window)){e[yr]=t;return}var u=a.indexOf(t);if(u===-1)return;l<=u&&(s=l)}if(o=a[s]||e.target,o!==t){i(e,`currentTarget`,{configurable:!0,get(){return o||n}});var d=B,f=V;Jn(null),Yn(null);try{for(var p,m=[];o!==null&&o!==t;){try{var h=o[yr]?.[r];h!=null&&(!o.disabled||e.target===o)&&h.call(o,e)}catch(e){p?m.push(e):p=e}if(e.cancelBubble)break;s++,o=s<a.length?a[s]:null}if(p){for(let e of m)queueMicrotask(()=>{throw e});throw p}}finally{e[yr]=t,delete e.currentTarget,Jn(d),Yn(f)}}}var Dr=globalThis?.window?.trustedTypes&&globalThis.window.trustedTypes.createPolicy(`svelte-trusted-html`,{createHTML:e=>e});function Or(e){return Dr?.createHTML(e)??e}function kr(e){var t=_n(`template`);return t.innerHTML=Or(e.replaceAll(`<!>`,`<!---->`)),t.content}function Ar(e,t){var n=V;n.nodes===null&&(n.nodes={start:e,end:t,a:null,t:null})}function W(e,t){var n=(t&1)!=0,r=(t&2)!=0,i,a=!e.startsWith(`<!>`);return()=>{if(O)return Ar(k,null),k;i===void 0&&(i=kr(a?e:`<!>`+e),n||(i=pn(i)));var t=r||cn?document.importNode(i,!0):i.cloneNode(!0);if(n){var o=pn(t),s=t.lastChild;Ar(o,s)}else Ar(t,t);return t}}function jr(e,t,n=`svg`){var r=!e.startsWith(`<!>`),i=(t&1)!=0,a=`<${n}>${r?e:`<!>`+e}</${n}>`,o;return()=>{if(O)return Ar(k,null),k;if(!o){var e=pn(kr(a));if(i)for(o=document.createDocumentFragment();pn(e);)o.appendChild(pn(e));else o=pn(e)}var t=o.cloneNode(!0);if(i){var n=pn(t),r=t.lastChild;Ar(n,r)}else Ar(t,t);return t}}function G(e,t){return jr(e,t,`svg`)}function Mr(e=``){if(!O){var t=fn(e+``);return Ar(t,t),t}var n=k;return n.nodeType===3?vn(n):(n.before(n=fn()),Ne(n)),Ar(n,n),n}function Nr(){if(O)return Ar(k,null),k;var e=document.createDocumentFragment(),t=document.createComment(``),n=fn();return e.append(t,n),Ar(t,n),e}function K(e,t){if(O){var n=V;(!(n.f&32768)||n.nodes.end===null)&&(n.nodes.end=k),Pe();return}e!==null&&e.before(t)}function q(e,t){var n=t==null?``:typeof t==`object`?`${t}`:t;n!==(e[ue]??=e.nodeValue)&&(e[ue]=n,e.nodeValue=`${n}`)}function Pr(e,t){return Ir(e,t)}var Fr=new Map;function Ir(e,{target:t,anchor:n,props:i={},events:a,context:o,intro:s=!0,transformError:c}){dn();var l=void 0,u=En(()=>{var s=n??t.appendChild(fn());pt(s,{pending:()=>{}},t=>{We({});var n=He;if(o&&(n.c=o),a&&(i.$$events=a),O&&Ar(t,null),l=e(t,i)||{},O&&(V.nodes.end=k,k===null||k.nodeType!==8||k.data!==`]`))throw ke(),we;Ge()},c);var u=new Set,d=e=>{for(var n=0;n<e.length;n++){var r=e[n];if(!u.has(r)){u.add(r);var i=vr(r);for(let e of[t,document]){var a=Fr.get(e);a===void 0&&(a=new Map,Fr.set(e,a));var o=a.get(r);o===void 0?(e.addEventListener(r,Er,{passive:i}),a.set(r,1)):a.set(r,o+1)}}}};return d(r(br)),xr.add(d),()=>{for(var e of u)for(let n of[t,document]){var r=Fr.get(n),i=r.get(e);--i==0?(n.removeEventListener(e,Er),r.delete(e),r.size===0&&Fr.delete(n)):r.set(e,i)}xr.delete(d),s!==n&&s.parentNode?.removeChild(s)}});return Lr.set(l,u),l}var Lr=new WeakMap,Rr=class{anchor;#e=new Map;#t=new Map;#n=new Map;#r=new Set;#i=!0;constructor(e,t=!0){this.anchor=e,this.#i=t}#a=e=>{if(this.#e.has(e)){var t=this.#e.get(e),n=this.#t.get(t);if(n)Bn(n),this.#r.delete(t);else{var r=this.#n.get(t);r&&(Bn(r.effect),this.#t.set(t,r.effect),this.#n.delete(t),r.fragment.lastChild.remove(),this.anchor.before(r.fragment),n=r.effect)}for(let[t,n]of this.#e){if(this.#e.delete(t),t===e)break;let r=this.#n.get(n);r&&(Fn(r.effect),this.#n.delete(n))}for(let[e,r]of this.#t){if(e===t||this.#r.has(e))continue;let i=()=>{if(Array.from(this.#e.values()).includes(e)){var t=document.createDocumentFragment();Hn(r,t),t.append(fn()),this.#n.set(e,{effect:r,fragment:t})}else Fn(r);this.#r.delete(e),this.#t.delete(e)};this.#i||!n?(this.#r.add(e),Rn(r,i,!1)):i()}}};#o=e=>{this.#e.delete(e);let t=Array.from(this.#e.values());for(let[e,n]of this.#n)t.includes(e)||(Fn(n.effect),this.#n.delete(e))};ensure(e,t){var n=N,r=gn();if(t&&!this.#t.has(e)&&!this.#n.has(e))if(r){var i=document.createDocumentFragment(),a=fn();i.append(a),this.#n.set(e,{effect:jn(()=>t(a)),fragment:i})}else this.#t.set(e,jn(()=>t(this.anchor)));if(this.#e.set(n,e),r){for(let[t,r]of this.#t)t===e?n.unskip_effect(r):n.skip_effect(r);for(let[t,r]of this.#n)t===e?n.unskip_effect(r.effect):n.skip_effect(r.effect);n.oncommit(this.#a),n.ondiscard(this.#o)}else O&&(this.anchor=k),this.#a(n)}};function J(e,t,n=!1){var r;O&&(r=k,Pe());var i=new Rr(e),a=n?S:0;function o(e,t){if(O){var n=Ie(r);if(e!==parseInt(n.substring(1))){var a=Fe();Ne(a),i.anchor=a,Me(!1),i.ensure(e,t),Me(!0);return}}i.ensure(e,t)}An(()=>{var e=!1;t((t,n=0)=>{e=!0,o(n,t)}),e||o(-1,null)},a)}var zr=Symbol(`NaN`);function Br(e,t,n){O&&Pe();var r=new Rr(e),i=!Ke();An(()=>{var e=t();e!==e&&(e=zr),i&&typeof e==`object`&&e&&(e={}),r.ensure(e,n)})}function Vr(e,t){return t}function Hr(e,t,n){for(var i=[],a=t.length,o,s=t.length,c=0;c<a;c++){let n=t[c];Rn(n,()=>{if(o){if(o.pending.delete(n),o.done.add(n),o.pending.size===0){var t=e.outrogroups;Ur(e,r(o.done)),t.delete(o),t.size===0&&(e.outrogroups=null)}}else--s},!1)}if(s===0){var l=i.length===0&&n!==null;if(l){var u=n,d=u.parentNode;hn(d),d.append(u),e.items.clear()}Ur(e,t,!l)}else o={pending:new Set(t),done:new Set},(e.outrogroups??=new Set).add(o)}function Ur(e,t,n=!0){var r;if(e.pending.size>0){r=new Set;for(let t of e.pending.values())for(let n of t)r.add(e.items.get(n).e)}for(var i=0;i<t.length;i++){var a=t[i];r?.has(a)?(a.f|=ee,Hn(a,document.createDocumentFragment())):Fn(t[i],n)}}var Wr;function Y(t,n,i,a,o,s=null){var c=t,l=new Map;if(n&4){var u=t;c=O?Ne(pn(u)):u.appendChild(fn())}O&&Pe();var d=null,f=St(()=>{var t=i();return e(t)?t:t==null?[]:r(t)}),p,m=new Map,h=!0;function g(e){v.effect.f&16384||(v.pending.delete(e),v.fallback=d,Kr(v,p,c,n,a),d!==null&&(p.length===0?d.f&33554432?(d.f^=ee,Jr(d,null,c)):Bn(d):Rn(d,()=>{d=null})))}function _(e){v.pending.delete(e)}var v={effect:An(()=>{p=H(f);var e=p.length;let t=!1;O&&Ie(c)===`[!`!=(e===0)&&(c=Fe(),Ne(c),Me(!1),t=!0);for(var r=new Set,u=N,v=gn(),y=0;y<e;y+=1){O&&k.nodeType===8&&k.data===`]`&&(c=k,t=!0,Me(!1));var b=p[y],x=a(b,y),S=h?null:l.get(x);S?(S.v&&$t(S.v,b),S.i&&$t(S.i,y),v&&u.unskip_effect(S.e)):(S=qr(l,h?c:Wr??=fn(),b,x,y,o,n,i),h||(S.e.f|=ee),l.set(x,S)),r.add(x)}if(e===0&&s&&!d&&(h?d=jn(()=>s(c)):(d=jn(()=>s(Wr??=fn())),d.f|=ee)),e>r.size&&me(``,``,``),O&&e>0&&Ne(Fe()),!h)if(m.set(u,r),v){for(let[e,t]of l)r.has(e)||u.skip_effect(t.e);u.oncommit(g),u.ondiscard(_)}else g(u);t&&Me(!0),H(f)}),flags:n,items:l,pending:m,outrogroups:null,fallback:d};h=!1,O&&(c=k)}function Gr(e){for(;e!==null&&!(e.f&32);)e=e.next;return e}function Kr(e,t,n,i,a){var o=(i&8)!=0,s=t.length,c=e.items,l=Gr(e.effect.first),u,d=null,f,p=[],m=[],h,g,_,v;if(o)for(v=0;v<s;v+=1)h=t[v],g=a(h,v),_=c.get(g).e,_.f&33554432||(_.nodes?.a?.measure(),(f??=new Set).add(_));for(v=0;v<s;v+=1){if(h=t[v],g=a(h,v),_=c.get(g).e,e.outrogroups!==null)for(let t of e.outrogroups)t.pending.delete(_),t.done.delete(_);if(_.f&8192&&(Bn(_),o&&(_.nodes?.a?.unfix(),(f??=new Set).delete(_))),_.f&33554432)if(_.f^=ee,_===l)Jr(_,null,n);else{var y=d?d.next:l;_===e.effect.last&&(e.effect.last=_.prev),_.prev&&(_.prev.next=_.next),_.next&&(_.next.prev=_.prev),Yr(e,d,_),Yr(e,_,y),Jr(_,y,n),d=_,p=[],m=[],l=Gr(d.next);continue}if(_!==l){if(u!==void 0&&u.has(_)){if(p.length<m.length){var b=m[0],x;d=b.prev;var S=p[0],C=p[p.length-1];for(x=0;x<p.length;x+=1)Jr(p[x],b,n);for(x=0;x<m.length;x+=1)u.delete(m[x]);Yr(e,S.prev,C.next),Yr(e,d,S),Yr(e,C,b),l=b,d=C,--v,p=[],m=[]}else u.delete(_),Jr(_,l,n),Yr(e,_.prev,_.next),Yr(e,_,d===null?e.effect.first:d.next),Yr(e,d,_),d=_;continue}for(p=[],m=[];l!==null&&l!==_;)(u??=new Set).add(l),m.push(l),l=Gr(l.next);if(l===null)continue}_.f&33554432||p.push(_),d=_,l=Gr(_.next)}if(e.outrogroups!==null){for(let t of e.outrogroups)t.pending.size===0&&(Ur(e,r(t.done)),e.outrogroups?.delete(t));e.outrogroups.size===0&&(e.outrogroups=null)}if(l!==null||u!==void 0){var w=[];if(u!==void 0)for(_ of u)_.f&8192||w.push(_);for(;l!==null;)!(l.f&8192)&&l!==e.fallback&&w.push(l),l=Gr(l.next);var T=w.length;if(T>0){var te=i&4&&s===0?n:null;if(o){for(v=0;v<T;v+=1)w[v].nodes?.a?.measure();for(v=0;v<T;v+=1)w[v].nodes?.a?.fix()}Hr(e,w,te)}}o&&Ye(()=>{if(f!==void 0)for(_ of f)_.nodes?.a?.apply()})}function qr(e,t,n,r,i,a,o,s){var c=o&1?o&16?Zt(n):Qt(n,!1,!1):null,l=o&2?Zt(i):null;return{v:c,i:l,e:jn(()=>(a(t,c??n,l??i,s),()=>{e.delete(r)}))}}function Jr(e,t,n){if(e.nodes)for(var r=e.nodes.start,i=e.nodes.end,a=t&&!(t.f&33554432)?t.nodes.start:n;r!==null;){var o=mn(r);if(a.before(r),r===i)return;r=o}}function Yr(e,t,n){t===null?e.effect.first=n:t.next=n,n===null?e.effect.last=t:n.prev=t}function Xr(e,t,n=!1,r=!1,i=!1,a=!1){var o=e,s=``;if(n){var c=e;O&&(o=Ne(pn(c)))}z(()=>{var e=V;if(s===(s=t()??``)){O&&Pe();return}if(n&&!O){e.nodes=null,c.innerHTML=s,s!==``&&Ar(pn(c),c.lastChild);return}if(e.nodes!==null&&(In(e.nodes.start,e.nodes.end),e.nodes=null),s!==``){if(O){for(var a=k.data,l=Pe(),u=l;l!==null&&(l.nodeType!==8||l.data!==``);)u=l,l=mn(l);if(l===null)throw ke(),we;Ar(k,u),o=Ne(l);return}var d=_n(r?`svg`:i?`math`:`template`,r?Ee:i?De:void 0);d.innerHTML=s;var f=r||i?d:d.content;if(Ar(pn(f),f.lastChild),r||i)for(;pn(f);)o.before(pn(f));else o.before(f)}})}function Zr(e,t,...n){var r=new Rr(e);An(()=>{let e=t()??null;r.ensure(e,e&&(t=>e(t,...n)))},S)}function Qr(e){var t,n,r=``;if(typeof e==`string`||typeof e==`number`)r+=e;else if(typeof e==`object`)if(Array.isArray(e)){var i=e.length;for(t=0;t<i;t++)e[t]&&(n=Qr(e[t]))&&(r&&(r+=` `),r+=n)}else for(n in e)e[n]&&(r&&(r+=` `),r+=n);return r}function $r(){for(var e,t,n=0,r=``,i=arguments.length;n<i;n++)(e=arguments[n])&&(t=Qr(e))&&(r&&(r+=` `),r+=t);return r}function ei(e){return typeof e==`object`?$r(e):e??``}var ti=[...` 	
-\r\f\xA0\v﻿`];function ni(e,t,n){var r=e==null?``:``+e;if(t&&(r=r?r+` `+t:t),n){for(var i of Object.keys(n))if(n[i])r=r?r+` `+i:i;else if(r.length)for(var a=i.length,o=0;(o=r.indexOf(i,o))>=0;){var s=o+a;(o===0||ti.includes(r[o-1]))&&(s===r.length||ti.includes(r[s]))?r=(o===0?``:r.substring(0,o))+r.substring(s+1):o=s}}return r===``?null:r}function ri(e,t=!1){var n=t?` !important;`:`;`,r=``;for(var i of Object.keys(e)){var a=e[i];a!=null&&a!==``&&(r+=` `+i+`: `+a+n)}return r}function ii(e){return e[0]!==`-`||e[1]!==`-`?e.toLowerCase():e}function ai(e,t){if(t){var n=``,r,i;if(Array.isArray(t)?(r=t[0],i=t[1]):r=t,e){e=String(e).replaceAll(/\s*\/\*.*?\*\/\s*/g,``).trim();var a=!1,o=0,s=!1,c=[];r&&c.push(...Object.keys(r).map(ii)),i&&c.push(...Object.keys(i).map(ii));var l=0,u=-1;let t=e.length;for(var d=0;d<t;d++){var f=e[d];if(s?f===`/`&&e[d-1]===`*`&&(s=!1):a?a===f&&(a=!1):f===`/`&&e[d+1]===`*`?s=!0:f===`"`||f===`'`?a=f:f===`(`?o++:f===`)`&&o--,!s&&a===!1&&o===0){if(f===`:`&&u===-1)u=d;else if(f===`;`||d===t-1){if(u!==-1){var p=ii(e.substring(l,u).trim());if(!c.includes(p)){f!==`;`&&d++;var m=e.substring(l,d).trim();n+=` `+m+`;`}}l=d+1,u=-1}}}}return r&&(n+=ri(r)),i&&(n+=ri(i,!0)),n=n.trim(),n===``?null:n}return e==null?null:String(e)}function X(e,t,n,r,i,a){var o=e[ce];if(O||o!==n||o===void 0){var s=ni(n,r,a);(!O||s!==e.getAttribute(`class`))&&(s==null?e.removeAttribute(`class`):t?e.className=s:e.setAttribute(`class`,s)),e[ce]=n}else if(a&&i!==a)for(var c in a){var l=!!a[c];(i==null||l!==!!i[c])&&e.classList.toggle(c,l)}return a}function oi(e,t={},n,r){for(var i in n){var a=n[i];t[i]!==a&&(n[i]==null?e.style.removeProperty(i):e.style.setProperty(i,a,r))}}function si(e,t,n,r){var i=e[le];if(O||i!==t){var a=ai(t,r);(!O||a!==e.getAttribute(`style`))&&(a==null?e.removeAttribute(`style`):e.style.cssText=a),e[le]=t}else r&&(Array.isArray(r)?(oi(e,n?.[0],r[0]),oi(e,n?.[1],r[1],`important`)):oi(e,n,r));return r}function ci(t,n,r=!1){if(t.multiple){if(n==null)return;if(!e(n))return Ae();for(var i of t.options)i.selected=n.includes(di(i));return}for(i of t.options)if(on(di(i),n)){i.selected=!0;return}(!r||n!==void 0)&&(t.selectedIndex=-1)}function li(e){var t=new MutationObserver(()=>{`__value`in e&&ci(e,e.__value)});t.observe(e,{childList:!0,subtree:!0,attributes:!0,attributeFilter:[`value`]}),Cn(()=>{t.disconnect()})}function ui(e,t,n=t){var r=new WeakSet,i=!0;ut(e,`change`,t=>{var i=t?`[selected]`:`:checked`,a;if(e.multiple)a=[].map.call(e.querySelectorAll(i),di);else{var o=e.querySelector(i)??e.querySelector(`option:not([disabled])`);a=o&&di(o)}n(a),e.__value=a,N!==null&&r.add(N)}),Dn(()=>{var a=t();if(e===document.activeElement){var o=N;if(r.has(o))return}if(ci(e,a,i),i&&a===void 0){var s=e.querySelector(`:checked`);s!==null&&(a=di(s),n(a))}e.__value=a,i=!1}),li(e)}function di(e){return`__value`in e?e.__value:e.value}var fi=Symbol(`is custom element`),pi=Symbol(`is html`),mi=fe?`link`:`LINK`,hi=fe?`progress`:`PROGRESS`;function Z(e){if(O){var t=!1,n=()=>{if(!t){if(t=!0,e.hasAttribute(`value`)){var n=e.value;Q(e,`value`,null),e.value=n}if(e.hasAttribute(`checked`)){var r=e.checked;Q(e,`checked`,null),e.checked=r}}};e[E]=n,Ye(n),ct()}}function gi(e,t){var n=_i(e);n.value===(n.value=t??void 0)||e.value===t&&(t!==0||e.nodeName!==hi)||(e.value=t??``)}function Q(e,t,n,r){var i=_i(e);O&&(i[t]=e.getAttribute(t),t===`src`||t===`srcset`||t===`href`&&e.nodeName===mi)||i[t]!==(i[t]=n)&&(t===`loading`&&(e[oe]=n),n==null?e.removeAttribute(t):typeof n!=`string`&&yi(e).includes(t)?e[t]=n:e.setAttribute(t,n))}function _i(e){return e[se]??={[fi]:e.nodeName.includes(`-`),[pi]:e.namespaceURI===Te}}var vi=new Map;function yi(e){var t=e.getAttribute(`is`)||e.nodeName,n=vi.get(t);if(n)return n;vi.set(t,n=[]);for(var r,i=e,a=Element.prototype;a!==i;){for(var s in r=o(i),r)r[s].set&&s!==`innerHTML`&&s!==`textContent`&&s!==`innerText`&&n.push(s);i=l(i)}return n}function bi(e,t,n=t){var r=new WeakSet;ut(e,`input`,async i=>{var a=i?e.defaultValue:e.value;if(a=Si(e)?Ci(a):a,n(a),N!==null&&r.add(N),await pr(),a!==(a=t())){var o=e.selectionStart,s=e.selectionEnd,c=e.value.length;if(e.value=a??``,s!==null){var l=e.value.length;o===s&&s===c&&l>c?(e.selectionStart=l,e.selectionEnd=l):(e.selectionStart=o,e.selectionEnd=Math.min(s,l))}}}),(O&&e.defaultValue!==e.value||gr(t)==null&&e.value)&&(n(Si(e)?Ci(e.value):e.value),N!==null&&r.add(N)),kn(()=>{var n=t();if(e===document.activeElement){var i=N;if(r.has(i))return}Si(e)&&n===Ci(e.value)||e.type===`date`&&!n&&!e.value||n!==e.value&&(e.value=n??``)})}function xi(e,t,n=t){ut(e,`change`,t=>{n(t?e.defaultChecked:e.checked)}),(O&&e.defaultChecked!==e.checked||gr(t)==null)&&n(e.checked),kn(()=>{e.checked=!!t()})}function Si(e){var t=e.type;return t===`number`||t===`range`}function Ci(e){return e===``?null:+e}var wi=new class e{#e=new WeakMap;#t;#n;static entries=new WeakMap;constructor(e){this.#n=e}observe(e,t){var n=this.#e.get(e)||new Set;return n.add(t),this.#e.set(e,n),this.#r().observe(e,this.#n),()=>{var n=this.#e.get(e);n.delete(t),n.size===0&&(this.#e.delete(e),this.#t.unobserve(e))}}#r(){return this.#t??=new ResizeObserver(t=>{for(var n of t){e.entries.set(n.target,n);for(var r of this.#e.get(n.target)||[])r(n)}})}}({box:`border-box`});function Ti(e,t,n){var r=wi.observe(e,()=>n(e[t]));Dn(()=>(gr(()=>n(e[t])),r))}function Ei(e,t){return e===t||e?.[ie]===t}function Di(e={},t,n,r){var i=He.r,a=V;return Dn(()=>{var o,s;return kn(()=>{o=s,s=r?.()||[],gr(()=>{Ei(n(...s),e)||(t(e,...s),o&&Ei(n(...o),e)&&t(null,...o))})}),()=>{let r=a;for(;r!==i&&r.parent!==null&&r.parent.f&33554432;)r=r.parent;let o=()=>{s&&Ei(n(...s),e)&&t(null,...s)},c=r.teardown;r.teardown=()=>{o(),c?.()}}}),e}function Oi(e,t,n,r){var i=!Be||(n&2)!=0,o=(n&8)!=0,s=(n&16)!=0,c=r,l=!0,u=void 0,d=()=>s&&i?(u??=yt(r),H(u)):(l&&(l=!1,c=s?gr(r):r),c);let f;if(o){var p=ie in e||ae in e;f=a(e,t)?.set??(p&&t in e?n=>e[t]=n:void 0)}var m,h=!1;o?[m,h]=at(()=>e[t]):m=e[t],m===void 0&&r!==void 0&&(m=d(),f&&(i&&ye(t),f(m)));var g=i?()=>{var n=e[t];return n===void 0?d():(l=!0,n)}:()=>{var n=e[t];return n!==void 0&&(c=void 0),n===void 0?c:n};if(i&&!(n&4))return g;if(f){var _=e.$$legacy;return(function(e,t){return arguments.length>0?((!i||!t||_||h)&&f(t?g():e),e):g()})}var v=!1,y=(n&1?yt:St)(()=>(v=!1,g()));o&&H(y);var b=V;return(function(e,t){if(arguments.length>0){let n=t?H(y):i&&o?rn(e):e;return F(y,n),v=!0,c!==void 0&&(c=n),e}return Gn&&v||b.f&16384?y.v:H(y)})}typeof window<`u`&&((window.__svelte??={}).v??=new Set).add(`5`);var ki=(e,t=d,n=d,r=d,i=d)=>{var a=Ai();let o;var s=I(a);let c;var l=R(s,2),u=I(l,!0);A(l),A(a),z(()=>{o=X(a,1,`st svelte-75r00e`,null,o,{ok:t(),out:n()}),c=X(s,1,`dot svelte-75r00e`,null,c,{filled:t()&&!n(),none:n()}),q(u,n()?`—`:t()?r():i())}),K(e,a)},Ai=W(`<span><span></span> <span class="long svelte-75r00e"> </span></span>`),ji=W(`<b class="won svelte-75r00e"> </b> `,1),Mi=W(`<span class="meta next svelte-75r00e"><!></span>`),Ni=W(` <span class="soon svelte-75r00e"> </span>`,1),Pi=W(`<span class="meta next svelte-75r00e"><!></span> <span class="meta gauge svelte-75r00e"><span class="lbl svelte-75r00e">saved</span> <span class="bar svelte-75r00e"><i class="svelte-75r00e"></i></span> <span class="cnt svelte-75r00e"> </span></span> <span class="meta gauge svelte-75r00e"><span class="lbl svelte-75r00e">ready</span> <span class="bar ready svelte-75r00e"><i class="svelte-75r00e"></i></span> <span class="cnt svelte-75r00e"> </span></span>`,1),Fi=W(`<div class="opened svelte-75r00e"><!></div>`),Ii=W(`<li><button type="button"><span class="head svelte-75r00e"><span class="nm svelte-75r00e"> </span> <span class="rnd svelte-75r00e"><!></span></span> <!></button> <!></li>`),Li=W(`<p class="msg quiet svelte-75r00e"> </p>`),Ri=W(`<button type="button" class="ship svelte-75r00e"><span> </span> <span class="ty svelte-75r00e"> </span> <span class="pl svelte-75r00e"> </span> <span class="sc svelte-75r00e"> </span> <!> <!></button>`),zi=W(`<li class="shiprow svelte-75r00e"><span> </span> <span class="ty svelte-75r00e"> </span> <span class="sc svelte-75r00e"> </span></li>`),Bi=W(`<div class="commander svelte-75r00e"><button type="button" class="ship fleet svelte-75r00e"><span class="nm svelte-75r00e"> </span> <span class="pl svelte-75r00e"> </span> <span class="sc svelte-75r00e"> </span> <!> <!></button> <ul class="ships svelte-75r00e"></ul></div>`),Vi=W(`<div class="faction svelte-75r00e"><div class="fhead svelte-75r00e"><span class="rank svelte-75r00e"> </span> <span class="fname svelte-75r00e"> </span> <span class="fscore svelte-75r00e"> </span> <span class="st head svelte-75r00e" title="orders saved"><span class="long svelte-75r00e">saved</span><span class="short svelte-75r00e">S</span></span> <span class="st head svelte-75r00e" title="said ready"><span class="long svelte-75r00e">ready</span><span class="short svelte-75r00e">R</span></span></div> <!></div>`),Hi=W(`<button type="button" class="replay svelte-75r00e">▶ Replay tick by tick</button> <!>`,1),Ui=W(`<p class="msg svelte-75r00e">Loading games…</p>`),Wi=W(`<p class="msg err svelte-75r00e"> </p>`),Gi=W(`<h2 class="svelte-75r00e">My solo game</h2> <ul class="svelte-75r00e"><li class="solo svelte-75r00e"><button type="button" class="pick svelte-75r00e"><span class="head svelte-75r00e"><span class="nm svelte-75r00e"> </span> <span class="rnd svelte-75r00e"> </span></span> <span class="meta next svelte-75r00e">no deadline · say you are ready and the round runs</span></button> <button type="button" class="corner svelte-75r00e">Replay ›</button></li></ul>`,1),Ki=W(`, or <button type="button" class="link svelte-75r00e">start a solo game</button> of your own`,1),qi=W(`<p class="msg quiet svelte-75r00e">No games yet. The director will add you to one<!>.</p>`),Ji=W(`<p class="msg quiet svelte-75r00e">Nothing being played right now.</p>`),Yi=W(`<h2 class="later svelte-75r00e">Finished</h2> <ul class="svelte-75r00e"></ul>`,1),Xi=W(`<p class="msg quiet svelte-75r00e">Pick a game first.</p>`),Zi=W(`<section class="detail svelte-75r00e"><h2 class="svelte-75r00e"><!></h2> <!></section>`),Qi=W(`<div class="cols svelte-75r00e"><section class="games svelte-75r00e"><!> <h2>Active</h2> <!> <ul class="svelte-75r00e"></ul> <!></section> <!></div>`),$i=W(`<div class="screen svelte-75r00e"><!></div>`);function ea(e,t){We(t,!0);let n=(e,t=d)=>{var n=Ii(),i=I(n);let a;var o=I(i),s=I(o),c=I(s,!0);A(s);var l=R(s,2),f=I(l),p=e=>{var n=Mr();z(()=>q(n,`${t().current_round-1} rounds`)),K(e,n)},m=e=>{var n=Mr();z(()=>q(n,`Round ${t().standing.round_nr??``}`)),K(e,n)};J(f,e=>{t().state===`finished`?e(p):e(m,-1)}),A(l),A(o);var h=R(o,2),y=e=>{var n=Mi(),r=I(n),i=e=>{var n=ji(),r=L(n),i=I(r,!0);A(r);var a=R(r);z(()=>{q(i,t().outcome.faction),q(a,` · ${t().outcome.reason??``}`)}),K(e,n)},a=e=>{K(e,Mr(`over · nothing left to plan`))};J(r,e=>{t().outcome?e(i):e(a,-1)}),A(n),K(e,n)},x=e=>{var n=Pi(),r=L(n),i=I(r),a=e=>{var n=Ni(),r=L(n),i=R(r),a=I(i,!0);A(i),z((e,t)=>{q(r,`next ${e??``} · `),q(a,t)},[()=>_(t().next_processing),()=>v(t().next_processing)]),K(e,n)},o=e=>{K(e,Mr(`no deadline, the director runs it`))};J(i,e=>{t().next_processing?e(a):e(o,-1)}),A(r);var s=R(r,2),c=R(I(s),2),l=I(c);A(c);var u=R(c,2),d=I(u);A(u),A(s);var f=R(s,2),p=R(I(f),2),m=I(p);A(p);var h=R(p,2),g=I(h);A(h),A(f),z((e,n)=>{si(l,`width: ${e??``}%`),q(d,`${t().standing.players_saved??``}/${t().standing.players??``}`),si(m,`width: ${n??``}%`),q(g,`${t().standing.players_ready??``}/${t().standing.players??``}`)},[()=>b(t().standing.players_saved,t().standing.players),()=>b(t().standing.players_ready,t().standing.players)]),K(e,n)};J(h,e=>{t().state===`finished`?e(y):e(x,-1)}),A(i);var C=R(i,2),w=e=>{var t=Fi(),n=I(t);r(n),A(t),K(e,t)};J(C,e=>{H(g)&&t().name===H(u)&&e(w)}),A(n),z(()=>{a=X(i,1,`pick svelte-75r00e`,null,a,{on:t().name===H(u)}),q(c,t().display)}),U(`click`,i,()=>S(t().name)),K(e,n)},r=e=>{var n=Nr(),r=L(n),i=e=>{var t=Li(),n=I(t);A(t),z(()=>q(n,`Loading ${H(u)??``}…`)),K(e,t)},a=e=>{var t=Li(),n=I(t);A(t),z(()=>q(n,`Nothing to show for ${H(u)??``}.`)),K(e,t)},s=e=>{var n=Hi(),r=L(n);Y(R(r,2),19,()=>H(o).factions,e=>e.name,(e,n,r)=>{var i=Vi(),a=I(i),o=I(a),s=I(o,!0);A(o);var c=R(o,2),l=I(c);A(c);var d=R(c,2),f=I(d,!0);A(d),j(4),A(a),Y(R(a,2),17,()=>y(H(n)),e=>e.player??`unassigned`,(e,n)=>{var r=Nr(),i=L(r),a=e=>{let r=M(()=>H(n).ships[0]);var i=Ri(),a=I(i);let o;var s=I(a,!0);A(a);var c=R(a,2),l=I(c,!0);A(c);var d=R(c,2),f=I(d,!0);A(d);var p=R(d,2),m=I(p,!0);A(p);var h=R(p,2);ki(h,()=>H(n).saved,()=>H(n).lost,()=>`saved`,()=>`waiting`),ki(R(h,2),()=>H(n).ready,()=>H(n).lost,()=>`ready`,()=>`not yet`),A(i),z((e,t)=>{i.disabled=e,Q(i,`title`,t),o=X(a,1,`nm svelte-75r00e`,null,o,{gone:!H(r).alive}),q(s,H(r).name),q(l,H(r).ship_type),q(f,H(n).player??`—`),q(m,H(r).score)},[()=>!x(H(n).player),()=>x(H(n).player)?`Open ${H(n).player}'s view`:`Not yours to open`]),U(`click`,i,()=>t.onPick(H(u),H(n).player)),K(e,i)},o=e=>{var r=Bi(),i=I(r),a=I(i),o=I(a,!0);A(a);var s=R(a,2),c=I(s,!0);A(s);var l=R(s,2),d=I(l,!0);A(l);var f=R(l,2);ki(f,()=>H(n).saved,()=>H(n).lost,()=>`saved`,()=>`waiting`),ki(R(f,2),()=>H(n).ready,()=>H(n).lost,()=>`ready`,()=>`not yet`),A(i);var p=R(i,2);Y(p,21,()=>H(n).ships,e=>e.name,(e,t)=>{var n=zi(),r=I(n);let i;var a=I(r,!0);A(r);var o=R(r,2),s=I(o,!0);A(o);var c=R(o,2),l=I(c,!0);A(c),A(n),z(()=>{i=X(r,1,`nm svelte-75r00e`,null,i,{gone:!H(t).alive}),q(a,H(t).name),q(s,H(t).ship_type),q(l,H(t).score)}),K(e,n)}),A(p),A(r),z((e,t,r)=>{i.disabled=e,Q(i,`title`,t),q(o,r),q(c,H(n).player??`unassigned`),q(d,H(n).score)},[()=>!x(H(n).player),()=>x(H(n).player)?`Open ${H(n).player}'s view and plan all ${H(n).ships.length} of their ships`:`Not yours to open`,()=>H(n).ships.map(e=>e.name).join(`, `)]),U(`click`,i,()=>t.onPick(H(u),H(n).player)),K(e,r)};J(i,e=>{H(n).ships.length===1?e(a):e(o,-1)}),K(e,r)}),A(i),z(()=>{q(s,H(r)+1),q(l,`Faction ${H(n).name??``}`),q(f,H(n).score)}),K(e,i)}),U(`click`,r,()=>t.onReplay(H(u))),K(e,n)};J(r,e=>{H(p)?e(i):H(o)?e(s,-1):e(a,1)}),K(e,n)},i=P(rn([])),a=P(null),o=P(null),s=M(()=>t.directing?H(i):H(i).filter(e=>t.me.games.includes(e.name))),c=M(()=>H(s).filter(e=>e.state===`active`)),l=M(()=>H(s).filter(e=>e.state===`finished`)),u=P(null),f=P(!0),p=P(!1),m=P(null),h=matchMedia(`(max-width: 820px)`),g=P(rn(h.matches));wn(()=>{let e=e=>F(g,e.matches,!0);return h.addEventListener(`change`,e),()=>h.removeEventListener(`change`,e)});function _(e){let n=new Date(e),r=new Date(t.nowMs+t.skew).toDateString()===n.toDateString(),i=n.toLocaleTimeString([],{hour:`2-digit`,minute:`2-digit`});return r?i:`${n.toLocaleDateString([],{weekday:`short`})} ${i}`}function v(e){let n=Math.round((Date.parse(e)-(t.nowMs+t.skew))/6e4);if(n<=0)return`due now`;if(n<60)return`in ${n} min`;let r=Math.floor(n/60);return n%60?`in ${r}h ${n%60}m`:`in ${r}h`}wn(()=>{(async()=>{let e=await fetch(`/api/game/solo`);e.ok&&F(a,await e.json(),!0)})()}),wn(()=>{(async()=>{try{let e=await fetch(`/api/game/games`);if(!e.ok)throw Error(`API returned ${e.status}`);F(i,(await e.json()).filter(e=>e.current_round>0&&(e.standing||e.state===`finished`)),!0)}catch(e){F(m,String(e),!0)}finally{F(f,!1)}})()});function y(e){let t=new Map;for(let n of e.ships){let e=n.player??``;t.has(e)||t.set(e,[]),t.get(e).push(n)}return[...t.entries()].map(([e,t])=>({player:e||null,ships:t,score:t.reduce((e,t)=>e+t.score,0),saved:t.every(e=>!e.alive||e.orders_in),ready:t[0].player_ready,lost:t.every(e=>!e.alive)})).sort((e,t)=>t.score-e.score||(e.player??``).localeCompare(t.player??``))}let b=(e,t)=>t?Math.round(100*e/t):0,x=e=>!!e&&(t.directing||e===t.me.name);wn(()=>{!t.directing&&H(u)&&!t.me.games.includes(H(u))&&(F(u,null),F(o,null))});async function S(e){if(F(o,null),H(u)===e){F(u,null);return}F(u,e,!0),F(p,!0);try{let t=await fetch(`/api/game/${e}/overview`);F(o,t.ok?await t.json():null,!0)}finally{F(p,!1)}}var C=$i(),w=I(C),ee=e=>{K(e,Ui())},T=e=>{var t=Wi(),n=I(t);A(t),z(()=>q(n,`Couldn't reach the API: ${H(m)??``}`)),K(e,t)},te=e=>{var i=Qi(),d=I(i),f=I(d),p=e=>{var n=Gi(),r=R(L(n),2),i=I(r),o=I(i),s=I(o),c=I(s),l=I(c,!0);A(c);var u=R(c,2),d=I(u);A(u),A(s),j(2),A(o);var f=R(o,2);A(i),A(r),z(()=>{q(l,H(a).game.display),q(d,`Round ${H(a).game.current_round??``}`)}),U(`click`,o,()=>t.onPick(H(a).game.name,t.me.name)),U(`click`,f,()=>t.onReplay(H(a).game.name)),K(e,n)};J(f,e=>{H(a)?.game&&e(p)});var m=R(f,2);let h;var _=R(m,2),v=e=>{var n=qi(),r=R(I(n)),i=e=>{var n=Ki(),r=R(L(n));j(),U(`click`,r,()=>t.onPage(`solo`)),K(e,n)};J(r,e=>{H(a)?.game||e(i)}),j(),A(n),K(e,n)},y=e=>{K(e,Ji())};J(_,e=>{H(s).length?H(c).length||e(y,1):e(v)});var b=R(_,2);Y(b,21,()=>H(c),e=>e.name,(e,t)=>{n(e,()=>H(t))}),A(b);var x=R(b,2),S=e=>{var t=Yi(),r=R(L(t),2);Y(r,21,()=>H(l),e=>e.name,(e,t)=>{n(e,()=>H(t))}),A(r),K(e,t)};J(x,e=>{H(l).length&&e(S)}),A(d);var C=R(d,2),w=e=>{var t=Zi(),n=I(t),i=I(n),a=e=>{K(e,Mr(`Factions`))},s=e=>{var t=Mr();z(()=>q(t,`${H(u)??``} · final standing`)),K(e,t)},c=e=>{var t=Mr();z(()=>q(t,`${H(u)??``} · planning round ${(H(o)?.last_round??0)+1}, best first`)),K(e,t)};J(i,e=>{H(u)?H(o)?.state===`finished`?e(s,1):e(c,-1):e(a)}),A(n);var l=R(n,2),d=e=>{K(e,Xi())},f=e=>{r(e)};J(l,e=>{H(u)?e(f,-1):e(d)}),A(t),K(e,t)};J(C,e=>{H(g)||e(w)}),A(i),z(()=>h=X(m,1,`svelte-75r00e`,null,h,{later:H(a)?.game})),K(e,i)};J(w,e=>{H(f)?e(ee):H(m)?e(T,1):e(te,-1)}),A(C),K(e,C),Ge()}wr([`click`]);var ta=[`forEach`,`isDisjointFrom`,`isSubsetOf`,`isSupersetOf`],na=[`difference`,`intersection`,`symmetricDifference`,`union`],ra=!1,ia=class e extends Set{#e=new Map;#t=P(0);#n=P(0);#r=ir||-1;constructor(e){if(super(),e){for(var t of e)super.add(t);this.#n.v=super.size}ra||this.#a()}#i(e){return ir===this.#r?P(e):Zt(e)}#a(){ra=!0;var t=e.prototype,n=Set.prototype;for(let e of ta)t[e]=function(...t){return H(this.#t),n[e].apply(this,t)};for(let r of na)t[r]=function(...t){H(this.#t);var i=n[r].apply(this,t);return new e(i)}}has(e){var t=super.has(e),n=this.#e,r=n.get(e);if(r===void 0){if(!t)return H(this.#t),!1;r=this.#i(!0),n.set(e,r)}return H(r),t}add(e){return super.has(e)||(super.add(e),F(this.#n,super.size),tn(this.#t)),this}delete(e){var t=super.delete(e),n=this.#e,r=n.get(e);return r!==void 0&&(n.delete(e),F(r,!1)),t&&(F(this.#n,super.size),tn(this.#t)),t}clear(){if(super.size!==0){super.clear();var e=this.#e;for(var t of e.values())F(t,!1);e.clear(),F(this.#n,0),tn(this.#t)}}keys(){return this.values()}values(){return H(this.#t),super.values()}entries(){return H(this.#t),super.entries()}[Symbol.iterator](){return this.keys()}get size(){return H(this.#n)}},aa=(e,t,n)=>Math.max(t,Math.min(n,e)),oa=e=>e*Math.PI/180,sa=e=>((e+180)%360+360)%360-180,$=(e,t)=>({vx:e,vy:-t}),ca=new Set([`Ship`,`Starbase`,`Beacon`]),la=new Set([`Terrain`]),ua=e=>e.category_name===`Ship`&&e.alive,da=/^\s*(\d+)\s*:\s*([RLA])\s*(-?\d+)\s*$/i,fa=/^\s*(\d+)\s*:\s*(?:F|FIRE|SCAN|REP|REPLENISH)\s+(\S+)\s*(.*)$/i,pa=/^\s*(\d+)\s*:\s*([A-Za-z]+)\s+(\S+)\s*(.*)$/,ma={defense:`Boost`,ecm:`Power`},ha=e=>e.components.filter(e=>ma[e.group]&&e.inputs.length);function ga(e,t){let n=Array(11).fill(0),r=Array(11).fill(0),i={},a={},o=[],s=new Set(ha(t).map(e=>e.name)),c=new Set(t.weapons.map(e=>e.name));for(let t of e){let e=t.trim();if(!e)continue;let l=e.match(da);if(l&&Number(l[1])>=1&&Number(l[1])<=10){let e=Number(l[1]),t=l[2].toUpperCase(),i=Number(l[3]);t===`A`?r[e]=i:n[e]=t===`R`?i:-i;continue}let u=e.match(fa);if(u&&Number(u[1])>=1&&Number(u[1])<=10){if(!c.has(u[2]))continue;let e=Number(u[1]);i[e]||(i[e]={}),i[e][u[2]]=u[3].split(/\s+/).filter(Boolean);continue}let d=e.match(pa);if(d&&Number(d[1])>=1&&Number(d[1])<=10&&s.has(d[3])){let e=Number(d[1]);a[e]||(a[e]={}),a[e][d[3]]={verb:d[2],params:d[4].split(/\s+/).filter(Boolean)};continue}o.push(e)}return{turn:n,accel:r,fire:i,comp:a,other:o}}function _a(e){let t=[];for(let n=1;n<=10;n++){e.turn[n]&&t.push([n,`${n}: ${e.turn[n]>0?`R`:`L`}${Math.abs(e.turn[n])}`]),e.accel[n]&&t.push([n,`${n}: A${e.accel[n]}`]);for(let[r,i]of Object.entries(e.fire[n]??{}))t.push([n,`${n}: Fire ${r} ${i.join(` `)}`.trim()]);for(let[r,i]of Object.entries(e.comp[n]??{}))t.push([n,`${n}: ${i.verb} ${r} ${i.params.join(` `)}`.trim()])}for(let n of e.other){let e=n.match(/^\s*(\d+)\s*:/);t.push([e?Number(e[1]):11,n])}return t.sort((e,t)=>e[0]-t[0]).map(e=>e[1])}function va(e,t){let n=[{t:0,x:e.x,y:e.y,heading:e.heading,speed:e.speed,atLimit:!1}],r=e.heading,i=e.speed,a=e.x,o=e.y;for(let s=1;s<=10;s++)r+=t.turn[s],i=aa(i+t.accel[s],-e.limits.max_speed,e.limits.max_speed),a+=Math.sin(oa(r))*i,o+=Math.cos(oa(r))*i,n.push({t:s,x:a,y:o,heading:r,speed:i,atLimit:Math.abs(t.turn[s])>=e.limits.max_turn||Math.abs(t.accel[s])>=e.limits.max_delta_v||Math.abs(i)>=e.limits.max_speed});return n}function ya(e,t){let n=[];for(let t of e.ships)n.push($(t.x,t.y));for(let t of e.ships)for(let e of t.track)n.push($(e.x,e.y));for(let t of e.contacts)for(let e of t.track)n.push($(e.x,e.y));for(let e of Object.values(t))for(let t of e)n.push($(t.x,t.y));return n}var ba=e=>e.inputs.findIndex(e=>e.kind===`direction`);function xa(e){if(!e.firing_arc)return[-180,180];let[t,n]=e.firing_arc;return t>n?[t-360,n]:[t,n]}function Sa(e,t){let[n,r]=xa(e),i=(n+r)/2,a=t-360*Math.round((t-i)/360);return Math.round(Math.min(r,Math.max(n,a)))}function Ca(e){let[t,n]=xa(e);return Math.round((t+n)/2)}var wa=(e,t)=>e.inputs.some(e=>e.kind===`object_name`&&(!e.choices||e.choices.some(e=>t.has(e)))),Ta=e=>e.inputs.map(t=>t.choices?t.choices[0]??``:t.kind===`direction`?String(Ca(e)):String(Math.round(t.max??0))),Ea=e=>e.inputs.length>1&&e.inputs[1].kind===`number_in_range`?e.inputs[1]:null;function Da(e,t){return 7*(1+2*aa((e.max-t)/(e.max-e.min),0,1))}function Oa(e,t){let n=aa((t-7)/14,0,1);return Math.round((e.max-n*(e.max-e.min))/5)*5}var ka=class{#e=P(null);get plan(){return H(this.#e)}set plan(e){F(this.#e,e,!0)}#t=P(!0);get loading(){return H(this.#t)}set loading(e){F(this.#t,e,!0)}#n=P(null);get error(){return H(this.#n)}set error(e){F(this.#n,e,!0)}#r=P(rn({}));get orders(){return H(this.#r)}set orders(e){F(this.#r,e,!0)}#i=P(rn({}));get baseline(){return H(this.#i)}set baseline(e){F(this.#i,e,!0)}#a=P(null);get selected(){return H(this.#a)}set selected(e){F(this.#a,e,!0)}#o=P(null);get selectedTick(){return H(this.#o)}set selectedTick(e){F(this.#o,e,!0)}#s=P(null);get aiming(){return H(this.#s)}set aiming(e){F(this.#s,e,!0)}#c=P(!1);get ready(){return H(this.#c)}set ready(e){F(this.#c,e,!0)}#l=P(!1);get settingReady(){return H(this.#l)}set settingReady(e){F(this.#l,e,!0)}#u=P(!1);get sending(){return H(this.#u)}set sending(e){F(this.#u,e,!0)}#d=P(``);get saveMsg(){return H(this.#d)}set saveMsg(e){F(this.#d,e,!0)}#f=P(null);get moved(){return H(this.#f)}set moved(e){F(this.#f,e,!0)}locked=new ia;#p=0;constructor(e,t){this.game=e,this.player=t}async load(e){let t=++this.#p;this.loading=!0,this.error=null;let n=`/api/game/${this.game}/players/${this.player}/plan`+(e===null?``:`?round=${e}`);try{let e=await fetch(n);if(!e.ok)throw Error(`API returned ${e.status}`);let r=await e.json();if(t!==this.#p)return;this.#m(r)}catch(e){t===this.#p&&(this.error=String(e))}finally{t===this.#p&&(this.loading=!1)}}#m(e){let t={},n={};for(let r of e.ships)r.owned&&(t[r.name]=ga(r.commands,r),n[r.name]=r.commands);this.plan=e,this.orders=t,this.baseline=n;let r=e.ships.filter(e=>e.owned),i=r.find(e=>e.category_name===`Ship`)??r[0];this.selected=i?i.name:null,this.selectedTick=null,this.aiming=null,this.saveMsg=``,this.ready=e.ready,this.locked.clear(),this.moved=null}#h=M(()=>this.plan?this.plan.round===this.plan.last_round&&this.plan.state===`active`:!1);get editable(){return H(this.#h)}set editable(e){F(this.#h,e)}#g=M(()=>this.plan?this.plan.ships.filter(e=>e.owned):[]);get ownShips(){return H(this.#g)}set ownShips(e){F(this.#g,e)}#_=M(()=>{let e={};if(this.plan)for(let t of this.plan.ships)!t.owned&&t.commands.length&&(e[t.name]=ga(t.commands,t));return e});get allyOrders(){return H(this.#_)}set allyOrders(e){F(this.#_,e)}ordersOf=e=>e.owned?this.orders[e.name]:this.allyOrders[e.name];#v=M(()=>{let e={};if(!this.plan)return e;for(let t of this.plan.ships){let n=this.ordersOf(t);n&&(e[t.name]=va(t,n))}return e});get chains(){return H(this.#v)}set chains(e){F(this.#v,e)}#y=M(()=>new Set(this.plan?[...this.plan.ships.map(e=>e.name),...this.plan.contacts.map(e=>e.name)]:[]));get drawn(){return H(this.#y)}set drawn(e){F(this.#y,e)}#b=M(()=>this.ownShips.find(e=>e.name===this.selected)??null);get ship(){return H(this.#b)}set ship(e){F(this.#b,e)}#x=M(()=>this.selected?this.chains[this.selected]??null:null);get chain(){return H(this.#x)}set chain(e){F(this.#x,e)}#S=M(()=>this.selected?this.orders[this.selected]??null:null);get shipOrders(){return H(this.#S)}set shipOrders(e){F(this.#S,e)}#C=M(()=>this.ship?ha(this.ship):[]);get orderableComponents(){return H(this.#C)}set orderableComponents(e){F(this.#C,e)}#w=M(()=>this.ownShips.some(e=>{let t=this.orders[e.name]?_a(this.orders[e.name]):[],n=this.baseline[e.name]??[];return t.length!==n.length||t.some((e,t)=>e!==n[t])}));get dirty(){return H(this.#w)}set dirty(e){F(this.#w,e)}#T=M(()=>{if(!this.plan)return{ships:0,enemyOrd:0,friendlyOrd:0,enemyShips:0};let e=this.plan.contacts.filter(e=>!la.has(e.category_name)),t=e.filter(e=>!ca.has(e.category_name));return{ships:e.filter(e=>ca.has(e.category_name)).length,enemyOrd:t.filter(e=>e.stance===`Foe`).length,friendlyOrd:t.filter(e=>e.stance===`Friend`).length,enemyShips:e.filter(e=>ca.has(e.category_name)&&e.stance===`Foe`).length}});get counts(){return H(this.#T)}set counts(e){F(this.#T,e)}selectShip(e){e!==this.selected&&(this.selected=e,this.selectedTick=null,this.aiming=null)}plannedShots(e){if(!this.shipOrders)return 0;let t=0;for(let n=1;n<=10;n++)this.shipOrders.fire[n]?.[e]&&t++;return t}ammoLeft=e=>e.ammo===null?null:e.ammo-this.plannedShots(e.name);aims=e=>wa(e,this.drawn);orderAt=(e,t)=>this.shipOrders&&e?this.shipOrders.fire[e]?.[t]:void 0;compOrderAt=(e,t)=>this.shipOrders&&e?this.shipOrders.comp[e]?.[t]:void 0;arm(e){if(!this.selectedTick||!this.shipOrders)return;let t=this.ammoLeft(e);if(!(t!==null&&t<=0)){if(wa(e,this.drawn)){this.aiming=e.name;return}this.shipOrders.fire[this.selectedTick]||(this.shipOrders.fire[this.selectedTick]={}),this.shipOrders.fire[this.selectedTick][e.name]=Ta(e),this.saveMsg=``}}pickTarget(e){!this.aiming||!this.selectedTick||!this.shipOrders||(this.shipOrders.fire[this.selectedTick]||(this.shipOrders.fire[this.selectedTick]={}),this.shipOrders.fire[this.selectedTick][this.aiming]=[e],this.aiming=null,this.saveMsg=``)}unarm(e,t){this.shipOrders?.fire[e]&&(delete this.shipOrders.fire[e][t],Object.keys(this.shipOrders.fire[e]).length||delete this.shipOrders.fire[e],this.saveMsg=``)}setParam(e,t,n,r){this.shipOrders.fire[e][t][n]=String(r),this.saveMsg=``}armComponent(e){if(!this.selectedTick||!this.shipOrders)return;let t=e.inputs.map(e=>e.choices?e.choices[0]:String(Math.round(e.min)));this.shipOrders.comp[this.selectedTick]||(this.shipOrders.comp[this.selectedTick]={}),this.shipOrders.comp[this.selectedTick][e.name]={verb:ma[e.group],params:t},this.saveMsg=``}unarmComponent(e,t){this.shipOrders?.comp[e]&&(delete this.shipOrders.comp[e][t],Object.keys(this.shipOrders.comp[e]).length||delete this.shipOrders.comp[e],this.saveMsg=``)}setCompParam(e,t,n,r){this.shipOrders.comp[e][t].params[n]=String(r),this.saveMsg=``}resetCourse(e){this.baseline[e]&&(this.orders[e]=ga(this.baseline[e],this.ownShips.find(t=>t.name===e)),this.saveMsg=``)}toggleLock(e){this.locked.has(e)?this.locked.delete(e):this.locked.add(e)}async saveAll(){this.sending=!0,this.saveMsg=`Saving…`;let e=[],t=!1;for(let n of this.ownShips){let r=_a(this.orders[n.name]);try{let i=await(await fetch(`/api/game/${this.game}/ships/${n.name}/commands`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({lines:r})})).json();i.ok?(this.baseline[n.name]=r,e.push(`${n.name}: ${r.length} order${r.length===1?``:`s`}`)):(t=!0,e.push(`${n.name}: REJECTED (${i.checks.filter(e=>!e.ok).map(e=>e.line).join(`, `)})`))}catch(r){t=!0,e.push(`${n.name}: error ${r}`)}}return this.saveMsg=e.join(` · `),this.sending=!1,!t}async toggleReady(){let e=!this.ready;this.settingReady=!0;try{if(e&&!await this.saveAll())return this.saveMsg+=` · Still not ready.`,null;let t=await fetch(`/api/game/${this.game}/players/${this.player}/ready`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({ready:e})});if(!t.ok)return null;let n=await t.json();return this.ready=n.ready,n.processed?(this.saveMsg=`Everyone was ready. The round has been processed.`,this.plan.last_round+1):null}finally{this.settingReady=!1}}async pulse(){if(document.visibilityState!==`visible`||!this.plan)return;let e=await fetch(`/api/game/${this.game}/pulse`);if(!e.ok)return;let t=await e.json();for(let e of this.plan.ships)e.player in t.ready&&(e.player_ready=t.ready[e.player]);t.last_round>this.plan.last_round&&(this.moved=t.last_round)}},Aa=.05,ja=400,Ma=110;function Na(e){let t=10**Math.floor(Math.log10(e)),n=e/t;return(n<=1?1:n<=2?2:n<=5?5:10)*t}var Pa=class{#e=P(0);get cx(){return H(this.#e)}set cx(e){F(this.#e,e,!0)}#t=P(0);get cy(){return H(this.#t)}set cy(e){F(this.#t,e,!0)}#n=P(2);get upp(){return H(this.#n)}set upp(e){F(this.#n,e,!0)}#r=P(0);get boxW(){return H(this.#r)}set boxW(e){F(this.#r,e,!0)}#i=P(0);get boxH(){return H(this.#i)}set boxH(e){F(this.#i,e,!0)}#a=M(()=>{let e=Math.max(1,this.boxW)*this.upp,t=Math.max(1,this.boxH)*this.upp;return{x:this.cx-e/2,y:this.cy-t/2,w:e,h:t}});get vb(){return H(this.#a)}set vb(e){F(this.#a,e)}sx=e=>(e-this.vb.x)/this.upp;sy=e=>(e-this.vb.y)/this.upp;toWorld=(e,t)=>({x:this.vb.x+e*this.upp,y:-(this.vb.y+t*this.upp)});panByPixels(e,t){this.cx-=e*this.upp,this.cy-=t*this.upp}zoomAt(e,t,n){let r=this.vb.x+e*this.upp,i=this.vb.y+t*this.upp,a=aa(this.upp*n,Aa,ja);this.cx=r-e*a+this.boxW*a/2,this.cy=i-t*a+this.boxH*a/2,this.upp=a}zoomBy(e){this.zoomAt(this.boxW/2,this.boxH/2,e)}centreOn(e,t){this.cx=e,this.cy=t}fitTo(e){if(!e.length||!this.boxW||!this.boxH)return;let t=e.map(e=>e.vx),n=e.map(e=>e.vy),r=Math.min(...t),i=Math.max(...t),a=Math.min(...n),o=Math.max(...n);this.cx=(r+i)/2,this.cy=(a+o)/2,this.upp=aa(Math.max(Math.max(i-r,50)/this.boxW,Math.max(o-a,50)/this.boxH)*1.15,Aa,ja)}#o=M(()=>{if(!this.boxW||!this.boxH)return{step:100,xs:[],ys:[]};let e=Na(this.upp*Ma),t=[],n=[];for(let n=Math.ceil(this.vb.x/e)*e;n<=this.vb.x+this.vb.w;n+=e)t.push(n);for(let t=Math.ceil(this.vb.y/e)*e;t<=this.vb.y+this.vb.h;t+=e)n.push(t);return{step:e,xs:t,ys:n}});get grid(){return H(this.#o)}set grid(e){F(this.#o,e)}#s=M(()=>this.grid.step/this.upp);get scaleBarPx(){return H(this.#s)}set scaleBarPx(e){F(this.#s,e)}},Fa={Ship:11,Starbase:7.5,Beacon:9,Missile:5.5,Mine:5},Ia=e=>e*Math.PI/180,La=e=>e.map(e=>e.join(`,`)).join(` `);function Ra(e,t,n,r,i){let a=r*i,o=Ia(n),s=(n,r)=>[e+Math.sin(n)*a*r,t-Math.cos(n)*a*r];return La([s(o,1),s(o+2.5,.62),s(o-2.5,.62)])}function za(e,t,n,r){let i=n*r;return La([[e,t-i],[e+i,t],[e,t+i],[e-i,t]])}function Ba(e,t,n,r){let i=n*r*.85;return La([[e-i,t-i],[e+i,t-i],[e+i,t+i],[e-i,t+i]])}function Va(e,t,n,r){let i=n*r;return La(Array.from({length:12},(n,r)=>{let a=Ia(r*30),o=r%2?.42:1;return[e+Math.sin(a)*i*o,t-Math.cos(a)*i*o]}))}function Ha(e,t,n,r,i){let a=Fa[e]??5;return e===`Starbase`?Ba(t,n,a,i):e===`Beacon`?Va(t,n,a,i):e===`Mine`?za(t,n,a,i):r===null?za(t,n,a*.5,i):Ra(t,n,r,a,i)}function Ua(e,t,n){let r=``;for(let i=0;i<12;i++){let a=i*Math.PI/6,o=i%2?n*.28:n*.42;r+=`M${e+Math.sin(a)*o} ${t-Math.cos(a)*o}L${e+Math.sin(a)*n} ${t-Math.cos(a)*n}`}return r}var Wa=W(`<p class="overlay-msg svelte-17jmwgz"> </p>`),Ga=W(`<p class="overlay-msg err svelte-17jmwgz"> </p>`),Ka=G(`<circle class="body svelte-17jmwgz"></circle>`),qa=G(`<line></line>`),Ja=G(`<!><!><circle class="origin svelte-17jmwgz" cx="0" cy="0"></circle>`,1),Ya=G(`<circle></circle>`),Xa=G(`<path class="kill svelte-17jmwgz"></path><circle class="kill-core svelte-17jmwgz"></circle>`,1),Za=G(`<line class="beam svelte-17jmwgz"></line>`),Qa=G(`<path class="breach svelte-17jmwgz"></path>`),$a=G(`<circle class="struck svelte-17jmwgz"></circle>`),eo=G(`<!><!>`,1),to=G(`<polyline></polyline><!>`,1),no=G(`<circle class="target-hit svelte-17jmwgz"></circle>`),ro=G(`<!><polygon></polygon><!>`,1),io=G(`<circle class="ship-hit svelte-17jmwgz"></circle>`),ao=G(`<circle></circle><polygon></polygon><!>`,1),oo=G(`<path></path>`),so=G(`<path class="arc svelte-17jmwgz"></path>`),co=G(`<circle class="shot-grab svelte-17jmwgz"></circle>`),lo=G(`<circle class="shot-handle svelte-17jmwgz"></circle>`),uo=G(`<polygon></polygon>`),fo=G(`<line></line><!><!>`,1),po=G(`<!><circle></circle>`,1),mo=G(`<!><!><!><!><!><!><!><!><!><!><!><!>`,1),ho=G(`<text class="grid-label svelte-17jmwgz"> </text>`),go=G(`<line class="scalebar svelte-17jmwgz" x1="14"></line><line class="scalebar svelte-17jmwgz" x1="14" x2="14"></line><line class="scalebar svelte-17jmwgz"></line><text class="grid-label svelte-17jmwgz" text-anchor="middle"> </text>`,1),_o=G(`<text class="cursor-label svelte-17jmwgz" text-anchor="end"> </text>`),vo=G(`<text text-anchor="middle"> <title> </title></text>`),yo=G(`<line class="leader svelte-17jmwgz"></line>`),bo=G(`<!><text> </text>`,1),xo=G(`<text class="tick-label svelte-17jmwgz"> </text>`),So=G(`<text text-anchor="middle"> </text>`),Co=W(`<button type="button" class="svelte-17jmwgz"> <span class="svelte-17jmwgz"> </span></button>`),wo=W(`<div class="pickone svelte-17jmwgz"></div>`),To=W(`<p class="readout svelte-17jmwgz"> </p>`),Eo=W(`<div class="plot svelte-17jmwgz"><!>  <svg preserveAspectRatio="none" role="img" aria-label="Faction tactical map. Drag to pan, pinch or scroll to zoom."><!><!><!></svg> <svg class="text-layer svelte-17jmwgz" preserveAspectRatio="none" aria-hidden="true"><!><!><!><!><!><!><!></svg> <!> <!> <!></div>`);function Do(e,t){We(t,!0);let n=Oi(t,`planning`,7),r=Oi(t,`camera`,7),i=Oi(t,`coarse`,3,!1),a=Oi(t,`grabbable`,19,()=>({path:!0,shots:!0,ticks:!0})),o=M(()=>n().plan),s=15.5,c=new Set([`hull`,`battery`]),l=M(()=>i()?{ship:24,node:22,shot:21,target:24}:{ship:16,node:13,shot:11,target:14}),u=M(()=>r().upp),f=M(()=>r().vb),p=M(()=>H(o)?H(o).contacts.filter(e=>la.has(e.category_name)?!1:ca.has(e.category_name)?!0:e.stance===`Friend`?t.layers.friendlyOrdnance:t.layers.enemyOrdnance).sort((e,t)=>Number(ca.has(e.category_name))-Number(ca.has(t.category_name))):[]),m=e=>e.track[e.track.length-1].tick<10,h=M(()=>H(o)?.ships.find(e=>e.name===n().selected)??null),g=M(()=>{if(!H(h))return[];let e=n().chain;return e?.length?[e[0],e[e.length-1]]:[{x:H(h).x,y:H(h).y}]}),_=M(()=>H(o)?H(o).contacts.filter(e=>la.has(e.category_name)):[]),v=e=>e.track.map(e=>{let t=$(e.x,e.y);return`${t.vx},${t.vy}`}).join(` `),y=e=>{let t=e.track[e.track.length-1];return $(t.x,t.y)},b=e=>e.map(e=>{let t=$(e.x,e.y);return`${t.vx},${t.vy}`}).join(` `);function x(e){if(e.track.length<2)return null;let t=e.track[e.track.length-2],n=e.track[e.track.length-1],r=n.x-t.x,i=n.y-t.y;return r===0&&i===0?null:Math.atan2(r,i)*180/Math.PI}let S=(e,t,n,r)=>[e+Math.sin(oa(n))*r*H(u),t-Math.cos(oa(n))*r*H(u)],C=(e,t,n,r)=>[e+Math.sin(oa(n))*r,t-Math.cos(oa(n))*r];function w(e,t,n,r,i){let[a,o]=r,s=((o-a)%360+360)%360,c=C(e,t,n+a,i),l=C(e,t,n+a+s,i);return`M ${e},${t} L ${c[0]},${c[1]} A ${i},${i} 0 ${+(s>180)} 1 ${l[0]},${l[1]} Z`}function ee(e,t,n,r,i){let a=C(e,t,n-r/2,i),o=C(e,t,n+r/2,i);return`M ${a[0]},${a[1]} A ${i},${i} 0 0 1 ${o[0]},${o[1]}`}let T=M(()=>{if(!H(o))return[];let e=[];for(let t of H(o).ships){let r=n().ordersOf(t),i=n().chains[t.name];if(!r||!i)continue;let a=Object.fromEntries(t.weapons.map(e=>[e.name,e])),s=t.name===n().selected;for(let c=1;c<=10;c++)for(let[l,u]of Object.entries(r.fire[c]??{})){let r=a[l],d=i[c];if(!r||!d)continue;let f=ba(r)>=0?`direction`:r.inputs[0]?.kind,p=r.inputs[0]?.choices?u[0]:l,m=$(d.x,d.y),h=s&&c===n().selectedTick,g=`${t.name}:${c}:${l}`;if(f===`object_name`){let r=H(o).contacts.find(e=>e.name===u[0]);e.push({key:g,ship:t.name,mine:s,tick:c,weapon:l,label:p,kind:f,node:d,nv:m,cur:h,target:r?r.track[r.track.length-1]:n().chains[u[0]]?.[c]??null,targetName:u[0]})}else{let n=Number(u[ba(r)])||0,i=d.heading+n,a=Ea(r),o;o=a?C(m.vx,m.vy,i,Da(a,Number(u[1])||a.max)):h?S(m.vx,m.vy,i,54):r.payload_speed?C(m.vx,m.vy,i,r.payload_speed):r.payload?C(m.vx,m.vy,i,d.speed):C(m.vx,m.vy,i,7),e.push({key:g,ship:t.name,mine:s,tick:c,weapon:l,label:p,kind:`direction`,node:d,nv:m,cur:h,angle:n,heading:i,end:o})}}}return e}),te=M(()=>{if(!H(o))return[];let e=[];for(let t of H(o).ships){let r=n().ordersOf(t),i=n().chains[t.name];if(!r||!i)continue;let a=Object.fromEntries(t.weapons.map(e=>[e.name,e])),o=t.name===n().selected;for(let s=1;s<=10;s++)for(let[c,l]of Object.entries(r.fire[s]??{})){let r=a[c],u=r?Ea(r):null;if(!u)continue;let d=i[s];if(!d)continue;let f=Number(l[1])||u.max;e.push({key:`${t.name}:${s}:${c}`,mine:o,nv:$(d.x,d.y),heading:d.heading,dir:Number(l[0])||0,width:f,r:Da(u,f),cur:o&&s===n().selectedTick})}}return e}),ne=M(()=>{if(!t.layers.grid)return[];let e=[];for(let t of r().grid.xs)e.push({key:`x${t}`,x:r().sx(t),y:13,text:`${Math.round(t)}`,mid:!0});for(let t of r().grid.ys)e.push({key:`y${t}`,x:7,y:r().sy(t)-5,text:`${Math.round(-t)}`,mid:!1});return e}),re=M(()=>{if(!H(o))return[];let e=[];for(let t of H(o).ships){let i=$(t.x,t.y);e.push({key:`s:${t.name}`,x:r().sx(i.vx),y:r().sy(i.vy),text:t.name,cls:t.owned?t.name===n().selected?`sel`:`own`:`ally`})}for(let t of H(p)){if(!ca.has(t.category_name))continue;let n=y(t);e.push({key:`c:${t.name}`,x:r().sx(n.vx),y:r().sy(n.vy),text:t.name,cls:t.stance===`Foe`?`enemy`:`ally`})}let t=[],i=[];for(let n of[...e].sort((e,t)=>e.y-t.y)){let e=n.text.length*7.5,r=n.x+12,a=n.y,o=0;for(;o++<80&&t.some(t=>Math.abs(t.ly-a)<s&&r<t.lx+t.w&&t.lx<r+e);)a+=s;t.push({lx:r,ly:a,w:e}),i.push({...n,lx:r,ly:a,moved:Math.abs(a-n.y)>5})}return i}),ie=M(()=>H(p).filter(e=>!ca.has(e.category_name)).map(e=>{let t=y(e);return{key:e.name,x:r().sx(t.vx),y:r().sy(t.vy),letter:e.type_name[0],enemy:e.stance===`Foe`,title:`${e.name} · ${e.type_name}`}})),ae=M(()=>{if(!t.layers.paths||!n().chain||!n().ship||!ua(n().ship))return[];let e=[];for(let t of n().chain.slice(1)){let n=$(t.x,t.y),r=e[e.length-1];r&&r.vx===n.vx&&r.vy===n.vy?r.ticks.push(t.t):e.push({vx:n.vx,vy:n.vy,ticks:[t.t]})}return e.map(e=>({key:`${e.ticks[0]}`,x:r().sx(e.vx)+9,y:r().sy(e.vy)-9,text:e.ticks.length===1?`${e.ticks[0]}`:`${e.ticks[0]}–${e.ticks.at(-1)}`}))}),oe=M(()=>t.layers.fire?H(T).map(e=>{if(e.kind===`object_name`){if(!e.target)return null;let t=$(e.target.x,e.target.y);return{key:e.key,x:r().sx((e.nv.vx+t.vx)/2),y:r().sy((e.nv.vy+t.vy)/2),text:e.label,cur:e.cur,mine:e.mine}}let t=S(e.end[0],e.end[1],e.heading,11);return{key:e.key,x:r().sx(t[0]),y:r().sy(t[1]),text:e.label,cur:e.cur,mine:e.mine}}).filter(Boolean):[]),se,ce=new Map,le=`none`,ue=null,E=null,de=0,fe=0,pe=0,me=0,he=0,ge=0,_e=0,ve=0,ye=!1,be=null,xe=null,Se=!1,Ce=M(()=>i()?9:3),we=P(null),D=P(null);function Te(e){let t=se.getBoundingClientRect();return{px:e.clientX-t.left,py:e.clientY-t.top}}function Ee(e){let{px:t,py:n}=Te(e);return r().toWorld(t,n)}function De(){let[e,t]=[...ce.values()],n=se.getBoundingClientRect();return{dist:Math.hypot(e.x-t.x,e.y-t.y),px:(e.x+t.x)/2-n.left,py:(e.y+t.y)/2-n.top}}function Oe(e){ce.set(e.pointerId,{x:e.clientX,y:e.clientY}),ce.size===2&&(le=`pinch`,xe=De(),ue=null,E=null,be=null,F(D,null),ye=!0)}function ke(e,t){le=t,ye=!1,he=_e=e.clientX,ge=ve=e.clientY,se.setPointerCapture(e.pointerId)}let Ae=P(null);function je(e,t,n){let{px:i,py:a}=Te(e);return t.map(e=>({...e,d:Math.hypot(r().sx(e.v.vx)-i,r().sy(e.v.vy)-a)})).filter(e=>e.d<=n).sort((e,t)=>e.d-t.d)}let O=M(()=>i()?44:34);function Me(e,t,n){let{px:i,py:a}=Te(e);F(Ae,{px:Math.max(0,Math.min(i,r().boxW-170)),py:Math.max(0,Math.min(a,r().boxH-H(O)*t.length)),hits:t,aiming:n},!0)}function k(e){H(Ae).aiming?n().pickTarget(e):n().selectShip(e),F(Ae,null)}function Ne(e){if(!(le===`pinch`||Se)){if(F(Ae,null),H(o)&&n().aiming){let t=je(e,[...H(p).map(e=>({name:e.name,note:e.type_name,v:y(e)})),...H(o).ships.map(e=>({name:e.name,note:e.ship_type,v:$(e.x,e.y)}))],H(l).target);if(t.length>1)return Me(e,t,!0);if(t.length===1)return n().pickTarget(t[0].name)}else if(H(o)){let t=je(e,H(o).ships.filter(e=>e.owned).map(e=>({name:e.name,note:e.ship_type,v:$(e.x,e.y)})),H(l).ship);if(t.length>1)return Me(e,t,!1);be=t.length?t[0].name:null}ke(e,`pan`)}}function Pe(e,t){if(le===`pinch`||Se||!n().editable||!a().path&&!a().ticks)return;t.stopPropagation(),ue=e;let r=n().chain[e],i=Ee(t);de=r.x-i.x,fe=r.y-i.y,ke(t,`node`)}function j(e,t){if(le===`pinch`||Se||!n().editable||!a().shots||!e.mine)return;t.stopPropagation(),E=e,n().selectedTick=e.tick;let r=e.node,i=Ee(t),o=Math.atan2(i.x-r.x,i.y-r.y)*180/Math.PI;pe=sa(e.heading-o),me=Math.hypot(e.end[0]-r.x,e.end[1]+r.y)-Math.hypot(i.x-r.x,i.y-r.y),ke(t,`shot`)}function Fe(e){if(!a().path){r().panByPixels(e.clientX-he,e.clientY-ge),he=e.clientX,ge=e.clientY;return}let t=n().ship,i=n().chain,o=n().shipOrders;if(!t||!i||!o)return;let s=i[ue-1],c=Ee(e),l=c.x+de-s.x,u=c.y+fe-s.y,d=aa(sa(Math.atan2(l,u)*180/Math.PI-s.heading),-t.limits.max_turn,t.limits.max_turn),f=aa(Math.hypot(l,u)-s.speed,-t.limits.max_delta_v,t.limits.max_delta_v),p=aa(s.speed+f,-t.limits.max_speed,t.limits.max_speed);o.turn[ue]=Math.round(d),o.accel[ue]=Math.round(p-s.speed),n().saveMsg=``;let m=o.turn[ue],h=o.accel[ue];F(D,`${ue} · ${m?(m>0?`R`:`L`)+Math.abs(m):`ahead`} · A${h>0?`+`:``}${h} · speed ${Math.round(s.speed+h)}`)}function Ie(e){let t=n().ownShips.find(e=>e.name===E.ship).weapons.find(e=>e.name===E.weapon),r=E.node,i=Ee(e),a=Sa(t,sa(Math.atan2(i.x-r.x,i.y-r.y)*180/Math.PI+pe-r.heading)),o=n().orders[E.ship].fire[E.tick][E.weapon];o[ba(t)]=String(a);let s=Ea(t),c=``;if(s){let e=Oa(s,Math.hypot(i.x-r.x,i.y-r.y)+me);o[1]=String(e),c=` · ${e}° wide`}n().saveMsg=``,F(D,`${E.weapon} · ${a}°${c}`)}function Le(e){let t=ce.get(e.pointerId);if(t&&(t.x=e.clientX,t.y=e.clientY),!i()){let t=Ee(e);F(we,{x:Math.round(t.x),y:Math.round(t.y)},!0)}if(Math.hypot(e.clientX-_e,e.clientY-ve)>H(Ce)&&(ye=!0),le===`pinch`){if(ce.size<2)return;let e=De();xe&&e.dist>0&&xe.dist>0&&(r().zoomAt(xe.px,xe.py,xe.dist/e.dist),r().panByPixels(e.px-xe.px,e.py-xe.py)),xe=e;return}if(le===`shot`)return Ie(e);if(le===`node`)return Fe(e);le===`pan`&&(r().panByPixels(e.clientX-he,e.clientY-ge),he=e.clientX,ge=e.clientY)}function Re(e){ce.delete(e.pointerId);let t=le;t!==`pinch`&&!ye&&(t===`node`?a().ticks&&(n().selectedTick=ue):be?n().selectShip(be):t===`pan`&&(n().selectedTick=null,n().aiming=null)),t===`pinch`&&(Se=!0),ce.size||(Se=!1),le=`none`,xe=null,ue=null,E=null,be=null,F(D,null);try{se.releasePointerCapture(e.pointerId)}catch{}}function ze(e){e.preventDefault();let t=aa(e.deltaMode===1?e.deltaY*16:e.deltaY,-100,100),n=Te(e);r().zoomAt(n.px,n.py,Math.exp(t*Math.log(1.06)/100))}var Be=Eo(),Ve=I(Be),He=e=>{var t=Wa(),r=I(t);A(t),z(()=>q(r,`Loading ${n().player??``}'s tactical picture…`)),K(e,t)},Ue=e=>{var t=Ga(),r=I(t);A(t),z(()=>q(r,`Couldn't reach the API: ${n().error??``}`)),K(e,t)};J(Ve,e=>{n().loading?e(He):n().error&&e(Ue,1)});var Ke=R(Ve,2);let qe;var Je=I(Ke);Y(Je,17,()=>H(_),e=>e.name,(e,t)=>{let n=M(()=>y(H(t)));var r=Ka();z(()=>{Q(r,`cx`,H(n).vx),Q(r,`cy`,H(n).vy),Q(r,`r`,H(t).radius),Q(r,`stroke-width`,H(u))}),K(e,r)});var Ye=R(Je),Xe=e=>{var t=Ja(),n=L(t);Y(n,16,()=>r().grid.xs,e=>e,(e,t)=>{var n=qa();let r;z(()=>{r=X(n,0,`grid svelte-17jmwgz`,null,r,{axis:t===0}),Q(n,`x1`,t),Q(n,`y1`,H(f).y),Q(n,`x2`,t),Q(n,`y2`,H(f).y+H(f).h),Q(n,`stroke-width`,H(u))}),K(e,n)});var i=R(n);Y(i,16,()=>r().grid.ys,e=>e,(e,t)=>{var n=qa();let r;z(()=>{r=X(n,0,`grid svelte-17jmwgz`,null,r,{axis:t===0}),Q(n,`x1`,H(f).x),Q(n,`y1`,t),Q(n,`x2`,H(f).x+H(f).w),Q(n,`y2`,t),Q(n,`stroke-width`,H(u))}),K(e,n)});var a=R(i);z(()=>{Q(a,`r`,6*H(u)),Q(a,`stroke-width`,1.2*H(u))}),K(e,t)};J(Ye,e=>{t.layers.grid&&e(Xe)});var Ze=R(Ye),Qe=e=>{var r=mo(),i=L(r),s=e=>{var t=Nr();Y(L(t),17,()=>H(g),Vr,(e,t,n)=>{let r=M(()=>$(H(t).x,H(t).y));var i=Ya();X(i,0,`scanring svelte-17jmwgz`,null,{},{from:n===0}),z(()=>{Q(i,`cx`,H(r).vx),Q(i,`cy`,H(r).vy),Q(i,`r`,H(h).scan_range),Q(i,`stroke-width`,H(u)),Q(i,`stroke-dasharray`,`${6*H(u)} ${8*H(u)}`)}),K(e,i)}),K(e,t)};J(i,e=>{t.layers.scan&&H(h)?.scan_range&&e(s)});var d=R(i),f=e=>{var t=Nr();Y(L(t),17,()=>H(o).explosions,e=>`${e.tick}:${e.x}:${e.y}:${e.radius}`,(e,t)=>{let n=M(()=>$(H(t).x,H(t).y));var r=Ya();z(e=>{X(r,0,`blast ${e??``}`,`svelte-17jmwgz`),Q(r,`cx`,H(n).vx),Q(r,`cy`,H(n).vy),Q(r,`r`,H(t).radius),Q(r,`stroke-width`,H(u))},[()=>H(t).damage_type.toLowerCase()]),K(e,r)}),K(e,t)};J(d,e=>{t.layers.explosions&&e(f)});var _=R(d);Y(_,17,()=>H(o).ships.filter(e=>!e.alive&&e.track.length),e=>e.name,(e,t)=>{let n=M(()=>H(t).track[H(t).track.length-1]),r=M(()=>$(H(n).x,H(n).y));var i=Xa(),a=L(i),o=R(a);Q(o,`r`,20*.18),z(e=>{Q(a,`d`,e),Q(a,`stroke-width`,1.4*H(u)),Q(o,`cx`,H(r).vx),Q(o,`cy`,H(r).vy)},[()=>Ua(H(r).vx,H(r).vy,20)]),K(e,i)});var S=R(_),C=e=>{var t=eo(),n=L(t);Y(n,17,()=>H(o).beams,e=>`${e.tick}:${e.x1},${e.y1}:${e.x2},${e.y2}`,(e,t)=>{let n=M(()=>$(H(t).x1,H(t).y1)),r=M(()=>$(H(t).x2,H(t).y2));var i=Za();z(()=>{Q(i,`x1`,H(n).vx),Q(i,`y1`,H(n).vy),Q(i,`x2`,H(r).vx),Q(i,`y2`,H(r).vy),Q(i,`stroke-width`,1.2*H(u))}),K(e,i)}),Y(R(n),17,()=>H(o).effects,e=>`${e.tick}:${e.target}:${e.part}:${e.outcome}`,(e,t)=>{let n=M(()=>$(H(t).x,H(t).y));var r=Nr(),i=L(r),a=e=>{var t=Xa(),r=L(t),i=R(r);Q(i,`r`,20*.18),z(e=>{Q(r,`d`,e),Q(r,`stroke-width`,1.4*H(u)),Q(i,`cx`,H(n).vx),Q(i,`cy`,H(n).vy)},[()=>Ua(H(n).vx,H(n).vy,20)]),K(e,t)},o=e=>{var r=Qa();z(e=>{Q(r,`d`,e),Q(r,`stroke-width`,2.6*H(u))},[()=>ee(H(n).vx,H(n).vy,H(t).bearing,90,15*H(u))]),K(e,r)},s=e=>{var t=$a();z(()=>{Q(t,`cx`,H(n).vx),Q(t,`cy`,H(n).vy),Q(t,`r`,12*H(u)),Q(t,`stroke-width`,1.6*H(u))}),K(e,t)},l=M(()=>H(t).outcome===`Damaged`&&c.has(H(t).part));J(i,e=>{H(t).outcome===`Breached`&&H(t).part===`hull`?e(a):H(t).outcome===`Breached`?e(o,1):H(l)&&e(s,2)}),K(e,r)}),K(e,t)};J(S,e=>{t.layers.hits&&e(C)});var ne=R(S);Y(ne,17,()=>H(p),e=>e.name,(e,r)=>{let i=M(()=>y(H(r)));var a=ro(),o=L(a),s=e=>{var t=to(),n=L(t);let i;Y(R(n),17,()=>H(r).track.slice(0,-1),e=>e.tick,(e,t,n,i)=>{let a=M(()=>$(H(t).x,H(t).y));var o=Ya();let s;z(()=>{s=X(o,0,`mark svelte-17jmwgz`,null,s,{enemy:H(r).stance===`Foe`}),Q(o,`cx`,H(a).vx),Q(o,`cy`,H(a).vy),Q(o,`r`,1.6*H(u))}),K(e,o)}),z(e=>{i=X(n,0,`track svelte-17jmwgz`,null,i,{enemy:H(r).stance===`Foe`}),Q(n,`points`,e),Q(n,`stroke-width`,1.2*H(u))},[()=>v(H(r))]),K(e,t)};J(o,e=>{t.layers.tracks&&H(r).track.length>1&&e(s)});var c=R(o);let d;var f=R(c),p=e=>{var t=no();z(()=>{Q(t,`cx`,H(i).vx),Q(t,`cy`,H(i).vy),Q(t,`r`,H(l).target*H(u))}),K(e,t)};J(f,e=>{n().aiming&&e(p)}),z((e,t)=>{d=X(c,0,`blip svelte-17jmwgz`,null,d,e),Q(c,`points`,t)},[()=>({enemy:H(r).stance===`Foe`,stale:m(H(r))}),()=>Ha(H(r).category_name,H(i).vx,H(i).vy,x(H(r)),H(u))]),K(e,a)});var re=R(ne),ie=e=>{var t=Nr();Y(L(t),17,()=>H(o).ships.filter(e=>e.track.some(t=>t.x!==e.track[0].x||t.y!==e.track[0].y)),e=>e.name,(e,t)=>{var r=to(),i=L(r);let a;Y(R(i),17,()=>H(t).track.slice(0,-1),e=>e.tick,(e,r)=>{let i=M(()=>$(H(r).x,H(r).y));var a=Ya();let o;z(()=>{o=X(a,0,`wake-dot svelte-17jmwgz`,null,o,{sel:H(t).name===n().selected,ally:!H(t).owned}),Q(a,`cx`,H(i).vx),Q(a,`cy`,H(i).vy),Q(a,`r`,1.8*H(u))}),K(e,a)}),z(e=>{a=X(i,0,`wake svelte-17jmwgz`,null,a,{sel:H(t).name===n().selected,ally:!H(t).owned}),Q(i,`points`,e),Q(i,`stroke-width`,1.4*H(u))},[()=>H(t).track.map(e=>{let t=$(e.x,e.y);return`${t.vx},${t.vy}`}).join(` `)]),K(e,r)}),K(e,t)};J(re,e=>{t.layers.tracks&&e(ie)});var ae=R(re),oe=e=>{var t=Nr();Y(L(t),17,()=>H(o).ships.filter(ua),e=>e.name,(e,t)=>{var r=Nr(),i=L(r),a=e=>{let r=M(()=>H(t).name===n().selected);var i=to(),a=L(i);let o;var s=R(a),c=e=>{var r=Nr();Y(L(r),17,()=>n().chains[H(t).name].slice(1),e=>e.t,(e,n)=>{let r=M(()=>$(H(n).x,H(n).y));var i=Ya();let a;z(()=>{a=X(i,0,`course-dot svelte-17jmwgz`,null,a,{ally:!H(t).owned}),Q(i,`cx`,H(r).vx),Q(i,`cy`,H(r).vy),Q(i,`r`,2.4*H(u))}),K(e,i)}),K(e,r)};J(s,e=>{H(r)||e(c)}),z(e=>{o=X(a,0,`course svelte-17jmwgz`,null,o,{sel:H(r),ally:!H(t).owned}),Q(a,`points`,e),Q(a,`stroke-width`,2*H(u))},[()=>b(n().chains[H(t).name])]),K(e,i)};J(i,e=>{n().chains[H(t).name]&&e(a)}),K(e,r)}),K(e,t)};J(ae,e=>{t.layers.paths&&e(oe)});var se=R(ae);Y(se,17,()=>H(o).ships,e=>e.name,(e,t)=>{let r=M(()=>$(H(t).x,H(t).y));var i=ao(),a=L(i);let o;var s=R(a);let c;var d=R(s),f=e=>{var t=no();z(()=>{Q(t,`cx`,H(r).vx),Q(t,`cy`,H(r).vy),Q(t,`r`,H(l).target*H(u))}),K(e,t)},p=e=>{var t=io();z(()=>{Q(t,`cx`,H(r).vx),Q(t,`cy`,H(r).vy),Q(t,`r`,H(l).ship*H(u))}),K(e,t)};J(d,e=>{n().aiming?e(f):H(t).owned&&e(p,1)}),z(e=>{o=X(a,0,`halo svelte-17jmwgz`,null,o,{own:H(t).owned,sel:H(t).name===n().selected}),Q(a,`cx`,H(r).vx),Q(a,`cy`,H(r).vy),Q(a,`r`,18*H(u)),Q(a,`stroke-width`,H(u)),c=X(s,0,`ship svelte-17jmwgz`,null,c,{own:H(t).owned}),Q(s,`points`,e)},[()=>Ha(H(t).category_name,H(r).vx,H(r).vy,H(t).heading,H(u))]),K(e,i)});var ce=R(se);Y(ce,17,()=>H(te),e=>e.key,(e,t)=>{var n=Nr(),r=L(n),i=e=>{var n=Ya();let r;z(()=>{r=X(n,0,`cone svelte-17jmwgz`,null,r,{cur:H(t).cur,other:!H(t).mine}),Q(n,`cx`,H(t).nv.vx),Q(n,`cy`,H(t).nv.vy),Q(n,`r`,H(t).r),Q(n,`stroke-width`,H(u))}),K(e,n)},a=e=>{var n=oo();let r;z(e=>{r=X(n,0,`cone svelte-17jmwgz`,null,r,{cur:H(t).cur,other:!H(t).mine}),Q(n,`stroke-width`,H(u)),Q(n,`d`,e)},[()=>w(H(t).nv.vx,H(t).nv.vy,H(t).heading,[H(t).dir-H(t).width/2,H(t).dir+H(t).width/2],H(t).r)]),K(e,n)};J(r,e=>{H(t).width>=360?e(i):e(a,-1)}),K(e,n)});var le=R(ce),ue=e=>{let t=M(()=>n().chain[n().selectedTick]),r=M(()=>$(H(t).x,H(t).y));var i=Nr();Y(L(i),17,()=>n().ship.weapons.filter(e=>e.firing_arc&&n().orderAt(n().selectedTick,e.name)),e=>e.name,(e,n)=>{var i=so();z(e=>Q(i,`d`,e),[()=>w(H(r).vx,H(r).vy,H(t).heading,H(n).firing_arc,44*H(u))]),K(e,i)}),K(e,i)};J(le,e=>{n().selectedTick&&n().ship&&n().chain?.[n().selectedTick]&&e(ue)});var E=R(le),de=e=>{var t=Nr();Y(L(t),17,()=>H(T),e=>e.key,(e,t)=>{var n=Nr(),r=L(n),i=e=>{var n=Nr(),r=L(n),i=e=>{let n=M(()=>$(H(t).target.x,H(t).target.y));var r=qa();let i;z(()=>{i=X(r,0,`shot-line svelte-17jmwgz`,null,i,{cur:H(t).cur,other:!H(t).mine}),Q(r,`x1`,H(t).nv.vx),Q(r,`y1`,H(t).nv.vy),Q(r,`x2`,H(n).vx),Q(r,`y2`,H(n).vy),Q(r,`stroke-width`,(H(t).cur?1.6:1.1)*H(u))}),K(e,r)};J(r,e=>{H(t).target&&e(i)}),K(e,n)},o=e=>{var n=fo(),r=L(n);let i;var o=R(r),s=e=>{var n=co();z(()=>{Q(n,`cx`,H(t).end[0]),Q(n,`cy`,H(t).end[1]),Q(n,`r`,H(l).shot*H(u))}),U(`pointerdown`,n,e=>j(H(t),e)),K(e,n)};J(o,e=>{H(t).mine&&a().shots&&e(s)});var c=R(o),d=e=>{var n=lo();z(()=>{Q(n,`cx`,H(t).end[0]),Q(n,`cy`,H(t).end[1]),Q(n,`r`,4.5*H(u)),Q(n,`stroke-width`,2*H(u))}),K(e,n)},f=e=>{var n=uo();let r;z(e=>{r=X(n,0,`shot-tip svelte-17jmwgz`,null,r,{other:!H(t).mine}),Q(n,`points`,e)},[()=>Ra(H(t).end[0],H(t).end[1],H(t).heading,4,H(u))]),K(e,n)};J(c,e=>{H(t).cur?e(d):e(f,-1)}),z(()=>{i=X(r,0,`shot svelte-17jmwgz`,null,i,{cur:H(t).cur,other:!H(t).mine}),Q(r,`x1`,H(t).nv.vx),Q(r,`y1`,H(t).nv.vy),Q(r,`x2`,H(t).end[0]),Q(r,`y2`,H(t).end[1]),Q(r,`stroke-width`,(H(t).cur?1.8:1.1)*H(u))}),K(e,n)};J(r,e=>{H(t).kind===`object_name`?e(i):e(o,-1)}),K(e,n)}),K(e,t)};J(E,e=>{t.layers.fire&&e(de)});var fe=R(E),pe=e=>{var t=Nr();Y(L(t),17,()=>n().chain.slice(1).reverse(),e=>e.t,(e,t)=>{let r=M(()=>$(H(t).x,H(t).y));var i=po(),o=L(i),s=e=>{var n=Ya();let i;z(()=>{i=X(n,0,`grab svelte-17jmwgz`,null,i,{"tap-only":!a().path}),Q(n,`cx`,H(r).vx),Q(n,`cy`,H(r).vy),Q(n,`r`,H(l).node*H(u))}),U(`pointerdown`,n,e=>Pe(H(t).t,e)),K(e,n)};J(o,e=>{n().editable&&(a().path||a().ticks)&&e(s)});var c=R(o);let d;z(()=>{d=X(c,0,`joint svelte-17jmwgz`,null,d,{limit:H(t).atLimit,cur:H(t).t===n().selectedTick}),Q(c,`cx`,H(r).vx),Q(c,`cy`,H(r).vy),Q(c,`r`,5*H(u)),Q(c,`stroke-width`,2*H(u))}),K(e,i)}),K(e,t)},me=M(()=>t.layers.paths&&n().chain&&n().ship&&ua(n().ship));J(fe,e=>{H(me)&&e(pe)}),K(e,r)};J(Ze,e=>{H(o)&&e(Qe)}),A(Ke),Di(Ke,e=>se=e,()=>se);var $e=R(Ke,2),et=I($e);Y(et,17,()=>H(ne),e=>e.key,(e,t)=>{var n=ho();Q(n,`font-size`,11);var r=I(n,!0);A(n),z(()=>{Q(n,`x`,H(t).x),Q(n,`y`,H(t).y),Q(n,`text-anchor`,H(t).mid?`middle`:`start`),q(r,H(t).text)}),K(e,n)});var tt=R(et),nt=e=>{var t=go(),n=L(t),i=R(n),a=R(i),o=R(a);Q(o,`font-size`,11);var s=I(o,!0);A(o),z(()=>{Q(n,`y1`,r().boxH-18),Q(n,`x2`,14+r().scaleBarPx),Q(n,`y2`,r().boxH-18),Q(i,`y1`,r().boxH-22),Q(i,`y2`,r().boxH-14),Q(a,`x1`,14+r().scaleBarPx),Q(a,`y1`,r().boxH-22),Q(a,`x2`,14+r().scaleBarPx),Q(a,`y2`,r().boxH-14),Q(o,`x`,14+r().scaleBarPx/2),Q(o,`y`,r().boxH-26),q(s,r().grid.step)}),K(e,t)};J(tt,e=>{t.layers.grid&&r().boxH&&e(nt)});var rt=R(tt),it=e=>{var t=_o();Q(t,`font-size`,11);var n=I(t);A(t),z((e,r)=>{Q(t,`x`,e),Q(t,`y`,r),q(n,`${H(we).x??``}, ${H(we).y??``}`)},[()=>Math.max(1,r().boxW)-12,()=>Math.max(1,r().boxH)-14]),K(e,t)};J(rt,e=>{H(we)&&e(it)});var at=R(rt);Y(at,17,()=>H(ie),e=>e.key,(e,t)=>{var n=vo();let r;Q(n,`font-size`,11);var i=I(n,!0),a=R(i),o=I(a,!0);A(a),A(n),z(()=>{r=X(n,0,`glyph svelte-17jmwgz`,null,r,{enemy:H(t).enemy}),Q(n,`x`,H(t).x),Q(n,`y`,H(t).y-7),q(i,H(t).letter),q(o,H(t).title)}),K(e,n)});var ot=R(at);Y(ot,17,()=>H(re),e=>e.key,(e,t)=>{var n=bo(),r=L(n),i=e=>{var n=yo();z(()=>{Q(n,`x1`,H(t).x),Q(n,`y1`,H(t).y),Q(n,`x2`,H(t).lx-2),Q(n,`y2`,H(t).ly-4)}),K(e,n)};J(r,e=>{H(t).moved&&e(i)});var a=R(r);Q(a,`font-size`,12.5);var o=I(a,!0);A(a),z(()=>{X(a,0,`label ${H(t).cls??``}`,`svelte-17jmwgz`),Q(a,`x`,H(t).lx),Q(a,`y`,H(t).ly),q(o,H(t).text)}),K(e,n)});var st=R(ot);Y(st,17,()=>H(ae),e=>e.key,(e,t)=>{var n=xo();Q(n,`font-size`,11);var r=I(n,!0);A(n),z(()=>{Q(n,`x`,H(t).x),Q(n,`y`,H(t).y),q(r,H(t).text)}),K(e,n)}),Y(R(st),17,()=>H(oe),e=>e.key,(e,t)=>{var n=So();let r;Q(n,`font-size`,11);var i=I(n,!0);A(n),z(()=>{r=X(n,0,`shot-label svelte-17jmwgz`,null,r,{cur:H(t).cur,other:!H(t).mine}),Q(n,`x`,H(t).x),Q(n,`y`,H(t).y),q(i,H(t).text)}),K(e,n)}),A($e);var ct=R($e,2),lt=e=>{var t=wo();Y(t,21,()=>H(Ae).hits,e=>e.name,(e,t)=>{var n=Co(),r=I(n,!0),i=R(r),a=I(i,!0);A(i),A(n),z(()=>{q(r,H(t).name),q(a,H(t).note)}),U(`click`,n,()=>k(H(t).name)),K(e,n)}),A(t),z(()=>si(t,`left: ${H(Ae).px??``}px; top: ${H(Ae).py??``}px; --row: ${H(O)??``}px;`)),K(e,t)};J(ct,e=>{H(Ae)&&e(lt)});var ut=R(ct,2),dt=e=>{var t=To(),n=I(t,!0);A(t),z(()=>q(n,H(D))),K(e,t)};J(ut,e=>{H(D)&&e(dt)}),Zr(R(ut,2),()=>t.children??d),A(Be),z(e=>{qe=X(Ke,0,`world svelte-17jmwgz`,null,qe,{aiming:n().aiming}),Q(Ke,`viewBox`,`${H(f).x} ${H(f).y} ${H(f).w} ${H(f).h}`),Q($e,`viewBox`,e)},[()=>`0 0 ${Math.max(1,r().boxW)} ${Math.max(1,r().boxH)}`]),Cr(`pointerdown`,Ke,Oe,!0),U(`pointerdown`,Ke,Ne),U(`pointermove`,Ke,Le),U(`pointerup`,Ke,Re),Cr(`pointercancel`,Ke,Re),Cr(`wheel`,Ke,ze),Cr(`pointerleave`,Ke,()=>F(we,null)),Ti(Be,`clientWidth`,e=>r().boxW=e),Ti(Be,`clientHeight`,e=>r().boxH=e),K(e,Be),Ge()}wr([`pointerdown`,`pointermove`,`pointerup`,`click`]);var Oo=W(`<span> <span class="pk svelte-13z1v14"> </span></span>`),ko=W(`<div class="comp svelte-13z1v14"><span class="cn svelte-13z1v14"> </span> <span class="cs svelte-13z1v14"></span></div>`),Ao=W(`<h2 class="svelte-13z1v14">Condition at Tick 0</h2> <div class="gauge svelte-13z1v14"><span class="gk svelte-13z1v14">Hull</span> <span class="gbar svelte-13z1v14"><i></i></span> <span class="gv svelte-13z1v14"> </span></div> <div class="gauge svelte-13z1v14"><span class="gk svelte-13z1v14">Battery</span> <span class="gbar svelte-13z1v14"><i class="power svelte-13z1v14"></i></span> <span class="gv svelte-13z1v14"> </span></div> <!>`,1),jo=W(`<p class="note svelte-13z1v14"> </p>`),Mo=W(`<span class="v svelte-13z1v14"><span class="q svelte-13z1v14"> </span> </span>`),No=W(`<span class="v svelte-13z1v14"> </span> <span class="v svelte-13z1v14"> </span> <!>`,1),Po=W(`<span class="who svelte-13z1v14"> </span>`),Fo=W(`<li><!> </li>`),Io=W(`<div class="tickrow svelte-13z1v14"><span class="t svelte-13z1v14"> </span> <!></div> <ul class="svelte-13z1v14"></ul>`,1),Lo=W(`<h2> </h2> <label class="all svelte-13z1v14"><input type="checkbox" class="svelte-13z1v14"/> all ships</label> <label class="all svelte-13z1v14"><input type="checkbox" class="svelte-13z1v14"/> every message</label> <!>`,1),Ro=W(`<!> <!>`,1);function zo(e,t){We(t,!0);let n=Oi(t,`parts`,3,`all`),r=P(!1),i=P(!1);function a(e,t){if(e===t)return e;if(/^\d+$/.test(e)&&/^\d+$/.test(t))return`${e}/${t}`;let n=e.match(/^(\d+)\s+(.+)$/),r=t.match(/^(\d+)\s+(.+)$/);return n&&r&&n[2]===r[2]?`${n[1]}/${r[1]} ${n[2]}`:e}let o=M(()=>{let e=t.planning.plan;if(!e)return[];let n=H(r)?e.ships:e.ships.filter(e=>e.name===t.planning.selected),a=new Map,o=e=>(a.has(e)||a.set(e,{tick:e,condition:null,events:[]}),a.get(e));for(let e of n){for(let t of e.events)(H(i)||t.kind!==`internal`)&&o(t.tick).events.push({ship:e.name,...t});if(!H(r))for(let t of e.conditions)o(t.tick).condition=t}return[...a.values()].sort((e,t)=>e.tick-t.tick)}),s=M(()=>t.planning.ship),c=e=>n()===`all`||n()===e;var l=Nr(),u=L(l),d=e=>{var l=Ro(),u=L(l),d=e=>{var t=Ao(),n=R(L(t),2),r=R(I(n),2),i=I(r);let o;A(r);var c=R(r,2),l=I(c);A(c),A(n);var u=R(n,2),d=R(I(u),2),f=I(d);A(d);var p=R(d,2),h=I(p);A(p),A(u),Y(R(u,2),17,()=>H(s).components,e=>e.name,(e,t)=>{var n=ko(),r=I(n),i=I(r,!0);A(r);var o=R(r,2);Y(o,21,()=>Object.entries(H(t).status),([e,t])=>e,(e,n)=>{var r=M(()=>m(H(n),2));let i=()=>H(r)[0],o=()=>H(r)[1];var s=Oo();let c;var l=I(s,!0),u=R(l),d=I(u,!0);A(u),A(s),z(e=>{c=X(s,1,`pair svelte-13z1v14`,null,c,{spent:o()!==H(t).full[i()]}),q(l,e),q(d,i())},[()=>a(o(),H(t).full[i()])]),K(e,s)}),A(o),A(n),z(()=>q(i,H(t).name)),K(e,n)}),z(()=>{si(i,`width: ${100*H(s).hull/H(s).max_hull}%`),o=X(i,1,`svelte-13z1v14`,null,o,{low:H(s).hull/H(s).max_hull<.34}),q(l,`${H(s).hull??``}/${H(s).max_hull??``}`),si(f,`width: ${100*H(s).battery/H(s).max_battery}%`),q(h,`${H(s).battery??``}/${H(s).max_battery??``}`)}),K(e,t)},f=M(()=>H(s)&&c(`condition`));J(u,e=>{H(f)&&e(d)});var p=R(u,2),h=e=>{var a=Lo(),c=L(a);let l;var u=I(c);A(c);var d=R(c,2),f=I(d);Z(f),j(),A(d);var p=R(d,2),h=I(p);Z(h),j(),A(p);var g=R(p,2),_=e=>{var n=jo(),r=I(n,!0);A(n),z(()=>q(r,t.planning.selected?`Nothing recorded.`:`Pick a ship to read its log.`)),K(e,n)},v=e=>{var t=Nr();Y(L(t),17,()=>H(o),e=>e.tick,(e,t)=>{var n=Io(),i=L(n),a=I(i),o=I(a,!0);A(a);var s=R(a,2),c=e=>{var n=No(),r=L(n),i=I(r);A(r);var a=R(r,2),o=I(a);A(a),Y(R(a,2),17,()=>Object.entries(H(t).condition.shields),([e,t])=>e,(e,t)=>{var n=M(()=>m(H(t),2));let r=()=>H(n)[0],i=()=>H(n)[1];var a=Mo(),o=I(a),s=I(o,!0);A(o);var c=R(o,1,!0);A(a),z(()=>{q(s,r()),q(c,i())}),K(e,a)}),z(()=>{q(i,`hull ${H(t).condition.hull??``}`),q(o,`bat ${H(t).condition.battery??``}`)}),K(e,n)};J(s,e=>{H(t).condition&&e(c)}),A(i);var l=R(i,2);Y(l,21,()=>H(t).events,Vr,(e,t)=>{var n=Fo(),i=I(n),a=e=>{var n=Po(),r=I(n,!0);A(n),z(()=>q(r,H(t).ship)),K(e,n)};J(i,e=>{H(r)&&e(a)});var o=R(i,1,!0);A(n),z(()=>{X(n,1,ei(H(t).kind),`svelte-13z1v14`),q(o,H(t).text)}),K(e,n)}),A(l),z(()=>q(o,H(t).tick)),K(e,n)}),K(e,t)};J(g,e=>{H(o).length?e(v,-1):e(_)}),z(()=>{l=X(c,1,`svelte-13z1v14`,null,l,{spaced:H(s)&&n()===`all`}),q(u,`Round ${t.planning.plan.round??``} · ${(H(r)?`faction`:t.planning.selected??`no ship`)??``}`)}),xi(f,()=>H(r),e=>F(r,e)),xi(h,()=>H(i),e=>F(i,e)),K(e,a)},g=M(()=>c(`log`));J(p,e=>{H(g)&&e(h)}),K(e,l)};J(u,e=>{t.planning.plan&&e(d)}),K(e,l),Ge()}var Bo=W(`<span> </span>`),Vo=W(`<tr><td class="t svelte-11q811x"><button type="button" class="tick-pick svelte-11q811x"> </button></td><td class="svelte-11q811x"><!></td><td class="svelte-11q811x"><!></td><td class="svelte-11q811x"> </td><td class="fire-cell svelte-11q811x"> </td></tr>`),Ho=W(`<table class="svelte-11q811x"><thead><tr><th class="t svelte-11q811x">Tick</th><th class="svelte-11q811x">Turn</th><th class="svelte-11q811x">Throttle</th><th class="svelte-11q811x">Speed</th><th class="svelte-11q811x">Orders</th></tr></thead><tbody class="svelte-11q811x"></tbody></table> <p class="limits-line svelte-11q811x"> </p>`,1);function Uo(e,t){We(t,!0);let n=Oi(t,`planning`,7),r=M(()=>n().ship),i=M(()=>n().shipOrders),a=M(()=>n().chain);var o=Nr(),s=L(o),c=e=>{var t=Ho(),o=L(t),s=R(I(o));Y(s,21,()=>H(a).slice(1),e=>e.t,(e,t)=>{let a=M(()=>[...Object.keys(H(i).fire[H(t).t]??{}),...Object.keys(H(i).comp[H(t).t]??{})]);var o=Vo();let s;var c=I(o),l=I(c),u=I(l,!0);A(l),A(c);var d=R(c),f=I(d),p=e=>{K(e,Mr(`·`))},m=e=>{var n=Bo();let a;var o=I(n);A(n),z((e,r)=>{a=X(n,1,`turn svelte-11q811x`,null,a,e),q(o,`${H(i).turn[H(t).t]>0?`R`:`L`}${r??``}`)},[()=>({pinned:Math.abs(H(i).turn[H(t).t])>=H(r).limits.max_turn}),()=>Math.abs(H(i).turn[H(t).t])]),K(e,n)};J(f,e=>{H(i).turn[H(t).t]?e(m,-1):e(p)}),A(d);var h=R(d),g=I(h),_=e=>{K(e,Mr(`·`))},v=e=>{var n=Bo();let a;var o=I(n);A(n),z(e=>{a=X(n,1,`accel svelte-11q811x`,null,a,e),q(o,`A${H(i).accel[H(t).t]>0?`+`:``}${H(i).accel[H(t).t]??``}`)},[()=>({pinned:Math.abs(H(i).accel[H(t).t])>=H(r).limits.max_delta_v})]),K(e,n)};J(g,e=>{H(i).accel[H(t).t]?e(v,-1):e(_)}),A(h);var y=R(h),b=I(y,!0);A(y);var x=R(y),S=I(x,!0);A(x),A(o),z(e=>{s=X(o,1,`svelte-11q811x`,null,s,{idle:!H(i).turn[H(t).t]&&!H(i).accel[H(t).t]&&!H(a).length,cur:H(t).t===n().selectedTick}),q(u,H(t).t),q(b,H(t).speed),q(S,e)},[()=>H(a).length?H(a).join(`,`):`·`]),U(`click`,o,()=>n().selectedTick=H(t).t),U(`click`,l,()=>n().selectedTick=H(t).t),K(e,o)}),A(s),A(o);var c=R(o,2),l=I(c);A(c),z(()=>q(l,`limits: ${H(r).limits.max_turn??``}° turn · Δv ${H(r).limits.max_delta_v??``} ·
+\r\f\xA0\v﻿`];function ni(e,t,n){var r=e==null?``:``+e;if(t&&(r=r?r+` `+t:t),n){for(var i of Object.keys(n))if(n[i])r=r?r+` `+i:i;else if(r.length)for(var a=i.length,o=0;(o=r.indexOf(i,o))>=0;){var s=o+a;(o===0||ti.includes(r[o-1]))&&(s===r.length||ti.includes(r[s]))?r=(o===0?``:r.substring(0,o))+r.substring(s+1):o=s}}return r===``?null:r}function ri(e,t=!1){var n=t?` !important;`:`;`,r=``;for(var i of Object.keys(e)){var a=e[i];a!=null&&a!==``&&(r+=` `+i+`: `+a+n)}return r}function ii(e){return e[0]!==`-`||e[1]!==`-`?e.toLowerCase():e}function ai(e,t){if(t){var n=``,r,i;if(Array.isArray(t)?(r=t[0],i=t[1]):r=t,e){e=String(e).replaceAll(/\s*\/\*.*?\*\/\s*/g,``).trim();var a=!1,o=0,s=!1,c=[];r&&c.push(...Object.keys(r).map(ii)),i&&c.push(...Object.keys(i).map(ii));var l=0,u=-1;let t=e.length;for(var d=0;d<t;d++){var f=e[d];if(s?f===`/`&&e[d-1]===`*`&&(s=!1):a?a===f&&(a=!1):f===`/`&&e[d+1]===`*`?s=!0:f===`"`||f===`'`?a=f:f===`(`?o++:f===`)`&&o--,!s&&a===!1&&o===0){if(f===`:`&&u===-1)u=d;else if(f===`;`||d===t-1){if(u!==-1){var p=ii(e.substring(l,u).trim());if(!c.includes(p)){f!==`;`&&d++;var m=e.substring(l,d).trim();n+=` `+m+`;`}}l=d+1,u=-1}}}}return r&&(n+=ri(r)),i&&(n+=ri(i,!0)),n=n.trim(),n===``?null:n}return e==null?null:String(e)}function X(e,t,n,r,i,a){var o=e[ce];if(O||o!==n||o===void 0){var s=ni(n,r,a);(!O||s!==e.getAttribute(`class`))&&(s==null?e.removeAttribute(`class`):t?e.className=s:e.setAttribute(`class`,s)),e[ce]=n}else if(a&&i!==a)for(var c in a){var l=!!a[c];(i==null||l!==!!i[c])&&e.classList.toggle(c,l)}return a}function oi(e,t={},n,r){for(var i in n){var a=n[i];t[i]!==a&&(n[i]==null?e.style.removeProperty(i):e.style.setProperty(i,a,r))}}function si(e,t,n,r){var i=e[le];if(O||i!==t){var a=ai(t,r);(!O||a!==e.getAttribute(`style`))&&(a==null?e.removeAttribute(`style`):e.style.cssText=a),e[le]=t}else r&&(Array.isArray(r)?(oi(e,n?.[0],r[0]),oi(e,n?.[1],r[1],`important`)):oi(e,n,r));return r}function ci(t,n,r=!1){if(t.multiple){if(n==null)return;if(!e(n))return Ae();for(var i of t.options)i.selected=n.includes(di(i));return}for(i of t.options)if(on(di(i),n)){i.selected=!0;return}(!r||n!==void 0)&&(t.selectedIndex=-1)}function li(e){var t=new MutationObserver(()=>{`__value`in e&&ci(e,e.__value)});t.observe(e,{childList:!0,subtree:!0,attributes:!0,attributeFilter:[`value`]}),Cn(()=>{t.disconnect()})}function ui(e,t,n=t){var r=new WeakSet,i=!0;ut(e,`change`,t=>{var i=t?`[selected]`:`:checked`,a;if(e.multiple)a=[].map.call(e.querySelectorAll(i),di);else{var o=e.querySelector(i)??e.querySelector(`option:not([disabled])`);a=o&&di(o)}n(a),e.__value=a,N!==null&&r.add(N)}),Dn(()=>{var a=t();if(e===document.activeElement){var o=N;if(r.has(o))return}if(ci(e,a,i),i&&a===void 0){var s=e.querySelector(`:checked`);s!==null&&(a=di(s),n(a))}e.__value=a,i=!1}),li(e)}function di(e){return`__value`in e?e.__value:e.value}var fi=Symbol(`is custom element`),pi=Symbol(`is html`),mi=fe?`link`:`LINK`,hi=fe?`progress`:`PROGRESS`;function Z(e){if(O){var t=!1,n=()=>{if(!t){if(t=!0,e.hasAttribute(`value`)){var n=e.value;Q(e,`value`,null),e.value=n}if(e.hasAttribute(`checked`)){var r=e.checked;Q(e,`checked`,null),e.checked=r}}};e[E]=n,Ye(n),ct()}}function gi(e,t){var n=_i(e);n.value===(n.value=t??void 0)||e.value===t&&(t!==0||e.nodeName!==hi)||(e.value=t??``)}function Q(e,t,n,r){var i=_i(e);O&&(i[t]=e.getAttribute(t),t===`src`||t===`srcset`||t===`href`&&e.nodeName===mi)||i[t]!==(i[t]=n)&&(t===`loading`&&(e[oe]=n),n==null?e.removeAttribute(t):typeof n!=`string`&&yi(e).includes(t)?e[t]=n:e.setAttribute(t,n))}function _i(e){return e[se]??={[fi]:e.nodeName.includes(`-`),[pi]:e.namespaceURI===Te}}var vi=new Map;function yi(e){var t=e.getAttribute(`is`)||e.nodeName,n=vi.get(t);if(n)return n;vi.set(t,n=[]);for(var r,i=e,a=Element.prototype;a!==i;){for(var s in r=o(i),r)r[s].set&&s!==`innerHTML`&&s!==`textContent`&&s!==`innerText`&&n.push(s);i=l(i)}return n}function bi(e,t,n=t){var r=new WeakSet;ut(e,`input`,async i=>{var a=i?e.defaultValue:e.value;if(a=Si(e)?Ci(a):a,n(a),N!==null&&r.add(N),await pr(),a!==(a=t())){var o=e.selectionStart,s=e.selectionEnd,c=e.value.length;if(e.value=a??``,s!==null){var l=e.value.length;o===s&&s===c&&l>c?(e.selectionStart=l,e.selectionEnd=l):(e.selectionStart=o,e.selectionEnd=Math.min(s,l))}}}),(O&&e.defaultValue!==e.value||gr(t)==null&&e.value)&&(n(Si(e)?Ci(e.value):e.value),N!==null&&r.add(N)),kn(()=>{var n=t();if(e===document.activeElement){var i=N;if(r.has(i))return}Si(e)&&n===Ci(e.value)||e.type===`date`&&!n&&!e.value||n!==e.value&&(e.value=n??``)})}function xi(e,t,n=t){ut(e,`change`,t=>{n(t?e.defaultChecked:e.checked)}),(O&&e.defaultChecked!==e.checked||gr(t)==null)&&n(e.checked),kn(()=>{e.checked=!!t()})}function Si(e){var t=e.type;return t===`number`||t===`range`}function Ci(e){return e===``?null:+e}var wi=new class e{#e=new WeakMap;#t;#n;static entries=new WeakMap;constructor(e){this.#n=e}observe(e,t){var n=this.#e.get(e)||new Set;return n.add(t),this.#e.set(e,n),this.#r().observe(e,this.#n),()=>{var n=this.#e.get(e);n.delete(t),n.size===0&&(this.#e.delete(e),this.#t.unobserve(e))}}#r(){return this.#t??=new ResizeObserver(t=>{for(var n of t){e.entries.set(n.target,n);for(var r of this.#e.get(n.target)||[])r(n)}})}}({box:`border-box`});function Ti(e,t,n){var r=wi.observe(e,()=>n(e[t]));Dn(()=>(gr(()=>n(e[t])),r))}function Ei(e,t){return e===t||e?.[ie]===t}function Di(e={},t,n,r){var i=He.r,a=V;return Dn(()=>{var o,s;return kn(()=>{o=s,s=r?.()||[],gr(()=>{Ei(n(...s),e)||(t(e,...s),o&&Ei(n(...o),e)&&t(null,...o))})}),()=>{let r=a;for(;r!==i&&r.parent!==null&&r.parent.f&33554432;)r=r.parent;let o=()=>{s&&Ei(n(...s),e)&&t(null,...s)},c=r.teardown;r.teardown=()=>{o(),c?.()}}}),e}function Oi(e,t,n,r){var i=!Be||(n&2)!=0,o=(n&8)!=0,s=(n&16)!=0,c=r,l=!0,u=void 0,d=()=>s&&i?(u??=yt(r),H(u)):(l&&(l=!1,c=s?gr(r):r),c);let f;if(o){var p=ie in e||ae in e;f=a(e,t)?.set??(p&&t in e?n=>e[t]=n:void 0)}var m,h=!1;o?[m,h]=at(()=>e[t]):m=e[t],m===void 0&&r!==void 0&&(m=d(),f&&(i&&ye(t),f(m)));var g=i?()=>{var n=e[t];return n===void 0?d():(l=!0,n)}:()=>{var n=e[t];return n!==void 0&&(c=void 0),n===void 0?c:n};if(i&&!(n&4))return g;if(f){var _=e.$$legacy;return(function(e,t){return arguments.length>0?((!i||!t||_||h)&&f(t?g():e),e):g()})}var v=!1,y=(n&1?yt:St)(()=>(v=!1,g()));o&&H(y);var b=V;return(function(e,t){if(arguments.length>0){let n=t?H(y):i&&o?rn(e):e;return F(y,n),v=!0,c!==void 0&&(c=n),e}return Gn&&v||b.f&16384?y.v:H(y)})}typeof window<`u`&&((window.__svelte??={}).v??=new Set).add(`5`);var ki=(e,t=d,n=d,r=d,i=d)=>{var a=Ai();let o;var s=I(a);let c;var l=R(s,2),u=I(l,!0);A(l),A(a),z(()=>{o=X(a,1,`st svelte-75r00e`,null,o,{ok:t(),out:n()}),c=X(s,1,`dot svelte-75r00e`,null,c,{filled:t()&&!n(),none:n()}),q(u,n()?`—`:t()?r():i())}),K(e,a)},Ai=W(`<span><span></span> <span class="long svelte-75r00e"> </span></span>`),ji=W(`<b class="won svelte-75r00e"> </b> `,1),Mi=W(`<span class="meta next svelte-75r00e"><!></span>`),Ni=W(` <span class="soon svelte-75r00e"> </span>`,1),Pi=W(`<span class="meta next svelte-75r00e"><!></span> <span class="meta gauge svelte-75r00e"><span class="lbl svelte-75r00e">saved</span> <span class="bar svelte-75r00e"><i class="svelte-75r00e"></i></span> <span class="cnt svelte-75r00e"> </span></span> <span class="meta gauge svelte-75r00e"><span class="lbl svelte-75r00e">ready</span> <span class="bar ready svelte-75r00e"><i class="svelte-75r00e"></i></span> <span class="cnt svelte-75r00e"> </span></span>`,1),Fi=W(`<div class="opened svelte-75r00e"><!></div>`),Ii=W(`<li><button type="button"><span class="head svelte-75r00e"><span class="nm svelte-75r00e"> </span> <span class="rnd svelte-75r00e"><!></span></span> <!></button> <!></li>`),Li=W(`<p class="msg quiet svelte-75r00e"> </p>`),Ri=W(`<button type="button" class="ship svelte-75r00e"><span> </span> <span class="ty svelte-75r00e"> </span> <span class="pl svelte-75r00e"> </span> <span class="sc svelte-75r00e"> </span> <!> <!></button>`),zi=W(`<li class="shiprow svelte-75r00e"><span> </span> <span class="ty svelte-75r00e"> </span> <span class="sc svelte-75r00e"> </span></li>`),Bi=W(`<div class="commander svelte-75r00e"><button type="button" class="ship fleet svelte-75r00e"><span class="nm svelte-75r00e"> </span> <span class="pl svelte-75r00e"> </span> <span class="sc svelte-75r00e"> </span> <!> <!></button> <ul class="ships svelte-75r00e"></ul></div>`),Vi=W(`<div class="faction svelte-75r00e"><div class="fhead svelte-75r00e"><span class="rank svelte-75r00e"> </span> <span class="fname svelte-75r00e"> </span> <span class="fscore svelte-75r00e"> </span> <span class="st head svelte-75r00e" title="orders saved"><span class="long svelte-75r00e">saved</span><span class="short svelte-75r00e">S</span></span> <span class="st head svelte-75r00e" title="said ready"><span class="long svelte-75r00e">ready</span><span class="short svelte-75r00e">R</span></span></div> <!></div>`),Hi=W(`<button type="button" class="replay svelte-75r00e">▶ Replay tick by tick</button> <!>`,1),Ui=W(`<p class="msg svelte-75r00e">Loading games…</p>`),Wi=W(`<p class="msg err svelte-75r00e"> </p>`),Gi=W(`<h2 class="svelte-75r00e">My solo game</h2> <ul class="svelte-75r00e"><li class="solo svelte-75r00e"><button type="button" class="pick svelte-75r00e"><span class="head svelte-75r00e"><span class="nm svelte-75r00e"> </span> <span class="rnd svelte-75r00e"> </span></span> <span class="meta next svelte-75r00e">no deadline · say you are ready and the round runs</span></button> <button type="button" class="corner svelte-75r00e">Replay ›</button></li></ul>`,1),Ki=W(`, or <button type="button" class="link svelte-75r00e">start a solo game</button> of your own`,1),qi=W(`<p class="msg quiet svelte-75r00e">No games yet. The director will add you to one<!>.</p>`),Ji=W(`<p class="msg quiet svelte-75r00e">Nothing being played right now.</p>`),Yi=W(`<h2 class="later svelte-75r00e">Finished</h2> <ul class="svelte-75r00e"></ul>`,1),Xi=W(`<p class="msg quiet svelte-75r00e">Pick a game first.</p>`),Zi=W(`<section class="detail svelte-75r00e"><h2 class="svelte-75r00e"><!></h2> <!></section>`),Qi=W(`<div class="cols svelte-75r00e"><section class="games svelte-75r00e"><!> <h2>Active</h2> <!> <ul class="svelte-75r00e"></ul> <!></section> <!></div>`),$i=W(`<div class="screen svelte-75r00e"><!></div>`);function ea(e,t){We(t,!0);let n=(e,t=d)=>{var n=Ii(),i=I(n);let a;var o=I(i),s=I(o),c=I(s,!0);A(s);var l=R(s,2),f=I(l),p=e=>{var n=Mr();z(()=>q(n,`${t().current_round-1} rounds`)),K(e,n)},m=e=>{var n=Mr();z(()=>q(n,`Round ${t().standing.round_nr??``}`)),K(e,n)};J(f,e=>{t().state===`finished`?e(p):e(m,-1)}),A(l),A(o);var h=R(o,2),y=e=>{var n=Mi(),r=I(n),i=e=>{var n=ji(),r=L(n),i=I(r,!0);A(r);var a=R(r);z(()=>{q(i,t().outcome.faction),q(a,` · ${t().outcome.reason??``}`)}),K(e,n)},a=e=>{K(e,Mr(`over · nothing left to plan`))};J(r,e=>{t().outcome?e(i):e(a,-1)}),A(n),K(e,n)},x=e=>{var n=Pi(),r=L(n),i=I(r),a=e=>{var n=Ni(),r=L(n),i=R(r),a=I(i,!0);A(i),z((e,t)=>{q(r,`next ${e??``} · `),q(a,t)},[()=>_(t().next_processing),()=>v(t().next_processing)]),K(e,n)},o=e=>{K(e,Mr(`no deadline, the director runs it`))};J(i,e=>{t().next_processing?e(a):e(o,-1)}),A(r);var s=R(r,2),c=R(I(s),2),l=I(c);A(c);var u=R(c,2),d=I(u);A(u),A(s);var f=R(s,2),p=R(I(f),2),m=I(p);A(p);var h=R(p,2),g=I(h);A(h),A(f),z((e,n)=>{si(l,`width: ${e??``}%`),q(d,`${t().standing.players_saved??``}/${t().standing.players??``}`),si(m,`width: ${n??``}%`),q(g,`${t().standing.players_ready??``}/${t().standing.players??``}`)},[()=>b(t().standing.players_saved,t().standing.players),()=>b(t().standing.players_ready,t().standing.players)]),K(e,n)};J(h,e=>{t().state===`finished`?e(y):e(x,-1)}),A(i);var C=R(i,2),w=e=>{var t=Fi(),n=I(t);r(n),A(t),K(e,t)};J(C,e=>{H(g)&&t().name===H(u)&&e(w)}),A(n),z(()=>{a=X(i,1,`pick svelte-75r00e`,null,a,{on:t().name===H(u)}),q(c,t().display)}),U(`click`,i,()=>S(t().name)),K(e,n)},r=e=>{var n=Nr(),r=L(n),i=e=>{var t=Li(),n=I(t);A(t),z(()=>q(n,`Loading ${H(u)??``}…`)),K(e,t)},a=e=>{var t=Li(),n=I(t);A(t),z(()=>q(n,`Nothing to show for ${H(u)??``}.`)),K(e,t)},s=e=>{var n=Hi(),r=L(n);Y(R(r,2),19,()=>H(o).factions,e=>e.name,(e,n,r)=>{var i=Vi(),a=I(i),o=I(a),s=I(o,!0);A(o);var c=R(o,2),l=I(c);A(c);var d=R(c,2),f=I(d,!0);A(d),j(4),A(a),Y(R(a,2),17,()=>y(H(n)),e=>e.player??`unassigned`,(e,n)=>{var r=Nr(),i=L(r),a=e=>{let r=M(()=>H(n).ships[0]);var i=Ri(),a=I(i);let o;var s=I(a,!0);A(a);var c=R(a,2),l=I(c,!0);A(c);var d=R(c,2),f=I(d,!0);A(d);var p=R(d,2),m=I(p,!0);A(p);var h=R(p,2);ki(h,()=>H(n).saved,()=>H(n).lost,()=>`saved`,()=>`waiting`),ki(R(h,2),()=>H(n).ready,()=>H(n).lost,()=>`ready`,()=>`not yet`),A(i),z((e,t)=>{i.disabled=e,Q(i,`title`,t),o=X(a,1,`nm svelte-75r00e`,null,o,{gone:!H(r).alive}),q(s,H(r).name),q(l,H(r).ship_type),q(f,H(n).player??`—`),q(m,H(r).score)},[()=>!x(H(n).player),()=>x(H(n).player)?`Open ${H(n).player}'s view`:`Not yours to open`]),U(`click`,i,()=>t.onPick(H(u),H(n).player)),K(e,i)},o=e=>{var r=Bi(),i=I(r),a=I(i),o=I(a,!0);A(a);var s=R(a,2),c=I(s,!0);A(s);var l=R(s,2),d=I(l,!0);A(l);var f=R(l,2);ki(f,()=>H(n).saved,()=>H(n).lost,()=>`saved`,()=>`waiting`),ki(R(f,2),()=>H(n).ready,()=>H(n).lost,()=>`ready`,()=>`not yet`),A(i);var p=R(i,2);Y(p,21,()=>H(n).ships,e=>e.name,(e,t)=>{var n=zi(),r=I(n);let i;var a=I(r,!0);A(r);var o=R(r,2),s=I(o,!0);A(o);var c=R(o,2),l=I(c,!0);A(c),A(n),z(()=>{i=X(r,1,`nm svelte-75r00e`,null,i,{gone:!H(t).alive}),q(a,H(t).name),q(s,H(t).ship_type),q(l,H(t).score)}),K(e,n)}),A(p),A(r),z((e,t,r)=>{i.disabled=e,Q(i,`title`,t),q(o,r),q(c,H(n).player??`unassigned`),q(d,H(n).score)},[()=>!x(H(n).player),()=>x(H(n).player)?`Open ${H(n).player}'s view and plan all ${H(n).ships.length} of their ships`:`Not yours to open`,()=>H(n).ships.map(e=>e.name).join(`, `)]),U(`click`,i,()=>t.onPick(H(u),H(n).player)),K(e,r)};J(i,e=>{H(n).ships.length===1?e(a):e(o,-1)}),K(e,r)}),A(i),z(()=>{q(s,H(r)+1),q(l,`Faction ${H(n).name??``}`),q(f,H(n).score)}),K(e,i)}),U(`click`,r,()=>t.onReplay(H(u))),K(e,n)};J(r,e=>{H(p)?e(i):H(o)?e(s,-1):e(a,1)}),K(e,n)},i=P(rn([])),a=P(null),o=P(null),s=M(()=>t.directing?H(i):H(i).filter(e=>t.me.games.includes(e.name))),c=M(()=>H(s).filter(e=>e.state===`active`)),l=M(()=>H(s).filter(e=>e.state===`finished`)),u=P(null),f=P(!0),p=P(!1),m=P(null),h=matchMedia(`(max-width: 820px)`),g=P(rn(h.matches));wn(()=>{let e=e=>F(g,e.matches,!0);return h.addEventListener(`change`,e),()=>h.removeEventListener(`change`,e)});function _(e){let n=new Date(e),r=new Date(t.nowMs+t.skew).toDateString()===n.toDateString(),i=n.toLocaleTimeString([],{hour:`2-digit`,minute:`2-digit`});return r?i:`${n.toLocaleDateString([],{weekday:`short`})} ${i}`}function v(e){let n=Math.round((Date.parse(e)-(t.nowMs+t.skew))/6e4);if(n<=0)return`due now`;if(n<60)return`in ${n} min`;let r=Math.floor(n/60);return n%60?`in ${r}h ${n%60}m`:`in ${r}h`}wn(()=>{(async()=>{let e=await fetch(`/api/game/solo`);e.ok&&F(a,await e.json(),!0)})()}),wn(()=>{(async()=>{try{let e=await fetch(`/api/game/games`);if(!e.ok)throw Error(`API returned ${e.status}`);F(i,(await e.json()).filter(e=>e.current_round>0&&(e.standing||e.state===`finished`)),!0)}catch(e){F(m,String(e),!0)}finally{F(f,!1)}})()});function y(e){let t=new Map;for(let n of e.ships){let e=n.player??``;t.has(e)||t.set(e,[]),t.get(e).push(n)}return[...t.entries()].map(([e,t])=>({player:e||null,ships:t,score:t.reduce((e,t)=>e+t.score,0),saved:t.every(e=>!e.alive||e.orders_in),ready:t[0].player_ready,lost:t.every(e=>!e.alive)})).sort((e,t)=>t.score-e.score||(e.player??``).localeCompare(t.player??``))}let b=(e,t)=>t?Math.round(100*e/t):0,x=e=>!!e&&(t.directing||e===t.me.name);wn(()=>{!t.directing&&H(u)&&!t.me.games.includes(H(u))&&(F(u,null),F(o,null))});async function S(e){if(F(o,null),H(u)===e){F(u,null);return}F(u,e,!0),F(p,!0);try{let t=await fetch(`/api/game/${e}/overview`);F(o,t.ok?await t.json():null,!0)}finally{F(p,!1)}}var C=$i(),w=I(C),ee=e=>{K(e,Ui())},T=e=>{var t=Wi(),n=I(t);A(t),z(()=>q(n,`Couldn't reach the API: ${H(m)??``}`)),K(e,t)},te=e=>{var i=Qi(),d=I(i),f=I(d),p=e=>{var n=Gi(),r=R(L(n),2),i=I(r),o=I(i),s=I(o),c=I(s),l=I(c,!0);A(c);var u=R(c,2),d=I(u);A(u),A(s),j(2),A(o);var f=R(o,2);A(i),A(r),z(()=>{q(l,H(a).game.display),q(d,`Round ${H(a).game.current_round??``}`)}),U(`click`,o,()=>t.onPick(H(a).game.name,t.me.name)),U(`click`,f,()=>t.onReplay(H(a).game.name)),K(e,n)};J(f,e=>{H(a)?.game&&e(p)});var m=R(f,2);let h;var _=R(m,2),v=e=>{var n=qi(),r=R(I(n)),i=e=>{var n=Ki(),r=R(L(n));j(),U(`click`,r,()=>t.onPage(`solo`)),K(e,n)};J(r,e=>{H(a)?.game||e(i)}),j(),A(n),K(e,n)},y=e=>{K(e,Ji())};J(_,e=>{H(s).length?H(c).length||e(y,1):e(v)});var b=R(_,2);Y(b,21,()=>H(c),e=>e.name,(e,t)=>{n(e,()=>H(t))}),A(b);var x=R(b,2),S=e=>{var t=Yi(),r=R(L(t),2);Y(r,21,()=>H(l),e=>e.name,(e,t)=>{n(e,()=>H(t))}),A(r),K(e,t)};J(x,e=>{H(l).length&&e(S)}),A(d);var C=R(d,2),w=e=>{var t=Zi(),n=I(t),i=I(n),a=e=>{K(e,Mr(`Factions`))},s=e=>{var t=Mr();z(()=>q(t,`${H(u)??``} · final standing`)),K(e,t)},c=e=>{var t=Mr();z(()=>q(t,`${H(u)??``} · planning round ${(H(o)?.last_round??0)+1}, best first`)),K(e,t)};J(i,e=>{H(u)?H(o)?.state===`finished`?e(s,1):e(c,-1):e(a)}),A(n);var l=R(n,2),d=e=>{K(e,Xi())},f=e=>{r(e)};J(l,e=>{H(u)?e(f,-1):e(d)}),A(t),K(e,t)};J(C,e=>{H(g)||e(w)}),A(i),z(()=>h=X(m,1,`svelte-75r00e`,null,h,{later:H(a)?.game})),K(e,i)};J(w,e=>{H(f)?e(ee):H(m)?e(T,1):e(te,-1)}),A(C),K(e,C),Ge()}wr([`click`]);var ta=[`forEach`,`isDisjointFrom`,`isSubsetOf`,`isSupersetOf`],na=[`difference`,`intersection`,`symmetricDifference`,`union`],ra=!1,ia=class e extends Set{#e=new Map;#t=P(0);#n=P(0);#r=ir||-1;constructor(e){if(super(),e){for(var t of e)super.add(t);this.#n.v=super.size}ra||this.#a()}#i(e){return ir===this.#r?P(e):Zt(e)}#a(){ra=!0;var t=e.prototype,n=Set.prototype;for(let e of ta)t[e]=function(...t){return H(this.#t),n[e].apply(this,t)};for(let r of na)t[r]=function(...t){H(this.#t);var i=n[r].apply(this,t);return new e(i)}}has(e){var t=super.has(e),n=this.#e,r=n.get(e);if(r===void 0){if(!t)return H(this.#t),!1;r=this.#i(!0),n.set(e,r)}return H(r),t}add(e){return super.has(e)||(super.add(e),F(this.#n,super.size),tn(this.#t)),this}delete(e){var t=super.delete(e),n=this.#e,r=n.get(e);return r!==void 0&&(n.delete(e),F(r,!1)),t&&(F(this.#n,super.size),tn(this.#t)),t}clear(){if(super.size!==0){super.clear();var e=this.#e;for(var t of e.values())F(t,!1);e.clear(),F(this.#n,0),tn(this.#t)}}keys(){return this.values()}values(){return H(this.#t),super.values()}entries(){return H(this.#t),super.entries()}[Symbol.iterator](){return this.keys()}get size(){return H(this.#n)}},aa=(e,t,n)=>Math.max(t,Math.min(n,e)),oa=e=>e*Math.PI/180,sa=e=>((e+180)%360+360)%360-180,$=(e,t)=>({vx:e,vy:-t}),ca=new Set([`Ship`,`Starbase`,`Beacon`]),la=new Set([`Terrain`]),ua=e=>e.category_name===`Ship`&&e.alive,da=/^\s*(\d+)\s*:\s*([RLA])\s*(-?\d+)\s*$/i,fa=/^\s*(\d+)\s*:\s*(?:F|FIRE|SCAN|REP|REPLENISH)\s+(\S+)\s*(.*)$/i,pa=/^\s*(\d+)\s*:\s*([A-Za-z]+)\s+(\S+)\s*(.*)$/,ma={defense:`Boost`,ecm:`Power`},ha=e=>e.components.filter(e=>ma[e.group]&&e.inputs.length);function ga(e,t){let n=Array(11).fill(0),r=Array(11).fill(0),i={},a={},o=[],s=new Set(ha(t).map(e=>e.name)),c=new Set(t.weapons.map(e=>e.name));for(let t of e){let e=t.trim();if(!e)continue;let l=e.match(da);if(l&&Number(l[1])>=1&&Number(l[1])<=10){let e=Number(l[1]),t=l[2].toUpperCase(),i=Number(l[3]);t===`A`?r[e]=i:n[e]=t===`R`?i:-i;continue}let u=e.match(fa);if(u&&Number(u[1])>=1&&Number(u[1])<=10){if(!c.has(u[2]))continue;let e=Number(u[1]);i[e]||(i[e]={}),i[e][u[2]]=u[3].split(/\s+/).filter(Boolean);continue}let d=e.match(pa);if(d&&Number(d[1])>=1&&Number(d[1])<=10&&s.has(d[3])){let e=Number(d[1]);a[e]||(a[e]={}),a[e][d[3]]={verb:d[2],params:d[4].split(/\s+/).filter(Boolean)};continue}o.push(e)}return{turn:n,accel:r,fire:i,comp:a,other:o}}function _a(e){let t=[];for(let n=1;n<=10;n++){e.turn[n]&&t.push([n,`${n}: ${e.turn[n]>0?`R`:`L`}${Math.abs(e.turn[n])}`]),e.accel[n]&&t.push([n,`${n}: A${e.accel[n]}`]);for(let[r,i]of Object.entries(e.fire[n]??{}))t.push([n,`${n}: Fire ${r} ${i.join(` `)}`.trim()]);for(let[r,i]of Object.entries(e.comp[n]??{}))t.push([n,`${n}: ${i.verb} ${r} ${i.params.join(` `)}`.trim()])}for(let n of e.other){let e=n.match(/^\s*(\d+)\s*:/);t.push([e?Number(e[1]):11,n])}return t.sort((e,t)=>e[0]-t[0]).map(e=>e[1])}function va(e,t){let n=[{t:0,x:e.x,y:e.y,heading:e.heading,speed:e.speed,atLimit:!1}],r=e.heading,i=e.speed,a=e.x,o=e.y;for(let s=1;s<=10;s++)r+=t.turn[s],i=aa(i+t.accel[s],-e.limits.max_speed,e.limits.max_speed),a+=Math.sin(oa(r))*i,o+=Math.cos(oa(r))*i,n.push({t:s,x:a,y:o,heading:r,speed:i,atLimit:Math.abs(t.turn[s])>=e.limits.max_turn||Math.abs(t.accel[s])>=e.limits.max_delta_v||Math.abs(i)>=e.limits.max_speed});return n}function ya(e,t){let n=[];for(let t of e.ships)n.push($(t.x,t.y));for(let t of e.ships)for(let e of t.track)n.push($(e.x,e.y));for(let t of e.contacts)for(let e of t.track)n.push($(e.x,e.y));for(let e of Object.values(t))for(let t of e)n.push($(t.x,t.y));return n}var ba=e=>e.inputs.findIndex(e=>e.kind===`direction`);function xa(e){if(!e.firing_arc)return[-180,180];let[t,n]=e.firing_arc;return t>n?[t-360,n]:[t,n]}function Sa(e,t){let[n,r]=xa(e),i=(n+r)/2,a=t-360*Math.round((t-i)/360);return Math.round(Math.min(r,Math.max(n,a)))}function Ca(e){let[t,n]=xa(e);return Math.round((t+n)/2)}var wa=(e,t)=>e.inputs.some(e=>e.kind===`object_name`&&(!e.choices||e.choices.some(e=>t.has(e)))),Ta=e=>e.inputs.map(t=>t.choices?t.choices[0]??``:t.kind===`direction`?String(Ca(e)):String(Math.round(t.max??0))),Ea=e=>e.inputs.length>1&&e.inputs[1].kind===`number_in_range`?e.inputs[1]:null;function Da(e,t){return 7*(1+2*aa((e.max-t)/(e.max-e.min),0,1))}function Oa(e,t){let n=aa((t-7)/14,0,1);return Math.round((e.max-n*(e.max-e.min))/5)*5}var ka=class{#e=P(null);get plan(){return H(this.#e)}set plan(e){F(this.#e,e,!0)}#t=P(!0);get loading(){return H(this.#t)}set loading(e){F(this.#t,e,!0)}#n=P(null);get error(){return H(this.#n)}set error(e){F(this.#n,e,!0)}#r=P(rn({}));get orders(){return H(this.#r)}set orders(e){F(this.#r,e,!0)}#i=P(rn({}));get baseline(){return H(this.#i)}set baseline(e){F(this.#i,e,!0)}#a=P(null);get selected(){return H(this.#a)}set selected(e){F(this.#a,e,!0)}#o=P(null);get selectedTick(){return H(this.#o)}set selectedTick(e){F(this.#o,e,!0)}#s=P(null);get aiming(){return H(this.#s)}set aiming(e){F(this.#s,e,!0)}#c=P(!1);get ready(){return H(this.#c)}set ready(e){F(this.#c,e,!0)}#l=P(!1);get settingReady(){return H(this.#l)}set settingReady(e){F(this.#l,e,!0)}#u=P(!1);get sending(){return H(this.#u)}set sending(e){F(this.#u,e,!0)}#d=P(``);get saveMsg(){return H(this.#d)}set saveMsg(e){F(this.#d,e,!0)}#f=P(null);get moved(){return H(this.#f)}set moved(e){F(this.#f,e,!0)}locked=new ia;#p=0;constructor(e,t){this.game=e,this.player=t}async load(e){let t=++this.#p;this.loading=!0,this.error=null;let n=`/api/game/${this.game}/players/${this.player}/plan`+(e===null?``:`?round=${e}`);try{let e=await fetch(n);if(!e.ok)throw Error(`API returned ${e.status}`);let r=await e.json();if(t!==this.#p)return;this.#m(r)}catch(e){t===this.#p&&(this.error=String(e))}finally{t===this.#p&&(this.loading=!1)}}#m(e){let t={},n={};for(let r of e.ships)r.owned&&(t[r.name]=ga(r.commands,r),n[r.name]=r.commands);this.plan=e,this.orders=t,this.baseline=n;let r=e.ships.filter(e=>e.owned),i=r.find(e=>e.category_name===`Ship`)??r[0];this.selected=i?i.name:null,this.selectedTick=null,this.aiming=null,this.saveMsg=``,this.ready=e.ready,this.locked.clear(),this.moved=null}#h=M(()=>this.plan?this.plan.round===this.plan.last_round&&this.plan.state===`active`:!1);get editable(){return H(this.#h)}set editable(e){F(this.#h,e)}#g=M(()=>this.plan?this.plan.ships.filter(e=>e.owned):[]);get ownShips(){return H(this.#g)}set ownShips(e){F(this.#g,e)}#_=M(()=>{let e={};if(this.plan)for(let t of this.plan.ships)!t.owned&&t.commands.length&&(e[t.name]=ga(t.commands,t));return e});get allyOrders(){return H(this.#_)}set allyOrders(e){F(this.#_,e)}ordersOf=e=>e.owned?this.orders[e.name]:this.allyOrders[e.name];#v=M(()=>{let e={};if(!this.plan)return e;for(let t of this.plan.ships){let n=this.ordersOf(t);n&&(e[t.name]=va(t,n))}return e});get chains(){return H(this.#v)}set chains(e){F(this.#v,e)}#y=M(()=>new Set(this.plan?[...this.plan.ships.map(e=>e.name),...this.plan.contacts.map(e=>e.name)]:[]));get drawn(){return H(this.#y)}set drawn(e){F(this.#y,e)}#b=M(()=>this.ownShips.find(e=>e.name===this.selected)??null);get ship(){return H(this.#b)}set ship(e){F(this.#b,e)}#x=M(()=>this.selected?this.chains[this.selected]??null:null);get chain(){return H(this.#x)}set chain(e){F(this.#x,e)}#S=M(()=>this.selected?this.orders[this.selected]??null:null);get shipOrders(){return H(this.#S)}set shipOrders(e){F(this.#S,e)}#C=M(()=>this.ship?ha(this.ship):[]);get orderableComponents(){return H(this.#C)}set orderableComponents(e){F(this.#C,e)}#w=M(()=>this.ownShips.some(e=>{let t=this.orders[e.name]?_a(this.orders[e.name]):[],n=this.baseline[e.name]??[];return t.length!==n.length||t.some((e,t)=>e!==n[t])}));get dirty(){return H(this.#w)}set dirty(e){F(this.#w,e)}#T=M(()=>{if(!this.plan)return{ships:0,enemyOrd:0,friendlyOrd:0,enemyShips:0};let e=this.plan.contacts.filter(e=>!la.has(e.category_name)),t=e.filter(e=>!ca.has(e.category_name));return{ships:e.filter(e=>ca.has(e.category_name)).length,enemyOrd:t.filter(e=>e.stance===`Foe`).length,friendlyOrd:t.filter(e=>e.stance===`Friend`).length,enemyShips:e.filter(e=>ca.has(e.category_name)&&e.stance===`Foe`).length}});get counts(){return H(this.#T)}set counts(e){F(this.#T,e)}selectShip(e){e!==this.selected&&(this.selected=e,this.selectedTick=null,this.aiming=null)}plannedShots(e){if(!this.shipOrders)return 0;let t=0;for(let n=1;n<=10;n++)this.shipOrders.fire[n]?.[e]&&t++;return t}ammoLeft=e=>e.ammo===null?null:e.ammo-this.plannedShots(e.name);aims=e=>wa(e,this.drawn);orderAt=(e,t)=>this.shipOrders&&e?this.shipOrders.fire[e]?.[t]:void 0;compOrderAt=(e,t)=>this.shipOrders&&e?this.shipOrders.comp[e]?.[t]:void 0;arm(e){if(!this.selectedTick||!this.shipOrders)return;let t=this.ammoLeft(e);if(!(t!==null&&t<=0)){if(wa(e,this.drawn)){this.aiming=e.name;return}this.shipOrders.fire[this.selectedTick]||(this.shipOrders.fire[this.selectedTick]={}),this.shipOrders.fire[this.selectedTick][e.name]=Ta(e),this.saveMsg=``}}pickTarget(e){!this.aiming||!this.selectedTick||!this.shipOrders||(this.shipOrders.fire[this.selectedTick]||(this.shipOrders.fire[this.selectedTick]={}),this.shipOrders.fire[this.selectedTick][this.aiming]=[e],this.aiming=null,this.saveMsg=``)}unarm(e,t){this.shipOrders?.fire[e]&&(delete this.shipOrders.fire[e][t],Object.keys(this.shipOrders.fire[e]).length||delete this.shipOrders.fire[e],this.saveMsg=``)}setParam(e,t,n,r){this.shipOrders.fire[e][t][n]=String(r),this.saveMsg=``}armComponent(e){if(!this.selectedTick||!this.shipOrders)return;let t=e.inputs.map(e=>e.choices?e.choices[0]:String(Math.round(e.min)));this.shipOrders.comp[this.selectedTick]||(this.shipOrders.comp[this.selectedTick]={}),this.shipOrders.comp[this.selectedTick][e.name]={verb:ma[e.group],params:t},this.saveMsg=``}unarmComponent(e,t){this.shipOrders?.comp[e]&&(delete this.shipOrders.comp[e][t],Object.keys(this.shipOrders.comp[e]).length||delete this.shipOrders.comp[e],this.saveMsg=``)}setCompParam(e,t,n,r){this.shipOrders.comp[e][t].params[n]=String(r),this.saveMsg=``}resetCourse(e){this.baseline[e]&&(this.orders[e]=ga(this.baseline[e],this.ownShips.find(t=>t.name===e)),this.saveMsg=``)}toggleLock(e){this.locked.has(e)?this.locked.delete(e):this.locked.add(e)}async saveAll(){this.sending=!0,this.saveMsg=`Saving…`;let e=[],t=!1;for(let n of this.ownShips){let r=_a(this.orders[n.name]);try{let i=await(await fetch(`/api/game/${this.game}/ships/${n.name}/commands`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({lines:r})})).json();i.ok?(this.baseline[n.name]=r,e.push(`${n.name}: ${r.length} order${r.length===1?``:`s`}`)):(t=!0,e.push(`${n.name}: REJECTED (${i.checks.filter(e=>!e.ok).map(e=>e.line).join(`, `)})`))}catch(r){t=!0,e.push(`${n.name}: error ${r}`)}}return this.saveMsg=e.join(` · `),this.sending=!1,!t}async toggleReady(){let e=!this.ready;this.settingReady=!0;try{if(e&&!await this.saveAll())return this.saveMsg+=` · Still not ready.`,null;let t=await fetch(`/api/game/${this.game}/players/${this.player}/ready`,{method:`POST`,headers:{"Content-Type":`application/json`},body:JSON.stringify({ready:e})});if(!t.ok)return null;let n=await t.json();if(this.ready=n.ready,!n.job)return null;this.saveMsg=`Everyone is ready. The round is being played.`;let r=await this.waitFor(n.job);if(r?.state===`pending`||r?.state===`running`)return this.saveMsg=`The round is taking long. It will show here once it has been played.`,null;if(r?.state!==`done`)return this.saveMsg=`The round could not be played: ${r?r.error:`it went missing.`}`,null;let i=await fetch(`/api/game/${this.game}/pulse`);return!i.ok||(await i.json()).last_round<=this.plan.last_round?(this.saveMsg=r.result,null):(this.saveMsg=`Everyone was ready. The round has been processed.`,this.plan.last_round+1)}finally{this.settingReady=!1}}async waitFor(e){let t=Date.now()+3e5,n=null;for(;Date.now()<t;){await new Promise(e=>setTimeout(e,1e3));let r=await fetch(`/api/game/${this.game}/jobs/${e}`);if(!r.ok)return null;if(n=await r.json(),n.state===`done`||n.state===`failed`)return n}return n}async pulse(){if(document.visibilityState!==`visible`||!this.plan)return;let e=await fetch(`/api/game/${this.game}/pulse`);if(!e.ok)return;let t=await e.json();for(let e of this.plan.ships)e.player in t.ready&&(e.player_ready=t.ready[e.player]);t.last_round>this.plan.last_round&&(this.moved=t.last_round)}},Aa=.05,ja=400,Ma=110;function Na(e){let t=10**Math.floor(Math.log10(e)),n=e/t;return(n<=1?1:n<=2?2:n<=5?5:10)*t}var Pa=class{#e=P(0);get cx(){return H(this.#e)}set cx(e){F(this.#e,e,!0)}#t=P(0);get cy(){return H(this.#t)}set cy(e){F(this.#t,e,!0)}#n=P(2);get upp(){return H(this.#n)}set upp(e){F(this.#n,e,!0)}#r=P(0);get boxW(){return H(this.#r)}set boxW(e){F(this.#r,e,!0)}#i=P(0);get boxH(){return H(this.#i)}set boxH(e){F(this.#i,e,!0)}#a=M(()=>{let e=Math.max(1,this.boxW)*this.upp,t=Math.max(1,this.boxH)*this.upp;return{x:this.cx-e/2,y:this.cy-t/2,w:e,h:t}});get vb(){return H(this.#a)}set vb(e){F(this.#a,e)}sx=e=>(e-this.vb.x)/this.upp;sy=e=>(e-this.vb.y)/this.upp;toWorld=(e,t)=>({x:this.vb.x+e*this.upp,y:-(this.vb.y+t*this.upp)});panByPixels(e,t){this.cx-=e*this.upp,this.cy-=t*this.upp}zoomAt(e,t,n){let r=this.vb.x+e*this.upp,i=this.vb.y+t*this.upp,a=aa(this.upp*n,Aa,ja);this.cx=r-e*a+this.boxW*a/2,this.cy=i-t*a+this.boxH*a/2,this.upp=a}zoomBy(e){this.zoomAt(this.boxW/2,this.boxH/2,e)}centreOn(e,t){this.cx=e,this.cy=t}fitTo(e){if(!e.length||!this.boxW||!this.boxH)return;let t=e.map(e=>e.vx),n=e.map(e=>e.vy),r=Math.min(...t),i=Math.max(...t),a=Math.min(...n),o=Math.max(...n);this.cx=(r+i)/2,this.cy=(a+o)/2,this.upp=aa(Math.max(Math.max(i-r,50)/this.boxW,Math.max(o-a,50)/this.boxH)*1.15,Aa,ja)}#o=M(()=>{if(!this.boxW||!this.boxH)return{step:100,xs:[],ys:[]};let e=Na(this.upp*Ma),t=[],n=[];for(let n=Math.ceil(this.vb.x/e)*e;n<=this.vb.x+this.vb.w;n+=e)t.push(n);for(let t=Math.ceil(this.vb.y/e)*e;t<=this.vb.y+this.vb.h;t+=e)n.push(t);return{step:e,xs:t,ys:n}});get grid(){return H(this.#o)}set grid(e){F(this.#o,e)}#s=M(()=>this.grid.step/this.upp);get scaleBarPx(){return H(this.#s)}set scaleBarPx(e){F(this.#s,e)}},Fa={Ship:11,Starbase:7.5,Beacon:9,Missile:5.5,Mine:5},Ia=e=>e*Math.PI/180,La=e=>e.map(e=>e.join(`,`)).join(` `);function Ra(e,t,n,r,i){let a=r*i,o=Ia(n),s=(n,r)=>[e+Math.sin(n)*a*r,t-Math.cos(n)*a*r];return La([s(o,1),s(o+2.5,.62),s(o-2.5,.62)])}function za(e,t,n,r){let i=n*r;return La([[e,t-i],[e+i,t],[e,t+i],[e-i,t]])}function Ba(e,t,n,r){let i=n*r*.85;return La([[e-i,t-i],[e+i,t-i],[e+i,t+i],[e-i,t+i]])}function Va(e,t,n,r){let i=n*r;return La(Array.from({length:12},(n,r)=>{let a=Ia(r*30),o=r%2?.42:1;return[e+Math.sin(a)*i*o,t-Math.cos(a)*i*o]}))}function Ha(e,t,n,r,i){let a=Fa[e]??5;return e===`Starbase`?Ba(t,n,a,i):e===`Beacon`?Va(t,n,a,i):e===`Mine`?za(t,n,a,i):r===null?za(t,n,a*.5,i):Ra(t,n,r,a,i)}function Ua(e,t,n){let r=``;for(let i=0;i<12;i++){let a=i*Math.PI/6,o=i%2?n*.28:n*.42;r+=`M${e+Math.sin(a)*o} ${t-Math.cos(a)*o}L${e+Math.sin(a)*n} ${t-Math.cos(a)*n}`}return r}var Wa=W(`<p class="overlay-msg svelte-17jmwgz"> </p>`),Ga=W(`<p class="overlay-msg err svelte-17jmwgz"> </p>`),Ka=G(`<circle class="body svelte-17jmwgz"></circle>`),qa=G(`<line></line>`),Ja=G(`<!><!><circle class="origin svelte-17jmwgz" cx="0" cy="0"></circle>`,1),Ya=G(`<circle></circle>`),Xa=G(`<path class="kill svelte-17jmwgz"></path><circle class="kill-core svelte-17jmwgz"></circle>`,1),Za=G(`<line class="beam svelte-17jmwgz"></line>`),Qa=G(`<path class="breach svelte-17jmwgz"></path>`),$a=G(`<circle class="struck svelte-17jmwgz"></circle>`),eo=G(`<!><!>`,1),to=G(`<polyline></polyline><!>`,1),no=G(`<circle class="target-hit svelte-17jmwgz"></circle>`),ro=G(`<!><polygon></polygon><!>`,1),io=G(`<circle class="ship-hit svelte-17jmwgz"></circle>`),ao=G(`<circle></circle><polygon></polygon><!>`,1),oo=G(`<path></path>`),so=G(`<path class="arc svelte-17jmwgz"></path>`),co=G(`<circle class="shot-grab svelte-17jmwgz"></circle>`),lo=G(`<circle class="shot-handle svelte-17jmwgz"></circle>`),uo=G(`<polygon></polygon>`),fo=G(`<line></line><!><!>`,1),po=G(`<!><circle></circle>`,1),mo=G(`<!><!><!><!><!><!><!><!><!><!><!><!>`,1),ho=G(`<text class="grid-label svelte-17jmwgz"> </text>`),go=G(`<line class="scalebar svelte-17jmwgz" x1="14"></line><line class="scalebar svelte-17jmwgz" x1="14" x2="14"></line><line class="scalebar svelte-17jmwgz"></line><text class="grid-label svelte-17jmwgz" text-anchor="middle"> </text>`,1),_o=G(`<text class="cursor-label svelte-17jmwgz" text-anchor="end"> </text>`),vo=G(`<text text-anchor="middle"> <title> </title></text>`),yo=G(`<line class="leader svelte-17jmwgz"></line>`),bo=G(`<!><text> </text>`,1),xo=G(`<text class="tick-label svelte-17jmwgz"> </text>`),So=G(`<text text-anchor="middle"> </text>`),Co=W(`<button type="button" class="svelte-17jmwgz"> <span class="svelte-17jmwgz"> </span></button>`),wo=W(`<div class="pickone svelte-17jmwgz"></div>`),To=W(`<p class="readout svelte-17jmwgz"> </p>`),Eo=W(`<div class="plot svelte-17jmwgz"><!>  <svg preserveAspectRatio="none" role="img" aria-label="Faction tactical map. Drag to pan, pinch or scroll to zoom."><!><!><!></svg> <svg class="text-layer svelte-17jmwgz" preserveAspectRatio="none" aria-hidden="true"><!><!><!><!><!><!><!></svg> <!> <!> <!></div>`);function Do(e,t){We(t,!0);let n=Oi(t,`planning`,7),r=Oi(t,`camera`,7),i=Oi(t,`coarse`,3,!1),a=Oi(t,`grabbable`,19,()=>({path:!0,shots:!0,ticks:!0})),o=M(()=>n().plan),s=15.5,c=new Set([`hull`,`battery`]),l=M(()=>i()?{ship:24,node:22,shot:21,target:24}:{ship:16,node:13,shot:11,target:14}),u=M(()=>r().upp),f=M(()=>r().vb),p=M(()=>H(o)?H(o).contacts.filter(e=>la.has(e.category_name)?!1:ca.has(e.category_name)?!0:e.stance===`Friend`?t.layers.friendlyOrdnance:t.layers.enemyOrdnance).sort((e,t)=>Number(ca.has(e.category_name))-Number(ca.has(t.category_name))):[]),m=e=>e.track[e.track.length-1].tick<10,h=M(()=>H(o)?.ships.find(e=>e.name===n().selected)??null),g=M(()=>{if(!H(h))return[];let e=n().chain;return e?.length?[e[0],e[e.length-1]]:[{x:H(h).x,y:H(h).y}]}),_=M(()=>H(o)?H(o).contacts.filter(e=>la.has(e.category_name)):[]),v=e=>e.track.map(e=>{let t=$(e.x,e.y);return`${t.vx},${t.vy}`}).join(` `),y=e=>{let t=e.track[e.track.length-1];return $(t.x,t.y)},b=e=>e.map(e=>{let t=$(e.x,e.y);return`${t.vx},${t.vy}`}).join(` `);function x(e){if(e.track.length<2)return null;let t=e.track[e.track.length-2],n=e.track[e.track.length-1],r=n.x-t.x,i=n.y-t.y;return r===0&&i===0?null:Math.atan2(r,i)*180/Math.PI}let S=(e,t,n,r)=>[e+Math.sin(oa(n))*r*H(u),t-Math.cos(oa(n))*r*H(u)],C=(e,t,n,r)=>[e+Math.sin(oa(n))*r,t-Math.cos(oa(n))*r];function w(e,t,n,r,i){let[a,o]=r,s=((o-a)%360+360)%360,c=C(e,t,n+a,i),l=C(e,t,n+a+s,i);return`M ${e},${t} L ${c[0]},${c[1]} A ${i},${i} 0 ${+(s>180)} 1 ${l[0]},${l[1]} Z`}function ee(e,t,n,r,i){let a=C(e,t,n-r/2,i),o=C(e,t,n+r/2,i);return`M ${a[0]},${a[1]} A ${i},${i} 0 0 1 ${o[0]},${o[1]}`}let T=M(()=>{if(!H(o))return[];let e=[];for(let t of H(o).ships){let r=n().ordersOf(t),i=n().chains[t.name];if(!r||!i)continue;let a=Object.fromEntries(t.weapons.map(e=>[e.name,e])),s=t.name===n().selected;for(let c=1;c<=10;c++)for(let[l,u]of Object.entries(r.fire[c]??{})){let r=a[l],d=i[c];if(!r||!d)continue;let f=ba(r)>=0?`direction`:r.inputs[0]?.kind,p=r.inputs[0]?.choices?u[0]:l,m=$(d.x,d.y),h=s&&c===n().selectedTick,g=`${t.name}:${c}:${l}`;if(f===`object_name`){let r=H(o).contacts.find(e=>e.name===u[0]);e.push({key:g,ship:t.name,mine:s,tick:c,weapon:l,label:p,kind:f,node:d,nv:m,cur:h,target:r?r.track[r.track.length-1]:n().chains[u[0]]?.[c]??null,targetName:u[0]})}else{let n=Number(u[ba(r)])||0,i=d.heading+n,a=Ea(r),o;o=a?C(m.vx,m.vy,i,Da(a,Number(u[1])||a.max)):h?S(m.vx,m.vy,i,54):r.payload_speed?C(m.vx,m.vy,i,r.payload_speed):r.payload?C(m.vx,m.vy,i,d.speed):C(m.vx,m.vy,i,7),e.push({key:g,ship:t.name,mine:s,tick:c,weapon:l,label:p,kind:`direction`,node:d,nv:m,cur:h,angle:n,heading:i,end:o})}}}return e}),te=M(()=>{if(!H(o))return[];let e=[];for(let t of H(o).ships){let r=n().ordersOf(t),i=n().chains[t.name];if(!r||!i)continue;let a=Object.fromEntries(t.weapons.map(e=>[e.name,e])),o=t.name===n().selected;for(let s=1;s<=10;s++)for(let[c,l]of Object.entries(r.fire[s]??{})){let r=a[c],u=r?Ea(r):null;if(!u)continue;let d=i[s];if(!d)continue;let f=Number(l[1])||u.max;e.push({key:`${t.name}:${s}:${c}`,mine:o,nv:$(d.x,d.y),heading:d.heading,dir:Number(l[0])||0,width:f,r:Da(u,f),cur:o&&s===n().selectedTick})}}return e}),ne=M(()=>{if(!t.layers.grid)return[];let e=[];for(let t of r().grid.xs)e.push({key:`x${t}`,x:r().sx(t),y:13,text:`${Math.round(t)}`,mid:!0});for(let t of r().grid.ys)e.push({key:`y${t}`,x:7,y:r().sy(t)-5,text:`${Math.round(-t)}`,mid:!1});return e}),re=M(()=>{if(!H(o))return[];let e=[];for(let t of H(o).ships){let i=$(t.x,t.y);e.push({key:`s:${t.name}`,x:r().sx(i.vx),y:r().sy(i.vy),text:t.name,cls:t.owned?t.name===n().selected?`sel`:`own`:`ally`})}for(let t of H(p)){if(!ca.has(t.category_name))continue;let n=y(t);e.push({key:`c:${t.name}`,x:r().sx(n.vx),y:r().sy(n.vy),text:t.name,cls:t.stance===`Foe`?`enemy`:`ally`})}let t=[],i=[];for(let n of[...e].sort((e,t)=>e.y-t.y)){let e=n.text.length*7.5,r=n.x+12,a=n.y,o=0;for(;o++<80&&t.some(t=>Math.abs(t.ly-a)<s&&r<t.lx+t.w&&t.lx<r+e);)a+=s;t.push({lx:r,ly:a,w:e}),i.push({...n,lx:r,ly:a,moved:Math.abs(a-n.y)>5})}return i}),ie=M(()=>H(p).filter(e=>!ca.has(e.category_name)).map(e=>{let t=y(e);return{key:e.name,x:r().sx(t.vx),y:r().sy(t.vy),letter:e.type_name[0],enemy:e.stance===`Foe`,title:`${e.name} · ${e.type_name}`}})),ae=M(()=>{if(!t.layers.paths||!n().chain||!n().ship||!ua(n().ship))return[];let e=[];for(let t of n().chain.slice(1)){let n=$(t.x,t.y),r=e[e.length-1];r&&r.vx===n.vx&&r.vy===n.vy?r.ticks.push(t.t):e.push({vx:n.vx,vy:n.vy,ticks:[t.t]})}return e.map(e=>({key:`${e.ticks[0]}`,x:r().sx(e.vx)+9,y:r().sy(e.vy)-9,text:e.ticks.length===1?`${e.ticks[0]}`:`${e.ticks[0]}–${e.ticks.at(-1)}`}))}),oe=M(()=>t.layers.fire?H(T).map(e=>{if(e.kind===`object_name`){if(!e.target)return null;let t=$(e.target.x,e.target.y);return{key:e.key,x:r().sx((e.nv.vx+t.vx)/2),y:r().sy((e.nv.vy+t.vy)/2),text:e.label,cur:e.cur,mine:e.mine}}let t=S(e.end[0],e.end[1],e.heading,11);return{key:e.key,x:r().sx(t[0]),y:r().sy(t[1]),text:e.label,cur:e.cur,mine:e.mine}}).filter(Boolean):[]),se,ce=new Map,le=`none`,ue=null,E=null,de=0,fe=0,pe=0,me=0,he=0,ge=0,_e=0,ve=0,ye=!1,be=null,xe=null,Se=!1,Ce=M(()=>i()?9:3),we=P(null),D=P(null);function Te(e){let t=se.getBoundingClientRect();return{px:e.clientX-t.left,py:e.clientY-t.top}}function Ee(e){let{px:t,py:n}=Te(e);return r().toWorld(t,n)}function De(){let[e,t]=[...ce.values()],n=se.getBoundingClientRect();return{dist:Math.hypot(e.x-t.x,e.y-t.y),px:(e.x+t.x)/2-n.left,py:(e.y+t.y)/2-n.top}}function Oe(e){ce.set(e.pointerId,{x:e.clientX,y:e.clientY}),ce.size===2&&(le=`pinch`,xe=De(),ue=null,E=null,be=null,F(D,null),ye=!0)}function ke(e,t){le=t,ye=!1,he=_e=e.clientX,ge=ve=e.clientY,se.setPointerCapture(e.pointerId)}let Ae=P(null);function je(e,t,n){let{px:i,py:a}=Te(e);return t.map(e=>({...e,d:Math.hypot(r().sx(e.v.vx)-i,r().sy(e.v.vy)-a)})).filter(e=>e.d<=n).sort((e,t)=>e.d-t.d)}let O=M(()=>i()?44:34);function Me(e,t,n){let{px:i,py:a}=Te(e);F(Ae,{px:Math.max(0,Math.min(i,r().boxW-170)),py:Math.max(0,Math.min(a,r().boxH-H(O)*t.length)),hits:t,aiming:n},!0)}function k(e){H(Ae).aiming?n().pickTarget(e):n().selectShip(e),F(Ae,null)}function Ne(e){if(!(le===`pinch`||Se)){if(F(Ae,null),H(o)&&n().aiming){let t=je(e,[...H(p).map(e=>({name:e.name,note:e.type_name,v:y(e)})),...H(o).ships.map(e=>({name:e.name,note:e.ship_type,v:$(e.x,e.y)}))],H(l).target);if(t.length>1)return Me(e,t,!0);if(t.length===1)return n().pickTarget(t[0].name)}else if(H(o)){let t=je(e,H(o).ships.filter(e=>e.owned).map(e=>({name:e.name,note:e.ship_type,v:$(e.x,e.y)})),H(l).ship);if(t.length>1)return Me(e,t,!1);be=t.length?t[0].name:null}ke(e,`pan`)}}function Pe(e,t){if(le===`pinch`||Se||!n().editable||!a().path&&!a().ticks)return;t.stopPropagation(),ue=e;let r=n().chain[e],i=Ee(t);de=r.x-i.x,fe=r.y-i.y,ke(t,`node`)}function j(e,t){if(le===`pinch`||Se||!n().editable||!a().shots||!e.mine)return;t.stopPropagation(),E=e,n().selectedTick=e.tick;let r=e.node,i=Ee(t),o=Math.atan2(i.x-r.x,i.y-r.y)*180/Math.PI;pe=sa(e.heading-o),me=Math.hypot(e.end[0]-r.x,e.end[1]+r.y)-Math.hypot(i.x-r.x,i.y-r.y),ke(t,`shot`)}function Fe(e){if(!a().path){r().panByPixels(e.clientX-he,e.clientY-ge),he=e.clientX,ge=e.clientY;return}let t=n().ship,i=n().chain,o=n().shipOrders;if(!t||!i||!o)return;let s=i[ue-1],c=Ee(e),l=c.x+de-s.x,u=c.y+fe-s.y,d=aa(sa(Math.atan2(l,u)*180/Math.PI-s.heading),-t.limits.max_turn,t.limits.max_turn),f=aa(Math.hypot(l,u)-s.speed,-t.limits.max_delta_v,t.limits.max_delta_v),p=aa(s.speed+f,-t.limits.max_speed,t.limits.max_speed);o.turn[ue]=Math.round(d),o.accel[ue]=Math.round(p-s.speed),n().saveMsg=``;let m=o.turn[ue],h=o.accel[ue];F(D,`${ue} · ${m?(m>0?`R`:`L`)+Math.abs(m):`ahead`} · A${h>0?`+`:``}${h} · speed ${Math.round(s.speed+h)}`)}function Ie(e){let t=n().ownShips.find(e=>e.name===E.ship).weapons.find(e=>e.name===E.weapon),r=E.node,i=Ee(e),a=Sa(t,sa(Math.atan2(i.x-r.x,i.y-r.y)*180/Math.PI+pe-r.heading)),o=n().orders[E.ship].fire[E.tick][E.weapon];o[ba(t)]=String(a);let s=Ea(t),c=``;if(s){let e=Oa(s,Math.hypot(i.x-r.x,i.y-r.y)+me);o[1]=String(e),c=` · ${e}° wide`}n().saveMsg=``,F(D,`${E.weapon} · ${a}°${c}`)}function Le(e){let t=ce.get(e.pointerId);if(t&&(t.x=e.clientX,t.y=e.clientY),!i()){let t=Ee(e);F(we,{x:Math.round(t.x),y:Math.round(t.y)},!0)}if(Math.hypot(e.clientX-_e,e.clientY-ve)>H(Ce)&&(ye=!0),le===`pinch`){if(ce.size<2)return;let e=De();xe&&e.dist>0&&xe.dist>0&&(r().zoomAt(xe.px,xe.py,xe.dist/e.dist),r().panByPixels(e.px-xe.px,e.py-xe.py)),xe=e;return}if(le===`shot`)return Ie(e);if(le===`node`)return Fe(e);le===`pan`&&(r().panByPixels(e.clientX-he,e.clientY-ge),he=e.clientX,ge=e.clientY)}function Re(e){ce.delete(e.pointerId);let t=le;t!==`pinch`&&!ye&&(t===`node`?a().ticks&&(n().selectedTick=ue):be?n().selectShip(be):t===`pan`&&(n().selectedTick=null,n().aiming=null)),t===`pinch`&&(Se=!0),ce.size||(Se=!1),le=`none`,xe=null,ue=null,E=null,be=null,F(D,null);try{se.releasePointerCapture(e.pointerId)}catch{}}function ze(e){e.preventDefault();let t=aa(e.deltaMode===1?e.deltaY*16:e.deltaY,-100,100),n=Te(e);r().zoomAt(n.px,n.py,Math.exp(t*Math.log(1.06)/100))}var Be=Eo(),Ve=I(Be),He=e=>{var t=Wa(),r=I(t);A(t),z(()=>q(r,`Loading ${n().player??``}'s tactical picture…`)),K(e,t)},Ue=e=>{var t=Ga(),r=I(t);A(t),z(()=>q(r,`Couldn't reach the API: ${n().error??``}`)),K(e,t)};J(Ve,e=>{n().loading?e(He):n().error&&e(Ue,1)});var Ke=R(Ve,2);let qe;var Je=I(Ke);Y(Je,17,()=>H(_),e=>e.name,(e,t)=>{let n=M(()=>y(H(t)));var r=Ka();z(()=>{Q(r,`cx`,H(n).vx),Q(r,`cy`,H(n).vy),Q(r,`r`,H(t).radius),Q(r,`stroke-width`,H(u))}),K(e,r)});var Ye=R(Je),Xe=e=>{var t=Ja(),n=L(t);Y(n,16,()=>r().grid.xs,e=>e,(e,t)=>{var n=qa();let r;z(()=>{r=X(n,0,`grid svelte-17jmwgz`,null,r,{axis:t===0}),Q(n,`x1`,t),Q(n,`y1`,H(f).y),Q(n,`x2`,t),Q(n,`y2`,H(f).y+H(f).h),Q(n,`stroke-width`,H(u))}),K(e,n)});var i=R(n);Y(i,16,()=>r().grid.ys,e=>e,(e,t)=>{var n=qa();let r;z(()=>{r=X(n,0,`grid svelte-17jmwgz`,null,r,{axis:t===0}),Q(n,`x1`,H(f).x),Q(n,`y1`,t),Q(n,`x2`,H(f).x+H(f).w),Q(n,`y2`,t),Q(n,`stroke-width`,H(u))}),K(e,n)});var a=R(i);z(()=>{Q(a,`r`,6*H(u)),Q(a,`stroke-width`,1.2*H(u))}),K(e,t)};J(Ye,e=>{t.layers.grid&&e(Xe)});var Ze=R(Ye),Qe=e=>{var r=mo(),i=L(r),s=e=>{var t=Nr();Y(L(t),17,()=>H(g),Vr,(e,t,n)=>{let r=M(()=>$(H(t).x,H(t).y));var i=Ya();X(i,0,`scanring svelte-17jmwgz`,null,{},{from:n===0}),z(()=>{Q(i,`cx`,H(r).vx),Q(i,`cy`,H(r).vy),Q(i,`r`,H(h).scan_range),Q(i,`stroke-width`,H(u)),Q(i,`stroke-dasharray`,`${6*H(u)} ${8*H(u)}`)}),K(e,i)}),K(e,t)};J(i,e=>{t.layers.scan&&H(h)?.scan_range&&e(s)});var d=R(i),f=e=>{var t=Nr();Y(L(t),17,()=>H(o).explosions,e=>`${e.tick}:${e.x}:${e.y}:${e.radius}`,(e,t)=>{let n=M(()=>$(H(t).x,H(t).y));var r=Ya();z(e=>{X(r,0,`blast ${e??``}`,`svelte-17jmwgz`),Q(r,`cx`,H(n).vx),Q(r,`cy`,H(n).vy),Q(r,`r`,H(t).radius),Q(r,`stroke-width`,H(u))},[()=>H(t).damage_type.toLowerCase()]),K(e,r)}),K(e,t)};J(d,e=>{t.layers.explosions&&e(f)});var _=R(d);Y(_,17,()=>H(o).ships.filter(e=>!e.alive&&e.track.length),e=>e.name,(e,t)=>{let n=M(()=>H(t).track[H(t).track.length-1]),r=M(()=>$(H(n).x,H(n).y));var i=Xa(),a=L(i),o=R(a);Q(o,`r`,20*.18),z(e=>{Q(a,`d`,e),Q(a,`stroke-width`,1.4*H(u)),Q(o,`cx`,H(r).vx),Q(o,`cy`,H(r).vy)},[()=>Ua(H(r).vx,H(r).vy,20)]),K(e,i)});var S=R(_),C=e=>{var t=eo(),n=L(t);Y(n,17,()=>H(o).beams,e=>`${e.tick}:${e.x1},${e.y1}:${e.x2},${e.y2}`,(e,t)=>{let n=M(()=>$(H(t).x1,H(t).y1)),r=M(()=>$(H(t).x2,H(t).y2));var i=Za();z(()=>{Q(i,`x1`,H(n).vx),Q(i,`y1`,H(n).vy),Q(i,`x2`,H(r).vx),Q(i,`y2`,H(r).vy),Q(i,`stroke-width`,1.2*H(u))}),K(e,i)}),Y(R(n),17,()=>H(o).effects,e=>`${e.tick}:${e.target}:${e.part}:${e.outcome}`,(e,t)=>{let n=M(()=>$(H(t).x,H(t).y));var r=Nr(),i=L(r),a=e=>{var t=Xa(),r=L(t),i=R(r);Q(i,`r`,20*.18),z(e=>{Q(r,`d`,e),Q(r,`stroke-width`,1.4*H(u)),Q(i,`cx`,H(n).vx),Q(i,`cy`,H(n).vy)},[()=>Ua(H(n).vx,H(n).vy,20)]),K(e,t)},o=e=>{var r=Qa();z(e=>{Q(r,`d`,e),Q(r,`stroke-width`,2.6*H(u))},[()=>ee(H(n).vx,H(n).vy,H(t).bearing,90,15*H(u))]),K(e,r)},s=e=>{var t=$a();z(()=>{Q(t,`cx`,H(n).vx),Q(t,`cy`,H(n).vy),Q(t,`r`,12*H(u)),Q(t,`stroke-width`,1.6*H(u))}),K(e,t)},l=M(()=>H(t).outcome===`Damaged`&&c.has(H(t).part));J(i,e=>{H(t).outcome===`Breached`&&H(t).part===`hull`?e(a):H(t).outcome===`Breached`?e(o,1):H(l)&&e(s,2)}),K(e,r)}),K(e,t)};J(S,e=>{t.layers.hits&&e(C)});var ne=R(S);Y(ne,17,()=>H(p),e=>e.name,(e,r)=>{let i=M(()=>y(H(r)));var a=ro(),o=L(a),s=e=>{var t=to(),n=L(t);let i;Y(R(n),17,()=>H(r).track.slice(0,-1),e=>e.tick,(e,t,n,i)=>{let a=M(()=>$(H(t).x,H(t).y));var o=Ya();let s;z(()=>{s=X(o,0,`mark svelte-17jmwgz`,null,s,{enemy:H(r).stance===`Foe`}),Q(o,`cx`,H(a).vx),Q(o,`cy`,H(a).vy),Q(o,`r`,1.6*H(u))}),K(e,o)}),z(e=>{i=X(n,0,`track svelte-17jmwgz`,null,i,{enemy:H(r).stance===`Foe`}),Q(n,`points`,e),Q(n,`stroke-width`,1.2*H(u))},[()=>v(H(r))]),K(e,t)};J(o,e=>{t.layers.tracks&&H(r).track.length>1&&e(s)});var c=R(o);let d;var f=R(c),p=e=>{var t=no();z(()=>{Q(t,`cx`,H(i).vx),Q(t,`cy`,H(i).vy),Q(t,`r`,H(l).target*H(u))}),K(e,t)};J(f,e=>{n().aiming&&e(p)}),z((e,t)=>{d=X(c,0,`blip svelte-17jmwgz`,null,d,e),Q(c,`points`,t)},[()=>({enemy:H(r).stance===`Foe`,stale:m(H(r))}),()=>Ha(H(r).category_name,H(i).vx,H(i).vy,x(H(r)),H(u))]),K(e,a)});var re=R(ne),ie=e=>{var t=Nr();Y(L(t),17,()=>H(o).ships.filter(e=>e.track.some(t=>t.x!==e.track[0].x||t.y!==e.track[0].y)),e=>e.name,(e,t)=>{var r=to(),i=L(r);let a;Y(R(i),17,()=>H(t).track.slice(0,-1),e=>e.tick,(e,r)=>{let i=M(()=>$(H(r).x,H(r).y));var a=Ya();let o;z(()=>{o=X(a,0,`wake-dot svelte-17jmwgz`,null,o,{sel:H(t).name===n().selected,ally:!H(t).owned}),Q(a,`cx`,H(i).vx),Q(a,`cy`,H(i).vy),Q(a,`r`,1.8*H(u))}),K(e,a)}),z(e=>{a=X(i,0,`wake svelte-17jmwgz`,null,a,{sel:H(t).name===n().selected,ally:!H(t).owned}),Q(i,`points`,e),Q(i,`stroke-width`,1.4*H(u))},[()=>H(t).track.map(e=>{let t=$(e.x,e.y);return`${t.vx},${t.vy}`}).join(` `)]),K(e,r)}),K(e,t)};J(re,e=>{t.layers.tracks&&e(ie)});var ae=R(re),oe=e=>{var t=Nr();Y(L(t),17,()=>H(o).ships.filter(ua),e=>e.name,(e,t)=>{var r=Nr(),i=L(r),a=e=>{let r=M(()=>H(t).name===n().selected);var i=to(),a=L(i);let o;var s=R(a),c=e=>{var r=Nr();Y(L(r),17,()=>n().chains[H(t).name].slice(1),e=>e.t,(e,n)=>{let r=M(()=>$(H(n).x,H(n).y));var i=Ya();let a;z(()=>{a=X(i,0,`course-dot svelte-17jmwgz`,null,a,{ally:!H(t).owned}),Q(i,`cx`,H(r).vx),Q(i,`cy`,H(r).vy),Q(i,`r`,2.4*H(u))}),K(e,i)}),K(e,r)};J(s,e=>{H(r)||e(c)}),z(e=>{o=X(a,0,`course svelte-17jmwgz`,null,o,{sel:H(r),ally:!H(t).owned}),Q(a,`points`,e),Q(a,`stroke-width`,2*H(u))},[()=>b(n().chains[H(t).name])]),K(e,i)};J(i,e=>{n().chains[H(t).name]&&e(a)}),K(e,r)}),K(e,t)};J(ae,e=>{t.layers.paths&&e(oe)});var se=R(ae);Y(se,17,()=>H(o).ships,e=>e.name,(e,t)=>{let r=M(()=>$(H(t).x,H(t).y));var i=ao(),a=L(i);let o;var s=R(a);let c;var d=R(s),f=e=>{var t=no();z(()=>{Q(t,`cx`,H(r).vx),Q(t,`cy`,H(r).vy),Q(t,`r`,H(l).target*H(u))}),K(e,t)},p=e=>{var t=io();z(()=>{Q(t,`cx`,H(r).vx),Q(t,`cy`,H(r).vy),Q(t,`r`,H(l).ship*H(u))}),K(e,t)};J(d,e=>{n().aiming?e(f):H(t).owned&&e(p,1)}),z(e=>{o=X(a,0,`halo svelte-17jmwgz`,null,o,{own:H(t).owned,sel:H(t).name===n().selected}),Q(a,`cx`,H(r).vx),Q(a,`cy`,H(r).vy),Q(a,`r`,18*H(u)),Q(a,`stroke-width`,H(u)),c=X(s,0,`ship svelte-17jmwgz`,null,c,{own:H(t).owned}),Q(s,`points`,e)},[()=>Ha(H(t).category_name,H(r).vx,H(r).vy,H(t).heading,H(u))]),K(e,i)});var ce=R(se);Y(ce,17,()=>H(te),e=>e.key,(e,t)=>{var n=Nr(),r=L(n),i=e=>{var n=Ya();let r;z(()=>{r=X(n,0,`cone svelte-17jmwgz`,null,r,{cur:H(t).cur,other:!H(t).mine}),Q(n,`cx`,H(t).nv.vx),Q(n,`cy`,H(t).nv.vy),Q(n,`r`,H(t).r),Q(n,`stroke-width`,H(u))}),K(e,n)},a=e=>{var n=oo();let r;z(e=>{r=X(n,0,`cone svelte-17jmwgz`,null,r,{cur:H(t).cur,other:!H(t).mine}),Q(n,`stroke-width`,H(u)),Q(n,`d`,e)},[()=>w(H(t).nv.vx,H(t).nv.vy,H(t).heading,[H(t).dir-H(t).width/2,H(t).dir+H(t).width/2],H(t).r)]),K(e,n)};J(r,e=>{H(t).width>=360?e(i):e(a,-1)}),K(e,n)});var le=R(ce),ue=e=>{let t=M(()=>n().chain[n().selectedTick]),r=M(()=>$(H(t).x,H(t).y));var i=Nr();Y(L(i),17,()=>n().ship.weapons.filter(e=>e.firing_arc&&n().orderAt(n().selectedTick,e.name)),e=>e.name,(e,n)=>{var i=so();z(e=>Q(i,`d`,e),[()=>w(H(r).vx,H(r).vy,H(t).heading,H(n).firing_arc,44*H(u))]),K(e,i)}),K(e,i)};J(le,e=>{n().selectedTick&&n().ship&&n().chain?.[n().selectedTick]&&e(ue)});var E=R(le),de=e=>{var t=Nr();Y(L(t),17,()=>H(T),e=>e.key,(e,t)=>{var n=Nr(),r=L(n),i=e=>{var n=Nr(),r=L(n),i=e=>{let n=M(()=>$(H(t).target.x,H(t).target.y));var r=qa();let i;z(()=>{i=X(r,0,`shot-line svelte-17jmwgz`,null,i,{cur:H(t).cur,other:!H(t).mine}),Q(r,`x1`,H(t).nv.vx),Q(r,`y1`,H(t).nv.vy),Q(r,`x2`,H(n).vx),Q(r,`y2`,H(n).vy),Q(r,`stroke-width`,(H(t).cur?1.6:1.1)*H(u))}),K(e,r)};J(r,e=>{H(t).target&&e(i)}),K(e,n)},o=e=>{var n=fo(),r=L(n);let i;var o=R(r),s=e=>{var n=co();z(()=>{Q(n,`cx`,H(t).end[0]),Q(n,`cy`,H(t).end[1]),Q(n,`r`,H(l).shot*H(u))}),U(`pointerdown`,n,e=>j(H(t),e)),K(e,n)};J(o,e=>{H(t).mine&&a().shots&&e(s)});var c=R(o),d=e=>{var n=lo();z(()=>{Q(n,`cx`,H(t).end[0]),Q(n,`cy`,H(t).end[1]),Q(n,`r`,4.5*H(u)),Q(n,`stroke-width`,2*H(u))}),K(e,n)},f=e=>{var n=uo();let r;z(e=>{r=X(n,0,`shot-tip svelte-17jmwgz`,null,r,{other:!H(t).mine}),Q(n,`points`,e)},[()=>Ra(H(t).end[0],H(t).end[1],H(t).heading,4,H(u))]),K(e,n)};J(c,e=>{H(t).cur?e(d):e(f,-1)}),z(()=>{i=X(r,0,`shot svelte-17jmwgz`,null,i,{cur:H(t).cur,other:!H(t).mine}),Q(r,`x1`,H(t).nv.vx),Q(r,`y1`,H(t).nv.vy),Q(r,`x2`,H(t).end[0]),Q(r,`y2`,H(t).end[1]),Q(r,`stroke-width`,(H(t).cur?1.8:1.1)*H(u))}),K(e,n)};J(r,e=>{H(t).kind===`object_name`?e(i):e(o,-1)}),K(e,n)}),K(e,t)};J(E,e=>{t.layers.fire&&e(de)});var fe=R(E),pe=e=>{var t=Nr();Y(L(t),17,()=>n().chain.slice(1).reverse(),e=>e.t,(e,t)=>{let r=M(()=>$(H(t).x,H(t).y));var i=po(),o=L(i),s=e=>{var n=Ya();let i;z(()=>{i=X(n,0,`grab svelte-17jmwgz`,null,i,{"tap-only":!a().path}),Q(n,`cx`,H(r).vx),Q(n,`cy`,H(r).vy),Q(n,`r`,H(l).node*H(u))}),U(`pointerdown`,n,e=>Pe(H(t).t,e)),K(e,n)};J(o,e=>{n().editable&&(a().path||a().ticks)&&e(s)});var c=R(o);let d;z(()=>{d=X(c,0,`joint svelte-17jmwgz`,null,d,{limit:H(t).atLimit,cur:H(t).t===n().selectedTick}),Q(c,`cx`,H(r).vx),Q(c,`cy`,H(r).vy),Q(c,`r`,5*H(u)),Q(c,`stroke-width`,2*H(u))}),K(e,i)}),K(e,t)},me=M(()=>t.layers.paths&&n().chain&&n().ship&&ua(n().ship));J(fe,e=>{H(me)&&e(pe)}),K(e,r)};J(Ze,e=>{H(o)&&e(Qe)}),A(Ke),Di(Ke,e=>se=e,()=>se);var $e=R(Ke,2),et=I($e);Y(et,17,()=>H(ne),e=>e.key,(e,t)=>{var n=ho();Q(n,`font-size`,11);var r=I(n,!0);A(n),z(()=>{Q(n,`x`,H(t).x),Q(n,`y`,H(t).y),Q(n,`text-anchor`,H(t).mid?`middle`:`start`),q(r,H(t).text)}),K(e,n)});var tt=R(et),nt=e=>{var t=go(),n=L(t),i=R(n),a=R(i),o=R(a);Q(o,`font-size`,11);var s=I(o,!0);A(o),z(()=>{Q(n,`y1`,r().boxH-18),Q(n,`x2`,14+r().scaleBarPx),Q(n,`y2`,r().boxH-18),Q(i,`y1`,r().boxH-22),Q(i,`y2`,r().boxH-14),Q(a,`x1`,14+r().scaleBarPx),Q(a,`y1`,r().boxH-22),Q(a,`x2`,14+r().scaleBarPx),Q(a,`y2`,r().boxH-14),Q(o,`x`,14+r().scaleBarPx/2),Q(o,`y`,r().boxH-26),q(s,r().grid.step)}),K(e,t)};J(tt,e=>{t.layers.grid&&r().boxH&&e(nt)});var rt=R(tt),it=e=>{var t=_o();Q(t,`font-size`,11);var n=I(t);A(t),z((e,r)=>{Q(t,`x`,e),Q(t,`y`,r),q(n,`${H(we).x??``}, ${H(we).y??``}`)},[()=>Math.max(1,r().boxW)-12,()=>Math.max(1,r().boxH)-14]),K(e,t)};J(rt,e=>{H(we)&&e(it)});var at=R(rt);Y(at,17,()=>H(ie),e=>e.key,(e,t)=>{var n=vo();let r;Q(n,`font-size`,11);var i=I(n,!0),a=R(i),o=I(a,!0);A(a),A(n),z(()=>{r=X(n,0,`glyph svelte-17jmwgz`,null,r,{enemy:H(t).enemy}),Q(n,`x`,H(t).x),Q(n,`y`,H(t).y-7),q(i,H(t).letter),q(o,H(t).title)}),K(e,n)});var ot=R(at);Y(ot,17,()=>H(re),e=>e.key,(e,t)=>{var n=bo(),r=L(n),i=e=>{var n=yo();z(()=>{Q(n,`x1`,H(t).x),Q(n,`y1`,H(t).y),Q(n,`x2`,H(t).lx-2),Q(n,`y2`,H(t).ly-4)}),K(e,n)};J(r,e=>{H(t).moved&&e(i)});var a=R(r);Q(a,`font-size`,12.5);var o=I(a,!0);A(a),z(()=>{X(a,0,`label ${H(t).cls??``}`,`svelte-17jmwgz`),Q(a,`x`,H(t).lx),Q(a,`y`,H(t).ly),q(o,H(t).text)}),K(e,n)});var st=R(ot);Y(st,17,()=>H(ae),e=>e.key,(e,t)=>{var n=xo();Q(n,`font-size`,11);var r=I(n,!0);A(n),z(()=>{Q(n,`x`,H(t).x),Q(n,`y`,H(t).y),q(r,H(t).text)}),K(e,n)}),Y(R(st),17,()=>H(oe),e=>e.key,(e,t)=>{var n=So();let r;Q(n,`font-size`,11);var i=I(n,!0);A(n),z(()=>{r=X(n,0,`shot-label svelte-17jmwgz`,null,r,{cur:H(t).cur,other:!H(t).mine}),Q(n,`x`,H(t).x),Q(n,`y`,H(t).y),q(i,H(t).text)}),K(e,n)}),A($e);var ct=R($e,2),lt=e=>{var t=wo();Y(t,21,()=>H(Ae).hits,e=>e.name,(e,t)=>{var n=Co(),r=I(n,!0),i=R(r),a=I(i,!0);A(i),A(n),z(()=>{q(r,H(t).name),q(a,H(t).note)}),U(`click`,n,()=>k(H(t).name)),K(e,n)}),A(t),z(()=>si(t,`left: ${H(Ae).px??``}px; top: ${H(Ae).py??``}px; --row: ${H(O)??``}px;`)),K(e,t)};J(ct,e=>{H(Ae)&&e(lt)});var ut=R(ct,2),dt=e=>{var t=To(),n=I(t,!0);A(t),z(()=>q(n,H(D))),K(e,t)};J(ut,e=>{H(D)&&e(dt)}),Zr(R(ut,2),()=>t.children??d),A(Be),z(e=>{qe=X(Ke,0,`world svelte-17jmwgz`,null,qe,{aiming:n().aiming}),Q(Ke,`viewBox`,`${H(f).x} ${H(f).y} ${H(f).w} ${H(f).h}`),Q($e,`viewBox`,e)},[()=>`0 0 ${Math.max(1,r().boxW)} ${Math.max(1,r().boxH)}`]),Cr(`pointerdown`,Ke,Oe,!0),U(`pointerdown`,Ke,Ne),U(`pointermove`,Ke,Le),U(`pointerup`,Ke,Re),Cr(`pointercancel`,Ke,Re),Cr(`wheel`,Ke,ze),Cr(`pointerleave`,Ke,()=>F(we,null)),Ti(Be,`clientWidth`,e=>r().boxW=e),Ti(Be,`clientHeight`,e=>r().boxH=e),K(e,Be),Ge()}wr([`pointerdown`,`pointermove`,`pointerup`,`click`]);var Oo=W(`<span> <span class="pk svelte-13z1v14"> </span></span>`),ko=W(`<div class="comp svelte-13z1v14"><span class="cn svelte-13z1v14"> </span> <span class="cs svelte-13z1v14"></span></div>`),Ao=W(`<h2 class="svelte-13z1v14">Condition at Tick 0</h2> <div class="gauge svelte-13z1v14"><span class="gk svelte-13z1v14">Hull</span> <span class="gbar svelte-13z1v14"><i></i></span> <span class="gv svelte-13z1v14"> </span></div> <div class="gauge svelte-13z1v14"><span class="gk svelte-13z1v14">Battery</span> <span class="gbar svelte-13z1v14"><i class="power svelte-13z1v14"></i></span> <span class="gv svelte-13z1v14"> </span></div> <!>`,1),jo=W(`<p class="note svelte-13z1v14"> </p>`),Mo=W(`<span class="v svelte-13z1v14"><span class="q svelte-13z1v14"> </span> </span>`),No=W(`<span class="v svelte-13z1v14"> </span> <span class="v svelte-13z1v14"> </span> <!>`,1),Po=W(`<span class="who svelte-13z1v14"> </span>`),Fo=W(`<li><!> </li>`),Io=W(`<div class="tickrow svelte-13z1v14"><span class="t svelte-13z1v14"> </span> <!></div> <ul class="svelte-13z1v14"></ul>`,1),Lo=W(`<h2> </h2> <label class="all svelte-13z1v14"><input type="checkbox" class="svelte-13z1v14"/> all ships</label> <label class="all svelte-13z1v14"><input type="checkbox" class="svelte-13z1v14"/> every message</label> <!>`,1),Ro=W(`<!> <!>`,1);function zo(e,t){We(t,!0);let n=Oi(t,`parts`,3,`all`),r=P(!1),i=P(!1);function a(e,t){if(e===t)return e;if(/^\d+$/.test(e)&&/^\d+$/.test(t))return`${e}/${t}`;let n=e.match(/^(\d+)\s+(.+)$/),r=t.match(/^(\d+)\s+(.+)$/);return n&&r&&n[2]===r[2]?`${n[1]}/${r[1]} ${n[2]}`:e}let o=M(()=>{let e=t.planning.plan;if(!e)return[];let n=H(r)?e.ships:e.ships.filter(e=>e.name===t.planning.selected),a=new Map,o=e=>(a.has(e)||a.set(e,{tick:e,condition:null,events:[]}),a.get(e));for(let e of n){for(let t of e.events)(H(i)||t.kind!==`internal`)&&o(t.tick).events.push({ship:e.name,...t});if(!H(r))for(let t of e.conditions)o(t.tick).condition=t}return[...a.values()].sort((e,t)=>e.tick-t.tick)}),s=M(()=>t.planning.ship),c=e=>n()===`all`||n()===e;var l=Nr(),u=L(l),d=e=>{var l=Ro(),u=L(l),d=e=>{var t=Ao(),n=R(L(t),2),r=R(I(n),2),i=I(r);let o;A(r);var c=R(r,2),l=I(c);A(c),A(n);var u=R(n,2),d=R(I(u),2),f=I(d);A(d);var p=R(d,2),h=I(p);A(p),A(u),Y(R(u,2),17,()=>H(s).components,e=>e.name,(e,t)=>{var n=ko(),r=I(n),i=I(r,!0);A(r);var o=R(r,2);Y(o,21,()=>Object.entries(H(t).status),([e,t])=>e,(e,n)=>{var r=M(()=>m(H(n),2));let i=()=>H(r)[0],o=()=>H(r)[1];var s=Oo();let c;var l=I(s,!0),u=R(l),d=I(u,!0);A(u),A(s),z(e=>{c=X(s,1,`pair svelte-13z1v14`,null,c,{spent:o()!==H(t).full[i()]}),q(l,e),q(d,i())},[()=>a(o(),H(t).full[i()])]),K(e,s)}),A(o),A(n),z(()=>q(i,H(t).name)),K(e,n)}),z(()=>{si(i,`width: ${100*H(s).hull/H(s).max_hull}%`),o=X(i,1,`svelte-13z1v14`,null,o,{low:H(s).hull/H(s).max_hull<.34}),q(l,`${H(s).hull??``}/${H(s).max_hull??``}`),si(f,`width: ${100*H(s).battery/H(s).max_battery}%`),q(h,`${H(s).battery??``}/${H(s).max_battery??``}`)}),K(e,t)},f=M(()=>H(s)&&c(`condition`));J(u,e=>{H(f)&&e(d)});var p=R(u,2),h=e=>{var a=Lo(),c=L(a);let l;var u=I(c);A(c);var d=R(c,2),f=I(d);Z(f),j(),A(d);var p=R(d,2),h=I(p);Z(h),j(),A(p);var g=R(p,2),_=e=>{var n=jo(),r=I(n,!0);A(n),z(()=>q(r,t.planning.selected?`Nothing recorded.`:`Pick a ship to read its log.`)),K(e,n)},v=e=>{var t=Nr();Y(L(t),17,()=>H(o),e=>e.tick,(e,t)=>{var n=Io(),i=L(n),a=I(i),o=I(a,!0);A(a);var s=R(a,2),c=e=>{var n=No(),r=L(n),i=I(r);A(r);var a=R(r,2),o=I(a);A(a),Y(R(a,2),17,()=>Object.entries(H(t).condition.shields),([e,t])=>e,(e,t)=>{var n=M(()=>m(H(t),2));let r=()=>H(n)[0],i=()=>H(n)[1];var a=Mo(),o=I(a),s=I(o,!0);A(o);var c=R(o,1,!0);A(a),z(()=>{q(s,r()),q(c,i())}),K(e,a)}),z(()=>{q(i,`hull ${H(t).condition.hull??``}`),q(o,`bat ${H(t).condition.battery??``}`)}),K(e,n)};J(s,e=>{H(t).condition&&e(c)}),A(i);var l=R(i,2);Y(l,21,()=>H(t).events,Vr,(e,t)=>{var n=Fo(),i=I(n),a=e=>{var n=Po(),r=I(n,!0);A(n),z(()=>q(r,H(t).ship)),K(e,n)};J(i,e=>{H(r)&&e(a)});var o=R(i,1,!0);A(n),z(()=>{X(n,1,ei(H(t).kind),`svelte-13z1v14`),q(o,H(t).text)}),K(e,n)}),A(l),z(()=>q(o,H(t).tick)),K(e,n)}),K(e,t)};J(g,e=>{H(o).length?e(v,-1):e(_)}),z(()=>{l=X(c,1,`svelte-13z1v14`,null,l,{spaced:H(s)&&n()===`all`}),q(u,`Round ${t.planning.plan.round??``} · ${(H(r)?`faction`:t.planning.selected??`no ship`)??``}`)}),xi(f,()=>H(r),e=>F(r,e)),xi(h,()=>H(i),e=>F(i,e)),K(e,a)},g=M(()=>c(`log`));J(p,e=>{H(g)&&e(h)}),K(e,l)};J(u,e=>{t.planning.plan&&e(d)}),K(e,l),Ge()}var Bo=W(`<span> </span>`),Vo=W(`<tr><td class="t svelte-11q811x"><button type="button" class="tick-pick svelte-11q811x"> </button></td><td class="svelte-11q811x"><!></td><td class="svelte-11q811x"><!></td><td class="svelte-11q811x"> </td><td class="fire-cell svelte-11q811x"> </td></tr>`),Ho=W(`<table class="svelte-11q811x"><thead><tr><th class="t svelte-11q811x">Tick</th><th class="svelte-11q811x">Turn</th><th class="svelte-11q811x">Throttle</th><th class="svelte-11q811x">Speed</th><th class="svelte-11q811x">Orders</th></tr></thead><tbody class="svelte-11q811x"></tbody></table> <p class="limits-line svelte-11q811x"> </p>`,1);function Uo(e,t){We(t,!0);let n=Oi(t,`planning`,7),r=M(()=>n().ship),i=M(()=>n().shipOrders),a=M(()=>n().chain);var o=Nr(),s=L(o),c=e=>{var t=Ho(),o=L(t),s=R(I(o));Y(s,21,()=>H(a).slice(1),e=>e.t,(e,t)=>{let a=M(()=>[...Object.keys(H(i).fire[H(t).t]??{}),...Object.keys(H(i).comp[H(t).t]??{})]);var o=Vo();let s;var c=I(o),l=I(c),u=I(l,!0);A(l),A(c);var d=R(c),f=I(d),p=e=>{K(e,Mr(`·`))},m=e=>{var n=Bo();let a;var o=I(n);A(n),z((e,r)=>{a=X(n,1,`turn svelte-11q811x`,null,a,e),q(o,`${H(i).turn[H(t).t]>0?`R`:`L`}${r??``}`)},[()=>({pinned:Math.abs(H(i).turn[H(t).t])>=H(r).limits.max_turn}),()=>Math.abs(H(i).turn[H(t).t])]),K(e,n)};J(f,e=>{H(i).turn[H(t).t]?e(m,-1):e(p)}),A(d);var h=R(d),g=I(h),_=e=>{K(e,Mr(`·`))},v=e=>{var n=Bo();let a;var o=I(n);A(n),z(e=>{a=X(n,1,`accel svelte-11q811x`,null,a,e),q(o,`A${H(i).accel[H(t).t]>0?`+`:``}${H(i).accel[H(t).t]??``}`)},[()=>({pinned:Math.abs(H(i).accel[H(t).t])>=H(r).limits.max_delta_v})]),K(e,n)};J(g,e=>{H(i).accel[H(t).t]?e(v,-1):e(_)}),A(h);var y=R(h),b=I(y,!0);A(y);var x=R(y),S=I(x,!0);A(x),A(o),z(e=>{s=X(o,1,`svelte-11q811x`,null,s,{idle:!H(i).turn[H(t).t]&&!H(i).accel[H(t).t]&&!H(a).length,cur:H(t).t===n().selectedTick}),q(u,H(t).t),q(b,H(t).speed),q(S,e)},[()=>H(a).length?H(a).join(`,`):`·`]),U(`click`,o,()=>n().selectedTick=H(t).t),U(`click`,l,()=>n().selectedTick=H(t).t),K(e,o)}),A(s),A(o);var c=R(o,2),l=I(c);A(c),z(()=>q(l,`limits: ${H(r).limits.max_turn??``}° turn · Δv ${H(r).limits.max_delta_v??``} ·
     max speed ${H(r).limits.max_speed??``}`)),K(e,t)};J(s,e=>{H(r)&&H(i)&&H(a)&&e(c)}),K(e,o),Ge()}wr([`click`]);var Wo=W(` <!>`,1),Go=W(`<button type="button"></button>`),Ko=W(`<span class="rounds svelte-11ssjzi"></span>`),qo=W(`<button type="button" class="badge moved svelte-11ssjzi"> </button>`),Jo=W(`<span class="badge aiming svelte-11ssjzi"> </span>`),Yo=W(`<span class="badge past svelte-11ssjzi">finished</span>`),Xo=W(`<span class="badge past svelte-11ssjzi">read only</span>`),Zo=W(`<div class="logbody svelte-11ssjzi"><!></div>`),Qo=W(`<div class="zoom svelte-11ssjzi"><button type="button" aria-label="Zoom in" class="svelte-11ssjzi">+</button> <button type="button" aria-label="Zoom out" class="svelte-11ssjzi">−</button> <button type="button" class="svelte-11ssjzi">Fit</button></div>`),$o=W(`<li><button type="button"><span></span> <span class="nm svelte-11ssjzi"> </span> <span class="ty svelte-11ssjzi"> </span> <span class="sp svelte-11ssjzi"> </span></button></li>`),es=W(`<span class="onmap svelte-11ssjzi" title="orders saved; their course and firing are on the map">plan</span>`),ts=W(`<li class="ally-row svelte-11ssjzi"><span></span> <span class="nm svelte-11ssjzi"> </span><span class="ty svelte-11ssjzi"> </span> <!></li>`),ns=W(`<span class="sk svelte-11ssjzi"> </span><span class="sv svelte-11ssjzi"> </span>`,1),rs=W(`<div class="buttons svelte-11ssjzi"><button type="button" class="ghost-btn svelte-11ssjzi">Reset course</button> <button type="button" class="save svelte-11ssjzi">Save all</button></div> <div class="buttons svelte-11ssjzi"><button type="button" title="Stop the course being dragged by accident. Weapons stay settable."> </button> <button type="button" title="Tell the director you are done with this round"> </button></div>`,1),is=W(`<p class="note svelte-11ssjzi"> </p>`),as=W(`<p> </p>`),os=W(`<h2 class="svelte-11ssjzi">Orders</h2> <p class="hint svelte-11ssjzi"> </p>`,1),ss=W(`<span></span>`),cs=W(`<button type="button" class="wfire on svelte-11ssjzi">clear</button>`),ls=W(`<button type="button" class="wfire svelte-11ssjzi"> </button>`),us=W(`<option> </option>`),ds=W(`<label class="slider aim svelte-11ssjzi"> <input type="range" step="5" class="svelte-11ssjzi"/> <b class="svelte-11ssjzi"> </b></label>`),fs=W(`<label class="slider svelte-11ssjzi"> <select class="svelte-11ssjzi"></select></label> <!>`,1),ps=W(`<span class="at svelte-11ssjzi"> </span>`),ms=W(`<label class="slider svelte-11ssjzi"> <input type="range" step="10" class="svelte-11ssjzi"/> <b class="svelte-11ssjzi"> </b></label>`),hs=W(`<label class="slider aim svelte-11ssjzi">aim <input type="range" step="5" class="svelte-11ssjzi"/> <b class="svelte-11ssjzi"> </b></label> <!>`,1),gs=W(`<div class="worder svelte-11ssjzi"><!></div>`),_s=W(`<li><div class="wrow svelte-11ssjzi"><span class="wname svelte-11ssjzi"> </span> <!> <span><!></span></div> <!></li>`),vs=W(`<select class="svelte-11ssjzi"></select>`),ys=W(`<input type="range" step="1" class="svelte-11ssjzi"/> <b class="svelte-11ssjzi"> </b>`,1),bs=W(`<label class="slider svelte-11ssjzi"> <!></label>`),xs=W(`<div class="worder svelte-11ssjzi"></div>`),Ss=W(`<li><div class="wrow svelte-11ssjzi"><span class="wname svelte-11ssjzi"> </span> <!> <span class="wammo svelte-11ssjzi"></span></div> <!></li>`),Cs=W(`<ul class="weapons svelte-11ssjzi"></ul>`),ws=W(`<h2 class="svelte-11ssjzi"> </h2> <ul class="weapons svelte-11ssjzi"></ul> <!> <p class="note svelte-11ssjzi">One order per weapon per tick. Drag a shot's handle on the map to
               re-aim it; the arc turns with the course you plotted.</p>`,1),Ts=W(`<li class="svelte-11ssjzi"> </li>`),Es=W(`<h2 class="spaced svelte-11ssjzi">Other orders</h2> <ul class="others svelte-11ssjzi"></ul>`,1),Ds=W(`<section class="svelte-11ssjzi"><details class="fold svelte-11ssjzi"><summary class="svelte-11ssjzi"> </summary> <div class="specs svelte-11ssjzi"></div></details></section> <section class="svelte-11ssjzi"><h2 class="svelte-11ssjzi"> </h2> <!> <!> <!></section> <section class="grow svelte-11ssjzi"><!> <!></section>`,1),Os=W(`<p class="tally svelte-11ssjzi"> <span class="enemy-txt svelte-11ssjzi"> </span> </p>`),ks=W(`<div class="console svelte-11ssjzi"><header class="svelte-11ssjzi"><button type="button" class="back svelte-11ssjzi" title="Choose another game or player">←</button> <h1 class="svelte-11ssjzi">Starship Arena</h1> <span class="sub svelte-11ssjzi"><!></span> <span class="spacer svelte-11ssjzi"></span> <!> <!> <!> <!> <span class="badge svelte-11ssjzi"> </span></header> <main class="svelte-11ssjzi"><aside><button type="button" class="tab svelte-11ssjzi">Log</button> <!></aside> <!> <aside class="panel svelte-11ssjzi"><section class="svelte-11ssjzi"><h2 class="svelte-11ssjzi">Your ships</h2> <ul class="ships svelte-11ssjzi"><!> <!></ul></section> <!> <section class="svelte-11ssjzi"><h2 class="svelte-11ssjzi">Layers</h2> <label class="svelte-11ssjzi"><input type="checkbox" class="svelte-11ssjzi"/> Grid &amp; origin</label> <label class="svelte-11ssjzi"><input type="checkbox" class="svelte-11ssjzi"/> Planned courses</label> <label class="svelte-11ssjzi"><input type="checkbox" class="svelte-11ssjzi"/> Weapon orders</label> <label class="svelte-11ssjzi"><input type="checkbox" class="svelte-11ssjzi"/> Scan range</label> <label class="svelte-11ssjzi"><input type="checkbox" class="svelte-11ssjzi"/> Tracks</label> <label class="svelte-11ssjzi"><input type="checkbox" class="svelte-11ssjzi"/> </label> <label class="svelte-11ssjzi"><input type="checkbox" class="svelte-11ssjzi"/> </label> <label class="svelte-11ssjzi"><input type="checkbox" class="svelte-11ssjzi"/> </label> <label class="svelte-11ssjzi"><input type="checkbox" class="svelte-11ssjzi"/> </label></section> <section class="svelte-11ssjzi"><!> <details class="fold svelte-11ssjzi"><summary class="svelte-11ssjzi">Legend</summary> <ul class="legend svelte-11ssjzi"><li class="svelte-11ssjzi"><span class="sw sel-sw svelte-11ssjzi"></span>ship being planned</li> <li class="svelte-11ssjzi"><span class="sw own svelte-11ssjzi"></span>your other ships</li> <li class="svelte-11ssjzi"><span class="sw course-sw svelte-11ssjzi"></span>their planned course</li> <li class="svelte-11ssjzi"><span class="sw ally svelte-11ssjzi"></span>faction ally, and the plan they saved</li> <li class="svelte-11ssjzi"><span class="sw enemy svelte-11ssjzi"></span>enemy contact</li> <li class="svelte-11ssjzi"><span class="sw blast-sw svelte-11ssjzi"></span>explosion (true radius)</li></ul> <p class="hint sub-hint svelte-11ssjzi">▲ course known · ◆ mine · ■ starbase · small ◆ seen once, course unknown</p></details></section></aside></main></div>`);function As(e,t){We(t,!0);let n=Oi(t,`layers`,7),r=P(!1),i=M(()=>t.planning.plan),a=M(()=>t.planning.ship),o=M(()=>({path:t.planning.editable&&!t.planning.locked.has(t.planning.selected),shots:t.planning.editable,ticks:!0}));function s(e){let n=$(e.x,e.y);t.camera.centreOn(n.vx,n.vy)}async function c(){let e=await t.planning.toggleReady();e!==null&&t.onRound(e)}var l=ks(),u=I(l),d=I(u),f=R(d,4),p=I(f),h=e=>{var n=Wo(),r=L(n),a=R(r),o=e=>{var t=Mr();z(()=>q(t,`planning round ${H(i).round+1}`)),K(e,t)},s=e=>{var t=Mr();z(()=>q(t,`after round ${H(i).round??``}`)),K(e,t)};J(a,e=>{t.planning.editable?e(o):e(s,-1)}),z(e=>q(r,`${H(i).player??``} · faction ${e??``} · `),[()=>H(i).factions.join(`, `)]),K(e,n)},g=e=>{K(e,Mr(`loading…`))};J(p,e=>{H(i)?e(h):e(g,-1)}),A(f);var _=R(f,4),v=e=>{var n=Ko();Y(n,21,()=>Array(H(i).last_round+1),Vr,(e,n,r)=>{var a=Go();let o;a.textContent=r,z(()=>o=X(a,1,`rbtn svelte-11ssjzi`,null,o,{on:r===H(i).round})),U(`click`,a,()=>t.onRound(r)),K(e,a)}),A(n),K(e,n)};J(_,e=>{H(i)&&e(v)});var y=R(_,2),b=e=>{var n=qo(),r=I(n);A(n),z(()=>q(r,`Round ${t.planning.moved??``} has been played. Open it`)),U(`click`,n,()=>t.onRound(t.planning.moved)),K(e,n)};J(y,e=>{t.planning.moved&&e(b)});var x=R(y,2),S=e=>{var n=Jo(),r=I(n);A(n),z(()=>q(r,`click a target for ${t.planning.aiming??``}`)),K(e,n)};J(x,e=>{t.planning.aiming&&e(S)});var C=R(x,2),w=e=>{K(e,Yo())},ee=e=>{K(e,Xo())};J(C,e=>{H(i)&&H(i).state===`finished`?e(w):H(i)&&!t.planning.editable&&e(ee,1)});var T=R(C,2),te=I(T,!0);A(T),A(u);var ne=R(u,2),re=I(ne);let ie;var ae=I(re),oe=R(ae,2),se=e=>{var n=Zo();zo(I(n),{get planning(){return t.planning}}),A(n),K(e,n)};J(oe,e=>{H(r)&&e(se)}),A(re);var ce=R(re,2);Do(ce,{get planning(){return t.planning},get camera(){return t.camera},get layers(){return n()},get grabbable(){return H(o)},children:(e,n)=>{var r=Qo(),i=I(r),a=R(i,2),o=R(a,2);A(r),U(`click`,i,()=>t.camera.zoomBy(1/1.15)),U(`click`,a,()=>t.camera.zoomBy(1.15)),U(`click`,o,function(...e){t.onFit?.apply(this,e)}),K(e,r)},$$slots:{default:!0}});var le=R(ce,2),ue=I(le),E=R(I(ue),2),de=I(E);Y(de,17,()=>t.planning.ownShips,e=>e.name,(e,n)=>{var r=$o(),i=I(r);let a;var o=I(i);let c;var l=R(o,2),u=I(l,!0);A(l);var d=R(l,2),f=I(d,!0);A(d);var p=R(d,2),m=I(p,!0);A(p),A(i),A(r),z(()=>{a=X(i,1,`pick svelte-11ssjzi`,null,a,{on:H(n).name===t.planning.selected,gone:!H(n).alive}),c=X(o,1,`lamp svelte-11ssjzi`,null,c,{lit:H(n).player_ready}),Q(o,`title`,H(n).player_ready?`you said ready`:`you have not said ready`),q(u,H(n).name),q(f,H(n).ship_type),q(m,H(n).speed)}),U(`click`,i,()=>{t.planning.selectShip(H(n).name),s(H(n))}),K(e,r)});var fe=R(de,2),pe=e=>{var t=Nr();Y(L(t),17,()=>H(i).ships.filter(e=>!e.owned),e=>e.name,(e,t)=>{var n=ts(),r=I(n);let i;var a=R(r,2),o=I(a,!0);A(a);var s=R(a),c=I(s,!0);A(s);var l=R(s,2),u=e=>{K(e,es())};J(l,e=>{H(t).commands.length&&e(u)}),A(n),z(()=>{i=X(r,1,`lamp svelte-11ssjzi`,null,i,{lit:H(t).player_ready}),Q(r,`title`,H(t).player?`${H(t).player} is ${H(t).player_ready?`ready`:`not ready`}`:``),q(o,H(t).name),q(c,H(t).player??H(t).ship_type)}),K(e,n)}),K(e,t)};J(fe,e=>{H(i)&&e(pe)}),A(E),A(ue);var me=R(ue,2),he=e=>{var n=Ds(),r=L(n),o=I(r),s=I(o),l=I(s);A(s);var u=R(s,2);Y(u,21,()=>Object.entries(H(a).specs),([e,t])=>e,(e,t)=>{var n=M(()=>m(H(t),2));let r=()=>H(n)[0],i=()=>H(n)[1];var a=ns(),o=L(a),s=I(o,!0);A(o);var c=R(o),l=I(c,!0);A(c),z(()=>{q(s,r()),q(l,i())}),K(e,a)}),A(u),A(o),A(r);var d=R(r,2),f=I(d),p=I(f);A(f);var h=R(f,2);Uo(h,{get planning(){return t.planning}});var g=R(h,2),_=e=>{var n=rs(),r=L(n),i=I(r),a=R(i,2);A(r);var o=R(r,2),s=I(o);let l;var u=I(s,!0);A(s);var d=R(s,2);let f;var p=I(d,!0);A(d),A(o),z((e,n)=>{a.disabled=t.planning.sending,l=X(s,1,`state svelte-11ssjzi`,null,l,e),q(u,n),f=X(d,1,`state svelte-11ssjzi`,null,f,{on:t.planning.ready}),d.disabled=t.planning.settingReady,q(p,t.planning.ready?`Ready`:`Not ready`)},[()=>({on:t.planning.locked.has(t.planning.selected)}),()=>t.planning.locked.has(t.planning.selected)?`Unlock path`:`Lock path`]),U(`click`,i,()=>t.planning.resetCourse(t.planning.selected)),U(`click`,a,()=>t.planning.saveAll()),U(`click`,s,()=>t.planning.toggleLock(t.planning.selected)),U(`click`,d,c),K(e,n)},v=e=>{var t=is(),n=I(t);A(t),z(()=>q(n,`Round ${H(i).round??``} has already been played. Go to round
               ${H(i).last_round??``} to give orders.`)),K(e,t)};J(g,e=>{t.planning.editable?e(_):e(v,-1)});var y=R(g,2),b=e=>{var n=as();let r;var i=I(n,!0);A(n),z(e=>{r=X(n,1,`savemsg svelte-11ssjzi`,null,r,e),q(i,t.planning.saveMsg)},[()=>({err:t.planning.saveMsg.includes(`REJECTED`)||t.planning.saveMsg.includes(`error`)})]),K(e,n)};J(y,e=>{t.planning.saveMsg&&e(b)}),A(d);var x=R(d,2),S=I(x),C=e=>{var t=os(),n=R(L(t),2),r=I(n);A(n),z(()=>q(r,`Click a joint on the course, or a tick number above, to give
@@ -4,6 +4,11 @@ import {
   defaultParams, needsATarget, NAMED, SCENERY,
 } from "./plan.js";
 
+const JOB_POLL_MS = 1000;
+// How long saying ready waits on its round before leaving it to the pulse. A worker that died
+// leaves its job running for good.
+const JOB_WAIT_MS = 5 * 60 * 1000;
+
 // One round of planning for one player: the picture the API sent, the orders being drawn on top
 // of it, and what is selected. Both shells drive this; neither keeps a second copy of any of it.
 
@@ -286,7 +291,23 @@ export class Planning {
       if (!res.ok) return null;
       const body = await res.json();
       this.ready = body.ready;
-      if (!body.processed) return null;
+      if (!body.job) return null;
+      this.saveMsg = "Everyone is ready. The round is being played.";
+      const job = await this.waitFor(body.job);
+      if (job?.state === "pending" || job?.state === "running") {
+        this.saveMsg = "The round is taking long. It will show here once it has been played.";
+        return null;
+      }
+      if (job?.state !== "done") {
+        this.saveMsg = `The round could not be played: ${job ? job.error : "it went missing."}`;
+        return null;
+      }
+      // Done can still mean nothing ran, when someone took ready back while the job waited.
+      const p = await fetch(`/api/game/${this.game}/pulse`);
+      if (!p.ok || (await p.json()).last_round <= this.plan.last_round) {
+        this.saveMsg = job.result;
+        return null;
+      }
       this.saveMsg = "Everyone was ready. The round has been processed.";
       return this.plan.last_round + 1;
     } finally {
@@ -294,6 +315,21 @@ export class Planning {
     }
   }
 
+  // The round saying ready sets off is played as a job, so ask after it until it is over, or
+  // for JOB_WAIT_MS. Then the job as it last stood, still pending or running.
+  async waitFor(job) {
+    const until = Date.now() + JOB_WAIT_MS;
+    let found = null;
+    while (Date.now() < until) {
+      await new Promise((resolve) => setTimeout(resolve, JOB_POLL_MS));
+      const res = await fetch(`/api/game/${this.game}/jobs/${job}`);
+      if (!res.ok) return null;
+      found = await res.json();
+      if (found.state === "done" || found.state === "failed") return found;
+    }
+    return found;
+  }
+
   // Polled while you wait. Push would need a connection held open, and the host has two workers.
   async pulse() {
     if (document.visibilityState !== "visible" || !this.plan) return;
@@ -0,0 +1,70 @@
+"""Every process adds what it counted to one file, and /api/metrics answers for all of them."""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from fastapi.testclient import TestClient
+
+from arena import metrics
+from arena.admin_ui.app import app as console
+from arena.api.app import app
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.original, metrics.directory = metrics.directory, self.root
+
+    def tearDown(self):
+        metrics.collected()
+        metrics.directory = self.original
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_nothing_is_counted_without_somewhere_to_keep_it(self):
+        metrics.directory = ''
+        metrics.count('arena_world_unpickles_total')
+        self.assertEqual('', metrics.exposition())
+        self.assertEqual([], os.listdir(self.root))
+
+    def test_what_another_worker_counted_is_added_in(self):
+        other = metrics.Counts(self.root)
+        other.count('arena_world_unpickles_total', 2, {})
+        other.flush()
+        metrics.count('arena_world_unpickles_total')
+        metrics.count('arena_read_bytes_total', 100, kind='world')
+        text = metrics.exposition()
+        self.assertIn('arena_world_unpickles_total 3', text)
+        self.assertIn('arena_read_bytes_total{kind="world"} 100', text)
+
+    def test_threads_counting_while_it_is_written_lose_nothing(self):
+        counts = metrics.Counts(self.root)
+
+        def counting():
+            for _ in range(2000):
+                counts.count('arena_world_unpickles_total', 1, {})
+                counts.observe('arena_round_seconds', 0.01, {})
+                counts.flush()
+        threads = [threading.Thread(target=counting) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        text = metrics.exposition()
+        self.assertIn('arena_world_unpickles_total 8000', text)
+        self.assertIn('arena_round_seconds_count 8000', text)
+
+    def test_a_request_is_timed_by_its_route(self):
+        client = TestClient(app)
+        client.get('/api/health')
+        client.get('/api/health')
+        text = client.get('/api/metrics').text
+        self.assertIn('# TYPE arena_request_seconds histogram', text)
+        self.assertIn('arena_request_seconds_count{app="api",method="GET",route="/api/health"} 2',
+                      text)
+        self.assertIn('le="+Inf"} 2', text)
+
+    def test_the_console_is_timed_too(self):
+        console.test_client().get('/players')
+        self.assertIn('app="console",method="GET",route="/players"', metrics.exposition())
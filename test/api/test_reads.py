@@ -0,0 +1,81 @@
+"""What an endpoint reads from disk, held to a budget so one that starts opening a file per ship
+fails here rather than on the host."""
+import os
+import shutil
+import tempfile
+import unittest
+
+from fastapi.testclient import TestClient
+
+from arena import tally
+from arena.admin_ui import appfacade
+from arena.admin_ui.app import app as console
+from arena.api import game as game_api
+from arena.api.app import app
+from arena.app.players import DIRECTOR, LOGIN_COOKIE
+from arena.app.services import GameService
+from arena.engine.admin import setup_game
+from arena.engine.gamedirectory import GameDirectory
+from arena.log import deactivate_logger_blocklist
+
+GAME = 'test-game'
+# Most files opened and worlds unpickled, per endpoint.
+BUDGET = {
+    '/api/game/games': (2, 2),
+    '/api/game/me': (4, 3),
+    f'/api/game/{GAME}/ships': (2, 2),
+    f'/api/game/{GAME}/overview': (1, 1),
+    f'/api/game/{GAME}/pulse': (2, 0),
+    '/api/game/valhalla': (0, 0),
+}
+
+
+def counted(response) -> dict:
+    return dict(part.split('=') for part in response.headers[tally.HEADER].split('; '))
+
+
+class TestATally(unittest.TestCase):
+    def test_only_reads_inside_it_are_counted(self):
+        path = os.path.join('test', 'test-games', GAME, 'ships.jsonl')
+        with tally.reading(path):
+            pass
+        with tally.tallied('test') as reads:
+            with tally.reading(path):
+                pass
+            tally.unpickled()
+        self.assertEqual((1, os.path.getsize(path), 1),
+                         (reads.opens, reads.bytes_read, reads.unpickles))
+        self.assertIsNone(tally.current())
+
+
+class TestEndpointsReadWithinBudget(unittest.TestCase):
+    def setUp(self):
+        deactivate_logger_blocklist()
+        self.root = tempfile.mkdtemp()
+        shutil.copytree(os.path.join('test', 'test-games', GAME), os.path.join(self.root, 'games', GAME))
+        setup_game(GameDirectory(os.path.join(self.root, 'games'), GAME))
+        self.service = GameService(self.root)
+        self.original, game_api.service = game_api.service, self.service
+        self.original_dir, appfacade.GAME_DATA_DIR = appfacade.GAME_DATA_DIR, self.root
+        tally.header = True
+        self.token = self.service.players.issue('Serge', role=DIRECTOR).token
+
+    def tearDown(self):
+        tally.header = False
+        game_api.service = self.original
+        appfacade.GAME_DATA_DIR = self.original_dir
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_the_game_api(self):
+        client = TestClient(app, base_url="https://testserver")
+        client.post('/api/game/login', json={'token': self.token})
+        for url, (opens, unpickles) in BUDGET.items():
+            with self.subTest(url):
+                reads = counted(client.get(url))
+                self.assertLessEqual(int(reads['opens']), opens)
+                self.assertLessEqual(int(reads['unpickles']), unpickles)
+
+    def test_the_console_says_what_it_read(self):
+        client = console.test_client()
+        client.set_cookie(LOGIN_COOKIE, self.token)
+        self.assertGreater(int(counted(client.get('/'))['opens']), 0)
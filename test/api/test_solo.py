@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 
 from arena.api import game as game_api
 from arena.api.app import app
+from arena.app import jobs
 from arena.app.services import GameService
 
 PICK = {'ships': [{'name': 'Rocinante', 'type': 'H2545'}]}
@@ -18,8 +19,10 @@ class TestSoloOverTheApi(TestCase):
         self.service = GameService(self.root)
         self.original, game_api.service = game_api.service, self.service
         self.client = TestClient(app, base_url="https://testserver")
+        jobs.background = False
 
     def tearDown(self):
+        jobs.background = True
         game_api.service = self.original
         shutil.rmtree(self.root, ignore_errors=True)
 
@@ -58,14 +61,20 @@ class TestSoloOverTheApi(TestCase):
                                  json={'lines': ['1: Accelerate 20']})
         self.assertTrue(saved.json()['ok'])
 
-    def test_saying_ready_processes_the_round(self):
+    def test_saying_ready_queues_the_round(self):
         self.login_as('Menno')
         self.client.post('/api/game/solo', json=PICK)
         self.client.post('/api/game/Solo_Menno/ships/Rocinante/commands',
                          json={'lines': ['1: Accelerate 20']})
 
         ready = self.client.post('/api/game/Solo_Menno/players/Menno/ready', json={'ready': True})
-        self.assertEqual({'ready': False, 'processed': True}, ready.json())
+        job = ready.json()['job']
+        self.assertTrue(ready.json()['ready'])
+        self.assertEqual('pending', self.client.get(f'/api/game/Solo_Menno/jobs/{job}').json()['state'])
+        self.assertEqual(1, self.client.get('/api/game/solo').json()['game']['current_round'])
+
+        self.service.job_queue.drain()
+        self.assertEqual('done', self.client.get(f'/api/game/Solo_Menno/jobs/{job}').json()['state'])
         self.assertEqual(2, self.client.get('/api/game/solo').json()['game']['current_round'])
 
     def test_it_stays_out_of_the_games_list(self):
@@ -1,7 +1,8 @@
 """A round this code cannot read says which game it is, and never takes a list down with it.
 
-`test-games/unreadable` is a real world saved before `DrawType` was removed from the engine, kept
-because no amount of regenerating can produce one again.
+`test-games/unreadable` is a real world saved before `DrawType` was removed from the engine, and
+with its points and vectors in the shape they were saved in then. Kept because no amount of
+regenerating can produce one again.
 """
 import shutil
 import tempfile
@@ -57,7 +58,9 @@ class TestAnUnreadableGame(unittest.TestCase):
         stale = self.admin.stale_rounds(BROKEN)
 
         self.assertEqual([0], [r.round_nr for r in stale])
-        self.assertEqual({'arena.engine.objects.event.DrawType': 1}, stale[0].missing)
+        self.assertEqual({'arena.engine.objects.event.DrawType': 1,
+                          'arena.engine.objects.objectinspace.Point': 32,
+                          'arena.engine.objects.objectinspace.Vector': 8}, stale[0].missing)
         self.assertEqual('', stale[0].error)
         self.assertFalse(stale[0].reads)
 
@@ -4,6 +4,7 @@ import tempfile
 from unittest import TestCase
 
 from arena.announce import Announcer, Channel
+from arena.app import jobs
 from arena.app.dto import By, GameSettings, ProcessingTrigger
 from arena.app.services import AdminService, GameService
 
@@ -77,8 +78,10 @@ class TestAnnouncingARound(TestCase):
         self.admin = AdminService(self.root, announcer=Announcer([self.speaker]))
         self.game = GameService(self.root, announcer=Announcer([self.speaker]))
         self.admin.create_game(GAME, SHIPS, 'generic')
+        jobs.background = False
 
     def tearDown(self):
+        jobs.background = True
         shutil.rmtree(self.root, ignore_errors=True)
 
     def _order_up(self):
@@ -105,6 +108,7 @@ class TestAnnouncingARound(TestCase):
         self.game.set_ready(GAME, 'Serge', True)
         self.assertEqual([], self.speaker.heard)
         self.game.set_ready(GAME, 'Ilya', True)
+        self.game.job_queue.drain()
         self.assertEqual(1, len(self.speaker.heard))
 
     def test_a_game_told_not_to_announce_stays_quiet(self):
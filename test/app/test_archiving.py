@@ -1,6 +1,7 @@
 import os
 import shutil
 import tempfile
+import zipfile
 from unittest import TestCase
 
 from arena.app.services import AdminService, GameService
@@ -46,8 +47,8 @@ class TestArchiving(TestCase):
 
     def test_nothing_is_lost_in_archiving(self):
         self.admin.archive_game('old')
-        with open(os.path.join(self.root, 'archived', 'old', 'ships.jsonl')) as f:
-            self.assertIn('Alpha', f.read())
+        with zipfile.ZipFile(os.path.join(self.root, 'archived', 'old', 'game.zip')) as pack:
+            self.assertIn('Alpha', pack.read('ships.jsonl').decode())
 
     def test_unarchiving_puts_it_back(self):
         self.admin.archive_game('old')
@@ -0,0 +1,119 @@
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase
+
+from arena.app import jobs
+from arena.app.dto import GameSettings
+from arena.app.jobs import JobQueue
+from arena.app.services import AdminService, GameService
+
+GAME = 'queued'
+SHIPS = [
+    {'name': 'Alpha', 'type': 'A2527', 'faction': 'One', 'player': 'Serge', 'x': 0, 'y': 0},
+    {'name': 'Bravo', 'type': 'A2527', 'faction': 'Two', 'player': 'Ilya', 'x': 100, 'y': 100},
+]
+
+
+class TestTheQueue(TestCase):
+    """Work a request hands over, run later by whoever claims it first."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.admin = AdminService(self.root)
+        self.game = GameService(self.root)
+        self.admin.create_game(GAME, SHIPS, 'generic')
+        jobs.background = False
+
+    def tearDown(self):
+        jobs.background = True
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _order_up(self):
+        for ship in ('Alpha', 'Bravo'):
+            self.game.save_commands(GAME, ship, ['1: A5'])
+
+    def test_a_job_waits_until_it_is_run(self):
+        self._order_up()
+        job = self.admin.queue(jobs.PROCESS, GAME)
+        self.assertEqual(jobs.PENDING, self.admin.job(job.id).state)
+        self.assertEqual(1, self.admin.standing(GAME).round_nr)
+
+        self.admin.job_queue.drain()
+        self.assertEqual((jobs.DONE, 'Round 1 processed.'),
+                         (self.admin.job(job.id).state, self.admin.job(job.id).result))
+        self.assertEqual(2, self.admin.standing(GAME).round_nr)
+
+    def test_it_says_when_there_was_nothing_to_do(self):
+        job = self.admin.queue(jobs.PROCESS, GAME)
+        self.admin.job_queue.drain()
+        self.assertEqual('Nothing processed: orders are still missing.', self.admin.job(job.id).result)
+
+    def test_the_same_work_still_waiting_is_queued_once(self):
+        first = self.admin.queue(jobs.FORCE, GAME)
+        self.assertEqual(first.id, self.admin.queue(jobs.FORCE, GAME).id)
+        self.assertNotEqual(first.id, self.admin.queue(jobs.REGENERATE, GAME).id)
+
+    def test_only_one_process_claims_a_job(self):
+        self.admin.queue(jobs.FORCE, GAME)
+        other = JobQueue(self.root, self.admin.run_job)
+        self.assertIsNotNone(self.admin.job_queue.claim())
+        self.assertIsNone(other.claim())
+
+    def test_a_failure_is_kept_and_the_next_job_still_runs(self):
+        self.admin.finish_game(GAME)
+        failed = self.admin.queue(jobs.FORCE, GAME)
+        exported = self.admin.queue(jobs.EXPORT, GAME)
+        self.admin.job_queue.drain()
+        self.assertEqual(jobs.FAILED, self.admin.job(failed.id).state)
+        self.assertIn('finished', self.admin.job(failed.id).error)
+        self.assertEqual(jobs.DONE, self.admin.job(exported.id).state)
+        self.assertTrue(os.path.isdir(os.path.join(self.root, 'valhalla', GAME)))
+
+    def test_the_last_player_ready_queues_the_round(self):
+        self.admin.save_settings(GAME, GameSettings(on_all_ready=True, process_hours=[]))
+        self._order_up()
+        self.assertIsNone(self.game.set_ready(GAME, 'Serge', True))
+        job = self.game.set_ready(GAME, 'Ilya', True)
+        self.assertEqual(1, self.admin.standing(GAME).round_nr)
+
+        self.game.job_queue.drain()
+        self.assertEqual('Round 1 processed.', self.admin.job(job.id).result)
+        self.assertEqual('player', self.admin.journal(GAME)[0].detail['by'])
+
+    def test_taking_it_back_before_the_job_runs_stops_it(self):
+        self.admin.save_settings(GAME, GameSettings(on_all_ready=True, process_hours=[]))
+        self._order_up()
+        self.game.set_ready(GAME, 'Serge', True)
+        job = self.game.set_ready(GAME, 'Ilya', True)
+        self.game.set_ready(GAME, 'Ilya', False)
+
+        self.game.job_queue.drain()
+        self.assertEqual('Nothing processed: not everyone is ready any more.',
+                         self.admin.job(job.id).result)
+        self.assertEqual(1, self.admin.standing(GAME).round_nr)
+
+    def test_the_newest_of_a_game_come_first(self):
+        older = self.admin.queue(jobs.FORCE, GAME)
+        newer = self.admin.queue(jobs.REGENERATE, GAME)
+        self.admin.job_queue.drain()
+        self.assertEqual([newer.id, older.id], [j.id for j in self.admin.jobs_of(GAME)])
+
+
+class TestDrainingInTheBackground(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.admin = AdminService(self.root)
+        self.admin.create_game(GAME, SHIPS, 'generic')
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_queuing_starts_a_thread_that_runs_it(self):
+        job = self.admin.queue(jobs.FORCE, GAME)
+        deadline = time.monotonic() + 30
+        while not self.admin.job(job.id).over and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(jobs.DONE, self.admin.job(job.id).state)
+        self.assertEqual(2, self.admin.standing(GAME).round_nr)
@@ -0,0 +1,142 @@
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import TestCase
+
+from arena import metrics
+from arena.app import locks
+from arena.app.locks import GameBusy, GameLock
+from arena.app.services import AdminService, GameService
+
+GAME = 'locked'
+SHIPS = [{'name': 'Alpha', 'type': 'A2527', 'faction': 'One', 'player': 'Serge', 'x': 0, 'y': 0}]
+
+
+def waiting(lock_dir: Path, count: int):
+    """Until that many tickets are taken."""
+    deadline = time.monotonic() + 10
+    while len(list(lock_dir.glob('*.ticket'))) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestAGameLock(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.tickets = Path(self.root) / 'locks' / GAME
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_writers_take_their_turn_in_the_order_they_asked(self):
+        served = []
+
+        def writer(name):
+            with GameLock(self.root, GAME, name):
+                served.append(name)
+
+        with GameLock(self.root, GAME, 'first'):
+            threads = []
+            for n, name in enumerate(('second', 'third', 'fourth'), start=2):
+                threads.append(threading.Thread(target=writer, args=(name,)))
+                threads[-1].start()
+                waiting(self.tickets, n)
+            self.assertEqual([], served)
+        for t in threads:
+            t.join(10)
+        self.assertEqual(['second', 'third', 'fourth'], served)
+
+    def test_a_waiter_gives_up_after_its_timeout(self):
+        with GameLock(self.root, GAME, 'round'):
+            failed = []
+
+            def impatient():
+                try:
+                    with GameLock(self.root, GAME, 'save', timeout=0.1):
+                        pass
+                except GameBusy as e:
+                    failed.append(e)
+            t = threading.Thread(target=impatient)
+            t.start()
+            t.join(10)
+        self.assertEqual(GAME, failed[0].game)
+        self.assertEqual(0, len(list(self.tickets.glob('*.ticket'))))
+
+    def test_the_same_thread_gets_it_again(self):
+        with GameLock(self.root, GAME, 'round'):
+            with GameLock(self.root, GAME, 'finish', timeout=0.1):
+                self.assertEqual(1, len(list(self.tickets.glob('*.ticket'))))
+            self.assertEqual(1, len(list(self.tickets.glob('*.ticket'))))
+        self.assertEqual(0, len(list(self.tickets.glob('*.ticket'))))
+
+    def test_a_ticket_nobody_holds_is_thrown_away(self):
+        self.tickets.mkdir(parents=True)
+        (self.tickets / f"{0:020d}-1-1.ticket").touch()
+        with GameLock(self.root, GAME, 'round', timeout=0.1):
+            self.assertEqual(1, len(list(self.tickets.glob('*.ticket'))))
+
+    def test_the_wait_is_counted(self):
+        original, metrics.directory = metrics.directory, self.root
+        try:
+            with GameLock(self.root, GAME, 'round'):
+                pass
+            self.assertIn('arena_lock_wait_seconds_count{operation="round"} 1',
+                          metrics.exposition())
+        finally:
+            metrics.collected()
+            metrics.directory = original
+
+
+class TestTheServicesLock(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.admin = AdminService(self.root)
+        self.game = GameService(self.root)
+        self.admin.create_game(GAME, SHIPS, 'generic')
+        self.original, locks.TIMEOUT_SECONDS = locks.TIMEOUT_SECONDS, 0.1
+
+    def tearDown(self):
+        locks.TIMEOUT_SECONDS = self.original
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_orders_wait_for_a_round_being_played(self):
+        held, done = threading.Event(), threading.Event()
+
+        def playing():
+            with GameLock(self.root, GAME, 'process_turn'):
+                held.set()
+                done.wait(10)
+        t = threading.Thread(target=playing)
+        t.start()
+        held.wait(10)
+        try:
+            with self.assertRaises(GameBusy):
+                self.game.save_commands(GAME, 'Alpha', ['1: A5'])
+        finally:
+            done.set()
+            t.join(10)
+        self.game.save_commands(GAME, 'Alpha', ['1: A5'])
+
+    def test_a_registration_waits_for_the_game_being_started(self):
+        self.admin.open_registrations('war', 'five-faction-war')
+        held, done = threading.Event(), threading.Event()
+
+        def starting():
+            with GameLock(self.root, 'war', 'start_game'):
+                held.set()
+                done.wait(10)
+        t = threading.Thread(target=starting)
+        t.start()
+        held.wait(10)
+        try:
+            for change in (lambda: self.admin.register('war', 'Rik', ['Voyager']),
+                           lambda: self.admin.assign('war', {'Rik': 'Human'}),
+                           lambda: self.admin.withdraw('war', 'Rik')):
+                with self.assertRaises(GameBusy):
+                    change()
+        finally:
+            done.set()
+            t.join(10)
+        self.admin.register('war', 'Rik', ['Voyager'])
+        self.assertEqual(['Rik'], [r.player for r in self.admin.registrations('war')])
@@ -0,0 +1,59 @@
+"""A game out of play is one file, and reads as it did when it was a directory of them."""
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from arena.app.services import AdminService, GameService
+from arena.engine.gamedirectory import GamesIn, GamesRoot
+
+SHIPS = [{'name': 'Alpha', 'type': 'A2527', 'faction': 'One', 'player': 'Serge', 'x': 0, 'y': 0}]
+
+
+def files_in(path: Path) -> dict[str, bytes]:
+    return {str(p.relative_to(path)): p.read_bytes() for p in path.rglob('*') if p.is_file()}
+
+
+class TestPacking(TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.admin = AdminService(str(self.root))
+        self.game = GameService(str(self.root))
+        self.admin.create_game('over', SHIPS, 'generic')
+        for _ in range(2):
+            self.game.save_commands('over', 'Alpha', ['1: A5'])
+            self.admin.process_turn('over')
+        self.played = files_in(self.root / 'games' / 'over')
+        self.plan = self.game.get_player_plan('over', 'Serge', 1)
+        self.admin.finish_game('over')
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_a_finished_game_is_one_file(self):
+        self.assertEqual(['game.zip'], os.listdir(self.root / 'finished' / 'over'))
+
+    def test_any_round_reads_out_of_the_pack(self):
+        self.assertEqual(self.plan.ships, self.game.get_player_plan('over', 'Serge', 1).ships)
+        self.assertEqual(2, GamesRoot(self.root).directory('over').last_round_number)
+
+    def test_a_line_added_to_a_packed_game_keeps_what_was_there(self):
+        self.admin._append_journal('over', 'looked at')
+        events = [e.event for e in self.admin.journal('over')]
+        self.assertEqual('looked at', events[0])
+        self.assertIn('processed', events)
+        self.assertEqual(['game.zip', 'journal.jsonl'],
+                         sorted(os.listdir(self.root / 'finished' / 'over')))
+
+    def test_it_comes_back_into_play_as_it_left(self):
+        self.admin.activate_game('over')
+        self.assertEqual(self.played, files_in(self.root / 'games' / 'over'))
+        self.game.save_commands('over', 'Alpha', ['1: A5'])
+
+    def test_a_game_left_loose_is_packed_on_asking(self):
+        gd = GamesRoot(self.root).directory_in(GamesIn.Finished, 'over')
+        gd.unpack()
+        self.assertEqual(['over'], self.admin.pack_games())
+        self.assertEqual([], self.admin.pack_games())
+        self.assertEqual(self.plan.ships, self.game.get_player_plan('over', 'Serge', 1).ships)
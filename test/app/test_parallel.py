@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase
+
+from arena.announce import Announcer
+from arena.app import parallel, services
+from arena.app.dto import By, GameSettings, ProcessingTrigger
+from arena.app.services import AdminService, GameService
+from arena.engine.game import Game
+from test.app.test_announcing import Loudspeaker
+
+SHIPS = [{'name': 'Alpha', 'type': 'A2527', 'faction': 'One', 'player': 'Serge', 'x': 0, 'y': 0}]
+EVERY_HOUR = list(range(24))
+
+
+def work(key: str) -> str:
+    if key == 'raises':
+        raise ValueError("no such game")
+    if key == 'hangs':
+        time.sleep(60)
+    if key == 'dies':
+        os._exit(3)
+    return f"{key} in {os.getpid()}"
+
+
+class TestEach(TestCase):
+    def test_each_runs_in_a_process_of_its_own(self):
+        ran = parallel.each(['a', 'b', 'c'], work, workers=2, budget=30)
+        self.assertEqual(['a', 'b', 'c'], [r.key for r in ran])
+        self.assertTrue(all(r.ok for r in ran))
+        self.assertNotIn(str(os.getpid()), ' '.join(r.said for r in ran))
+
+    def test_one_going_wrong_leaves_the_rest_alone(self):
+        ran = {r.key: r for r in parallel.each(['raises', 'fine', 'hangs', 'dies'], work,
+                                               workers=4, budget=1)}
+        self.assertTrue(ran['fine'].ok)
+        self.assertEqual((False, 'no such game'), (ran['raises'].ok, ran['raises'].said))
+        self.assertIn('still running after 1 seconds', ran['hangs'].said)
+        self.assertIn('exit code 3', ran['dies'].said)
+
+
+class TestProcessDue(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.speaker = Loudspeaker()
+        self.admin = AdminService(self.root, announcer=Announcer([self.speaker]))
+        for name in ('first', 'second', 'never'):
+            self.admin.create_game(name, SHIPS, 'generic')
+        for name in ('first', 'second'):
+            self.admin.save_settings(name, GameSettings(on_all_ready=False,
+                                                        process_hours=EVERY_HOUR))
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_every_due_game_is_played_and_journalled(self):
+        GameService(self.root).save_commands('first', 'Alpha', ['1: A5'])
+        run = self.admin.process_due()
+        self.assertEqual(['first: round 1 processed',
+                          'second: round 1 processed, no orders from Alpha'], sorted(run))
+        for name, rounds in (('first', 2), ('second', 2), ('never', 1)):
+            self.assertEqual(rounds, self.admin.standing(name).round_nr)
+        self.assertEqual('deadline', self.admin.journal('second')[0].detail['trigger'])
+
+    def test_the_round_waiting_longest_goes_first(self):
+        self.admin.force_process_turn('first', By.DIRECTOR, ProcessingTrigger.MANUAL_FORCED)
+        self.assertEqual(['second', 'first'],
+                         [line.split(':')[0] for line in self.admin.process_due()])
+
+    def test_a_round_saved_before_its_child_was_stopped_counts_as_played(self):
+        def saves_then_hangs(game):
+            Game(self.admin._gd(game)).process_current_round()
+            time.sleep(60)
+        self.admin._play_due = saves_then_hangs
+        GameService(self.root).save_commands('first', 'Alpha', ['1: A5'])
+        original, services.PROCESS_DUE_BUDGET_SECONDS = services.PROCESS_DUE_BUDGET_SECONDS, 1
+        try:
+            run = sorted(self.admin.process_due())
+        finally:
+            services.PROCESS_DUE_BUDGET_SECONDS = original
+        self.assertTrue(run[0].startswith('first: round 1 processed, then still running'))
+        latest = self.admin.journal('first')[0]
+        self.assertEqual(('processed', '1'), (latest.event, latest.detail['round']))
+        self.assertEqual(1, len(self.speaker.heard))
+        self.assertTrue(run[1].startswith('second: FAILED'))
+        self.assertEqual('failed', self.admin.journal('second')[0].event)
@@ -0,0 +1,94 @@
+"""A regenerate replays beside the game, and the game takes the replay only if it got all the way."""
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from arena.app import services
+from arena.engine import trace
+from arena.app.services import AdminService, GameService
+
+SHIPS = [{'name': 'Alpha', 'type': 'A2527', 'faction': 'One', 'player': 'Serge', 'x': 0, 'y': 0}]
+
+
+class TestRegenerating(TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.admin = AdminService(str(self.root))
+        game = GameService(str(self.root))
+        for name in ('first', 'second'):
+            self.admin.create_game(name, SHIPS, 'generic')
+            for _ in range(2):
+                game.save_commands(name, 'Alpha', ['1: A5'])
+                self.admin.process_turn(name)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def world(self, game: str, nr: int) -> Path:
+        return self.root / 'games' / game / f"status_round_{nr}.pickle"
+
+    def test_every_game_comes_back_on_its_round_in_the_order_given(self):
+        heard = []
+        ran = self.admin.regenerate_games(['second', 'first'], heard.append)
+        self.assertEqual([('second', True, '2'), ('first', True, '2')],
+                         [(r.key, r.ok, r.said) for r in ran])
+        self.assertEqual(['second', 'first'], [r.key for r in heard])
+        self.assertEqual('regenerated', self.admin.journal('first')[0].event)
+        self.assertEqual([], os.listdir(self.root / 'staging' / 'games'))
+
+    def test_played_in_process_a_trace_sees_the_rounds(self):
+        os.remove(self.root / 'games' / 'first' / 'status_round_1.inputs')
+        path = self.root / 'trace.json'
+        trace.start()
+        try:
+            ran = self.admin.regenerate_games(['first'], in_process=True)
+        finally:
+            trace.stop(str(path))
+        self.assertEqual([('first', True, '2')], [(r.key, r.ok, r.said) for r in ran])
+        spans = json.loads(path.read_text())['traceEvents']
+        self.assertIn('process_current_round', {span['name'] for span in spans})
+
+    def test_a_replay_that_stops_short_is_thrown_away(self):
+        os.remove(self.root / 'games' / 'first' / 'commands' / 'Alpha-commands-1.txt')
+        before = self.world('first', 2).stat().st_mtime_ns
+        self.assertEqual(0, self.admin.regenerate_game('first'))
+        self.assertEqual(before, self.world('first', 2).stat().st_mtime_ns)
+        self.assertEqual(3, self.admin.standing('first').round_nr)
+        self.assertEqual('failed', self.admin.journal('first')[0].event)
+
+    def test_a_game_that_plays_on_while_it_is_replayed_keeps_what_it_played(self):
+        replay = services.engine_regenerate_game
+
+        def meanwhile(staged, target):
+            GameService(str(self.root)).save_commands('first', 'Alpha', ['1: A5'])
+            self.admin.process_turn('first')
+            return replay(staged, target)
+        services.engine_regenerate_game = meanwhile
+        try:
+            with self.assertRaises(ValueError):
+                self.admin.regenerate_game('first')
+        finally:
+            services.engine_regenerate_game = replay
+        self.assertEqual(4, self.admin.standing('first').round_nr)
+        self.assertEqual('failed', self.admin.journal('first')[0].event)
+        self.assertEqual([], os.listdir(self.root / 'staging' / 'games'))
+
+    def test_two_replays_of_one_game_at_once_build_apart(self):
+        os.remove(self.root / 'games' / 'first' / 'status_round_1.inputs')
+        replay = services.engine_regenerate_game
+
+        def and_another(staged, target):
+            services.engine_regenerate_game = replay
+            second.append(self.admin.regenerate_game('first'))
+            return replay(staged, target)
+        second = []
+        services.engine_regenerate_game = and_another
+        try:
+            self.assertEqual(2, self.admin.regenerate_game('first'))
+        finally:
+            services.engine_regenerate_game = replay
+        self.assertEqual([2], second)
+        self.assertEqual([], os.listdir(self.root / 'staging' / 'games'))
@@ -4,6 +4,7 @@ import tempfile
 from pathlib import Path
 from unittest import TestCase
 
+from arena.app import jobs
 from arena.app.scenarios.solo import OPPOSITION, PLAYER_FACTION, SPOTS
 from arena.app.services import AdminService, GameService
 
@@ -15,8 +16,10 @@ class TestSoloGames(TestCase):
         self.root = Path(tempfile.mkdtemp())
         self.game = GameService(str(self.root))
         self.admin = AdminService(str(self.root))
+        jobs.background = False
 
     def tearDown(self):
+        jobs.background = True
         shutil.rmtree(self.root, ignore_errors=True)
 
     def start(self, player='Menno', picks=None):
@@ -74,11 +77,12 @@ class TestSoloGames(TestCase):
         self.assertEqual(SPOTS[PLAYER_FACTION][0], (mine.pos.x, mine.pos.y))
         self.assertEqual(0, mine.heading)
 
-    def test_saying_ready_processes_the_round_on_the_spot(self):
+    def test_saying_ready_queues_the_round(self):
         name = self.start().game.name
         self.game.save_commands(name, 'Rocinante', ['1: Accelerate 20'])
 
-        self.assertTrue(self.game.set_ready(name, 'Menno', True))
+        self.assertIsNotNone(self.game.set_ready(name, 'Menno', True))
+        self.game.job_queue.drain()
         self.assertEqual(2, self.game.solo_game('Menno').game.current_round)
 
     def test_nothing_is_announced_and_no_hour_is_kept(self):
@@ -0,0 +1,165 @@
+"""A data root copied into a database reads as it did, plays as it did, and copies back. One kept
+there from the start runs every game it has without a file on disk."""
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from unittest import TestCase
+
+from arena.app.dto import GameSettings
+from arena.app.naming import solo_game_name
+from arena.app.players import PlayerRegistry
+from arena.app.services import AdminService, GameService
+from arena.cfg import PLAYERS_FILE_NAME
+from arena.engine.admin import regenerate_game
+from arena.engine.gamedirectory import GameDirectory, GamesIn, GamesRoot
+from arena.storage import FileStorage, SqliteStorage, matching
+
+SHIPS = [{'name': 'Alpha', 'type': 'A2527', 'faction': 'One', 'player': 'Serge', 'x': 0, 'y': 0}]
+
+
+def contents(store) -> dict[str, bytes]:
+    found = {}
+    for name in store.files():
+        with store.reading(name, 'rb') as f:
+            found[name] = f.read()
+    return found
+
+
+class TestStoring(TestCase):
+    def setUp(self):
+        self.work = Path(tempfile.mkdtemp())
+        self.root = self.work / 'root'
+        self.admin = AdminService(str(self.root))
+        game = GameService(str(self.root))
+        self.admin.issue_login('Serge')
+        for name in ('playing', 'over'):
+            self.admin.create_game(name, SHIPS, 'generic')
+            for _ in range(2):
+                game.save_commands(name, 'Alpha', ['1: A5'])
+                self.admin.process_turn(name)
+        self.admin.finish_game('over')
+        self.database = SqliteStorage(self.work / 'arena.sqlite')
+        GamesRoot(self.root).copy_into(self.database)
+
+    def tearDown(self):
+        shutil.rmtree(self.work, ignore_errors=True)
+
+    def in_database(self, where: GamesIn, game: str) -> GameDirectory:
+        return GameDirectory(str(self.work), game, where, self.database.within(f"{where}/{game}"))
+
+    def test_every_file_is_in_the_database_as_it_was_on_disk(self):
+        for where, game in ((GamesIn.Active, 'playing'), (GamesIn.Finished, 'over')):
+            on_disk = GamesRoot(self.root).directory_in(where, game)
+            self.assertEqual(contents(on_disk.store), contents(self.in_database(where, game).store))
+        registry = PlayerRegistry(str(self.work), self.database)
+        self.assertEqual(['Serge'], [p.name for p in registry.all()])
+
+    def test_a_game_in_the_database_plays_as_it_did_on_disk(self):
+        gd = self.in_database(GamesIn.Active, 'playing')
+        played = [gd.read_ticks(nr) for nr in range(3)]
+        self.assertEqual(2, regenerate_game(gd, 2))
+        self.assertEqual(played, [gd.read_ticks(nr) for nr in range(3)])
+        self.assertEqual([0, 1, 2], gd.saved_rounds)
+
+    def test_the_database_copies_back_into_the_data_root_it_came_from(self):
+        back = GamesRoot(self.work / 'back')
+        back.copy_from(self.database)
+        for where, game in ((GamesIn.Active, 'playing'), (GamesIn.Finished, 'over')):
+            self.assertEqual(contents(GamesRoot(self.root).directory_in(where, game).store),
+                             contents(back.directory_in(where, game).store))
+        self.assertTrue(back.directory_in(GamesIn.Finished, 'over').packed)
+        self.assertEqual(['Serge'], [p.name for p in PlayerRegistry(str(back.root)).all()])
+
+    def test_a_line_added_in_the_database_keeps_what_was_there(self):
+        gd = self.in_database(GamesIn.Finished, 'over')
+        before = len(gd.read_journal())
+        gd.append_journal({'event': 'looked at'})
+        self.assertEqual(before + 1, len(gd.read_journal()))
+
+    def test_a_wildcard_stays_inside_one_directory(self):
+        files = ['commands/Alpha-commands-1.txt', 'journal.jsonl', 'ready/Serge.txt']
+        self.assertEqual({'journal.jsonl', 'commands', 'ready'}, matching(files, '*'))
+        self.assertEqual({'commands/Alpha-commands-1.txt'}, matching(files, 'commands/*-1.txt'))
+        self.assertEqual(FileStorage(self.root / 'games' / 'playing').names('*'),
+                         self.database.within('games/playing').names('*'))
+
+
+class TestOneDatabase(TestCase):
+    """A data root whose games and registry are all in the database, with nothing on disk."""
+
+    def setUp(self):
+        self.work = Path(tempfile.mkdtemp())
+        self.database = SqliteStorage(self.work / 'arena.sqlite')
+        self.admin = AdminService(str(self.work), store=self.database)
+        self.game = GameService(str(self.work), store=self.database)
+        self.admin.issue_login('Serge')
+
+    def tearDown(self):
+        shutil.rmtree(self.work, ignore_errors=True)
+
+    def on_disk(self) -> list[str]:
+        return sorted(str(p.relative_to(self.work)) for p in self.work.rglob('*')
+                      if p.is_file() and not p.name.startswith('arena.sqlite')
+                      and not p.match('*.lock') and 'staging' not in p.parts)
+
+    def test_a_game_is_played_finished_and_archived_in_it(self):
+        self.admin.create_game('playing', SHIPS, 'generic')
+        for _ in range(2):
+            self.game.save_commands('playing', 'Alpha', ['1: A5'])
+            self.admin.process_turn('playing')
+        self.assertEqual(2, self.admin.regenerate_game('playing'))
+        self.admin.finish_game('playing')
+        self.assertEqual(['playing'], [g.name for g in self.admin.list_finished_games()])
+        self.admin.archive_game('playing')
+        self.assertEqual(['playing'], [g.name for g in self.admin.list_archived_games()])
+        self.assertEqual([], self.on_disk())
+        self.admin.delete_archived_game('playing')
+        self.assertEqual(set(), self.admin.game_names_in_use())
+        self.assertEqual([PLAYERS_FILE_NAME], self.database.names('*'))
+
+    def test_a_game_registers_starts_and_goes_back_in_it(self):
+        self.admin.open_registrations('war', 'five-faction-war')
+        self.admin.register('war', 'Rik', ['Voyager'])
+        ships = [{'name': 'Voyager', 'type': 'H2545', 'faction': 'Human', 'player': 'Rik'}]
+        self.admin.start_game('war', ships, GameSettings(on_all_ready=True, process_hours=[8]))
+        self.assertEqual(['war'], [g.name for g in self.admin.list_games()])
+        self.assertTrue(self.admin.is_reopenable('war'))
+        self.admin.reopen_registrations('war')
+        self.assertEqual([('Rik', 1)],
+                         [(e.player, e.ships) for e in self.admin.registrations('war')])
+        self.assertEqual([], self.on_disk())
+
+    def test_a_player_plays_a_game_of_their_own_in_it(self):
+        self.game.start_solo_game('Serge', [{'name': 'Alpha', 'type': 'A2527'}])
+        self.game.start_solo_game('Serge', [{'name': 'Beta', 'type': 'A2527'}])
+        self.assertEqual(['Beta'], self.game.list_ships(solo_game_name('Serge')))
+        self.assertEqual([], self.on_disk())
+
+
+class TestFilesOnDisk(TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_two_threads_writing_one_file_each_leave_it_whole(self):
+        store = FileStorage(self.root)
+        failed = []
+
+        def writing(text: str):
+            try:
+                for _ in range(300):
+                    store.write('players.jsonl', text * 1000)
+            except OSError as e:
+                failed.append(e)
+        threads = [threading.Thread(target=writing, args=(text,)) for text in 'ab']
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual([], failed)
+        with store.reading('players.jsonl') as f:
+            self.assertIn(f.read(), ('a' * 1000, 'b' * 1000))
+        self.assertEqual(['players.jsonl'], store.loose_names)
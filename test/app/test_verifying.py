@@ -0,0 +1,37 @@
+"""A replay aside is held against what each tick came to when the game was played."""
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from arena.app.services import AdminService, GameService
+
+SHIPS = [{'name': 'Alpha', 'type': 'A2527', 'faction': 'One', 'player': 'Serge', 'x': 0, 'y': 0}]
+
+
+class TestVerifying(TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.admin = AdminService(str(self.root))
+        self.admin.create_game('game', SHIPS, 'generic')
+        game = GameService(str(self.root))
+        for _ in range(2):
+            game.save_commands('game', 'Alpha', ['1: A5', '4: R30'])
+            self.admin.process_turn('game')
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_a_game_replays_the_same(self):
+        self.assertIsNone(self.admin.verify_game('game'))
+
+    def test_it_says_the_first_tick_and_object_that_parted(self):
+        (self.root / 'games' / 'game' / 'commands' / 'Alpha-commands-2.txt').write_text('1: A5\n4: R30\n6: L45')
+        found = self.admin.verify_game('game')
+        self.assertEqual((2, 6, 'Alpha', 'changed'),
+                         (found.round_nr, found.tick, found.name, found.why))
+
+    def test_a_round_with_nothing_recorded_is_said_so(self):
+        (self.root / 'games' / 'game' / 'status_round_1.ticks').unlink()
+        found = self.admin.verify_game('game')
+        self.assertEqual((1, 0, ''), (found.round_nr, found.tick, found.name))
@@ -0,0 +1,26 @@
+"""The battle benchmark builds what it says and plays it. How long it takes is not for a test."""
+from unittest import TestCase
+
+from arena.app.scenarios.five_faction_war import FACTIONS
+from bench.battle import PHASES, battle, measure
+
+
+class TestABattle(TestCase):
+    def test_the_same_seed_builds_the_same_battle(self):
+        (one, _), (two, _) = battle(20, seed=3), battle(20, seed=3)
+        self.assertEqual([(o.name, o.xy) for o in one.objects.values()],
+                         [(o.name, o.xy) for o in two.objects.values()])
+
+    def test_every_faction_flies_and_every_order_is_one_it_can_give(self):
+        world, commands = battle(10)
+        self.assertEqual(set(FACTIONS),
+                         {o.faction for o in world.objects.values() if o.is_player_controlled})
+        self.assertEqual([], [cmd.text for ship in commands.values() for cs in ship.values()
+                              for cmd in cs.errors])
+
+    def test_a_round_is_measured_phase_by_phase(self):
+        result = measure(10)
+        self.assertEqual(10, result['objects'])
+        self.assertEqual({f'{p}_s' for p in PHASES}, set(result['phases']))
+        self.assertGreater(result['encounter_passes'], 0)
+        self.assertGreater(result['pickle_bytes'], 0)
@@ -0,0 +1,38 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from bench.load import measure, percentile
+from bench.season import SESSIONS_FILE, season
+
+
+class TestALoadTest(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_a_season_is_made_through_the_services(self):
+        sessions = season(self.root, games=2, players=3, ships_per_game=2, rounds=1)
+        self.assertEqual(4, len(sessions))
+        self.assertEqual(['Season_001', 'Season_002'],
+                         sorted(os.listdir(os.path.join(self.root, 'games'))))
+        with open(os.path.join(self.root, SESSIONS_FILE)) as f:
+            self.assertEqual(sessions, json.load(f)['sessions'])
+
+    def test_every_endpoint_of_a_session_is_measured(self):
+        season(self.root, games=1, players=2, ships_per_game=2, rounds=1)
+        measured = measure(self.root, sessions=2, concurrency=2)
+        self.assertEqual(['login', 'games', 'plan', 'commands', 'ready', 'replay'],
+                         list(measured['endpoints']))
+        self.assertTrue(all(e['requests'] == 2 and e['errors'] == 0
+                            for e in measured['endpoints'].values()))
+
+    def test_a_percentile_is_a_latency_that_was_measured(self):
+        taken = [0.1 * n for n in range(1, 101)]
+        self.assertEqual(taken[49], percentile(taken, 50))
+        self.assertEqual(taken[98], percentile(taken, 99))
+        self.assertEqual(0.5, percentile([0.5], 95))
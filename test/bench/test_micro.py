@@ -0,0 +1,22 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from bench import micro
+
+
+class TestTheMicrobenchmarks(TestCase):
+    def test_every_primitive_runs(self):
+        with patch.object(micro, 'CALLS', 200):
+            for name in micro.PRIMITIVES:
+                measured = micro.measure(name, repeat=1)
+                self.assertGreater(measured['ops_per_sec'], 0, name)
+
+    def test_a_commit_is_compared_with_what_was_last_recorded_there(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, 'micro.jsonl')
+            for commit, took in (('abc1234', 1.0), ('abc1234', 2.0), ('def5678', 3.0)):
+                micro.record({'format': micro.results.FORMAT, 'commit': commit,
+                              'primitives': {'Vector.move': {'op_s': took}}}, path)
+            self.assertEqual({'Vector.move': {'op_s': 2.0}}, micro.recorded_at(path, 'abc'))
@@ -0,0 +1,14 @@
+from unittest import TestCase
+
+from bench.replay import bundled, replay
+
+
+class TestReplayingTheBundledGames(TestCase):
+    def test_only_games_with_orders_are_replayed(self):
+        self.assertEqual(['apitest', 'test-game'], bundled())
+
+    def test_every_round_is_measured(self):
+        rounds = replay('test-game', traced=True)
+        self.assertEqual(['1', '2', '3'], list(rounds))
+        self.assertTrue(all(r['peak_bytes'] > 0 and r['pickle_bytes'] > 0 for r in rounds.values()))
+        self.assertIn('round_s', replay('apitest')['1'])
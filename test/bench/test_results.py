@@ -0,0 +1,21 @@
+from unittest import TestCase
+
+from bench.results import compare, flatten
+
+
+class TestComparingResults(TestCase):
+    def test_only_times_and_sizes_are_compared(self):
+        baseline = {'10': {'round_s': 1.0, 'phases': {'move_s': 0.5}, 'pickle_bytes': 100,
+                           'objects': 10}}
+        now = {'10': {'round_s': 1.2, 'phases': {'move_s': 0.5}, 'pickle_bytes': 200,
+                      'objects': 20, 'new_s': 1.0}}
+        self.assertEqual(['10.round_s', '10.phases.move_s', '10.pickle_bytes'],
+                         [c.key for c in compare(baseline, now)])
+
+    def test_worse_by_more_than_the_tolerance_is_a_regression(self):
+        changes = {c.key: c for c in compare({'a_s': 1.0, 'b_s': 1.0}, {'a_s': 1.2, 'b_s': 1.3})}
+        self.assertFalse(changes['a_s'].regressed(0.25))
+        self.assertTrue(changes['b_s'].regressed(0.25))
+
+    def test_what_is_not_a_number_is_left_out(self):
+        self.assertEqual({'a.b': 1}, flatten({'a': {'b': 1, 'c': 'text', 'd': True}}))
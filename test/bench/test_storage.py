@@ -0,0 +1,22 @@
+import shutil
+import tempfile
+from unittest import TestCase
+
+from bench.season import season
+from bench.storage import OPERATIONS, measure
+
+
+class TestFilesAgainstADatabase(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_both_stores_are_measured_on_every_game(self):
+        season(self.root, games=2, players=2, ships_per_game=2, rounds=1)
+        measured = measure(self.root, repeat=1)
+        self.assertEqual(2, measured['games'])
+        for store in ('files', 'sqlite'):
+            self.assertEqual(set(OPERATIONS) | {'size_bytes'}, set(measured['stores'][store]))
+            self.assertGreater(measured['stores'][store]['size_bytes'], 0)
@@ -0,0 +1,76 @@
+"""Profiling a round plays it on a copy, and leaves the game exactly as it was."""
+import hashlib
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import TestCase
+
+from arena.app.locks import GameLock
+from arena.cli.profiling import profile, scratch_copy
+from arena.engine.admin import setup_game
+from arena.engine.gamedirectory import GameDirectory
+from arena.engine.round import PHASES
+from arena.log import deactivate_logger_blocklist
+
+
+def contents(root: Path) -> dict:
+    return {str(p.relative_to(root)): hashlib.sha256(p.read_bytes()).hexdigest()
+            for p in root.rglob('*') if p.is_file()}
+
+
+class TestProfilingARound(TestCase):
+    def setUp(self):
+        deactivate_logger_blocklist()
+        self.root = Path(tempfile.mkdtemp())
+        shutil.copytree('./test/test-games/test-game', self.root / 'games' / 'test-game')
+        self.gd = GameDirectory(str(self.root / 'games'), 'test-game')
+        game = setup_game(self.gd)
+        game.process_current_round()
+        self.out = self.root / 'profiles'
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_the_current_round_is_written_up_and_the_game_left_alone(self):
+        before = contents(self.root / 'games')
+        written = profile(self.gd, str(self.out))
+        self.assertEqual(before, contents(self.root / 'games'))
+
+        self.assertEqual(['test-game-round-2.txt', 'test-game-round-2.pstats',
+                          'test-game-round-2-memory.txt'], [Path(p).name for p in written])
+        self.assertIn('process_current_round', Path(written[0]).read_text())
+        memory = Path(written[2]).read_text()
+        for phase in PHASES:
+            self.assertIn(phase, memory)
+
+    def test_a_round_already_played_can_be_played_again(self):
+        written = profile(self.gd, str(self.out), round_nr=1)
+        self.assertEqual('test-game-round-1.txt', Path(written[0]).name)
+
+    def test_a_round_of_a_packed_game_can_be_played_again(self):
+        self.gd.pack()
+        written = profile(self.gd, str(self.out), round_nr=1)
+        self.assertEqual('test-game-round-1.txt', Path(written[0]).name)
+        self.assertEqual(['game.zip'], [p.name for p in Path(self.gd.path).iterdir()])
+
+    def test_a_round_not_yet_reached_is_refused(self):
+        with self.assertRaises(SystemExit):
+            profile(self.gd, str(self.out), round_nr=5)
+
+    def test_the_game_is_copied_once_nobody_is_changing_it(self):
+        held, done = threading.Event(), []
+
+        def round_being_played():
+            with GameLock(self.root, 'test-game', 'round'):
+                held.set()
+                time.sleep(0.2)
+                done.append('round')
+
+        writer = threading.Thread(target=round_being_played)
+        writer.start()
+        held.wait()
+        scratch_copy(self.gd, str(self.root / 'copy'))
+        self.assertEqual(['round'], done)
+        writer.join()
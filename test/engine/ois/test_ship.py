@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from arena.engine.objects.event import InternalEvent
 from arena.engine.objects.registry import builder
 from arena.engine.objects.registry.mines import SplinterMine
 from arena.engine.objects.registry.missiles import Rocket
@@ -59,3 +60,18 @@ class TestWhatLeavesAWreck(TestCase):
         owner = builder.create("Layer", 'H2545', (0, 0), player='Rik')
         mine = SplinterMine().create('M', Vector(Point(0, 0), heading=0, speed=0), owner=owner)
         self.assertFalse(mine.leaves_a_wreck)
+
+
+class TestAMessageInTheLog(TestCase):
+    """Kept as its template and values, and read out the same as if it had been written out."""
+
+    def test_it_reads_as_it_always_has(self):
+        ship = builder.create("Voyager", 'H2545', (0, 0))
+        ship.turn(10)
+        message = ship.history.current.events[-1]
+        self.assertEqual("Turned {} degrees to {}", message.message)
+        self.assertEqual((10, 10), message.args)
+        self.assertEqual("Turned 10 degrees to 10", str(message))
+
+    def test_one_with_nothing_to_fill_in_is_left_alone(self):
+        self.assertEqual("Braces {} stay.", str(InternalEvent("Braces {} stay.")))
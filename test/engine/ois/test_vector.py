@@ -1,3 +1,5 @@
+import pickle
+from dataclasses import FrozenInstanceError
 from unittest import TestCase
 
 from arena.engine.objects.geometry import Point, Vector
@@ -69,4 +71,30 @@ class TestComponentAlong(TestCase):
         self.assertAlmostEqual(-60, vector(90, 60).component_along(270))
 
     def test_part_of_it_at_an_angle(self):
-        self.assertAlmostEqual(60 * 0.5, vector(90, 60).component_along(30), places=6)
\ No newline at end of file
+        self.assertAlmostEqual(60 * 0.5, vector(90, 60).component_along(30), places=6)
+
+class TestAVectorIsAValue(TestCase):
+    """A snapshot holds the vector it was given, so nothing may change one in place."""
+
+    def test_it_cannot_be_changed(self):
+        with self.assertRaises(FrozenInstanceError):
+            vector(0, 10).speed = 20
+        with self.assertRaises(FrozenInstanceError):
+            Point(1, 2).x = 3
+
+    def test_a_turn_is_a_new_vector(self):
+        original = vector(0, 10)
+        turned = original.turn(90)
+        self.assertEqual(0, original.heading)
+        self.assertEqual(90, turned.heading)
+        self.assertEqual((10.0, 0.0), tuple(round(d, 6) for d in turned.delta))
+
+    def test_it_pickles_as_what_it_holds(self):
+        """What it works out for itself is left behind, and worked out again when asked."""
+        original = Vector(Point(1.25, 2.5), heading=450, speed=10)
+        original.delta
+        copy = pickle.loads(pickle.dumps(original))
+        self.assertEqual(original, copy)
+        self.assertEqual(90, copy.heading)
+        self.assertEqual(original.delta, copy.delta)
+        self.assertNotIn(b'_delta', pickle.dumps(original))
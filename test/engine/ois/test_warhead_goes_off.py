@@ -27,7 +27,7 @@ class TestAWarheadGoesOffWhenItsContainerDies(TestCase):
     def _parked(self, name, x):
         rocket = Rocket().create(name, Vector(Point(x, 0), heading=90, speed=0),
                                  owner=self.shooter)
-        rocket.vector.speed = 0
+        rocket.speed = 0
         return rocket
 
     def test_a_blast_carries_to_the_missile_it_kills(self):
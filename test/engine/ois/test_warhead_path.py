@@ -27,7 +27,7 @@ class TestWarheadTriggersOnItsPath(TestCase):
 
     def _rocket_heading_east(self):
         rocket = Rocket().create("R", Vector(Point(0, 0), heading=90, speed=0), owner=self.shooter)
-        self.ois['R'] = rocket
+        self.world.add(rocket)
         return rocket
 
     def _ticks(self, how_many):
@@ -2,8 +2,15 @@ import shutil
 import tempfile
 import unittest
 
-from arena.engine.admin import GameSetup
+import os
+from pathlib import Path
+
+from arena import tally
+from arena.engine import admin, fingerprint
+from arena.engine.admin import GameSetup, regenerate_game, setup_game
+from arena.engine.game import Game, world_of
 from arena.engine.gamedirectory import GameDirectory, ShipFile
+from arena.errors import RoundNotKept
 
 PLACED = [
     {'name': 'Blaster', 'type': 'H2545', 'faction': 'One', 'player': 'Serge',
@@ -45,4 +52,131 @@ class TestTheRosterSurvivesSetup(unittest.TestCase):
         setup = GameSetup(self.gd, ShipFile(self.gd, PLACED))
 
         for ship in PLACED:
-            self.assertEqual(ship['heading'], setup.ships[ship['name']].heading)
\ No newline at end of file
+            self.assertEqual(ship['heading'], setup.ships[ship['name']].heading)
+
+
+def where_everything_was(gd: GameDirectory, nr: int) -> dict:
+    world = world_of(gd, nr)
+    return {(part, name): (o.pos, sorted(o.history.ticks))
+            for part in ('objects', 'graveyard', 'destroyed')
+            for name, o in getattr(world, part).items()}
+
+
+class TestRegeneratingKeepsTheWorldInMemory(unittest.TestCase):
+    """Round after round on one world, with each saved as it goes and none read back."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        for name in ('replayed', 'reopened'):
+            shutil.copytree('test/test-games/test-game', f"{self.root}/{name}",
+                            ignore=shutil.ignore_patterns('*.pickle'))
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_it_reads_back_only_the_start(self):
+        gd = GameDirectory(self.root, 'replayed')
+        with tally.tallied('test') as reads:
+            self.assertEqual(3, regenerate_game(gd, 3))
+        self.assertEqual(2, reads.unpickles)
+
+    def test_it_plays_the_rounds_a_game_opened_afresh_each_round_would(self):
+        replayed, reopened = GameDirectory(self.root, 'replayed'), GameDirectory(self.root, 'reopened')
+        regenerate_game(replayed, 3)
+        setup_game(reopened)
+        while Game(reopened).current_round_ready:
+            Game(reopened).process_current_round()
+        for nr in range(4):
+            self.assertEqual(where_everything_was(reopened, nr), where_everything_was(replayed, nr))
+
+
+class TestRegeneratingStartsAfterWhatIsUnchanged(unittest.TestCase):
+    """A saved round played from what it would be played from today is kept, with all before it."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        shutil.copytree('test/test-games/test-game', f"{self.root}/game",
+                        ignore=shutil.ignore_patterns('*.pickle'))
+        self.gd = GameDirectory(self.root, 'game')
+        regenerate_game(self.gd, 3)
+        for nr in range(4):
+            os.utime(self.gd.status_file_for_round(nr), ns=(0, 0))
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def replayed(self) -> list[bool]:
+        """Which rounds were saved again, rather than left as they were."""
+        return [os.stat(self.gd.status_file_for_round(nr)).st_mtime_ns > 0 for nr in range(4)]
+
+    def test_nothing_changed_replays_nothing(self):
+        self.assertEqual(3, regenerate_game(self.gd))
+        self.assertEqual([False, False, False, False], self.replayed())
+
+    def test_a_round_with_other_orders_is_replayed_with_those_after_it(self):
+        orders = Path(self.gd.command_file('Blaster-1', 2))
+        orders.write_text(orders.read_text() + '\n')
+        self.assertEqual(3, regenerate_game(self.gd))
+        self.assertEqual([False, False, True, True], self.replayed())
+
+    def test_a_round_that_cannot_be_read_goes_back_to_a_keyframe(self):
+        Path(self.gd.status_file_for_round(3)).write_bytes(b'not a world')
+        os.utime(self.gd.status_file_for_round(3), ns=(0, 0))
+        original, admin.KEYFRAME_ROUNDS = admin.KEYFRAME_ROUNDS, 2
+        try:
+            self.assertEqual(3, regenerate_game(self.gd))
+        finally:
+            admin.KEYFRAME_ROUNDS = original
+        self.assertEqual([False, False, False, True], self.replayed())
+        self.assertTrue(self.gd.load_world(3).objects)
+
+
+class TestKeepingOnlySomeRounds(unittest.TestCase):
+    """A game that keeps one world in so many plays the others again when somebody asks."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        for name in ('sparse', 'full'):
+            shutil.copytree('test/test-games/test-game', f"{self.root}/games/{name}",
+                            ignore=shutil.ignore_patterns('*.pickle'))
+        self.sparse = GameDirectory(f"{self.root}/games", 'sparse')
+        self.full = GameDirectory(f"{self.root}/games", 'full')
+        self.sparse.write_settings({'keep_every': 2})
+        regenerate_game(self.sparse, 3)
+        regenerate_game(self.full, 3)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_it_keeps_round_0_every_other_round_and_the_latest(self):
+        self.assertEqual([0, 2, 3], self.sparse.saved_rounds)
+        self.assertEqual(self.full.read_inputs(1), self.sparse.read_inputs(1))
+
+    def test_a_round_let_go_of_comes_back_as_it_was_played(self):
+        self.assertEqual(where_everything_was(self.full, 1), where_everything_was(self.sparse, 1))
+        self.assertEqual([0, 2, 3], self.sparse.saved_rounds)
+
+    def test_a_round_played_again_is_read_from_the_cache_next_time(self):
+        world_of(self.sparse, 1)
+        with tally.tallied('test') as reads:
+            world_of(self.sparse, 1)
+        self.assertEqual(1, reads.unpickles)
+
+    def test_a_round_whose_orders_changed_since_cannot_come_back(self):
+        orders = Path(self.sparse.command_file('Blaster-1', 1))
+        orders.write_text(orders.read_text() + '\n')
+        with self.assertRaises(RoundNotKept):
+            world_of(self.sparse, 1)
+
+    def test_a_round_let_go_of_still_comes_back_under_another_engine(self):
+        original, fingerprint.engine = fingerprint.engine, lambda: 'another engine'
+        try:
+            world_of(self.sparse, 1)
+        finally:
+            fingerprint.engine = original
+
+    def test_only_what_plays_a_round_counts_as_the_engine(self):
+        names = [source.name for source in fingerprint.sources()]
+        self.assertIn('round.py', names)
+        for left_out in ('gamedirectory.py', 'trace.py', 'fingerprint.py', 'manual.py'):
+            self.assertNotIn(left_out, names)
@@ -0,0 +1,34 @@
+"""A phase passes by whatever only has the empty default for its hooks."""
+from unittest import TestCase
+
+from arena.engine.command import Commandable, is_commandable
+from arena.engine.hooks import answering, answers
+from arena.engine.objects.component import Component
+from arena.engine.objects.objectinspace import ObjectInSpace
+from arena.engine.objects.registry import builder
+
+
+class TestWhoAnswers(TestCase):
+    def setUp(self):
+        self.ship = builder.create('Alpha', 'H2545', (0, 0))
+        self.rock = builder.create('Rock', 'Asteroid', (100, 0))
+        self.beacon = builder.create('Gate', 'JumpPoint', (200, 0))
+
+    def test_a_body_has_nothing_to_do_before_it_moves(self):
+        self.assertFalse(answers(self.rock, ObjectInSpace, 'generate', 'use_energy', 'pre_move'))
+        self.assertTrue(answers(self.ship, ObjectInSpace, 'generate'))
+
+    def test_any_one_of_the_hooks_is_enough(self):
+        self.assertTrue(answers(self.beacon, ObjectInSpace, 'scan', 'post_move'))
+
+    def test_the_order_given_is_kept(self):
+        things = [self.beacon, self.rock, self.ship]
+        self.assertEqual([self.beacon, self.ship], answering(things, ObjectInSpace, 'post_move'))
+
+    def test_components_are_asked_against_their_own_base(self):
+        reaching = answering(self.ship.all_components.values(), Component, 'encounter')
+        self.assertTrue(all(type(c).encounter is not Component.encounter for c in reaching))
+
+    def test_the_commandable_answer_is_the_protocols(self):
+        for ois in (self.ship, self.rock, self.beacon):
+            self.assertEqual(isinstance(ois, Commandable), is_commandable(ois))
@@ -0,0 +1,62 @@
+"""Objects that cannot reach each other this tick are asked about their encounters apart."""
+from random import Random
+from unittest import TestCase
+
+from arena.engine.objects.geometry import Point, Vector
+from arena.engine.objects.registry import builder
+from arena.engine.objects.registry.mines import SplinterMine
+from arena.engine.objects.registry.missiles import Rocket
+from arena.engine.round import islands
+from arena.engine.world import World
+
+
+def ship(name: str, faction: str, x: float, y: float, heading: float = 0, speed: float = 0):
+    ois = builder.create(name, 'H2545', (x, y))
+    ois.faction = faction
+    ois.vector = Vector(Point(x, y), heading, speed)
+    return ois
+
+
+class TestIslands(TestCase):
+    def test_far_apart_is_apart(self):
+        alpha, beta = ship('Alpha', 'One', 0, 0), ship('Beta', 'Two', 1000, 0)
+        self.assertEqual([[alpha], [beta]], islands([alpha, beta]))
+
+    def test_two_points_close_by_are_apart(self):
+        """Only bulk stops anything, so two ships never meet however near they pass."""
+        alpha, beta = ship('Alpha', 'One', 0, 0), ship('Beta', 'Two', 10, 0)
+        self.assertEqual([[alpha], [beta]], islands([alpha, beta]))
+
+    def test_a_leg_reaching_a_rock_joins_them(self):
+        alpha, rock = ship('Alpha', 'One', 0, 0, 90, 100), builder.create('Rock', 'Asteroid', (130, 0))
+        self.assertEqual([[alpha, rock]], islands([alpha, rock]))
+
+    def test_a_warhead_reaches_as_far_as_it_goes_off(self):
+        alpha = ship('Alpha', 'One', 0, 0)
+        self.assertEqual(6, SplinterMine().create('M', Vector(Point(0, 0), 0, 0)).range)
+        mine = SplinterMine().create('M', Vector(Point(7, 0), 0, 0), owner=ship('Owner', 'Two', 0, 900))
+        self.assertEqual([[alpha, mine]], islands([alpha, mine]))
+
+    def test_each_keeps_the_order_it_was_given(self):
+        objects = [builder.create(f'Rock{i}', 'Asteroid', ((i % 2) * 1000, i * 40)) for i in range(6)]
+        self.assertEqual([objects[0::2], objects[1::2]], islands(objects))
+
+    def test_asked_apart_they_answer_as_they_would_together(self):
+        rng = Random(31)
+        owners = [ship('Red', 'Red', 0, 5000), ship('Blue', 'Blue', 0, -5000)]
+        objects = [builder.create(f'Rock{i}', 'Asteroid', (rng.uniform(-500, 500), rng.uniform(-500, 500)))
+                   for i in range(15)]
+        objects += [ship(f'Ship{i}', rng.choice(['Red', 'Blue']), rng.uniform(-500, 500),
+                         rng.uniform(-500, 500), rng.uniform(0, 360), rng.uniform(0, 100))
+                    for i in range(30)]
+        objects += [Rocket().create(f'R{i}', Vector(Point(rng.uniform(-500, 500), rng.uniform(-500, 500)),
+                                                    rng.uniform(0, 360), 60), owner=rng.choice(owners))
+                    for i in range(20)]
+        world = World(None, {o.name: o for o in objects})
+
+        groups = islands(objects)
+        self.assertGreater(len(groups), 1)
+        for island in groups:
+            part = world.only(island)
+            for ois in island:
+                self.assertEqual(ois.encounter(world), ois.encounter(part))
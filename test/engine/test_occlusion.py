@@ -1,7 +1,9 @@
 """A body between two ships hides them from each other. See docs/gddr/0038."""
+from random import Random
 from unittest import TestCase
 
 from arena.engine.gamedirectory import GameDirectory
+from arena.engine.objects.geometry import Leg
 from arena.engine.objects.registry import builder
 from arena.engine.world import World
 
@@ -53,6 +55,34 @@ class TestASightLine(TestCase):
         self.assertFalse(world.blocks_sight(self.alpha, beacon))
 
 
+class TestTheSightGrid(TestCase):
+    def test_it_answers_what_looking_at_every_body_would(self):
+        """Sight lines of every length, across squares and along their edges."""
+        rng = Random(38)
+        rocks = [builder.create(f'Rock{i}', rng.choice(['Asteroid', 'Boulder']),
+                                (rng.uniform(-1000, 1000), rng.uniform(-1000, 1000)))
+                 for i in range(60)]
+        ships = [ship(f'Ship{i}', rng.choice([-200, 0, 100, rng.uniform(-1200, 1200)]),
+                      rng.uniform(-1200, 1200)) for i in range(40)]
+        world = world_with(*rocks, *ships)
+
+        for looker in ships:
+            for target in ships:
+                here, there = looker.xy, target.xy
+                sight = Leg(here, (there.x - here.x, there.y - here.y))
+                expected = any(sight.closest_fraction(Leg(o.xy, (0, 0)), o.radius) is not None
+                               for o in rocks)
+                self.assertEqual(expected, world.blocks_sight(looker, target))
+
+    def test_a_body_arriving_is_in_the_way_at_once(self):
+        alpha, beta = ship('Alpha', -100, 0), ship('Beta', 100, 0)
+        world = world_with(alpha, beta)
+        self.assertFalse(world.blocks_sight(alpha, beta))
+
+        world.add(rock(0, 0))
+        self.assertTrue(world.blocks_sight(alpha, beta))
+
+
 class TestWhatAShipSees(TestCase):
     def test_it_scans_what_it_has_a_clear_line_to(self):
         alpha, beta = ship('Alpha', -60, 0), ship('Beta', 60, 0)
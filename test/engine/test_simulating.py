@@ -0,0 +1,53 @@
+"""Rounds played headless, in memory, come out as the same rounds played through a directory."""
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from arena.cfg import REPO_ROOT
+from arena.engine import fingerprint
+from arena.engine.admin import setup_game
+from arena.engine.game import simulate
+from arena.engine.gamedirectory import GameDirectory
+
+GAME = os.path.join(REPO_ROOT, 'test', 'test-games', 'test-game')
+
+
+class TestSimulating(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        shutil.copytree(GAME, os.path.join(self.root, 'test-game'),
+                        ignore=shutil.ignore_patterns('status_round_*'))
+        self.gd = GameDirectory(self.root, 'test-game')
+        game = setup_game(self.gd)
+        self.start = self.gd.load_world(0)
+        self.orders = []
+        while game.current_round_ready:
+            nr = game.current_round_nr
+            self.orders.append({ship.name: self.gd.read_command_file(ship.name, nr)
+                                for ship in game.player_ships})
+            game.process_current_round(carry_on=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_every_round_comes_out_as_it_did_on_disk(self):
+        worlds = simulate(self.start, 0, self.orders)
+        self.assertEqual([1, 2, 3], list(worlds))
+        for nr, world in worlds.items():
+            self.assertEqual(self.gd.read_ticks(nr), fingerprint.of_ticks(world, nr))
+
+    def test_the_world_given_is_left_as_it_was(self):
+        before = fingerprint.of_ticks(self.start, 0)
+        simulate(self.start, 0, self.orders)
+        self.assertEqual(before, fingerprint.of_ticks(self.start, 0))
+        self.assertIs(self.gd, self.start._dir)
+
+    def test_without_every_round_the_world_given_is_played_on(self):
+        worlds = simulate(self.start, 0, self.orders, every_round=False)
+        self.assertEqual({3: self.start}, worlds)
+        self.assertEqual(self.gd.read_ticks(3), fingerprint.of_ticks(self.start, 3))
+
+    def test_a_ship_without_orders_gives_none(self):
+        worlds = simulate(self.start, 0, [{}])
+        self.assertEqual([1], list(worlds))
@@ -0,0 +1,52 @@
+"""A trace costs nothing until it is started, and says where a round went once it is."""
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from arena.engine import trace
+from arena.engine.admin import setup_game
+from arena.engine.gamedirectory import GameDirectory
+from arena.log import deactivate_logger_blocklist
+
+
+class TestOff(TestCase):
+    def test_nothing_is_collected(self):
+        self.assertFalse(trace._trace)
+        self.assertIs(trace.span('a'), trace.span('b'))
+        things = [1, 2]
+        self.assertIs(things, trace.each(things))
+        trace.note(candidates=3)
+
+    def test_stopping_what_never_started_writes_nothing(self):
+        path = Path(tempfile.mkdtemp()) / 'trace.json'
+        trace.stop(str(path))
+        self.assertFalse(path.exists())
+
+
+class TestARoundTraced(TestCase):
+    def setUp(self):
+        deactivate_logger_blocklist()
+        self.root = Path(tempfile.mkdtemp())
+        shutil.copytree('./test/test-games/test-game', self.root / 'test-game')
+
+    def tearDown(self):
+        trace.stop()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_every_phase_pass_and_object_is_a_span(self):
+        game = setup_game(GameDirectory(str(self.root), 'test-game'))
+        trace.start()
+        game.process_current_round()
+        trace.stop(str(self.root / 'trace.json'))
+
+        events = json.loads((self.root / 'trace.json').read_text())['traceEvents']
+        names = {e['name'] for e in events}
+        for phase in ('process_current_round', 'load_commands', 'do_tick', 'open_tick',
+                      'resolve_encounters', 'move', 'scan_and_decide', 'StatusFile.save'):
+            self.assertIn(phase, names)
+        self.assertIn('Ship', names)
+        passes = [e for e in events if e['name'] == 'resolve_earliest']
+        self.assertTrue(all('candidates' in e['args'] for e in passes))
+        self.assertTrue(all(e['ph'] == 'X' and e['dur'] >= 0 for e in events))
@@ -0,0 +1,97 @@
+"""The world files what it holds by what the hot loops ask, and has to stay right about it."""
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from arena.engine.admin import setup_game
+from arena.engine.gamedirectory import GameDirectory
+from arena.engine.objects.objectinspace import Stance
+from arena.engine.objects.registry import builder
+from arena.engine.objects.registry.missiles import Rocket
+from arena.engine.objects.geometry import Point, Vector
+from arena.engine.world import World, Whereabouts
+from arena.log import deactivate_logger_blocklist
+
+
+def ship(name: str, faction: str | None, x: float = 0, player: str = None):
+    ois = builder.create(name, 'H2545', (x, 0), player=player)
+    ois.faction = faction
+    return ois
+
+
+class TestOnOtherSides(TestCase):
+    def setUp(self):
+        self.ours = ship('Ours', 'One')
+        self.theirs = ship('Theirs', 'Two', 100)
+        self.others = ship('Others', 'Three', 200)
+        self.rock = builder.create('Rock', 'Asteroid', (300, 0))
+        self.rocket = Rocket().create('R', Vector(Point(0, 0), 90, 0), owner=self.theirs)
+        self.world = World(None, {o.name: o for o in (self.theirs, self.rock, self.ours, self.rocket,
+                                                      self.others)})
+
+    def test_it_holds_every_foe_in_the_order_they_came_into_space(self):
+        foes = [o for o in self.world.objects.values() if o.stance_towards(self.ours) == Stance.Foe]
+        self.assertEqual(foes, self.world.on_other_sides(self.ours))
+
+    def test_what_is_fired_is_on_its_owners_side(self):
+        self.assertNotIn(self.rocket, self.world.on_other_sides(self.theirs))
+        self.assertIn(self.rocket, self.world.on_other_sides(self.others))
+
+    def test_something_on_no_side_has_nobody_on_another(self):
+        self.assertEqual([], self.world.on_other_sides(self.rock))
+
+    def test_something_that_leaves_space_is_nobodys_foe_any_more(self):
+        self.world.move_to_graveyard(self.theirs)
+        self.assertEqual([self.rocket, self.others], self.world.on_other_sides(self.ours))
+
+
+class TestFindObjects(TestCase):
+    def setUp(self):
+        self.world = World(None, {'Alpha': ship('Alpha', 'One', player='Ann'),
+                                  'Beta': ship('Beta', 'Two'),
+                                  'Rock': builder.create('Rock', 'Asteroid', (300, 0))})
+        self.world.add_to_graveyard(ship('Gamma', 'One', player='Bob'))
+        World.checking = True
+
+    def tearDown(self):
+        World.checking = False
+
+    def test_filters_combine(self):
+        found = self.world.find_objects(faction='One', player_controlled=True)
+        self.assertEqual({'Alpha', 'Gamma'}, set(found))
+        found = self.world.find_objects(where={Whereabouts.Objects}, terrain=False)
+        self.assertEqual({'Alpha', 'Beta'}, set(found))
+        self.assertEqual({'Rock'}, set(self.world.find_objects(category='Terrain')))
+
+    def test_a_tag_is_found_once_the_world_has_put_it_on(self):
+        self.world.tag(self.world.graveyard['Gamma'], 'claimed')
+        self.assertEqual({'Gamma'}, set(self.world.find_objects(with_tags={'claimed'})))
+        self.assertEqual({'Alpha', 'Beta', 'Rock'},
+                         set(self.world.find_objects(without_tags={'claimed'})))
+
+    def test_a_change_behind_its_back_is_caught(self):
+        self.world.objects['Delta'] = ship('Delta', 'Two')
+        with self.assertRaises(AssertionError):
+            self.world.find_objects(faction='Two')
+
+
+class TestAGameKeepsItsIndexesRight(TestCase):
+    """The whole test game, checking every index against a search every time one is asked."""
+
+    def setUp(self):
+        deactivate_logger_blocklist()
+        self.root = Path(tempfile.mkdtemp())
+        shutil.copytree('./test/test-games/test-game', self.root / 'test-game')
+        World.checking = True
+
+    def tearDown(self):
+        World.checking = False
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_every_round(self):
+        game = setup_game(GameDirectory(str(self.root), 'test-game'))
+        while game.current_round_ready:
+            game.process_current_round()
+        game._dir.load_current_world().check_indexes()
+        self.assertGreater(game._dir.last_round_number, 0)